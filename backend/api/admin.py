@@ -0,0 +1,25 @@
+"""
+Access control for operator-only endpoints.
+
+Admin endpoints are disabled (404) unless OCEAN_ADMIN_TOKEN is set in the
+API's environment; requests must then send that token in the X-Admin-Token
+header.
+"""
+
+import hmac
+import os
+from typing import Optional
+
+from fastapi import Header, HTTPException
+
+ADMIN_TOKEN_ENV = "OCEAN_ADMIN_TOKEN"
+ADMIN_TOKEN_HEADER = "X-Admin-Token"
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)):
+    """FastAPI dependency rejecting requests without the configured admin token."""
+    expected = os.environ.get(ADMIN_TOKEN_ENV)
+    if not expected:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not x_admin_token or not hmac.compare_digest(x_admin_token.encode(), expected.encode()):
+        raise HTTPException(status_code=403, detail=f"Missing or invalid {ADMIN_TOKEN_HEADER} header")
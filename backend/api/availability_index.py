@@ -0,0 +1,203 @@
+"""
+Precomputed dataset availability for the /datasets and /available-dates endpoints.
+
+Per-dataset dates and file counts are derived from the file catalog and kept
+until the catalog's generation counter for that dataset moves (a file landed
+or was removed). Serialized responses and their ETags are built once per
+state, so repeat calls cost a single generation lookup.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Any, Tuple
+
+from api.json_response import dumps, payload_etag
+from api.middleware.compression import precompressed
+from utils.file_catalog import FileCatalog
+
+logger = logging.getLogger(__name__)
+
+CATALOG_STAGE = "unified"
+
+# Microplastics is a single multi-year point file with fixed coverage
+MICROPLASTICS_COVERAGE = ("1993-01-01", "2025-12-31")
+
+
+def compress_date_ranges(dates: List[str]) -> List[List[str]]:
+    """
+    Collapse sorted ISO dates into inclusive [start, end] runs of consecutive days.
+
+    Example: ["2024-01-01", "2024-01-02", "2024-01-05"] -> [["2024-01-01", "2024-01-02"], ["2024-01-05", "2024-01-05"]]
+    """
+    ranges: List[List[str]] = []
+    run_start = previous = None
+    for date_str in dates:
+        current = date.fromisoformat(date_str)
+        if previous is not None and current - previous == timedelta(days=1):
+            previous = current
+            continue
+        if run_start is not None:
+            ranges.append([run_start.isoformat(), previous.isoformat()])
+        run_start = previous = current
+    if run_start is not None:
+        ranges.append([run_start.isoformat(), previous.isoformat()])
+    return ranges
+
+
+@dataclass
+class DatasetAvailability:
+    """Cached availability for one dataset."""
+    generation: int
+    file_count: int
+    dates: List[str] = field(default_factory=list)
+
+    @property
+    def ranges(self) -> List[List[str]]:
+        return compress_date_ranges(self.dates)
+
+
+class AvailabilityIndex:
+    """Catalog-backed availability cache with incremental invalidation."""
+
+    def __init__(self, file_catalog: FileCatalog, dataset_config: Dict[str, Dict[str, Any]]):
+        """
+        Initialize the index.
+
+        Args:
+            file_catalog: Catalog of the ocean-data root
+            dataset_config: DataExtractor dataset configuration (names and file patterns)
+        """
+        self.file_catalog = file_catalog
+        self.dataset_config = dataset_config
+        self._datasets: Dict[str, DatasetAvailability] = {}
+        self._state: Optional[Tuple[Tuple[str, int], ...]] = None
+        self._payloads: Dict[str, Tuple[str, bytes]] = {}
+        self._lock = threading.Lock()
+
+    def refresh(self) -> bool:
+        """
+        Bring the index up to date with the catalog.
+
+        Returns:
+            True if any dataset was recomputed
+        """
+        generations = self.file_catalog.generations(CATALOG_STAGE)
+        state = tuple(sorted((name, generations.get(name, 0)) for name in self.dataset_config))
+        if state == self._state:
+            return False
+
+        with self._lock:
+            if state == self._state:
+                return False
+            changed = []
+            for dataset_id, config in self.dataset_config.items():
+                generation = generations.get(dataset_id, 0)
+                cached = self._datasets.get(dataset_id)
+                if cached is not None and cached.generation == generation:
+                    continue
+                pattern = config["file_pattern"]
+                self._datasets[dataset_id] = DatasetAvailability(
+                    generation=generation,
+                    file_count=self.file_catalog.count(CATALOG_STAGE, dataset_id, pattern),
+                    dates=[] if dataset_id == "microplastics"
+                    else self.file_catalog.dates(CATALOG_STAGE, dataset_id, pattern)
+                )
+                changed.append(dataset_id)
+
+            self._state = state
+            self._payloads = {}
+            logger.info(f"📅 Availability index refreshed: {', '.join(changed)}")
+        return True
+
+    def get(self, dataset_id: str) -> DatasetAvailability:
+        """Current availability for a dataset."""
+        self.refresh()
+        return self._datasets[dataset_id]
+
+    def dataset_summaries(self) -> Dict[str, Dict[str, Any]]:
+        """Coverage, latest date and file count per dataset (the /datasets fields that change)."""
+        self.refresh()
+        summaries = {}
+        for dataset_id in self.dataset_config:
+            availability = self._datasets[dataset_id]
+            if dataset_id == "microplastics":
+                start, end = MICROPLASTICS_COVERAGE
+                latest = end
+            else:
+                start = availability.dates[0] if availability.dates else "No data"
+                end = availability.dates[-1] if availability.dates else "No data"
+                latest = availability.dates[-1] if availability.dates else None
+            summaries[dataset_id] = {
+                "temporal_coverage": {"start": start, "end": end},
+                "file_count": availability.file_count,
+                "latest_date": latest
+            }
+        return summaries
+
+    def available_dates(self, date_format: str = "list") -> Dict[str, Any]:
+        """
+        Available dates per dataset.
+
+        Args:
+            date_format: 'list' (every date, legacy shape) or 'ranges'
+                (consecutive-day runs plus start/end/count)
+        """
+        self.refresh()
+        result: Dict[str, Any] = {}
+        for dataset_id in self.dataset_config:
+            availability = self._datasets[dataset_id]
+            if dataset_id == "microplastics":
+                start, end = MICROPLASTICS_COVERAGE
+                if date_format == "list":
+                    result[dataset_id] = [f"{start} to {end}"]
+                else:
+                    result[dataset_id] = {"start": start, "end": end, "count": None, "ranges": [[start, end]]}
+                continue
+
+            if date_format == "list":
+                result[dataset_id] = list(availability.dates)
+            else:
+                result[dataset_id] = {
+                    "start": availability.dates[0] if availability.dates else None,
+                    "end": availability.dates[-1] if availability.dates else None,
+                    "count": len(availability.dates),
+                    "ranges": availability.ranges
+                }
+        return result
+
+    def payload(self, kind: str, builder) -> Tuple[str, bytes]:
+        """
+        Serialized response body and its ETag, built once per catalog state.
+
+        Args:
+            kind: Cache key for the response variant
+            builder: Callable returning the JSON-serializable content
+
+        Returns:
+            Tuple of (etag, body bytes)
+        """
+        self.refresh()
+        state = self._state
+        cached = self._payloads.get(kind)
+        if cached is not None:
+            return cached
+        body = dumps(builder())
+        etag = payload_etag(body)
+        precompressed.register(body)
+        with self._lock:
+            # Don't cache a body built from a state that was replaced meanwhile
+            if self._state == state:
+                self._payloads[kind] = (etag, body)
+        return etag, body
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Evaluate an If-None-Match header against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
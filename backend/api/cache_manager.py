@@ -7,6 +7,8 @@ Implements multi-layered caching to dramatically speed up data access:
 3. Smart file handle management
 """
 
+from __future__ import annotations
+
 import asyncio
 import time
 import json
@@ -15,10 +17,15 @@ from typing import Dict, Any, Optional, Tuple, List
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import logging
-import xarray as xr
 import numpy as np
 from concurrent.futures import ThreadPoolExecutor
 
+from utils.netcdf_access import open_dataset, open_netcdf
+from utils.lazy_imports import lazy_import
+
+# Imported on first use: xarray (with pandas) dominates API startup time
+xr = lazy_import("xarray")
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -83,10 +90,10 @@ class CoordinateGrid:
         file_size_mb = self.file_path.stat().st_size / (1024 * 1024)
         
         if file_size_mb > 100:  # Large files need chunked loading
-            with xr.open_dataset(self.file_path, chunks='auto', decode_cf=False, cache=True, lock=False) as ds:
+            with open_netcdf(self.file_path, chunks='auto', decode_cf=False, cache=True) as ds:
                 self._process_coordinate_data(ds)
         else:
-            with xr.open_dataset(self.file_path, cache=True, lock=False) as ds:
+            with open_netcdf(self.file_path, cache=True) as ds:
                 self._process_coordinate_data(ds)
                 
     def _process_coordinate_data(self, ds):
@@ -232,19 +239,17 @@ class SmartFileManager:
             
             if file_size_mb > 100:  # Large files (>100MB) need chunking
                 logger.info(f"🚀 Large file detected ({file_size_mb:.1f}MB), using chunked loading")
-                ds = xr.open_dataset(
+                ds = open_dataset(
                     file_path, 
                     chunks='auto',      # Enable chunking for large files
                     decode_cf=False,    # Skip decoding for faster loading
-                    cache=True,         # Enable caching
-                    lock=False          # Disable locking for better performance
+                    cache=True          # Enable caching
                 )
             else:
                 # Smaller files can be loaded normally but with optimizations
-                ds = xr.open_dataset(
+                ds = open_dataset(
                     file_path,
-                    cache=True,         # Enable caching
-                    lock=False          # Disable locking for better performance
+                    cache=True          # Enable caching
                 )
                 
             self.open_files[file_key] = ds
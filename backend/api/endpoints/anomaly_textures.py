@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Anomaly Texture Module
+
+Renders departures from the day-of-year climatology as globe textures. The
+day's surface field is block-averaged onto the climatology grid and the
+stored mean is subtracted, so no historical files are read per request.
+Rendered PNGs are cached on disk next to the climatology, keyed by how many
+days the climatology contained, so they refresh as new days are folded in.
+"""
+
+import logging
+import threading
+from datetime import date
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+from fastapi.responses import FileResponse
+
+from api.single_flight import SingleFlight
+from utils.area_weighting import surface_field
+from utils.climatology import CLIMATOLOGY_VARIABLES, coarsen_to_target
+from utils.netcdf_access import open_netcdf
+from utils.lazy_imports import lazy_import
+
+# Imported on first use: the texture generator pulls in matplotlib and cmocean
+Image = lazy_import("PIL.Image")
+texture_generator = lazy_import("processors.texture_generator")
+
+logger = logging.getLogger(__name__)
+
+ANOMALY_COLORMAP = "cmocean.balance"
+
+
+class AnomalyTextureService:
+    """Anomaly textures rendered from the stored climatologies."""
+
+    def __init__(self, data_extractor):
+        """
+        Initialize the anomaly texture service.
+
+        Args:
+            data_extractor: DataExtractor providing dataset resolution, files and the climatology engine
+        """
+        self.data_extractor = data_extractor
+        self.climatology = data_extractor.climatology
+        self.cache_path = self.climatology.base_path / "textures"
+        self.generator = texture_generator.TextureGenerator(self.cache_path)
+        self.render_flights = SingleFlight("anomaly_texture")
+        self._render_lock = threading.Lock()
+
+    def serve_anomaly_texture(self, dataset: str, variable: Optional[str] = None,
+                              date_str: Optional[str] = None) -> FileResponse:
+        """
+        Serve the anomaly texture of a dataset variable for a date.
+
+        Raises:
+            ValueError: Dataset or variable without a climatology
+            FileNotFoundError: No data file, or not enough years in the climatology yet
+        """
+        resolved_dataset = self.data_extractor._resolve_acidity_dataset(dataset, date_str)
+        variables = CLIMATOLOGY_VARIABLES.get(resolved_dataset)
+        if not variables:
+            raise ValueError(f"No climatology for dataset: {dataset}")
+        variable = variable or variables[0]
+        if variable not in variables:
+            raise ValueError(f"No climatology for {variable} in {resolved_dataset}. Available: {', '.join(variables)}")
+
+        if not date_str:
+            availability = self.data_extractor.availability_index.get(resolved_dataset)
+            if not availability.dates:
+                raise FileNotFoundError(f"No data available for {dataset}")
+            date_str = availability.dates[-1]
+
+        file_path = self.data_extractor._find_dataset_file(resolved_dataset, date_str)
+        if not file_path:
+            raise FileNotFoundError(f"No data file for {dataset} on {date_str}")
+        file_date = self.data_extractor._extract_date_from_filename(file_path.name)
+        if not file_date:
+            raise FileNotFoundError(f"Cannot determine the date of {file_path.name}")
+
+        store = self.climatology.store(resolved_dataset, variable)
+        version = store.summary()["days"]
+        output_path = (self.cache_path / resolved_dataset / variable /
+                       f"{variable}_anomaly_{file_date.replace('-', '')}_c{version}.png")
+
+        if not output_path.exists():
+            self.render_flights.run(
+                str(output_path),
+                lambda: self._render(store, file_path, variable, date.fromisoformat(file_date), output_path)
+            )
+
+        return FileResponse(
+            path=str(output_path),
+            media_type="image/png",
+            headers={
+                "Cache-Control": "public, max-age=3600",
+                "X-Texture-Date": file_date,
+                "X-Climatology-Days": str(version)
+            }
+        )
+
+    def _render(self, store, file_path: Path, variable: str, day: date, output_path: Path):
+        """Compute the anomaly field and write it as a PNG (symmetric color scale around zero)."""
+        if output_path.exists():
+            return
+        with open_netcdf(file_path) as ds:
+            field = surface_field(ds, variable)
+            if field is None:
+                raise FileNotFoundError(f"{variable} not found in {file_path.name}")
+            field = coarsen_to_target(field)
+            values = field.values.astype(np.float64)
+
+        # The day is compared against a normal it is not part of
+        normal = store.normal_field(day, exclude=values)
+        if normal is None:
+            raise FileNotFoundError(f"No climatology stored for {variable} yet")
+        mean, _, lats, lons = normal
+        if values.shape != mean.shape:
+            raise FileNotFoundError(f"Grid of {file_path.name} does not match the {variable} climatology")
+
+        anomaly = values - mean
+        finite = np.abs(anomaly[np.isfinite(anomaly)])
+        if finite.size == 0:
+            raise FileNotFoundError(f"Not enough years in the {variable} climatology for {day.isoformat()}")
+        limit = float(np.percentile(finite, 98)) or 1.0
+
+        # matplotlib colormaps are not thread-safe to mutate; render one texture at a time
+        with self._render_lock:
+            texture, _ = self.generator.data_to_texture(
+                anomaly, lons, lats, ANOMALY_COLORMAP,
+                normalize_method='custom', vmin=-limit, vmax=limit
+            )
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        for stale in output_path.parent.glob(output_path.name.rsplit("_c", 1)[0] + "_c*.png"):
+            stale.unlink(missing_ok=True)
+        tmp_path = output_path.with_suffix(".tmp.png")
+        Image.fromarray(texture, mode='RGBA').save(tmp_path, 'PNG')
+        tmp_path.replace(output_path)
+        logger.info(f"🌡️ Rendered {variable} anomaly texture for {day.isoformat()} (±{limit:.3g})")
@@ -5,9 +5,9 @@ Handles reading NetCDF files and extracting point data with high performance.
 Supports all datasets: SST, currents, and acidity.
 """
 
-import xarray as xr
+from __future__ import annotations
+
 import numpy as np
-import pandas as pd
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 import time
@@ -16,24 +16,49 @@ from datetime import datetime, date
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
+from collections import OrderedDict
+import threading
 
 from api.models.responses import (
     DatasetInfo, PointDataResponse, MultiDatasetResponse, 
-    Coordinates, DataValue
+    Coordinates, DataValue, LeanDataValue, LeanPointDataResponse, LeanMultiDatasetResponse
 )
 from api.cache_manager import cache_manager, CachedPoint
+from api.json_response import PayloadCache, dumps
 from api.middleware.resilience import with_retry, managed_resource, default_retry_policy
+from api.middleware.tracing import StageClock, dataset_seconds, span, timed_lock
 from utils.parameter_interpreter import parameter_interpreter
+from utils.file_catalog import default_data_root, get_file_catalog, extract_file_date
+from utils.climatology import get_climatology_engine, CLIMATOLOGY_VARIABLES
+from utils.area_weighting import VELOCITY_PAIRS
+from utils.currents_derived import speed_direction
+from utils.netcdf_access import file_lock, open_dataset, open_netcdf
+from utils.logging_config import DebugSampler
+from api.availability_index import AvailabilityIndex
+from api.single_flight import SingleFlight
+from utils.lazy_imports import lazy_import
+
+# Imported on first use: xarray and pandas dominate API startup time
+xr = lazy_import("xarray")
+pd = lazy_import("pandas")
 
 logger = logging.getLogger(__name__)
 
+# Per-request lines are DEBUG; one in every OCEAN_LOG_SAMPLE_EVERY of each is kept
+logger.addFilter(DebugSampler())
+
+# Short names kept for clients that read 'speed'/'direction'
+DERIVED_CURRENTS_ALIASES = {'speed': 'current_speed', 'direction': 'current_direction'}
+
 class DataExtractor:
     """High-performance data extraction engine."""
     
     def __init__(self):
         """Initialize the data extractor."""
-        self.data_path = Path(__file__).parent.parent.parent.parent / "ocean-data" / "processed" / "unified_coords"
-        self.executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ocean_data")
+        self.data_path = default_data_root() / "processed" / "unified_coords"
+        self.executor_workers = 4
+        self.executor = ThreadPoolExecutor(max_workers=self.executor_workers, thread_name_prefix="ocean_data")
+        self.file_catalog = get_file_catalog(self.data_path.parent.parent)
         
         # Register cleanup for graceful shutdown
         import atexit
@@ -87,6 +112,28 @@ class DataExtractor:
             }
         }
         
+        # Dataset availability answered from the file catalog, rebuilt only when files land
+        self.availability_index = AvailabilityIndex(self.file_catalog, self.dataset_config)
+        
+        # Single-flight groups: concurrent identical requests share one extraction
+        self.point_flights = SingleFlight("point_extraction")
+        self.microplastics_flights = SingleFlight("microplastics_points")
+        
+        # Serialized GeoJSON collections per file version and filter combination
+        self.microplastics_payloads = PayloadCache(max_entries=32)
+        
+        # Per-file lat/lon axes used to map a click to its grid cell
+        self._axes_cache: "OrderedDict[Tuple[str, int], Optional[Tuple[np.ndarray, np.ndarray]]]" = OrderedDict()
+        self._axes_cache_size = 64
+        self._axes_lock = threading.Lock()
+        
+        # Executor tasks waiting for a worker and running, exported by /metrics
+        self._executor_counts = {"queued": 0, "running": 0}
+        self._executor_lock = threading.Lock()
+        
+        # Running day-of-year climatologies maintained at ingest, for anomalies
+        self.climatology = get_climatology_engine(self.data_path.parent.parent)
+        
         logger.info("🔧 Data extractor initialized")
     
     def _cleanup(self):
@@ -125,6 +172,39 @@ class DataExtractor:
             educational_context=educational_context
         )
     
+    def lean_point_response(self, response: PointDataResponse) -> LeanPointDataResponse:
+        """Point response reduced to values, units and classification IDs (detail=lean)."""
+        with span("classify", response.dataset):
+            data = {
+                var_name: LeanDataValue(
+                    value=data_value.value,
+                    units=data_value.units,
+                    valid=data_value.valid,
+                    classification_id=parameter_interpreter.get_classification_id(var_name, data_value.value)
+                )
+                for var_name, data_value in response.data.items()
+            }
+        return LeanPointDataResponse(
+            dataset=response.dataset,
+            location=response.location,
+            actual_location=response.actual_location,
+            date=response.date,
+            data=data,
+            extraction_time_ms=response.extraction_time_ms
+        )
+    
+    def lean_multi_response(self, response: MultiDatasetResponse) -> LeanMultiDatasetResponse:
+        """Multi-dataset response with every dataset in lean detail mode."""
+        return LeanMultiDatasetResponse(
+            location=response.location,
+            date=response.date,
+            datasets={
+                name: self.lean_point_response(result) if isinstance(result, PointDataResponse) else result
+                for name, result in response.datasets.items()
+            },
+            total_extraction_time_ms=response.total_extraction_time_ms
+        )
+    
     def _add_ecosystem_insights(self, datasets: Dict[str, Any], location: Tuple[float, float]) -> Dict[str, Any]:
         """Add ecosystem-level insights based on multi-parameter analysis."""
         # Extract numeric measurements from all datasets
@@ -151,52 +231,24 @@ class DataExtractor:
 
     async def get_available_datasets(self) -> Dict[str, DatasetInfo]:
         """Get information about all available datasets."""
+        return self.get_dataset_infos()
+    
+    def get_dataset_infos(self) -> Dict[str, DatasetInfo]:
+        """Build dataset information from the availability index."""
         datasets = {}
+        summaries = self.availability_index.dataset_summaries()
         
         for dataset_id, config in self.dataset_config.items():
             try:
-                # Special handling for microplastics
-                if dataset_id == "microplastics":
-                    microplastics_path = self.data_path / "microplastics" / "unified" / "microplastics_complete_1993_2025.nc"
-                    files = [microplastics_path] if microplastics_path.exists() else []
-                    
-                    # Fixed temporal coverage for microplastics
-                    temporal_coverage = {
-                        "start": "1993-01-01",
-                        "end": "2025-12-31"
-                    }
-                    latest_date = "2025-12-31"
-                else:
-                    # Standard file handling for other datasets
-                    dataset_path = self.data_path / dataset_id
-                    files = list(dataset_path.rglob(config["file_pattern"])) if dataset_path.exists() else []
-                    
-                    # Get date range
-                    dates = []
-                    for file_path in files:
-                        try:
-                            date_str = self._extract_date_from_filename(file_path.name)
-                            if date_str:
-                                dates.append(date_str)
-                        except:
-                            continue
-                    
-                    dates.sort()
-                    
-                    temporal_coverage = {
-                        "start": dates[0] if dates else "No data",
-                        "end": dates[-1] if dates else "No data"
-                    }
-                    latest_date = dates[-1] if dates else None
-                
+                summary = summaries[dataset_id]
                 datasets[dataset_id] = DatasetInfo(
                     name=config["name"],
                     description=config["description"],
                     variables=config["variables"],
-                    temporal_coverage=temporal_coverage,
+                    temporal_coverage=summary["temporal_coverage"],
                     spatial_resolution=config["spatial_resolution"],
-                    file_count=len(files),
-                    latest_date=latest_date
+                    file_count=summary["file_count"],
+                    latest_date=summary["latest_date"]
                 )
                 
             except Exception as e:
@@ -214,34 +266,14 @@ class DataExtractor:
         
         return datasets
     
-    async def get_available_dates(self) -> Dict[str, List[str]]:
-        """Get all available dates for each dataset."""
-        available_dates = {}
+    async def get_available_dates(self, date_format: str = "list") -> Dict[str, Any]:
+        """
+        Get all available dates for each dataset.
         
-        for dataset_id, config in self.dataset_config.items():
-            if dataset_id == "microplastics":
-                # Microplastics has all dates in single file
-                available_dates[dataset_id] = ["1993-01-01 to 2025-12-31"]
-                continue
-                
-            dataset_path = self.data_path / dataset_id
-            if not dataset_path.exists():
-                available_dates[dataset_id] = []
-                continue
-                
-            pattern = config["file_pattern"]
-            files = list(dataset_path.rglob(pattern))
-            
-            dates = []
-            for file_path in files:
-                date_str = self._extract_date_from_filename(file_path.name)
-                if date_str:
-                    dates.append(date_str)
-            
-            dates.sort()
-            available_dates[dataset_id] = dates
-            
-        return available_dates
+        Args:
+            date_format: 'list' for every date, 'ranges' for consecutive-day runs
+        """
+        return self.availability_index.available_dates(date_format)
 
     def _open_dataset_optimized(self, file_path: Path, chunks: Optional[Dict] = None) -> xr.Dataset:
         """
@@ -252,9 +284,9 @@ class DataExtractor:
             # For large files, use dask chunks for memory efficiency
             if chunks:
                 logger.info(f"🚀 Opening large dataset with chunks: {chunks}")
-                ds = xr.open_dataset(file_path, chunks=chunks, engine='netcdf4')
+                ds = open_dataset(file_path, chunks=chunks, engine='netcdf4')
             else:
-                ds = xr.open_dataset(file_path, engine='netcdf4')
+                ds = open_dataset(file_path, engine='netcdf4')
             
             # Check file size and log performance info
             file_size_mb = file_path.stat().st_size / (1024 * 1024)
@@ -266,86 +298,48 @@ class DataExtractor:
         except Exception as e:
             logger.error(f"Failed to open dataset {file_path}: {e}")
             # Fallback to standard opening
-            return xr.open_dataset(file_path)
+            return open_dataset(file_path)
 
     def _calculate_derived_currents_variables(self, point_data: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Calculate derived variables for currents data (speed, direction).
-        Works with both OSCAR (u,v) and CMEMS (uo,vo) velocity components.
-        """
-        import math
-        
-        # Determine which velocity components are available
-        u_var = None
-        v_var = None
-        
-        # Check for CMEMS variables (uo, vo)
-        if 'uo' in point_data and 'vo' in point_data:
-            u_var = point_data['uo']
-            v_var = point_data['vo']
-            velocity_source = 'CMEMS'
-        # Check for OSCAR variables (u, v)
-        elif 'u' in point_data and 'v' in point_data:
-            u_var = point_data['u']
-            v_var = point_data['v']
-            velocity_source = 'OSCAR'
-        else:
-            logger.debug("No velocity components found for derived variable calculation")
-            return point_data
+        Complete current speed and direction for a currents point.
         
-        # Only calculate if both components are valid
-        if (u_var and v_var and 
-            u_var.get('valid', False) and v_var.get('valid', False) and 
-            u_var.get('value') is not None and v_var.get('value') is not None):
-            
-            u_val = float(u_var['value'])
-            v_val = float(v_var['value'])
-            
-            # Calculate speed (magnitude)
-            speed = math.sqrt(u_val**2 + v_val**2)
-            
-            # Calculate direction (in meteorological convention: degrees from North, clockwise)
-            direction_rad = math.atan2(u_val, v_val)  # Note: u,v order for oceanographic convention
-            direction_deg = math.degrees(direction_rad)
-            
-            # Convert to 0-360 range
-            if direction_deg < 0:
-                direction_deg += 360
-            
-            # Add derived variables if they don't already exist
-            if 'speed' not in point_data:
-                point_data['speed'] = {
-                    'value': speed,
-                    'units': 'm s-1',
-                    'long_name': 'Current speed',
-                    'valid': True
-                }
-            
-            if 'current_speed' not in point_data:
-                point_data['current_speed'] = {
-                    'value': speed,
-                    'units': 'm s-1', 
-                    'long_name': 'Current speed',
-                    'valid': True
-                }
-            
-            if 'direction' not in point_data:
-                point_data['direction'] = {
-                    'value': direction_deg,
-                    'units': 'degrees',
-                    'long_name': 'Current direction',
-                    'valid': True
-                }
+        Files harmonized since ingest-time derivation already carry current_speed and
+        current_direction, read like any other variable; they are only computed here for
+        legacy files. 'speed' and 'direction' alias them for older clients.
+        """
+        if 'current_speed' not in point_data or 'current_direction' not in point_data:
+            components = next(
+                ((point_data[u_name], point_data[v_name]) for u_name, v_name in VELOCITY_PAIRS
+                 if u_name in point_data and v_name in point_data),
+                None
+            )
+            if components is None:
+                logger.debug("No velocity components found for derived variable calculation")
+                return point_data
             
-            if 'current_direction' not in point_data:
-                point_data['current_direction'] = {
-                    'value': direction_deg,
-                    'units': 'degrees',
-                    'long_name': 'Current direction', 
-                    'valid': True
-                }
+            u_var, v_var = components
+            if not (u_var.get('valid') and v_var.get('valid')):
+                return point_data
             
-            logger.debug(f"🧮 Calculated derived variables from {velocity_source} data: speed={speed:.3f} m/s, direction={direction_deg:.1f}°")
+            speed, direction = speed_direction(float(u_var['value']), float(v_var['value']))
+            point_data.setdefault('current_speed', {
+                'value': speed,
+                'units': 'm s-1',
+                'long_name': 'Current speed',
+                'valid': True
+            })
+            point_data.setdefault('current_direction', {
+                'value': direction,
+                'units': 'degrees',
+                'long_name': 'Current direction',
+                'valid': True
+            })
+            logger.debug("🧮 Calculated derived variables for legacy file: speed=%.3f m/s, direction=%.1f°", speed, direction)
+        
+        for alias, name in DERIVED_CURRENTS_ALIASES.items():
+            if alias not in point_data:
+                point_data[alias] = dict(point_data[name])
         
         return point_data
 
@@ -370,7 +364,7 @@ class DataExtractor:
             nearest_lat = float(lat_values[lat_idx])
             nearest_lon = float(lon_values[lon_idx])
             
-            logger.debug(f"🎯 Fast spatial lookup: ({lat:.3f}, {lon:.3f}) → ({nearest_lat:.3f}, {nearest_lon:.3f})")
+            logger.debug("🎯 Fast spatial lookup: (%.3f, %.3f) → (%.3f, %.3f)", lat, lon, nearest_lat, nearest_lon)
             return nearest_lat, nearest_lon
             
         except Exception as e:
@@ -406,7 +400,7 @@ class DataExtractor:
         
         # If no date provided, default to current data
         if not date_str:
-            logger.info("🔄 No date provided for acidity request, defaulting to acidity_current")
+            logger.debug("🔄 No date provided for acidity request, defaulting to acidity_current")
             return "acidity_current"
         
         # Parse the date to determine which dataset to use
@@ -419,30 +413,41 @@ class DataExtractor:
             if year <= 2022:
                 # Historical period (2003-2022): use historical data
                 resolved = "acidity_historical"
-                logger.info(f"📅 Date {date_str} (year {year}) → using acidity_historical")
+                logger.debug("📅 Date %s (year %d) → using acidity_historical", date_str, year)
             else:
                 # Current period (2023-present): use current data
                 resolved = "acidity_current"
-                logger.info(f"📅 Date {date_str} (year {year}) → using acidity_current")
+                logger.debug("📅 Date %s (year %d) → using acidity_current", date_str, year)
             
             return resolved
             
         except Exception as e:
-            logger.warning(f"❌ Could not parse date {date_str}: {e}, defaulting to acidity_current")
+            logger.warning("❌ Could not parse date %s: %s, defaulting to acidity_current", date_str, e)
             return "acidity_current"
 
-    def extract_point_data(self, dataset: str, lat: float, lon: float, date_str: Optional[str] = None) -> PointDataResponse:
-        """Smart data extraction with automatic acidity dataset routing."""
+    def extract_point_data(self, dataset: str, lat: float, lon: float, date_str: Optional[str] = None,
+                           anomaly: bool = False) -> PointDataResponse:
+        """Smart data extraction with automatic acidity dataset routing (optionally with climatology anomalies)."""
         start_time = time.time()
-        
-        # Smart dataset resolution for acidity data
-        resolved_dataset = self._resolve_acidity_dataset(dataset, date_str)
-        logger.info(f"📊 Dataset resolution: {dataset} → {resolved_dataset} for date {date_str}")
-        
-        # Find the data file directly
-        file_path = self._find_dataset_file(resolved_dataset, date_str)
+        try:
+            return self._extract_point_data(dataset, lat, lon, date_str, anomaly, start_time)
+        finally:
+            dataset_seconds.observe(time.time() - start_time, dataset)
+    
+    def _extract_point_data(self, dataset: str, lat: float, lon: float, date_str: Optional[str],
+                            anomaly: bool, start_time: float) -> PointDataResponse:
+        """Resolve the file of a point request and extract from it through the single-flight group."""
+        with span("resolve", dataset):
+            # Smart dataset resolution for acidity data
+            resolved_dataset = self._resolve_acidity_dataset(dataset, date_str)
+            logger.debug("📊 Dataset resolution: %s → %s for date %s", dataset, resolved_dataset, date_str)
+            
+            # Find the data file directly
+            file_path = self._find_dataset_file(resolved_dataset, date_str)
         if not file_path:
-            logger.warning(f"No data file found for dataset {resolved_dataset} (original: {dataset}) on {date_str}")
+            logger.warning("No data file found for dataset %s (original: %s) on %s",
+                           resolved_dataset, dataset, date_str,
+                           extra={"dataset": dataset, "date": date_str})
             return PointDataResponse(
                 dataset=dataset,  # Keep original dataset name in response
                 location=Coordinates(lat=lat, lon=lon),
@@ -453,105 +458,223 @@ class DataExtractor:
                 file_source="no-file"
             )
         
+        # Concurrent clicks on the same grid cell of the same file share one extraction
+        with span("coordinates", dataset):
+            grid_cell = self._grid_cell(file_path, lat, lon)
+        flight_key = (dataset, str(file_path), grid_cell)
+        result = self.point_flights.run(
+            flight_key,
+            lambda: self._extract_point_from_file(dataset, resolved_dataset, file_path, lat, lon, date_str, start_time)
+        )
+        response = self._rebind_point_response(result, lat, lon, date_str)
+        if anomaly:
+            response = self._add_anomalies(response, resolved_dataset, file_path)
+        return response
+    
+    def _add_anomalies(self, response: PointDataResponse, resolved_dataset: str,
+                       file_path: Path) -> PointDataResponse:
+        """
+        Add '<variable>_anomaly' and '<variable>_climatology' values from the stored climatology.
+        
+        Returns a copy: the extraction result may be shared with coalesced callers.
+        """
+        file_date = extract_file_date(file_path.name)
+        if not file_date or not response.data:
+            return response
+        day = date.fromisoformat(file_date)
+        location = response.actual_location
+        
+        extra = {}
+        for var_name in CLIMATOLOGY_VARIABLES.get(resolved_dataset, []):
+            current = response.data.get(var_name)
+            if current is None:
+                continue
+            normal = self.climatology.normal(resolved_dataset, var_name, day, location.lat, location.lon,
+                                             file_path=file_path)
+            if normal is None:
+                continue
+            extra[f"{var_name}_climatology"] = DataValue(
+                value=normal["mean"],
+                units=current.units,
+                long_name=f"{current.long_name} climatology ({normal['years']} years, ±{normal['std']:.3g})",
+                valid=True
+            )
+            anomaly_value = (current.value - normal["mean"]
+                             if current.valid and isinstance(current.value, (int, float)) else None)
+            extra[f"{var_name}_anomaly"] = DataValue(
+                value=anomaly_value,
+                units=current.units,
+                long_name=f"{current.long_name} anomaly",
+                valid=anomaly_value is not None
+            )
+        
+        if not extra:
+            return response
+        return response.model_copy(update={"data": {**response.data, **extra}})
+    
+    def _grid_cell(self, file_path: Path, lat: float, lon: float) -> Tuple:
+        """Nearest grid cell indices for a location, or the rounded location for point datasets."""
+        axes = self._coordinate_axes(file_path)
+        if axes is None:
+            return ("point", round(lat, 4), round(lon, 4))
+        lats, lons = axes
+        return (int(np.abs(lats - lat).argmin()), int(np.abs(lons - lon).argmin()))
+    
+    def _coordinate_axes(self, file_path: Path) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """1-D lat/lon axes of a gridded file, read once per file version."""
+        try:
+            cache_key = (str(file_path), file_path.stat().st_mtime_ns)
+        except OSError:
+            return None
+        
+        # Held across the read so concurrent first clicks on a file open it once
+        with self._axes_lock:
+            if cache_key in self._axes_cache:
+                self._axes_cache.move_to_end(cache_key)
+                return self._axes_cache[cache_key]
+            
+            axes = None
+            try:
+                with open_netcdf(file_path) as ds:
+                    lat_name = next((name for name in ('lat', 'latitude') if name in ds.dims), None)
+                    lon_name = next((name for name in ('lon', 'longitude') if name in ds.dims), None)
+                    if lat_name and lon_name:
+                        axes = (ds[lat_name].values.astype(np.float64), ds[lon_name].values.astype(np.float64))
+            except Exception as e:
+                logger.warning(f"Could not read coordinate axes from {file_path.name}: {e}")
+            
+            self._axes_cache[cache_key] = axes
+            while len(self._axes_cache) > self._axes_cache_size:
+                self._axes_cache.popitem(last=False)
+        return axes
+    
+    def _rebind_point_response(self, result: PointDataResponse, lat: float, lon: float,
+                               date_str: Optional[str]) -> PointDataResponse:
+        """Give a shared extraction result the caller's own requested location and date label."""
+        date_label = date_str or ("error" if result.file_source == "error" else "latest")
+        if result.location.lat == lat and result.location.lon == lon and result.date == date_label:
+            return result
+        return result.model_copy(update={
+            "location": Coordinates(lat=lat, lon=lon),
+            "date": date_label
+        })
+    
+    def _extract_point_from_file(self, dataset: str, resolved_dataset: str, file_path: Path,
+                                 lat: float, lon: float, date_str: Optional[str],
+                                 start_time: float) -> PointDataResponse:
+        """Open a dataset file and extract all configured variables at a point."""
+        # Microplastics are discrete samples (latitude/longitude along 'time'), not a grid
+        if resolved_dataset == "microplastics":
+            return self._extract_microplastics_point_data(file_path, lat, lon, start_time)
+
         # Optimized data extraction with chunked loading for large files
         try:
-            # Use chunked loading for large currents files
-            if resolved_dataset == "currents":
-                ds = self._open_dataset_optimized(file_path, chunks={'lat': 100, 'lon': 100})
-            else:
-                ds = xr.open_dataset(file_path)
-                
-            with ds:
-                # Find nearest point with optimized spatial lookup
+            # One extraction per file at a time; HDF5 calls also hold the library lock
+            with timed_lock(file_lock(file_path), dataset):
+                stages = StageClock(dataset)
+                # Use chunked loading for large currents files
                 if resolved_dataset == "currents":
-                    nearest_lat, nearest_lon = self._find_nearest_point_optimized(ds, lat, lon)
+                    ds = self._open_dataset_optimized(file_path, chunks={'lat': 100, 'lon': 100})
                 else:
-                    # Standard coordinate detection for other datasets
-                    lat_coord = 'latitude' if 'latitude' in ds.coords else 'lat'
-                    lon_coord = 'longitude' if 'longitude' in ds.coords else 'lon'
-                    nearest_lat = ds[lat_coord].sel({lat_coord: lat}, method='nearest').values
-                    nearest_lon = ds[lon_coord].sel({lon_coord: lon}, method='nearest').values
-                
-                # Extract data at the point using variables from resolved dataset
-                point_data = {}
-                dataset_vars = self.dataset_config.get(resolved_dataset, {}).get("variables", list(ds.data_vars))
-                logger.info(f"🔍 Extracting variables for {resolved_dataset}: {dataset_vars}")
+                    ds = open_dataset(file_path)
+                stages.lap("open")
                 
-                for var_name in dataset_vars:
-                    if var_name in ds.data_vars and len(ds[var_name].dims) >= 2:  # Skip scalar variables
-                        try:
-                            # Determine coordinate/dimension names for this specific variable
-                            var_dims = ds[var_name].dims
+                with ds:
+                    # Find nearest point with optimized spatial lookup
+                    if resolved_dataset == "currents":
+                        nearest_lat, nearest_lon = self._find_nearest_point_optimized(ds, lat, lon)
+                    else:
+                        # Standard coordinate detection for other datasets
+                        lat_coord = 'latitude' if 'latitude' in ds.coords else 'lat'
+                        lon_coord = 'longitude' if 'longitude' in ds.coords else 'lon'
+                        nearest_lat = ds[lat_coord].sel({lat_coord: lat}, method='nearest').values
+                        nearest_lon = ds[lon_coord].sel({lon_coord: lon}, method='nearest').values
+                    stages.lap("coordinates")
+                
+                    # Extract data at the point using variables from resolved dataset
+                    point_data = {}
+                    dataset_vars = self.dataset_config.get(resolved_dataset, {}).get("variables", list(ds.data_vars))
+                    logger.debug("🔍 Extracting variables for %s: %s", resolved_dataset, dataset_vars)
+                
+                    for var_name in dataset_vars:
+                        if var_name in ds.data_vars and len(ds[var_name].dims) >= 2:  # Skip scalar variables
+                            try:
+                                # Determine coordinate/dimension names for this specific variable
+                                var_dims = ds[var_name].dims
                             
-                            # Find the latitude dimension name for this variable
-                            lat_dim = None
-                            for dim in var_dims:
-                                if dim in ['latitude', 'lat']:
-                                    lat_dim = dim
-                                    break
+                                # Find the latitude dimension name for this variable
+                                lat_dim = None
+                                for dim in var_dims:
+                                    if dim in ['latitude', 'lat']:
+                                        lat_dim = dim
+                                        break
                             
-                            # Find the longitude dimension name for this variable  
-                            lon_dim = None
-                            for dim in var_dims:
-                                if dim in ['longitude', 'lon']:
-                                    lon_dim = dim
-                                    break
+                                # Find the longitude dimension name for this variable  
+                                lon_dim = None
+                                for dim in var_dims:
+                                    if dim in ['longitude', 'lon']:
+                                        lon_dim = dim
+                                        break
                             
-                            if lat_dim is None or lon_dim is None:
-                                logger.warning(f"Could not find lat/lon dimensions for {var_name}, dims: {var_dims}")
-                                continue
+                                if lat_dim is None or lon_dim is None:
+                                    logger.warning(f"Could not find lat/lon dimensions for {var_name}, dims: {var_dims}")
+                                    continue
                                 
-                            # Select data using the correct dimension names for this variable
-                            var_data = ds[var_name].sel({lat_dim: nearest_lat, lon_dim: nearest_lon}, method='nearest')
+                                # Select data using the correct dimension names for this variable
+                                var_data = ds[var_name].sel({lat_dim: nearest_lat, lon_dim: nearest_lon}, method='nearest')
                             
-                            # Handle time dimension - take the first/only time if present
-                            if 'time' in var_data.dims:
-                                var_data = var_data.isel(time=0)
+                                # Handle time dimension - take the first/only time if present
+                                if 'time' in var_data.dims:
+                                    var_data = var_data.isel(time=0)
                             
-                            # Handle depth/zlev dimension - take surface (first level) if present
-                            if 'zlev' in var_data.dims:
-                                var_data = var_data.isel(zlev=0)
-                            elif 'depth' in var_data.dims:
-                                var_data = var_data.isel(depth=0)
+                                # Handle depth/zlev dimension - take surface (first level) if present
+                                if 'zlev' in var_data.dims:
+                                    var_data = var_data.isel(zlev=0)
+                                elif 'depth' in var_data.dims:
+                                    var_data = var_data.isel(depth=0)
                             
-                            value = var_data.values
+                                value = var_data.values
                             
-                            # Handle numpy types
-                            if hasattr(value, 'item'):
-                                value = value.item()
+                                # Handle numpy types
+                                if hasattr(value, 'item'):
+                                    value = value.item()
                             
-                            # Get units and long_name if available
-                            units = ds[var_name].attrs.get('units', '')
-                            long_name = ds[var_name].attrs.get('long_name', var_name)
+                                # Get units and long_name if available
+                                units = ds[var_name].attrs.get('units', '')
+                                long_name = ds[var_name].attrs.get('long_name', var_name)
                             
-                            point_data[var_name] = {
-                                'value': float(value) if not np.isnan(value) else None,
-                                'units': units,
-                                'long_name': long_name,
-                                'valid': not np.isnan(value)
-                            }
-                        except Exception as e:
-                            logger.warning(f"Failed to extract {var_name}: {e}")
-                
-                # Calculate derived variables for currents data
-                if resolved_dataset == "currents":
-                    point_data = self._calculate_derived_currents_variables(point_data)
+                                point_data[var_name] = {
+                                    'value': float(value) if not np.isnan(value) else None,
+                                    'units': units,
+                                    'long_name': long_name,
+                                    'valid': not np.isnan(value)
+                                }
+                            except Exception as e:
+                                logger.warning(f"Failed to extract {var_name}: {e}")
+                
+                    # Calculate derived variables for currents data
+                    if resolved_dataset == "currents":
+                        point_data = self._calculate_derived_currents_variables(point_data)
+                    stages.lap("read")
                 
-                extraction_time = (time.time() - start_time) * 1000
-                logger.info(f"✅ Extracted {dataset} data in {extraction_time:.1f}ms")
+                    extraction_time = (time.time() - start_time) * 1000
+                    logger.debug("✅ Extracted %s data in %.1fms", dataset, extraction_time,
+                                 extra={"dataset": dataset, "file": file_path.name,
+                                        "extraction_ms": round(extraction_time, 1)})
                 
-                return PointDataResponse(
-                    dataset=dataset,
-                    location=Coordinates(lat=lat, lon=lon),
-                    actual_location=Coordinates(lat=float(nearest_lat), lon=float(nearest_lon)),
-                    date=date_str or "latest",
-                    data=point_data,
-                    extraction_time_ms=extraction_time,
-                    file_source=str(file_path.name)
-                )
+                    return PointDataResponse(
+                        dataset=dataset,
+                        location=Coordinates(lat=lat, lon=lon),
+                        actual_location=Coordinates(lat=float(nearest_lat), lon=float(nearest_lon)),
+                        date=date_str or "latest",
+                        data=point_data,
+                        extraction_time_ms=extraction_time,
+                        file_source=str(file_path.name)
+                    )
                 
         except Exception as e:
-            logger.error(f"Failed to extract data from {file_path}: {e}")
+            logger.error("Failed to extract data from %s: %s", file_path, e,
+                         extra={"dataset": dataset, "file": file_path.name})
             return PointDataResponse(
                 dataset=dataset,
                 location=Coordinates(lat=lat, lon=lon),
@@ -691,11 +814,9 @@ class DataExtractor:
     async def _extract_microplastics_optimized(self, file_path: Path, lat: float, lon: float, cache_date: str) -> PointDataResponse:
         """Optimized microplastics extraction with caching."""
         # Use legacy method for now but add caching
-        loop = asyncio.get_event_loop()
         start_time = time.time()
         
-        result = await loop.run_in_executor(
-            self.executor,
+        result = await self._run_in_executor(
             self._extract_microplastics_point_data,
             file_path, lat, lon, start_time
         )
@@ -719,11 +840,9 @@ class DataExtractor:
     async def _extract_discrete_optimized(self, dataset: str, file_path: Path, lat: float, lon: float, cache_date: str) -> PointDataResponse:
         """Optimized discrete sample extraction with caching."""
         # Use legacy method for now but add caching
-        loop = asyncio.get_event_loop()
         start_time = time.time()
         
-        result = await loop.run_in_executor(
-            self.executor,
+        result = await self._run_in_executor(
             self._extract_discrete_sample_data,
             dataset, file_path, lat, lon, start_time
         )
@@ -754,73 +873,75 @@ class DataExtractor:
             if dataset == "microplastics":
                 return self._extract_microplastics_point_data(file_path, lat, lon, start_time)
             
-            # Standard gridded data extraction with explicit resource management
-            try:
-                ds = xr.open_dataset(file_path)
-            except Exception as e:
-                logger.error(f"Failed to open NetCDF file {file_path}: {e}")
-                raise
+            # One extraction per file at a time; HDF5 calls also hold the library lock
+            with file_lock(file_path):
+                # Standard gridded data extraction with explicit resource management
+                try:
+                    ds = open_dataset(file_path)
+                except Exception as e:
+                    logger.error(f"Failed to open NetCDF file {file_path}: {e}")
+                    raise
                 
-            try:
-                # Determine coordinate names (different datasets use different names)
-                lat_coord = 'latitude' if 'latitude' in ds.coords else 'lat'
-                lon_coord = 'longitude' if 'longitude' in ds.coords else 'lon'
+                try:
+                    # Determine coordinate names (different datasets use different names)
+                    lat_coord = 'latitude' if 'latitude' in ds.coords else 'lat'
+                    lon_coord = 'longitude' if 'longitude' in ds.coords else 'lon'
                 
-                # Find nearest grid point
-                lat_idx = np.argmin(np.abs(ds[lat_coord].values - lat))
-                lon_idx = np.argmin(np.abs(ds[lon_coord].values - lon))
+                    # Find nearest grid point
+                    lat_idx = np.argmin(np.abs(ds[lat_coord].values - lat))
+                    lon_idx = np.argmin(np.abs(ds[lon_coord].values - lon))
                 
-                actual_lat = float(ds[lat_coord].values[lat_idx])
-                actual_lon = float(ds[lon_coord].values[lon_idx])
+                    actual_lat = float(ds[lat_coord].values[lat_idx])
+                    actual_lon = float(ds[lon_coord].values[lon_idx])
                 
-                # Extract data variables
-                data = {}
-                variables = self.dataset_config[dataset]["variables"]
+                    # Extract data variables
+                    data = {}
+                    variables = self.dataset_config[dataset]["variables"]
                 
-                for var_name in variables:
-                    if var_name in ds.data_vars:
-                        var_data = ds[var_name].isel({lat_coord: lat_idx, lon_coord: lon_idx})
+                    for var_name in variables:
+                        if var_name in ds.data_vars:
+                            var_data = ds[var_name].isel({lat_coord: lat_idx, lon_coord: lon_idx})
                         
-                        # Handle time dimension if present
-                        if 'time' in var_data.dims:
-                            var_data = var_data.isel(time=0)
+                            # Handle time dimension if present
+                            if 'time' in var_data.dims:
+                                var_data = var_data.isel(time=0)
                         
-                        # Handle depth dimension if present (take surface)
-                        if 'depth' in var_data.dims:
-                            var_data = var_data.isel(depth=0)
+                            # Handle depth dimension if present (take surface)
+                            if 'depth' in var_data.dims:
+                                var_data = var_data.isel(depth=0)
                         
-                        # Extract scalar value
-                        value = float(var_data.values.item() if var_data.values.ndim == 0 else var_data.values.flatten()[0])
+                            # Extract scalar value
+                            value = float(var_data.values.item() if var_data.values.ndim == 0 else var_data.values.flatten()[0])
                         
-                        # Create enhanced DataValue with educational context
-                        data[var_name] = self._create_enhanced_data_value(
-                            value=value,
-                            units=var_data.attrs.get("units", "unknown"),
-                            long_name=var_data.attrs.get("long_name", var_name),
-                            valid=not np.isnan(value),
-                            parameter_name=var_name,
-                            location=(lat, lon),
-                            date=self._get_data_date(ds, file_path)
-                        )
+                            # Create enhanced DataValue with educational context
+                            data[var_name] = self._create_enhanced_data_value(
+                                value=value,
+                                units=var_data.attrs.get("units", "unknown"),
+                                long_name=var_data.attrs.get("long_name", var_name),
+                                valid=not np.isnan(value),
+                                parameter_name=var_name,
+                                location=(lat, lon),
+                                date=self._get_data_date(ds, file_path)
+                            )
                 
-                # Get date from dataset or filename
-                data_date = self._get_data_date(ds, file_path)
+                    # Get date from dataset or filename
+                    data_date = self._get_data_date(ds, file_path)
                 
-                extraction_time = (time.time() - start_time) * 1000
+                    extraction_time = (time.time() - start_time) * 1000
                 
-                return PointDataResponse(
-                    dataset=dataset,
-                    location=Coordinates(lat=lat, lon=lon),
-                    actual_location=Coordinates(lat=actual_lat, lon=actual_lon),
-                    date=data_date,
-                    data=data,
-                    extraction_time_ms=round(extraction_time, 2),
-                    file_source=str(file_path)
-                )
-            finally:
-                # Always close the dataset
-                if ds is not None:
-                    ds.close()
+                    return PointDataResponse(
+                        dataset=dataset,
+                        location=Coordinates(lat=lat, lon=lon),
+                        actual_location=Coordinates(lat=actual_lat, lon=actual_lon),
+                        date=data_date,
+                        data=data,
+                        extraction_time_ms=round(extraction_time, 2),
+                        file_source=str(file_path)
+                    )
+                finally:
+                    # Always close the dataset
+                    if ds is not None:
+                        ds.close()
                 
         except Exception as e:
             logger.error(f"Error extracting data from {file_path}: {e}")
@@ -836,7 +957,7 @@ class DataExtractor:
         """Extract microplastics point data with nearest neighbor matching."""
         try:
             # Use decode_cf=False to handle corrupted data_source variable
-            with xr.open_dataset(file_path, decode_cf=False) as ds:
+            with open_netcdf(file_path, decode_cf=False) as ds:
                 # Get coordinate arrays
                 lats = ds['latitude'].values
                 lons = ds['longitude'].values
@@ -1001,7 +1122,7 @@ class DataExtractor:
     def _extract_discrete_sample_data(self, dataset: str, file_path: Path, lat: float, lon: float, start_time: float) -> PointDataResponse:
         """Extract discrete sample data (e.g., GLODAP pH data) with nearest neighbor matching."""
         try:
-            with xr.open_dataset(file_path) as ds:
+            with open_netcdf(file_path) as ds:
                 # GLODAP data uses 'obs' dimension for individual observations
                 if 'obs' not in ds.dims:
                     raise ValueError(f"Expected 'obs' dimension in discrete sample dataset {dataset}")
@@ -1099,13 +1220,13 @@ class DataExtractor:
             logger.error(f"Error extracting discrete sample data from {file_path}: {e}")
             raise
 
-    async def get_all_microplastics_points(self, 
-                                         min_concentration: Optional[float] = None,
-                                         data_source: Optional[str] = None,
-                                         year_min: Optional[int] = None,
-                                         year_max: Optional[int] = None,
-                                         spatial_bounds: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get all microplastics measurement points for visualization."""
+    async def get_microplastics_points_payload(self, 
+                                              min_concentration: Optional[float] = None,
+                                              data_source: Optional[str] = None,
+                                              year_min: Optional[int] = None,
+                                              year_max: Optional[int] = None,
+                                              spatial_bounds: Optional[Dict] = None) -> bytes:
+        """Get all microplastics measurement points for visualization, as serialized GeoJSON."""
         logger.info("Fetching all microplastics points for visualization overlay")
         
         # Find microplastics file
@@ -1113,13 +1234,69 @@ class DataExtractor:
         if not file_path:
             raise ValueError("Microplastics dataset not found")
         
-        # Load data in thread pool
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            self.executor,
-            self._get_microplastics_points_sync,
-            file_path, min_concentration, data_source, year_min, year_max, spatial_bounds
+        # A filter combination of one file version always yields the same collection
+        bounds_key = tuple(sorted(spatial_bounds.items())) if spatial_bounds else None
+        payload_key = (str(file_path), file_path.stat().st_mtime_ns,
+                       min_concentration, data_source, year_min, year_max, bounds_key)
+        body = self.microplastics_payloads.lookup(payload_key)
+        if body is not None:
+            return body
+        
+        # Identical filter combinations in flight share one load; serialize in the thread pool too
+        body = await self.microplastics_flights.run_async(
+            payload_key,
+            lambda: self._run_in_executor(
+                lambda: dumps(self._get_microplastics_points_sync(
+                    file_path, min_concentration, data_source, year_min, year_max, spatial_bounds
+                ))
+            )
         )
+        self.microplastics_payloads.put(payload_key, body)
+        return body
+    
+    def _run_in_executor(self, func, *args) -> asyncio.Future:
+        """Run func(*args) on the extraction executor, counting it as queued until a worker starts it."""
+        started = threading.Event()
+        
+        def task():
+            with self._executor_lock:
+                self._executor_counts["queued"] -= 1
+                self._executor_counts["running"] += 1
+            started.set()
+            try:
+                return func(*args)
+            finally:
+                with self._executor_lock:
+                    self._executor_counts["running"] -= 1
+        
+        def cancelled(future):
+            # A task cancelled before a worker picked it up never runs task()
+            if future.cancelled() and not started.is_set():
+                with self._executor_lock:
+                    self._executor_counts["queued"] -= 1
+        
+        with self._executor_lock:
+            self._executor_counts["queued"] += 1
+        try:
+            future = self.executor.submit(task)
+        except RuntimeError:
+            with self._executor_lock:
+                self._executor_counts["queued"] -= 1
+            raise
+        future.add_done_callback(cancelled)
+        return asyncio.wrap_future(future)
+    
+    def get_executor_stats(self) -> Dict[str, int]:
+        """Extraction executor tasks waiting for a worker and running."""
+        with self._executor_lock:
+            return {**self._executor_counts, "workers": self.executor_workers}
+    
+    def get_coalescing_stats(self) -> Dict[str, Any]:
+        """Counters for work deduplicated by the single-flight groups."""
+        return {
+            "point_extraction": self.point_flights.get_stats(),
+            "microplastics_points": self.microplastics_flights.get_stats()
+        }
     
     def _get_microplastics_points_sync(self, 
                                       file_path: Path,
@@ -1130,7 +1307,7 @@ class DataExtractor:
                                       spatial_bounds: Optional[Dict]) -> Dict[str, Any]:
         """Synchronously extract all microplastics points."""
         try:
-            with xr.open_dataset(file_path) as ds:
+            with open_netcdf(file_path) as ds:
                 # Extract arrays
                 lats = ds['latitude'].values
                 lons = ds['longitude'].values
@@ -1254,7 +1431,7 @@ class DataExtractor:
         Simple, direct file path construction - no scanning, no fallbacks.
         Since all data is available, we use predictable file paths.
         """
-        base_path = Path(__file__).parent.parent.parent.parent / "ocean-data" / "processed" / "unified_coords"
+        base_path = self.data_path
         
         # Handle latest date requests by using today's date
         if not date_str or date_str == "latest":
@@ -1288,16 +1465,16 @@ class DataExtractor:
         file_path = base_path / file_patterns[dataset]
         
         if file_path.exists():
-            logger.info(f"✅ Found file: {file_path}")
+            logger.debug("✅ Found file: %s", file_path)
             return file_path
         else:
-            logger.warning(f"❌ File not found: {file_path}")
+            logger.debug("❌ File not found: %s", file_path)
             return None
     
     def _validate_dataset_file(self, file_path: Path) -> bool:
         """Validate that a dataset file has proper coordinates and variables."""
         try:
-            with xr.open_dataset(file_path) as ds:
+            with open_netcdf(file_path) as ds:
                 # Check that file has coordinates and variables
                 if len(ds.coords) == 0 or len(ds.data_vars) == 0:
                     logger.warning(f"Corrupted file detected (no coords/vars): {file_path.name}")
@@ -1320,18 +1497,18 @@ class DataExtractor:
     def extract_multi_point_data(self, datasets: List[str], lat: float, lon: float, date_str: Optional[str] = None) -> MultiDatasetResponse:
         """Simple multi-dataset extraction - no async, no timeouts, no parallel complexity."""
         start_time = time.time()
-        logger.info(f"🔄 Simple multi-dataset extraction for {datasets} at ({lat}, {lon})")
+        logger.debug("🔄 Simple multi-dataset extraction for %s at (%s, %s)", datasets, lat, lon)
         
         # Extract data from each dataset sequentially
         dataset_data = {}
         for dataset in datasets:
             try:
-                logger.info(f"📊 Extracting {dataset}")
+                logger.debug("📊 Extracting %s", dataset)
                 result = self.extract_point_data(dataset, lat, lon, date_str)
                 dataset_data[dataset] = result
-                logger.info(f"✅ Successfully extracted data for {dataset}")
+                logger.debug("✅ Successfully extracted data for %s", dataset)
             except Exception as e:
-                logger.error(f"❌ Error extracting data for {dataset}: {e}")
+                logger.error("❌ Error extracting data for %s: %s", dataset, e, extra={"dataset": dataset})
                 dataset_data[dataset] = {
                     "error": str(e),
                     "dataset": dataset
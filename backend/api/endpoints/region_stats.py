@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Region Statistics Module
+
+Bounding-box aggregation over harmonized gridded datasets. Surface grids are
+held in memory (LRU, byte-bounded) after the first request, and the cos(lat)
+area weights and ocean masks are computed once per grid, so a regional
+dashboard gets mean/min/max/percentiles in one call instead of thousands of
+point requests.
+"""
+
+import time
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from api.models.responses import RegionStatsResponse, RegionVariableStats
+from api.single_flight import SingleFlight
+from utils.area_weighting import latitude_weights, parse_stats, surface_field, weighted_stats
+from utils.netcdf_access import open_netcdf
+from utils.parameter_interpreter import parameter_interpreter
+
+logger = logging.getLogger(__name__)
+
+# Grid signature: (lat size, lon size, first/last lat, first/last lon)
+GridKey = Tuple[int, int, float, float, float, float]
+
+# Variable whose valid cells define a dataset's ocean (defined over all open water, unlike e.g. ice)
+OCEAN_MASK_VARIABLES = {
+    "sst": "sst",
+    "currents": "uo",
+    "acidity_current": "ph",
+    "acidity_historical": "o2",
+}
+
+
+@dataclass
+class SurfaceField:
+    """A variable's surface layer loaded as a (lat, lon) array."""
+    values: np.ndarray
+    lats: np.ndarray
+    lons: np.ndarray
+    units: str
+    long_name: str
+
+    @property
+    def grid_key(self) -> GridKey:
+        return (self.lats.size, self.lons.size, float(self.lats[0]), float(self.lats[-1]),
+                float(self.lons[0]), float(self.lons[-1]))
+
+
+def parse_bbox(bbox: str) -> Tuple[float, float, float, float]:
+    """
+    Parse 'minLon,minLat,maxLon,maxLat' (minLon > maxLon crosses the antimeridian).
+
+    Raises:
+        ValueError: If the string is malformed or out of range
+    """
+    parts = bbox.split(',')
+    if len(parts) != 4:
+        raise ValueError("Invalid bbox format. Use: minLon,minLat,maxLon,maxLat")
+    min_lon, min_lat, max_lon, max_lat = (float(part) for part in parts)
+    if not (-90 <= min_lat <= max_lat <= 90):
+        raise ValueError("bbox latitudes must satisfy -90 <= minLat <= maxLat <= 90")
+    if not (-180 <= min_lon <= 180 and -180 <= max_lon <= 180):
+        raise ValueError("bbox longitudes must be within [-180, 180]")
+    return min_lon, min_lat, max_lon, max_lat
+
+
+def lon_mask(lons: np.ndarray, min_lon: float, max_lon: float) -> np.ndarray:
+    """
+    Longitude selection of a parsed bbox in the grid's own convention (-180..180 or 0..360).
+
+    A box spanning 360 degrees selects every longitude: on a 0..360 grid both
+    of its edges would otherwise wrap onto the same meridian.
+    """
+    if max_lon - min_lon >= 360:
+        return np.ones(lons.shape, dtype=bool)
+    if lons.max() > 180:
+        min_lon, max_lon = min_lon % 360, max_lon % 360
+    if min_lon <= max_lon:
+        return (lons >= min_lon) & (lons <= max_lon)
+    return (lons >= min_lon) | (lons <= max_lon)
+
+
+class RegionStatsService:
+    """Area-weighted bounding-box statistics on cached in-memory grids."""
+
+    def __init__(self, data_extractor, max_cache_bytes: int = 512 * 1024 * 1024):
+        """
+        Initialize the region statistics service.
+
+        Args:
+            data_extractor: DataExtractor used for dataset resolution and file lookup
+            max_cache_bytes: Memory budget for cached surface grids
+        """
+        self.data_extractor = data_extractor
+        self.max_cache_bytes = max_cache_bytes
+        self._fields: "OrderedDict[Tuple[str, int, str], SurfaceField]" = OrderedDict()
+        self._cache_bytes = 0
+        self._weights: Dict[GridKey, np.ndarray] = {}
+        self._ocean_masks: Dict[Tuple[str, GridKey, str], np.ndarray] = {}
+        self._lock = threading.Lock()
+        self.load_flights = SingleFlight("region_grid_load")
+
+    def region_stats(self, dataset: str, bbox: str, date_str: Optional[str] = None,
+                     stats: str = "mean,min,max", variables: Optional[str] = None) -> RegionStatsResponse:
+        """
+        Aggregate a dataset over a bounding box.
+
+        Args:
+            dataset: Dataset name (acidity is routed by date like point queries)
+            bbox: 'minLon,minLat,maxLon,maxLat'
+            date_str: Date in YYYY-MM-DD format (latest available if not specified)
+            stats: Comma-separated statistics (mean, min, max, std, median, count, pNN)
+            variables: Comma-separated variables (all configured surface variables if not specified)
+
+        Raises:
+            ValueError: Invalid parameters or non-gridded dataset
+            FileNotFoundError: No data file for the dataset/date
+        """
+        start_time = time.time()
+        stat_names = parse_stats(stats)
+        min_lon, min_lat, max_lon, max_lat = parse_bbox(bbox)
+
+        if dataset == "microplastics":
+            raise ValueError("Region statistics need a gridded dataset; microplastics is point data")
+        resolved_dataset = self.data_extractor._resolve_acidity_dataset(dataset, date_str)
+        config = self.data_extractor.dataset_config.get(resolved_dataset)
+        if config is None:
+            raise ValueError(f"Unknown dataset: {dataset}")
+
+        if not date_str:
+            availability = self.data_extractor.availability_index.get(resolved_dataset)
+            if not availability.dates:
+                raise FileNotFoundError(f"No data available for {dataset}")
+            date_str = availability.dates[-1]
+
+        file_path = self.data_extractor._find_dataset_file(resolved_dataset, date_str)
+        if not file_path:
+            raise FileNotFoundError(f"No data file for {dataset} on {date_str}")
+
+        requested = [name.strip() for name in variables.split(',')] if variables else config["variables"]
+        fields = self._load_fields(file_path, requested, strict=bool(variables))
+        if not fields:
+            raise ValueError(f"No gridded surface variables found for {dataset}")
+
+        reference_name, reference = next(iter(fields.items()))
+        lat_mask = (reference.lats >= min_lat) & (reference.lats <= max_lat)
+        lon_selection = lon_mask(reference.lons, min_lon, max_lon)
+        lat_idx, lon_idx = np.nonzero(lat_mask)[0], np.nonzero(lon_selection)[0]
+        if lat_idx.size == 0 or lon_idx.size == 0:
+            raise ValueError("Bounding box contains no grid cells")
+
+        region = np.ix_(lat_idx, lon_idx)
+        weights = self._grid_weights(reference)[lat_idx][:, np.newaxis]
+        ocean = self._ocean_mask(resolved_dataset, file_path, reference_name, reference)[region]
+        ocean_cells = int(ocean.sum())
+
+        variable_stats = {}
+        for var_name, field in fields.items():
+            if field.grid_key != reference.grid_key:
+                logger.warning(f"Skipping {var_name}: grid differs from {reference_name}")
+                continue
+            values = field.values[region]
+            finite = np.isfinite(values)
+            valid_ocean_cells = int((finite & ocean).sum())
+            variable_stats[var_name] = RegionVariableStats(
+                units=field.units,
+                long_name=field.long_name,
+                stats=weighted_stats(values, weights, stat_names),
+                valid_cells=int(finite.sum()),
+                coverage_percent=round(100.0 * valid_ocean_cells / ocean_cells, 2) if ocean_cells else 0.0,
+                classifications=parameter_interpreter.classification_breakdown(var_name, values, weights)
+            )
+
+        region_lats = reference.lats[lat_idx]
+        region_lons = reference.lons[lon_idx]
+        west_lon, east_lon = self._lon_extent(region_lons, min_lon, max_lon)
+        return RegionStatsResponse(
+            dataset=dataset,
+            date=date_str,
+            requested_bounds={"min_lon": min_lon, "min_lat": min_lat, "max_lon": max_lon, "max_lat": max_lat},
+            actual_bounds={
+                "min_lon": west_lon, "min_lat": float(region_lats.min()),
+                "max_lon": east_lon, "max_lat": float(region_lats.max())
+            },
+            grid_cells=int(lat_idx.size * lon_idx.size),
+            ocean_cells=ocean_cells,
+            variables=variable_stats,
+            extraction_time_ms=round((time.time() - start_time) * 1000, 2),
+            file_source=file_path.name
+        )
+
+    @staticmethod
+    def _lon_extent(region_lons: np.ndarray, min_lon: float, max_lon: float) -> Tuple[float, float]:
+        """Western and eastern edge of the selected cells (west > east across the antimeridian)."""
+        lons = np.where(region_lons > 180, region_lons - 360, region_lons)
+        if min_lon <= max_lon:
+            return float(lons.min()), float(lons.max())
+        western, eastern = lons[lons >= min_lon], lons[lons <= max_lon]
+        return (float(western.min()) if western.size else float(eastern.min()),
+                float(eastern.max()) if eastern.size else float(western.max()))
+
+    def _grid_weights(self, field: SurfaceField) -> np.ndarray:
+        """cos(lat) weights per row, computed once per grid."""
+        key = field.grid_key
+        weights = self._weights.get(key)
+        if weights is None:
+            weights = latitude_weights(field.lats)
+            with self._lock:
+                self._weights[key] = weights
+        return weights
+
+    def _ocean_mask(self, dataset: str, file_path: Path, var_name: str, field: SurfaceField) -> np.ndarray:
+        """
+        Ocean cells of a dataset's grid, computed once per grid.
+
+        Valid cells of the dataset's OCEAN_MASK_VARIABLES entry are ocean, so
+        coverage does not depend on which variable was requested first (an
+        ice field is NaN over most of the ocean). Without that variable on the
+        grid, the requested variable's own valid cells are used, cached per variable.
+        """
+        mask_var = OCEAN_MASK_VARIABLES.get(dataset)
+        for key in ((dataset, field.grid_key, mask_var), (dataset, field.grid_key, var_name)):
+            mask = self._ocean_masks.get(key)
+            if mask is not None:
+                return mask
+
+        source = self._load_fields(file_path, [mask_var], strict=False).get(mask_var) if mask_var else None
+        if source is not None and source.grid_key == field.grid_key:
+            key, mask = (dataset, field.grid_key, mask_var), np.isfinite(source.values)
+        else:
+            key, mask = (dataset, field.grid_key, var_name), np.isfinite(field.values)
+        with self._lock:
+            self._ocean_masks[key] = mask
+        return mask
+
+    def _load_fields(self, file_path: Path, variables: List[str], strict: bool) -> Dict[str, SurfaceField]:
+        """Surface fields for the requested variables, from memory when cached."""
+        mtime_ns = file_path.stat().st_mtime_ns
+        fields: Dict[str, SurfaceField] = {}
+        missing = []
+        with self._lock:
+            for var_name in variables:
+                key = (str(file_path), mtime_ns, var_name)
+                field = self._fields.get(key)
+                if field is not None:
+                    self._fields.move_to_end(key)
+                    fields[var_name] = field
+                else:
+                    missing.append(var_name)
+
+        if missing:
+            # Concurrent requests for the same file and variables share one read
+            loaded = self.load_flights.run(
+                (str(file_path), mtime_ns, tuple(missing)),
+                lambda: self._read_fields(file_path, missing)
+            )
+            absent = [name for name in missing if name not in loaded]
+            if strict and absent:
+                raise ValueError(f"Variables not available as surface grids: {', '.join(absent)}")
+            with self._lock:
+                for var_name, field in loaded.items():
+                    key = (str(file_path), mtime_ns, var_name)
+                    if key not in self._fields:
+                        self._fields[key] = field
+                        self._cache_bytes += field.values.nbytes
+                self._evict()
+            fields.update(loaded)
+
+        # Keep the caller's variable order
+        return {name: fields[name] for name in variables if name in fields}
+
+    def _evict(self):
+        """Drop least recently used grids beyond the memory budget (lock held)."""
+        while self._cache_bytes > self.max_cache_bytes and len(self._fields) > 1:
+            _, field = self._fields.popitem(last=False)
+            self._cache_bytes -= field.values.nbytes
+
+    @staticmethod
+    def _read_fields(file_path: Path, variables: List[str]) -> Dict[str, SurfaceField]:
+        """Read the surface (first time/depth) layer of each variable as float32."""
+        fields = {}
+        logger.info(f"📂 Loading surface grids from {file_path.name}: {variables}")
+        with open_netcdf(file_path) as ds:
+            for var_name in variables:
+                layer = surface_field(ds, var_name)
+                if layer is None:
+                    continue
+                lat_dim, lon_dim = layer.dims
+                fields[var_name] = SurfaceField(
+                    values=layer.values.astype(np.float32),
+                    lats=ds[lat_dim].values.astype(np.float64),
+                    lons=ds[lon_dim].values.astype(np.float64),
+                    units=layer.attrs.get('units', ''),
+                    long_name=layer.attrs.get('long_name', var_name)
+                )
+        return fields
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Cached grid count and memory use."""
+        with self._lock:
+            return {
+                "cached_fields": len(self._fields),
+                "cache_bytes": self._cache_bytes,
+                "weight_grids": len(self._weights),
+                "ocean_masks": len(self._ocean_masks)
+            }
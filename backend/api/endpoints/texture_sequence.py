@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Texture Sequence Module
+
+Serves runs of consecutive texture frames for animation playback in a few
+requests instead of one per frame. Frames are chosen from the in-memory
+texture index (no directory scans) and delivered as:
+- manifest: JSON frame list with sprite-sheet pages and their layout
+- sprite: one page of frames packed into a single PNG grid
+- multipart: the manifest followed by every frame PNG in one multipart/mixed stream
+"""
+
+import io
+import json
+import math
+import logging
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import date, timedelta
+from typing import Any, Dict, Iterator, List, Tuple
+
+from api.single_flight import SingleFlight
+from utils.lazy_imports import lazy_import
+
+Image = lazy_import("PIL.Image")
+
+logger = logging.getLogger(__name__)
+
+# Response header carrying a sprite sheet's layout
+SEQUENCE_HEADERS = ["X-Sprite-Layout"]
+
+# Frames per sprite-sheet page and the largest sheet edge (a common WebGL MAX_TEXTURE_SIZE)
+FRAMES_PER_PAGE = 100
+MAX_SHEET_SIZE = 8192
+MAX_SEQUENCE_FRAMES = 1000
+
+
+class TextureSequenceService:
+    """Animation frame sequences built from the texture index."""
+
+    def __init__(self, texture_service, max_cached_sheets: int = 16):
+        """
+        Initialize the sequence service.
+
+        Args:
+            texture_service: TextureService whose index and resolution preferences are used
+            max_cached_sheets: Sprite-sheet PNGs kept in memory
+        """
+        self.texture_service = texture_service
+        self.max_cached_sheets = max_cached_sheets
+        self._sheets: "OrderedDict[Tuple, Tuple[bytes, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.sheet_flights = SingleFlight("sprite_sheet")
+
+    def select_frames(self, category: str, start: str, end: str, step: int = 1,
+                      resolution: str = "medium") -> List[Dict[str, Any]]:
+        """
+        Available frames from start to end, at most one per step days.
+
+        Each step window takes its first available date, so gaps in the
+        archive shift frames instead of dropping them.
+
+        Raises:
+            ValueError: Invalid category, dates or step
+        """
+        if category not in self.texture_service.supported_categories:
+            raise ValueError(f"Unsupported category: {category}")
+        if step < 1:
+            raise ValueError("step must be at least 1 day")
+        start_date, end_date = date.fromisoformat(start), date.fromisoformat(end)
+        if end_date < start_date:
+            raise ValueError("end must not be before start")
+
+        available = self.texture_service.texture_index.get(category)
+        frames = []
+        next_date = start_date
+        for date_str, resolutions in available.items():
+            current = date.fromisoformat(date_str)
+            if current < next_date:
+                continue
+            if current > end_date:
+                break
+            path = self.texture_service._pick_resolution(category, resolutions, resolution, strict=False)
+            if path is None:
+                continue
+            frames.append({
+                "index": len(frames),
+                "date": date_str,
+                "resolution": next(name for name, candidate in resolutions.items() if candidate == path),
+                "path": path
+            })
+            if len(frames) > MAX_SEQUENCE_FRAMES:
+                raise ValueError(f"Sequence has more than {MAX_SEQUENCE_FRAMES} frames; use a larger step")
+            next_date = current + timedelta(days=step)
+        return frames
+
+    def manifest(self, category: str, start: str, end: str, step: int = 1,
+                 resolution: str = "medium") -> Dict[str, Any]:
+        """Frame list plus the sprite-sheet pages that cover it."""
+        frames = self.select_frames(category, start, end, step, resolution)
+        return self._manifest(category, start, end, step, resolution, frames)
+
+    @staticmethod
+    def _manifest(category: str, start: str, end: str, step: int, resolution: str,
+                  frames: List[Dict[str, Any]]) -> Dict[str, Any]:
+        pages = []
+        for page in range(math.ceil(len(frames) / FRAMES_PER_PAGE)):
+            page_frames = frames[page * FRAMES_PER_PAGE:(page + 1) * FRAMES_PER_PAGE]
+            pages.append({
+                "page": page,
+                "first_frame": page_frames[0]["index"],
+                "frame_count": len(page_frames),
+                "url": (f"/textures/{category}/sequence?start={start}&end={end}&step={step}"
+                        f"&resolution={resolution}&format=sprite&page={page}")
+            })
+        return {
+            "category": category,
+            "start": start,
+            "end": end,
+            "step_days": step,
+            "frame_count": len(frames),
+            "frames": [
+                {
+                    "index": frame["index"],
+                    "date": frame["date"],
+                    "resolution": frame["resolution"],
+                    "url": f"/textures/{category}?date={frame['date']}&resolution={frame['resolution']}",
+                    "size": frame["path"].stat().st_size
+                }
+                for frame in frames
+            ],
+            "sprite_pages": pages
+        }
+
+    def sprite_sheet(self, category: str, start: str, end: str, step: int = 1,
+                     resolution: str = "medium", page: int = 0) -> Tuple[bytes, Dict[str, Any]]:
+        """
+        One page of frames packed row-major into a PNG grid.
+
+        Frames are downscaled uniformly when needed so the sheet fits MAX_SHEET_SIZE.
+
+        Returns:
+            (png bytes, layout with columns, rows, frame size and frame dates)
+
+        Raises:
+            ValueError: Invalid parameters or page out of range
+        """
+        frames = self.select_frames(category, start, end, step, resolution)
+        page_frames = frames[page * FRAMES_PER_PAGE:(page + 1) * FRAMES_PER_PAGE]
+        if page < 0 or not page_frames:
+            raise ValueError(f"Page {page} is out of range ({math.ceil(len(frames) / FRAMES_PER_PAGE)} pages)")
+
+        key = tuple((str(frame["path"]), frame["path"].stat().st_mtime_ns) for frame in page_frames)
+        with self._lock:
+            cached = self._sheets.get(key)
+            if cached is not None:
+                self._sheets.move_to_end(key)
+                return cached
+
+        sheet = self.sheet_flights.run(key, lambda: self._compose(page_frames))
+        with self._lock:
+            self._sheets[key] = sheet
+            while len(self._sheets) > self.max_cached_sheets:
+                self._sheets.popitem(last=False)
+        return sheet
+
+    @staticmethod
+    def _compose(frames: List[Dict[str, Any]]) -> Tuple[bytes, Dict[str, Any]]:
+        """Paste frames into a grid sheet."""
+        with Image.open(frames[0]["path"]) as first:
+            source_width, source_height = first.size
+        columns = math.ceil(math.sqrt(len(frames)))
+        rows = math.ceil(len(frames) / columns)
+        scale = min(1.0, MAX_SHEET_SIZE / (columns * source_width), MAX_SHEET_SIZE / (rows * source_height))
+        frame_width = max(1, int(source_width * scale))
+        frame_height = max(1, int(source_height * scale))
+
+        sheet = Image.new("RGBA", (columns * frame_width, rows * frame_height), (0, 0, 0, 0))
+        for i, frame in enumerate(frames):
+            with Image.open(frame["path"]) as image:
+                image = image.convert("RGBA")
+                if image.size != (frame_width, frame_height):
+                    image = image.resize((frame_width, frame_height), Image.BILINEAR)
+                sheet.paste(image, ((i % columns) * frame_width, (i // columns) * frame_height))
+
+        buffer = io.BytesIO()
+        sheet.save(buffer, "PNG")
+        layout = {
+            "columns": columns,
+            "rows": rows,
+            "frame_width": frame_width,
+            "frame_height": frame_height,
+            "dates": [frame["date"] for frame in frames]
+        }
+        logger.info(f"🎞️ Packed {len(frames)} frames into a {sheet.size[0]}x{sheet.size[1]} sprite sheet")
+        return buffer.getvalue(), layout
+
+    def multipart_stream(self, manifest: Dict[str, Any], frames: List[Dict[str, Any]],
+                         boundary: str) -> Iterator[bytes]:
+        """multipart/mixed body: the manifest as JSON, then each frame PNG in order."""
+        yield (f"--{boundary}\r\nContent-Type: application/json\r\n\r\n"
+               f"{json.dumps(manifest)}\r\n").encode()
+        for frame in frames:
+            body = frame["path"].read_bytes()
+            yield (f"--{boundary}\r\nContent-Type: image/png\r\nContent-Length: {len(body)}\r\n"
+                   f"X-Frame-Index: {frame['index']}\r\nX-Frame-Date: {frame['date']}\r\n\r\n").encode()
+            yield body
+            yield b"\r\n"
+        yield f"--{boundary}--\r\n".encode()
+
+    def multipart(self, category: str, start: str, end: str, step: int = 1,
+                  resolution: str = "medium") -> Tuple[Iterator[bytes], str]:
+        """
+        Streamed multipart response of a whole sequence.
+
+        Returns:
+            (body iterator, content type with boundary)
+        """
+        frames = self.select_frames(category, start, end, step, resolution)
+        manifest = self._manifest(category, start, end, step, resolution, frames)
+        boundary = f"frames-{uuid.uuid4().hex}"
+        return self.multipart_stream(manifest, frames, boundary), f"multipart/mixed; boundary={boundary}"
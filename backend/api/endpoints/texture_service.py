@@ -8,22 +8,142 @@ Serves texture files from the ocean-data/textures directory via API endpoints.
 
 import os
 import json
+import time
+import threading
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from fastapi import HTTPException
 from fastapi.responses import FileResponse
 import logging
 
+from api.json_response import dumps, payload_etag
+from api.middleware.compression import precompressed
+from api.single_flight import SingleFlight
+from utils.file_catalog import FileCatalog, default_data_root, get_file_catalog
+from utils.lazy_imports import deferred
+
 logger = logging.getLogger(__name__)
 
+CATALOG_STAGE = "textures"
+
+# Seconds between checks of a category's directory mtimes for files the catalog was not told about
+DIRECTORY_CHECK_INTERVAL = 5.0
+
+
+def parse_texture_filename(category: str, filename: str) -> Optional[Tuple[str, str]]:
+    """
+    Date (YYYY-MM-DD) and resolution encoded in a texture filename.
+    
+    Expected formats:
+    - Legacy: {category}_texture_YYYYMMDD_{resolution}.png
+    - ERDDAP: SST_YYYYMMDD.png (ultra resolution)
+    """
+    parts = Path(filename).stem.split('_')
+    if category == "sst" and len(parts) == 2 and parts[0].upper() == "SST":
+        date_str, resolution = parts[1], "ultra"
+    elif len(parts) >= 4:
+        date_str, resolution = parts[2], parts[3]
+    else:
+        return None
+    if len(date_str) != 8 or not date_str.isdigit():
+        return None
+    return f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}", resolution
+
+
+class TextureIndex:
+    """
+    In-memory category -> date -> resolution -> path index of texture files.
+    
+    Built from the file catalog and rebuilt per category only when the
+    catalog's generation counter for it moves (a texture was written or removed).
+    Textures copied in without the catalog (rsync, manual regeneration) change
+    the mtime of their directory; when a category's directory mtimes move, that
+    directory is reconciled into the catalog, which bumps the generation.
+    """
+    
+    def __init__(self, file_catalog: FileCatalog, categories: List[str], texture_base_path: Path):
+        self.file_catalog = file_catalog
+        self.categories = categories
+        self.texture_base_path = texture_base_path
+        self._textures: Dict[str, Dict[str, Dict[str, Path]]] = {}
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        # Category -> directory mtimes at the last reconcile, and when they were last checked
+        self._directory_states: Dict[str, Tuple] = {}
+        self._directory_checked: Dict[str, float] = {}
+        self._reconcile_lock = threading.Lock()
+    
+    def _directory_state(self, category: str) -> Tuple:
+        """mtimes of a category directory and its subdirectories (a file added or removed moves its directory's)."""
+        directory = self.texture_base_path / category
+        try:
+            state = [("", directory.stat().st_mtime_ns)]
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        state.append((entry.name, entry.stat().st_mtime_ns))
+        except OSError:
+            return ()
+        return tuple(sorted(state))
+    
+    def _check_directory(self, category: str):
+        """Reconcile a category with the filesystem if its directories changed outside the catalog."""
+        now = time.monotonic()
+        if now - self._directory_checked.get(category, float("-inf")) < DIRECTORY_CHECK_INTERVAL:
+            return
+        with self._reconcile_lock:
+            if now - self._directory_checked.get(category, float("-inf")) < DIRECTORY_CHECK_INTERVAL:
+                return
+            state = self._directory_state(category)
+            if state and state != self._directory_states.get(category):
+                stats = self.file_catalog.rebuild(self.texture_base_path / category)
+                if stats["added"] or stats["updated"] or stats["removed"]:
+                    logger.info(f"🖼️ Picked up texture changes made outside the catalog for {category}: {stats}")
+            self._directory_states[category] = state
+            self._directory_checked[category] = time.monotonic()
+    
+    def refresh(self):
+        """Pick up textures changed outside the catalog in any category (see get)."""
+        for category in self.categories:
+            self._check_directory(category)
+    
+    def get(self, category: str) -> Dict[str, Dict[str, Path]]:
+        """Textures of a category by date and resolution (dates in ascending order)."""
+        self._check_directory(category)
+        generation = self.file_catalog.generations(CATALOG_STAGE).get(category, 0)
+        if category in self._textures and self._generations.get(category) == generation:
+            return self._textures[category]
+        
+        with self._lock:
+            if category in self._textures and self._generations.get(category) == generation:
+                return self._textures[category]
+            textures: Dict[str, Dict[str, Path]] = {}
+            for entry in self.file_catalog.entries(CATALOG_STAGE, category, "*.png"):
+                parsed = parse_texture_filename(category, entry.path.name)
+                if parsed is None:
+                    continue
+                date_str, resolution = parsed
+                # Year subdirectories win over flat duplicates, as in the original lookup order
+                existing = textures.setdefault(date_str, {}).get(resolution)
+                if existing is None or len(entry.path.parts) > len(existing.parts):
+                    textures[date_str][resolution] = entry.path
+            self._textures[category] = dict(sorted(textures.items()))
+            self._generations[category] = generation
+            logger.info(f"🖼️ Texture index for {category}: {len(textures)} dates")
+            return self._textures[category]
+
 class TextureService:
     """Service for managing and serving ocean data textures."""
     
-    def __init__(self, texture_base_path: str = "../ocean-data/textures"):
-        """Initialize texture service with base path to textures directory."""
+    def __init__(self, texture_base_path: Optional[str] = None):
+        """Initialize texture service with base path to textures directory (default: <ocean-data root>/textures)."""
         # Resolve the path relative to the backend directory
         backend_dir = Path(__file__).parent.parent.parent  # Go up from api/endpoints/ to backend/
-        self.texture_base_path = (backend_dir / texture_base_path).resolve()
+        if texture_base_path is None:
+            self.texture_base_path = default_data_root() / "textures"
+        else:
+            self.texture_base_path = (backend_dir / texture_base_path).resolve()
         self.supported_categories = ["sst"]
         self.supported_resolutions = ["preview", "low", "medium", "high", "ultra"]
         
@@ -33,6 +153,17 @@ class TextureService:
             logger.info(f"Current working directory: {Path.cwd()}")
             logger.info(f"Backend directory: {backend_dir}")
             raise ValueError(f"Texture directory not found: {self.texture_base_path}")
+        
+        # Texture files by date and resolution, kept in step with the file catalog
+        self.texture_index = TextureIndex(
+            get_file_catalog(self.texture_base_path.parent), self.supported_categories, self.texture_base_path
+        )
+        
+        # Concurrent lookups for the same texture share one index search
+        self.lookup_flights = SingleFlight("texture_lookup")
+        
+        # Serialized metadata body, kept until a texture is written or removed
+        self._metadata_payload: Optional[Tuple[Tuple, str, bytes]] = None
     
     def get_available_textures(self) -> Dict[str, Dict[str, List[str]]]:
         """
@@ -41,69 +172,13 @@ class TextureService:
         Returns:
             Dict with structure: {category: {date: [resolutions]}}
         """
-        available = {}
-        
-        for category in self.supported_categories:
-            category_path = self.texture_base_path / category
-            available[category] = {}
-            
-            if category_path.exists():
-                logger.info(f"Scanning texture directory: {category_path}")
-                
-                # Scan for texture files recursively (handles year subdirectories)
-                texture_files = list(category_path.rglob("*.png"))
-                logger.info(f"Found {len(texture_files)} texture files for category {category}")
-                
-                for texture_file in texture_files:
-                    # Extract date and resolution from filename
-                    # Expected formats: 
-                    # - Legacy: {category}_texture_YYYYMMDD_{resolution}.png
-                    # - New ERDDAP: SST_YYYYMMDD.png
-                    filename = texture_file.stem
-                    parts = filename.split('_')
-                    
-                    logger.debug(f"Processing texture file: {texture_file} (parts: {parts})")
-                    
-                    # Handle new ERDDAP format (SST_YYYYMMDD)
-                    if category == "sst" and len(parts) == 2 and parts[0].upper() == "SST":
-                        try:
-                            date_str = parts[1]  # YYYYMMDD
-                            if len(date_str) == 8 and date_str.isdigit():
-                                formatted_date = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
-                                
-                                if formatted_date not in available[category]:
-                                    available[category][formatted_date] = []
-                                
-                                # ERDDAP textures are ultra-high resolution
-                                if "ultra" not in available[category][formatted_date]:
-                                    available[category][formatted_date].append("ultra")
-                                    logger.debug(f"Added ERDDAP texture: {formatted_date} (ultra)")
-                        except (IndexError, ValueError) as e:
-                            logger.warning(f"Could not parse ERDDAP texture filename: {filename} - {e}")
-                    
-                    # Handle legacy format
-                    elif len(parts) >= 4:
-                        try:
-                            # Extract date (YYYYMMDD format)
-                            date_str = parts[2]  # Should be YYYYMMDD
-                            resolution = parts[3] if len(parts) > 3 else "medium"
-                            
-                            # Convert YYYYMMDD to YYYY-MM-DD for consistency
-                            if len(date_str) == 8 and date_str.isdigit():
-                                formatted_date = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
-                                
-                                if formatted_date not in available[category]:
-                                    available[category][formatted_date] = []
-                                
-                                if resolution not in available[category][formatted_date]:
-                                    available[category][formatted_date].append(resolution)
-                                    logger.debug(f"Added legacy texture: {formatted_date} ({resolution})")
-                        except (IndexError, ValueError) as e:
-                            logger.warning(f"Could not parse texture filename: {filename} - {e}")
-                
-                logger.info(f"Category {category}: {len(available[category])} dates available")
-        
-        return available
+        return {
+            category: {
+                date_str: list(resolutions)
+                for date_str, resolutions in self.texture_index.get(category).items()
+            }
+            for category in self.supported_categories
+        }
     
     def find_best_texture(self, category: str, date: Optional[str] = None, resolution: str = "medium") -> Optional[Path]:
         """
@@ -117,190 +192,61 @@ class TextureService:
         Returns:
             Path to best available texture file or None if not found
         """
+        return self.lookup_flights.run(
+            (category, date, resolution),
+            lambda: self._find_best_texture(category, date, resolution)
+        )
+    
+    def _find_best_texture(self, category: str, date: Optional[str], resolution: str) -> Optional[Path]:
+        """Index search behind find_best_texture."""
         if category not in self.supported_categories:
             logger.warning(f"Unsupported category: {category}")
             return None
         
-        category_path = self.texture_base_path / category
-        if not category_path.exists():
-            logger.warning(f"Category directory not found: {category_path}")
-            return None
-        
-        # Get all available textures for this category
-        available = self.get_available_textures().get(category, {})
-        
+        available = self.texture_index.get(category)
         if not available:
             logger.warning(f"No textures available for category: {category}")
             return None
         
-        # Strategy 1: Exact match (preferred date and resolution)
-        if date and date in available:
-            date_str = date.replace('-', '')  # Convert to YYYYMMDD
-            year = date[:4]
-            
-            # Special handling for SST ERDDAP textures (ultra resolution)
-            if category == "sst" and "ultra" in available[date]:
-                # Try ERDDAP format with year subdirectory
-                texture_file = category_path / year / f"SST_{date_str}.png"
-                if texture_file.exists():
-                    logger.info(f"Found ERDDAP SST texture with year dir: {texture_file}")
-                    return texture_file
-                    
-                # Try ERDDAP format without year subdirectory
-                texture_file = category_path / f"SST_{date_str}.png"
-                if texture_file.exists():
-                    logger.info(f"Found ERDDAP SST texture without year dir: {texture_file}")
-                    return texture_file
-            
-            # Standard format handling
-            if resolution in available[date]:
-                # Try with year subdirectory first
-                texture_file = category_path / year / f"{category}_texture_{date_str}_{resolution}.png"
-                if texture_file.exists():
-                    logger.info(f"Found exact match with year dir: {texture_file}")
-                    return texture_file
-                    
-                # Try without year subdirectory
-                texture_file = category_path / f"{category}_texture_{date_str}_{resolution}.png"
-                if texture_file.exists():
-                    logger.info(f"Found exact match without year dir: {texture_file}")
-                    return texture_file
-        
-        # Strategy 2: Same date, different resolution
-        if date and date in available:
-            date_str = date.replace('-', '')  # Convert to YYYYMMDD
-            year = date[:4]
-            
-            # Check for ultra resolution (ERDDAP SST) first
-            if "ultra" in available[date] and category == "sst":
-                # Try ERDDAP format
-                texture_file = category_path / year / f"SST_{date_str}.png"
-                if texture_file.exists():
-                    logger.info(f"Found ERDDAP SST texture (ultra resolution) with year dir: {texture_file}")
-                    return texture_file
-                    
-                texture_file = category_path / f"SST_{date_str}.png"
-                if texture_file.exists():
-                    logger.info(f"Found ERDDAP SST texture (ultra resolution) without year dir: {texture_file}")
-                    return texture_file
-            
-            # Check standard resolutions
-            for alt_resolution in self.supported_resolutions:
-                if alt_resolution in available[date]:
-                    # Try with year subdirectory
-                    texture_file = category_path / year / f"{category}_texture_{date_str}_{alt_resolution}.png"
-                    if texture_file.exists():
-                        logger.info(f"Found same date, different resolution with year dir: {texture_file}")
-                        return texture_file
-                        
-                    # Try without year subdirectory
-                    texture_file = category_path / f"{category}_texture_{date_str}_{alt_resolution}.png"
-                    if texture_file.exists():
-                        logger.info(f"Found same date, different resolution without year dir: {texture_file}")
-                        return texture_file
-        
-        # Strategy 3: Find closest date texture
         if date:
-            from datetime import datetime
-            try:
-                target_date = datetime.strptime(date, "%Y-%m-%d")
-                
-                # Find the closest date
-                closest_date = None
-                min_diff = float('inf')
-                
-                for avail_date in available.keys():
-                    avail_datetime = datetime.strptime(avail_date, "%Y-%m-%d") 
-                    diff = abs((target_date - avail_datetime).days)
-                    if diff < min_diff:
-                        min_diff = diff
-                        closest_date = avail_date
-                
-                if closest_date:
-                    logger.info(f"Using closest date: {closest_date} (requested: {date})")
-                    alt_date = closest_date
-                    date_str = alt_date.replace('-', '')
-                    year = alt_date[:4]
-                    
-                    # Try ERDDAP format first
-                    if category == "sst" and "ultra" in available[alt_date]:
-                        texture_file = category_path / year / f"SST_{date_str}.png"
-                        if texture_file.exists():
-                            logger.info(f"Found closest ERDDAP texture: {texture_file}")
-                            return texture_file
-                    
-                    # Try other resolutions for closest date
-                    for alt_resolution in available[alt_date]:
-                        if alt_resolution != "ultra":
-                            texture_file = category_path / year / f"{category}_texture_{date_str}_{alt_resolution}.png"
-                            if texture_file.exists():
-                                logger.info(f"Found closest texture: {texture_file}")
-                                return texture_file
-            except:
-                pass
-        
-        # Strategy 4: Fallback to most recent if no date provided
-        for alt_date in sorted(available.keys(), reverse=True):  # Most recent first
-            date_str = alt_date.replace('-', '')  # Convert to YYYYMMDD
-            year = alt_date[:4]
-            
-            # For SST, prefer ultra resolution (ERDDAP) over requested resolution
-            if category == "sst" and "ultra" in available[alt_date]:
-                texture_file = category_path / year / f"SST_{date_str}.png"
-                if texture_file.exists():
-                    logger.info(f"Found ERDDAP SST texture for different date with year dir: {texture_file}")
-                    return texture_file
-                    
-                texture_file = category_path / f"SST_{date_str}.png"
-                if texture_file.exists():
-                    logger.info(f"Found ERDDAP SST texture for different date without year dir: {texture_file}")
-                    return texture_file
-            
-            # Check requested resolution
-            if resolution in available[alt_date]:
-                # Try with year subdirectory
-                texture_file = category_path / year / f"{category}_texture_{date_str}_{resolution}.png"
-                if texture_file.exists():
-                    logger.info(f"Found different date, same resolution with year dir: {texture_file}")
-                    return texture_file
-                    
-                # Try without year subdirectory
-                texture_file = category_path / f"{category}_texture_{date_str}_{resolution}.png"
-                if texture_file.exists():
-                    logger.info(f"Found different date, same resolution without year dir: {texture_file}")
-                    return texture_file
+            # Exact date, otherwise the closest date with a texture
+            if date not in available:
+                try:
+                    target_date = datetime.strptime(date, "%Y-%m-%d")
+                except ValueError:
+                    target_date = None
+                if target_date is not None:
+                    closest_date = min(
+                        available,
+                        key=lambda avail_date: abs((target_date - datetime.strptime(avail_date, "%Y-%m-%d")).days)
+                    )
+                    logger.debug("Using closest date: %s (requested: %s)", closest_date, date)
+                    date = closest_date
+            if date in available:
+                return self._pick_resolution(category, available[date], resolution, strict=False)
         
-        # Strategy 4: Any available texture for this category
-        for alt_date in sorted(available.keys(), reverse=True):  # Most recent first
-            for alt_resolution in available[alt_date]:
-                date_str = alt_date.replace('-', '')  # Convert to YYYYMMDD
-                year = alt_date[:4]
-                
-                # Handle ERDDAP SST format
-                if category == "sst" and alt_resolution == "ultra":
-                    texture_file = category_path / year / f"SST_{date_str}.png"
-                    if texture_file.exists():
-                        logger.info(f"Found fallback ERDDAP SST texture with year dir: {texture_file}")
-                        return texture_file
-                        
-                    texture_file = category_path / f"SST_{date_str}.png"
-                    if texture_file.exists():
-                        logger.info(f"Found fallback ERDDAP SST texture without year dir: {texture_file}")
-                        return texture_file
-                else:
-                    # Try standard format with year subdirectory
-                    texture_file = category_path / year / f"{category}_texture_{date_str}_{alt_resolution}.png"
-                    if texture_file.exists():
-                        logger.info(f"Found fallback texture with year dir: {texture_file}")
-                        return texture_file
-                        
-                    # Try without year subdirectory
-                    texture_file = category_path / f"{category}_texture_{date_str}_{alt_resolution}.png"
-                    if texture_file.exists():
-                        logger.info(f"Found fallback texture without year dir: {texture_file}")
-                        return texture_file
+        # No usable date: most recent texture at the preferred resolution, then anything
+        for alt_date in reversed(available):
+            texture_file = self._pick_resolution(category, available[alt_date], resolution, strict=True)
+            if texture_file is not None:
+                return texture_file
+        latest = available[next(reversed(available))]
+        return self._pick_resolution(category, latest, resolution, strict=False)
+    
+    def _pick_resolution(self, category: str, resolutions: Dict[str, Path], resolution: str,
+                         strict: bool) -> Optional[Path]:
+        """
+        Preferred texture among the resolutions of one date.
         
-        logger.warning(f"No texture found for category: {category}")
+        SST ERDDAP (ultra) textures come first, then the requested resolution, then
+        (unless strict) any other resolution in supported order.
+        """
+        preference = (["ultra"] if category == "sst" else []) + [resolution]
+        if not strict:
+            preference += self.supported_resolutions + list(resolutions)
+        for candidate in preference:
+            if candidate in resolutions:
+                return resolutions[candidate]
         return None
     
     def get_texture_metadata(self, texture_path: Path) -> Dict[str, str]:
@@ -402,7 +348,7 @@ class TextureService:
             "ETag": f'"{int(time.time())}"'  # Unique ETag each time
         }
         
-        logger.info(f"Serving texture: {texture_path}")
+        logger.debug("Serving texture: %s", texture_path)
         
         return FileResponse(
             path=str(texture_path),
@@ -440,6 +386,24 @@ class TextureService:
         
         return summary
 
+    
+    def metadata_payload(self) -> Tuple[str, bytes]:
+        """Serialized available-textures index and summary with its ETag, rebuilt only when textures change."""
+        self.texture_index.refresh()
+        generation = tuple(sorted(self.texture_index.file_catalog.generations(CATALOG_STAGE).items()))
+        cached = self._metadata_payload
+        if cached is not None and cached[0] == generation:
+            return cached[1], cached[2]
+        body = dumps({
+            "available_textures": self.get_available_textures(),
+            "summary": self.get_texture_summary()
+        })
+        etag = payload_etag(body)
+        precompressed.register(body)
+        self._metadata_payload = (generation, etag, body)
+        return etag, body
+
 
-# Global texture service instance
-texture_service = TextureService()
\ No newline at end of file
+# Global texture service instance, built on first use (a missing texture
+# directory fails texture requests instead of API startup)
+texture_service = deferred(TextureService, "texture_service")
\ No newline at end of file
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Texture Video Module
+
+Serves the month/year texture videos written offline by
+processors/texture_video_encoder.py. Each video's JSON sidecar maps frame
+indices to dates; the video itself is served as a file so browsers can seek
+with range requests.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List
+
+from processors.texture_video_encoder import VIDEO_CODECS, period_bounds, video_name
+
+logger = logging.getLogger(__name__)
+
+
+class TextureVideoService:
+    """Encoded texture videos of each category, found through the file catalog."""
+
+    def __init__(self, texture_service):
+        """
+        Initialize the video service.
+
+        Args:
+            texture_service: TextureService providing the texture root, catalog and categories
+        """
+        self.texture_service = texture_service
+        self.file_catalog = texture_service.texture_index.file_catalog
+
+    def list_videos(self, category: str) -> List[Dict[str, Any]]:
+        """
+        Manifests of the category's videos, oldest period first.
+
+        Raises:
+            ValueError: Unsupported category
+        """
+        if category not in self.texture_service.supported_categories:
+            raise ValueError(f"Unsupported category: {category}")
+        videos = []
+        for entry in self.file_catalog.entries("textures", category, f"{category}_*_*.json"):
+            try:
+                manifest = json.loads(entry.path.read_text())
+            except (OSError, ValueError) as e:
+                logger.warning(f"⚠️ Skipping unreadable video manifest {entry.path.name}: {e}")
+                continue
+            if not entry.path.with_suffix(".webm").exists():
+                continue
+            manifest.pop("sources", None)
+            manifest["url"] = f"/textures/{category}/videos/{manifest['period']}?codec={manifest['codec']}"
+            videos.append(manifest)
+        return sorted(videos, key=lambda manifest: (manifest["period"], manifest["codec"]))
+
+    def video_path(self, category: str, period: str, codec: str = "vp9") -> Path:
+        """
+        Path of one encoded video.
+
+        Raises:
+            ValueError: Unsupported category or codec, malformed period
+            FileNotFoundError: The period has not been encoded with this codec
+        """
+        if category not in self.texture_service.supported_categories:
+            raise ValueError(f"Unsupported category: {category}")
+        if codec not in VIDEO_CODECS:
+            raise ValueError(f"Unknown codec: {codec}. Available: {', '.join(VIDEO_CODECS)}")
+        period_bounds(period)
+        name = video_name(category, period, codec)
+        for entry in self.file_catalog.entries("textures", category, name):
+            if entry.path.exists():
+                return entry.path
+        raise FileNotFoundError(f"No {codec} video of {category} for {period}")
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Map Tile Module
+
+Renders 256x256 XYZ (Web Mercator) tiles from harmonized grids on demand, so
+a client can fetch only the visible, zoom-appropriate part of a field at its
+native resolution (0.083° for CMEMS currents) instead of a whole-globe 1°
+texture. Tiles use the same scientific colormaps as the texture generator,
+with a fixed color range per variable so adjacent tiles match and a color
+means the same value on every day.
+
+Rendered tiles are kept in an in-memory LRU. Zooms up to DISK_CACHE_MAX_ZOOM
+are also kept on disk under ocean-data/tiles/ within a byte budget (least
+recently used first out), and low zooms of the latest day are pre-rendered.
+"""
+
+import io
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from api.single_flight import SingleFlight
+from utils.lazy_imports import lazy_import
+
+# Imported on first use: the texture generator pulls in matplotlib and cmocean
+Image = lazy_import("PIL.Image")
+texture_generator = lazy_import("processors.texture_generator")
+
+logger = logging.getLogger(__name__)
+
+TILE_SIZE = 256
+MAX_ZOOM = 10
+PRERENDER_MAX_ZOOM = 2
+
+# Higher zooms are cheap to render and many; they stay in memory only
+DISK_CACHE_MAX_ZOOM = 5
+DISK_CACHE_MAX_BYTES = 512 * 1024 ** 2
+
+# Tiles are stored under tiles/<TILE_STYLE>/; bump when the rendering changes (older tiles get pruned)
+TILE_STYLE = "v2"
+
+# Variable rendered when none is requested
+DEFAULT_TILE_VARIABLES = {
+    "sst": "sst",
+    "currents": "current_speed",
+    "acidity_current": "ph",
+    "acidity_historical": "chl",
+}
+
+# Variable -> TextureGenerator data type (selects the colormap)
+TILE_DATA_TYPES = {
+    "sst": "sst",
+    "current_speed": "speed",
+    "speed": "speed",
+    "uo": "velocity",
+    "vo": "velocity",
+    "u": "velocity",
+    "v": "velocity",
+    "ph": "ph",
+}
+
+# Variable -> fixed (vmin, vmax) color range in the dataset's units
+TILE_COLOR_RANGES = {
+    # sst (degC)
+    "sst": (-2.0, 32.0),
+    "anom": (-5.0, 5.0),
+    # currents (m s-1, degC, PSU)
+    "current_speed": (0.0, 1.5),
+    "speed": (0.0, 1.5),
+    "uo": (-1.0, 1.0),
+    "vo": (-1.0, 1.0),
+    "u": (-1.0, 1.0),
+    "v": (-1.0, 1.0),
+    "ug": (-1.0, 1.0),
+    "vg": (-1.0, 1.0),
+    "thetao": (-2.0, 32.0),
+    "so": (32.0, 38.0),
+    # acidity_current (pH, mol m-3)
+    "ph": (7.6, 8.3),
+    "dissic": (1.9, 2.3),
+    "talk": (2.2, 2.45),
+    # acidity_historical (mmol m-3, mg m-3, mg m-3 day-1)
+    "no3": (0.0, 30.0),
+    "po4": (0.0, 2.5),
+    "si": (0.0, 60.0),
+    "o2": (150.0, 350.0),
+    "chl": (0.0, 1.0),
+    "nppv": (0.0, 50.0),
+}
+
+
+def tile_pixel_coordinates(z: int, x: int, y: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Longitude of each pixel column and latitude of each pixel row (top to bottom) of a tile."""
+    n = 2 ** z
+    offsets = (np.arange(TILE_SIZE) + 0.5) / TILE_SIZE
+    lons = (x + offsets) / n * 360.0 - 180.0
+    lats = np.degrees(np.arctan(np.sinh(np.pi * (1 - 2 * (y + offsets) / n))))
+    return lons, lats
+
+
+def axis_indices(axis: np.ndarray, values: np.ndarray, periodic: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Nearest index on a regular axis for each value.
+
+    Args:
+        axis: Regularly spaced coordinates (ascending or descending)
+        values: Coordinates to look up
+        periodic: Wrap around (a longitude axis covering the whole globe)
+
+    Returns:
+        Indices and a mask of values within half a cell of the axis
+    """
+    step = (axis[-1] - axis[0]) / (axis.size - 1) if axis.size > 1 else 1.0
+    position = (values - axis[0]) / step
+    indices = np.rint(position).astype(np.int64)
+    if periodic:
+        return indices % axis.size, np.ones(values.shape, dtype=bool)
+    inside = (position >= -0.5) & (position <= axis.size - 0.5)
+    return np.clip(indices, 0, axis.size - 1), inside
+
+
+class TileService:
+    """On-demand colormapped XYZ tiles from harmonized grids."""
+
+    def __init__(self, data_extractor, region_stats_service, max_cached_tiles: int = 2048,
+                 max_disk_bytes: int = DISK_CACHE_MAX_BYTES):
+        """
+        Initialize the tile service.
+
+        Args:
+            data_extractor: DataExtractor used for dataset resolution and file lookup
+            region_stats_service: RegionStatsService whose surface grid cache tiles share
+            max_cached_tiles: In-memory LRU size (PNG bytes, typically 5-60 KB each)
+            max_disk_bytes: Disk budget of the tile cache under ocean-data/tiles/
+        """
+        self.data_extractor = data_extractor
+        self.region_stats_service = region_stats_service
+        self.tile_root = data_extractor.file_catalog.data_root / "tiles"
+        self.tile_path = self.tile_root / TILE_STYLE
+        self.generator = texture_generator.TextureGenerator()
+        self.max_cached_tiles = max_cached_tiles
+        self.max_disk_bytes = max_disk_bytes
+        self._tiles: "OrderedDict[Tuple, bytes]" = OrderedDict()
+        self._colormaps: Dict[str, object] = {}
+        self._lock = threading.Lock()
+        # Tile file -> size, least recently used first; scanned from disk on first use
+        self._disk_index: "Optional[OrderedDict[Path, int]]" = None
+        self._disk_bytes = 0
+        self._disk_lock = threading.Lock()
+        self.render_flights = SingleFlight("tile_render")
+        self.hits = 0
+        self.disk_hits = 0
+        self.renders = 0
+
+    def get_tile(self, dataset: str, z: int, x: int, y: int, variable: Optional[str] = None,
+                 date_str: Optional[str] = None) -> Tuple[bytes, str]:
+        """
+        PNG bytes of one tile.
+
+        Returns:
+            (png bytes, data date)
+
+        Raises:
+            ValueError: Invalid tile address, dataset or variable
+            FileNotFoundError: No data file for the dataset/date
+        """
+        if not 0 <= z <= MAX_ZOOM:
+            raise ValueError(f"Zoom must be between 0 and {MAX_ZOOM}")
+        if not (0 <= x < 2 ** z and 0 <= y < 2 ** z):
+            raise ValueError(f"Tile {x}/{y} is outside zoom level {z}")
+
+        resolved_dataset = self.data_extractor._resolve_acidity_dataset(dataset, date_str)
+        if resolved_dataset not in DEFAULT_TILE_VARIABLES:
+            raise ValueError(f"Tiles need a gridded dataset: {dataset}")
+        variable = variable or DEFAULT_TILE_VARIABLES[resolved_dataset]
+        if variable not in TILE_COLOR_RANGES:
+            raise ValueError(f"No tile color range for variable: {variable}")
+
+        if not date_str:
+            availability = self.data_extractor.availability_index.get(resolved_dataset)
+            if not availability.dates:
+                raise FileNotFoundError(f"No data available for {dataset}")
+            date_str = availability.dates[-1]
+
+        file_path = self.data_extractor._find_dataset_file(resolved_dataset, date_str)
+        if not file_path:
+            raise FileNotFoundError(f"No data file for {dataset} on {date_str}")
+        file_date = self.data_extractor._extract_date_from_filename(file_path.name) or file_path.stem
+        mtime_ns = file_path.stat().st_mtime_ns
+
+        key = (resolved_dataset, variable, file_date, mtime_ns, z, x, y)
+        with self._lock:
+            tile = self._tiles.get(key)
+            if tile is not None:
+                self._tiles.move_to_end(key)
+                self.hits += 1
+                return tile, file_date
+
+        tile = self.render_flights.run(key, lambda: self._load_or_render(
+            resolved_dataset, variable, file_path, file_date, mtime_ns, z, x, y
+        ))
+        with self._lock:
+            self._tiles[key] = tile
+            while len(self._tiles) > self.max_cached_tiles:
+                self._tiles.popitem(last=False)
+        return tile, file_date
+
+    def _load_or_render(self, dataset: str, variable: str, file_path: Path, file_date: str,
+                        mtime_ns: int, z: int, x: int, y: int) -> bytes:
+        """Tile from the disk cache if it is newer than its source file, otherwise rendered and stored (low zooms)."""
+        if z > DISK_CACHE_MAX_ZOOM:
+            return self._render(file_path, variable, z, x, y)
+
+        disk_path = self.tile_path / dataset / variable / file_date / str(z) / str(x) / f"{y}.png"
+        try:
+            if disk_path.stat().st_mtime_ns >= mtime_ns:
+                tile = disk_path.read_bytes()
+                self._touch_disk_tile(disk_path)
+                self.disk_hits += 1
+                return tile
+        except OSError:
+            pass
+
+        tile = self._render(file_path, variable, z, x, y)
+        try:
+            disk_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = disk_path.with_suffix(".tmp")
+            tmp_path.write_bytes(tile)
+            tmp_path.replace(disk_path)
+            self._add_disk_tile(disk_path, len(tile))
+        except OSError as e:
+            logger.warning(f"⚠️ Could not store tile {disk_path}: {e}")
+        return tile
+
+    def _disk_tiles(self) -> "OrderedDict[Path, int]":
+        """Index of the tiles on disk, oldest first (disk lock held)."""
+        if self._disk_index is None:
+            tiles = []
+            for root, _, files in os.walk(self.tile_root):
+                for name in files:
+                    path = Path(root) / name
+                    try:
+                        stat = path.stat()
+                    except OSError:
+                        continue
+                    tiles.append((stat.st_mtime_ns, path, stat.st_size))
+            tiles.sort(key=lambda tile: tile[0])
+            self._disk_index = OrderedDict((path, size) for _, path, size in tiles)
+            self._disk_bytes = sum(size for _, _, size in tiles)
+        return self._disk_index
+
+    def _touch_disk_tile(self, path: Path):
+        """Mark a disk tile as recently used (its mtime carries the order across restarts)."""
+        with self._disk_lock:
+            index = self._disk_tiles()
+            if path in index:
+                index.move_to_end(path)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _add_disk_tile(self, path: Path, size: int):
+        """Record a stored tile and prune the least recently used tiles beyond the disk budget."""
+        with self._disk_lock:
+            index = self._disk_tiles()
+            self._disk_bytes += size - index.pop(path, 0)
+            index[path] = size
+            pruned = 0
+            while self._disk_bytes > self.max_disk_bytes and len(index) > 1:
+                old_path, old_size = index.popitem(last=False)
+                self._disk_bytes -= old_size
+                try:
+                    old_path.unlink()
+                    pruned += 1
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logger.warning(f"⚠️ Could not prune tile {old_path}: {e}")
+                    continue
+                # Drop directories the pruning emptied (rmdir fails on the first non-empty one)
+                for parent in old_path.parents:
+                    if parent == self.tile_root:
+                        break
+                    try:
+                        parent.rmdir()
+                    except OSError:
+                        break
+        if pruned:
+            logger.info(f"🧹 Pruned {pruned} least recently used tiles from the disk cache")
+
+    def _render(self, file_path: Path, variable: str, z: int, x: int, y: int) -> bytes:
+        """Sample the surface grid at each tile pixel (nearest cell) and colormap it."""
+        fields = self.region_stats_service._load_fields(file_path, [variable], strict=True)
+        field = fields[variable]
+        vmin, vmax = TILE_COLOR_RANGES[variable]
+
+        lons, lats = tile_pixel_coordinates(z, x, y)
+        if field.lons.max() > 180:
+            lons = lons % 360
+        row_idx, row_inside = axis_indices(field.lats, lats)
+        lon_step = abs(field.lons[-1] - field.lons[0]) / max(field.lons.size - 1, 1)
+        col_idx, col_inside = axis_indices(field.lons, lons, periodic=lon_step * field.lons.size >= 359.9)
+
+        values = field.values[np.ix_(row_idx, col_idx)].astype(np.float64)
+        values[~row_inside, :] = np.nan
+        values[:, ~col_inside] = np.nan
+
+        normalized = np.clip((values - vmin) / (vmax - vmin), 0, 1)
+        rgba = self._colormap(variable)(np.ma.masked_invalid(normalized))
+        image = Image.fromarray((rgba * 255).astype(np.uint8), mode='RGBA')
+
+        buffer = io.BytesIO()
+        image.save(buffer, 'PNG', optimize=False)
+        self.renders += 1
+        return buffer.getvalue()
+
+    def _colormap(self, variable: str):
+        """The texture generator's colormap for a variable, with NaN (land) transparent."""
+        cmap = self._colormaps.get(variable)
+        if cmap is None:
+            data_type = TILE_DATA_TYPES.get(variable, "concentration")
+            cmap = self.generator.get_colormap(self.generator.get_scientific_colormap(data_type)).copy()
+            cmap.set_bad(color='white', alpha=0.0)
+            with self._lock:
+                self._colormaps[variable] = cmap
+        return cmap
+
+    def prerender_latest(self, max_zoom: int = PRERENDER_MAX_ZOOM) -> int:
+        """
+        Render zooms 0..max_zoom of the latest day of every tiled dataset.
+
+        Returns:
+            Number of tiles rendered or found in the disk cache
+        """
+        count = 0
+        for dataset, variable in DEFAULT_TILE_VARIABLES.items():
+            availability = self.data_extractor.availability_index.get(dataset)
+            if not availability.dates:
+                continue
+            date_str = availability.dates[-1]
+            try:
+                for z in range(max_zoom + 1):
+                    for x in range(2 ** z):
+                        for y in range(2 ** z):
+                            self.get_tile(dataset, z, x, y, variable, date_str)
+                            count += 1
+            except Exception as e:
+                logger.warning(f"⚠️ Could not pre-render {dataset} tiles for {date_str}: {e}")
+        if count:
+            logger.info(f"🗺️ Pre-rendered {count} low-zoom tiles")
+        return count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Tile cache counters."""
+        with self._disk_lock:
+            disk_tiles = len(self._disk_index) if self._disk_index is not None else None
+            disk_bytes = self._disk_bytes if self._disk_index is not None else None
+        with self._lock:
+            return {
+                "cached_tiles": len(self._tiles),
+                "disk_tiles": disk_tiles,
+                "disk_bytes": disk_bytes,
+                "memory_hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "renders": self.renders,
+                "coalesced": self.render_flights.get_stats()
+            }
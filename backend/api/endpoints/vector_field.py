@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Vector Field Module
+
+Serves downsampled surface current u/v fields for GPU particle animation,
+cut from the per-day pyramids built at ingest (utils/vector_fields.py).
+Days written before the pyramids existed are built on first request.
+
+Formats (rows run north to south, columns west to east, u then v per cell):
+- float16: raw little-endian half floats, NaN over land
+- rg8: RGBA PNG, R=u and G=v quantized to 0-255 over [-scale, scale], A=0 over land
+- rg16: raw little-endian uint16 pairs over [-scale, scale] in 1-65535, 0 over land
+"""
+
+import io
+import logging
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from api.endpoints.region_stats import lon_mask, parse_bbox
+from api.single_flight import SingleFlight
+from utils.area_weighting import velocity_components
+from utils.netcdf_access import open_netcdf
+from utils.vector_fields import get_vector_field_store, level_key
+from utils.lazy_imports import lazy_import
+
+Image = lazy_import("PIL.Image")
+xr = lazy_import("xarray")
+
+logger = logging.getLogger(__name__)
+
+VECTOR_FORMATS = {
+    "float16": "application/octet-stream",
+    "rg8": "image/png",
+    "rg16": "application/octet-stream",
+}
+
+# Headers a browser client needs to read to place the field on the globe
+VECTOR_FIELD_HEADERS = [
+    "X-Field-Width", "X-Field-Height", "X-Field-Bounds", "X-Field-Resolution",
+    "X-Value-Scale", "X-Data-Date", "X-Available-Resolutions"
+]
+
+
+class VectorFieldService:
+    """Downsampled current fields from the ingest-time pyramids."""
+
+    def __init__(self, data_extractor):
+        """
+        Initialize the vector field service.
+
+        Args:
+            data_extractor: DataExtractor used for file lookup and availability
+        """
+        self.data_extractor = data_extractor
+        self.store = get_vector_field_store(data_extractor.file_catalog.data_root)
+        self.build_flights = SingleFlight("vector_pyramid_build")
+
+    def get_field(self, date_str: Optional[str] = None, bbox: Optional[str] = None,
+                  resolution: float = 1.0, fmt: str = "float16") -> Tuple[bytes, str, Dict[str, str]]:
+        """
+        Encoded u/v field for a date and region.
+
+        Args:
+            date_str: Date in YYYY-MM-DD format (latest if not specified)
+            bbox: 'minLon,minLat,maxLon,maxLat' (whole globe if not specified)
+            resolution: Requested grid spacing in degrees; the nearest stored level not finer is used
+            fmt: 'float16', 'rg8' or 'rg16'
+
+        Returns:
+            (body, media type, headers)
+
+        Raises:
+            ValueError: Invalid parameters
+            FileNotFoundError: No currents data for the date
+        """
+        if fmt not in VECTOR_FORMATS:
+            raise ValueError(f"Unknown format: {fmt}. Available: {', '.join(VECTOR_FORMATS)}")
+        if resolution <= 0:
+            raise ValueError("resolution must be positive")
+
+        # A dated field never changes; "latest" moves on with the next ingest
+        cache_control = "public, max-age=86400" if date_str else "public, max-age=300"
+        if not date_str:
+            availability = self.data_extractor.availability_index.get("currents")
+            if not availability.dates:
+                raise FileNotFoundError("No currents data available")
+            date_str = availability.dates[-1]
+
+        arrays = self.store.load(date_str)
+        if arrays is None:
+            arrays = self.build_flights.run(date_str, lambda: self._build_missing(date_str))
+
+        levels = self.store.levels(arrays)
+        level = next((value for value in levels if value >= resolution - 1e-6), levels[-1])
+        key = level_key(level)
+        u, v = arrays[f"u_{key}"], arrays[f"v_{key}"]
+        lats, lons = arrays[f"lat_{key}"], arrays[f"lon_{key}"]
+
+        if bbox:
+            u, v, lats, lons = self._crop(u, v, lats, lons, *parse_bbox(bbox))
+
+        # North-up rows, as in image textures
+        if lats.size > 1 and lats[0] < lats[-1]:
+            u, v, lats = u[::-1], v[::-1], lats[::-1]
+
+        finite = np.isfinite(u) & np.isfinite(v)
+        scale = float(max(np.abs(u[finite]).max(), np.abs(v[finite]).max())) if finite.any() else 1.0
+        scale = scale or 1.0
+
+        body = self._encode(u, v, finite, scale, fmt)
+        half_cell = level / 2
+        headers = {
+            "X-Field-Width": str(lons.size),
+            "X-Field-Height": str(lats.size),
+            "X-Field-Bounds": ",".join(f"{value:g}" for value in (
+                float(lons[0]) - half_cell, float(lats[-1]) - half_cell,
+                float(lons[-1]) + half_cell, float(lats[0]) + half_cell
+            )),
+            "X-Field-Resolution": f"{level:g}",
+            "X-Value-Scale": f"{scale:.6g}",
+            "X-Data-Date": date_str,
+            "X-Available-Resolutions": ",".join(f"{value:g}" for value in levels),
+            "Cache-Control": cache_control
+        }
+        return body, VECTOR_FORMATS[fmt], headers
+
+    def _build_missing(self, date_str: str) -> Dict[str, np.ndarray]:
+        """Build the pyramid of a day harmonized before pyramids were precomputed."""
+        file_path = self.data_extractor._find_dataset_file("currents", date_str)
+        if not file_path:
+            raise FileNotFoundError(f"No currents data file for {date_str}")
+        logger.info(f"🌀 Building missing current field pyramid for {date_str}")
+        # Only the surface u/v are read under the file lock; averaging runs after it is released
+        with open_netcdf(file_path) as ds:
+            components = velocity_components(ds)
+            if components is None:
+                raise FileNotFoundError(f"No velocity components in {file_path.name}")
+            surface = xr.Dataset({component.name: component.load() for component in components})
+        if self.store.write(surface, date_str) is None:
+            raise FileNotFoundError(f"No velocity components in {file_path.name}")
+        return self.store.load(date_str)
+
+    @staticmethod
+    def _crop(u: np.ndarray, v: np.ndarray, lats: np.ndarray, lons: np.ndarray,
+              min_lon: float, min_lat: float, max_lon: float, max_lat: float):
+        """Cut a bounding box; a box across the antimeridian is stitched west-to-east."""
+        rows = np.nonzero((lats >= min_lat) & (lats <= max_lat))[0]
+        cols = np.nonzero(lon_mask(lons, min_lon, max_lon))[0]
+        if min_lon > max_lon:
+            # West of the antimeridian first; on a 0..360 grid the western part already comes first
+            wrapped = np.where(lons[cols] > 180, lons[cols] - 360, lons[cols])
+            cols = cols[np.argsort(wrapped < min_lon, kind="stable")]
+        if rows.size == 0 or cols.size == 0:
+            raise ValueError("Bounding box contains no grid cells at this resolution")
+        region = np.ix_(rows, cols)
+        return u[region], v[region], lats[rows], lons[cols]
+
+    @staticmethod
+    def _encode(u: np.ndarray, v: np.ndarray, finite: np.ndarray, scale: float, fmt: str) -> bytes:
+        """Interleave u/v in the requested encoding."""
+        if fmt == "float16":
+            return np.stack([u, v], axis=-1).astype("<f2").tobytes()
+
+        normalized = np.stack([u, v], axis=-1).astype(np.float32) / (2 * scale) + 0.5
+        normalized = np.clip(np.nan_to_num(normalized, nan=0.5), 0.0, 1.0)
+        if fmt == "rg16":
+            packed = (1 + np.rint(normalized * 65534)).astype("<u2")
+            packed[~finite] = 0
+            return packed.tobytes()
+
+        rgba = np.zeros(u.shape + (4,), dtype=np.uint8)
+        rgba[..., :2] = np.rint(normalized * 255).astype(np.uint8)
+        rgba[..., 3] = np.where(finite, 255, 0)
+        buffer = io.BytesIO()
+        Image.fromarray(rgba, mode="RGBA").save(buffer, "PNG")
+        return buffer.getvalue()
@@ -0,0 +1,101 @@
+"""
+orjson-based JSON responses.
+
+orjson serializes dicts, lists, dataclasses, datetimes and numpy scalars and
+arrays directly to UTF-8 bytes, several times faster than the stdlib json
+path FastAPI uses by default. Pydantic models and paths are handled by the
+fallback hook. NaN and infinity are written as null, as JSON requires.
+
+Payloads that never change for a given key (dataset lists, parameter
+metadata, filtered microplastics collections of one file) can be serialized
+once and served as bytes from a PayloadCache.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import PurePath
+from typing import Any, Hashable, Optional
+
+import numpy as np
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from api.middleware.compression import precompressed
+from api.middleware.tracing import span
+
+JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    """Types orjson does not serialize natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, np.ndarray):
+        # dtypes orjson does not take natively (e.g. datetime64, object)
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, PurePath):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize content to compact JSON bytes."""
+    return orjson.dumps(content, default=_default, option=JSON_OPTIONS)
+
+
+def payload_etag(body: bytes) -> str:
+    """Strong ETag of a serialized payload."""
+    return f'"{hashlib.sha1(body).hexdigest()[:20]}"'
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson (the application's default response class)."""
+
+    def render(self, content: Any) -> bytes:
+        with span("serialize"):
+            return dumps(content)
+
+
+class PayloadCache:
+    """Bounded LRU of serialized JSON bodies for payloads that are immutable per key."""
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self._payloads: "OrderedDict[Hashable, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, key: Hashable) -> Optional[bytes]:
+        """Cached body for a key, or None (counted as a miss)."""
+        with self._lock:
+            body = self._payloads.get(key)
+            if body is None:
+                self.misses += 1
+                return None
+            self._payloads.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def put(self, key: Hashable, body: bytes):
+        precompressed.register(body)
+        with self._lock:
+            self._payloads[key] = body
+            self._payloads.move_to_end(key)
+            while len(self._payloads) > self.max_entries:
+                self._payloads.popitem(last=False)
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._payloads),
+                "bytes": sum(len(body) for body in self._payloads.values()),
+                "hits": self.hits,
+                "misses": self.misses
+            }
@@ -10,28 +10,53 @@ FastAPI application providing access to ocean climate data including:
 All data is served from harmonized NetCDF files with unified coordinate systems.
 """
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import FileResponse, Response, StreamingResponse
 import uvicorn
 from pathlib import Path
 import sys
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union
+import os
+import json
+import time
 import logging
 import asyncio
 
+import anyio
+import psutil
+
 # Add backend to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from api.models.responses import (
     DatasetInfo, PointDataResponse, MultiDatasetResponse,
-    HealthResponse, ErrorResponse
+    HealthResponse, ErrorResponse, RegionStatsResponse,
+    LeanPointDataResponse, LeanMultiDatasetResponse
 )
 from api.endpoints.data_extractor import DataExtractor
 from api.endpoints.texture_service import texture_service
-
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+from api.endpoints.texture_sequence import TextureSequenceService, SEQUENCE_HEADERS
+from api.endpoints.texture_video import TextureVideoService
+from api.endpoints.region_stats import RegionStatsService
+from api.endpoints.anomaly_textures import AnomalyTextureService
+from api.endpoints.tile_service import TileService
+from api.endpoints.vector_field import VectorFieldService, VECTOR_FIELD_HEADERS
+from api.availability_index import etag_matches
+from api.json_response import FastJSONResponse
+from api.middleware.compression import CompressionMiddleware, get_compression_stats, precompressed
+from api.middleware.tracing import PROMETHEUS_CONTENT_TYPE, Sample, TracingMiddleware, render_metrics
+from api.cache_manager import cache_manager
+from api.realtime import RealtimeHub
+from api.admin import require_admin
+from api.profiler import MAX_DURATION_S, endpoint_codes, profile_filename, sampling_profiler
+from utils.summary_stats import get_summary_table, REGIONS, SUMMARY_STATS
+from utils.parameter_interpreter import parameter_interpreter
+from utils.logging_config import configure_logging
+from utils.lazy_imports import deferred, load_times, warm_up
+
+# Configure logging (levels, format and file via the OCEAN_LOG_* environment variables)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 # Initialize FastAPI app
@@ -40,7 +65,8 @@ app = FastAPI(
     description="Access to harmonized ocean climate data including SST, currents, and biogeochemistry",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=FastJSONResponse
 )
 
 # Configure CORS
@@ -50,10 +76,47 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=VECTOR_FIELD_HEADERS + SEQUENCE_HEADERS,
 )
 
+# gzip/brotli for JSON and text responses above the size threshold
+app.add_middleware(CompressionMiddleware)
+
+# Per-request stage spans (Server-Timing header) and latency histograms for /metrics
+app.add_middleware(TracingMiddleware)
+
+# Services are built on first use (or by the startup warm-up), so importing
+# this module stays fast and needs no data directories to exist
+
 # Initialize data extractor
-data_extractor = DataExtractor()
+data_extractor = deferred(DataExtractor, "data_extractor")
+
+# Bounding-box aggregation on cached in-memory grids
+region_stats_service = deferred(lambda: RegionStatsService(data_extractor), "region_stats_service")
+
+# Daily area-weighted summaries written at ingest time
+summary_table = deferred(lambda: get_summary_table(data_extractor.file_catalog.data_root), "summary_table")
+
+# Anomaly textures rendered from the ingest-time climatologies
+anomaly_texture_service = deferred(lambda: AnomalyTextureService(data_extractor), "anomaly_texture_service")
+
+# XYZ map tiles rendered from the harmonized grids (shares the region grid cache)
+tile_service = deferred(lambda: TileService(data_extractor, region_stats_service), "tile_service")
+
+# Downsampled current fields for particle animation, precomputed at ingest
+vector_field_service = deferred(lambda: VectorFieldService(data_extractor), "vector_field_service")
+
+# Animation frame sequences from the texture index
+texture_sequence_service = deferred(lambda: TextureSequenceService(texture_service), "texture_sequence_service")
+
+# Month/year texture videos encoded offline
+texture_video_service = deferred(lambda: TextureVideoService(texture_service), "texture_video_service")
+
+# WebSocket channel for point queries and new-data notifications
+realtime_hub = deferred(lambda: RealtimeHub(data_extractor), "realtime_hub")
+
+# Set to 0 to skip the startup warm-up (everything then loads on first use)
+PRELOAD_ENV = "OCEAN_PRELOAD"
 
 # Simple request queue to prevent memory exhaustion from simultaneous requests
 active_requests = 0
@@ -67,12 +130,29 @@ async def startup_event():
     # Skip data availability check for faster startup
     logger.info("⚡ Fast startup mode - skipping data availability check")
     
-    logger.info("✅ API ready to serve ocean data!")
+    realtime_hub.start()
+    
+    # Load heavy modules and services, then render low-zoom tiles of the latest
+    # data, in the background: the API serves requests meanwhile
+    if os.environ.get(PRELOAD_ENV, "1") != "0":
+        asyncio.get_running_loop().run_in_executor(None, _warm_up_and_prerender)
+    
+    started = time.time() - psutil.Process().create_time()
+    logger.info(f"✅ API ready to serve ocean data! ({started:.2f}s since process start)")
+
+def _warm_up_and_prerender():
+    """Startup background task: load deferred modules and services, then prerender tiles."""
+    warm_up()
+    try:
+        tile_service.prerender_latest()
+    except Exception as e:
+        logger.warning(f"Tile prerender skipped: {e}")
 
 @app.on_event("shutdown") 
 async def shutdown_event():
     """Clean up on shutdown."""
     logger.info("🌊 Ocean Data Management API shutting down...")
+    await realtime_hub.stop()
 
 @app.get("/", response_model=Dict[str, Any])
 async def root():
@@ -82,7 +162,8 @@ async def root():
         "version": "1.0.0",
         "docs": "/docs",
         "health": "/health",
-        "datasets": "/datasets"
+        "datasets": "/datasets",
+        "websocket": "/ws"
     }
 
 @app.get("/health", response_model=HealthResponse)
@@ -105,73 +186,136 @@ async def health_check():
             total_files=0
         )
 
+def _cached_json_response(request: Request, etag: str, body: bytes,
+                          cache_control: str = "no-cache") -> Response:
+    """Serve a precomputed JSON body, answering 304 when the client's ETag is current."""
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 @app.get("/datasets", response_model=Dict[str, DatasetInfo])
-async def list_datasets():
+def list_datasets(request: Request):
     """List all available datasets with metadata."""
     try:
-        return await data_extractor.get_available_datasets()
+        etag, body = data_extractor.availability_index.payload(
+            "datasets",
+            lambda: {name: info.model_dump() for name, info in data_extractor.get_dataset_infos().items()}
+        )
+        return _cached_json_response(request, etag, body)
     except Exception as e:
         logger.error(f"Error listing datasets: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/available-dates", response_model=Dict[str, List[str]])
-async def get_available_dates():
+@app.get("/available-dates")
+def get_available_dates(
+    request: Request,
+    format: str = Query("list", pattern="^(list|ranges)$",
+                        description="'list' for every date, 'ranges' for compact consecutive-day runs")
+):
     """Get all available dates for each dataset."""
     try:
-        return await data_extractor.get_available_dates()
+        etag, body = data_extractor.availability_index.payload(
+            f"available_dates:{format}",
+            lambda: data_extractor.availability_index.available_dates(format)
+        )
+        return _cached_json_response(request, etag, body)
     except Exception as e:
         logger.error(f"Error getting available dates: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/sst/point", response_model=PointDataResponse)
-async def get_sst_point(
+DETAIL_QUERY = Query("full", pattern="^(full|lean)$",
+                     description="'lean' returns values, units and classification IDs only; see /parameters/metadata")
+
+def _with_detail(response: PointDataResponse, detail: str):
+    """Apply the requested detail level to a point response."""
+    return data_extractor.lean_point_response(response) if detail == "lean" else response
+
+@app.get("/parameters/metadata")
+async def get_parameters_metadata(
+    request: Request,
+    parameters: Optional[str] = Query(None, description="Comma-separated parameter names (all if not specified)")
+):
+    """Static educational text and classification descriptions by parameter and classification ID."""
+    names = [name.strip() for name in parameters.split(',')] if parameters else None
+    etag, body = parameter_interpreter.metadata_payload(names)
+    return _cached_json_response(request, etag, body, cache_control="public, max-age=86400")
+
+@app.get("/sst/point", response_model=Union[PointDataResponse, LeanPointDataResponse])
+def get_sst_point(
     lat: float = Query(..., ge=-90, le=90, description="Latitude in degrees"),
     lon: float = Query(..., ge=-180, le=180, description="Longitude in degrees"),
-    date: Optional[str] = Query(None, description="Date in YYYY-MM-DD format (latest if not specified)")
+    date: Optional[str] = Query(None, description="Date in YYYY-MM-DD format (latest if not specified)"),
+    anomaly: bool = Query(False, description="Add departures from the day-of-year climatology"),
+    detail: str = DETAIL_QUERY
 ):
     """Extract SST data at a specific point."""
     try:
-        return data_extractor.extract_point_data("sst", lat, lon, date)
+        return _with_detail(data_extractor.extract_point_data("sst", lat, lon, date, anomaly), detail)
     except Exception as e:
         logger.error(f"Error extracting SST data: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/currents/point", response_model=PointDataResponse)
-async def get_currents_point(
+@app.get("/currents/point", response_model=Union[PointDataResponse, LeanPointDataResponse])
+def get_currents_point(
     lat: float = Query(..., ge=-90, le=90, description="Latitude in degrees"),
     lon: float = Query(..., ge=-180, le=180, description="Longitude in degrees"),
-    date: Optional[str] = Query(None, description="Date in YYYY-MM-DD format (latest if not specified)")
+    date: Optional[str] = Query(None, description="Date in YYYY-MM-DD format (latest if not specified)"),
+    anomaly: bool = Query(False, description="Add departures from the day-of-year climatology"),
+    detail: str = DETAIL_QUERY
 ):
     """Extract current data at a specific point."""
     try:
-        return data_extractor.extract_point_data("currents", lat, lon, date)
+        return _with_detail(data_extractor.extract_point_data("currents", lat, lon, date, anomaly), detail)
     except Exception as e:
         logger.error(f"Error extracting currents data: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/acidity/point", response_model=PointDataResponse)
-async def get_acidity_point(
+@app.get("/currents/vectors")
+def get_currents_vectors(
+    date: Optional[str] = Query(None, description="Date in YYYY-MM-DD format (latest if not specified)"),
+    bbox: Optional[str] = Query(None, description="Bounding box 'minLon,minLat,maxLon,maxLat' (global if not specified)"),
+    resolution: float = Query(1.0, description="Grid spacing in degrees (0.25, 0.5, 1 or 2; nearest coarser level is used)"),
+    format: str = Query("float16", description="Encoding: float16, rg8 (PNG) or rg16")
+):
+    """Downsampled surface u/v current field for GPU particle animation."""
+    try:
+        body, media_type, headers = vector_field_service.get_field(date, bbox, resolution, format)
+        return Response(content=body, media_type=media_type, headers=headers)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error serving current vectors: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/acidity/point", response_model=Union[PointDataResponse, LeanPointDataResponse])
+def get_acidity_point(
     lat: float = Query(..., ge=-90, le=90, description="Latitude in degrees"),
     lon: float = Query(..., ge=-180, le=180, description="Longitude in degrees"),
-    date: Optional[str] = Query(None, description="Date in YYYY-MM-DD format (latest if not specified)")
+    date: Optional[str] = Query(None, description="Date in YYYY-MM-DD format (latest if not specified)"),
+    anomaly: bool = Query(False, description="Add departures from the day-of-year climatology"),
+    detail: str = DETAIL_QUERY
 ):
     """Extract ocean acidity/biogeochemistry data at a specific point."""
     try:
-        return data_extractor.extract_point_data("acidity", lat, lon, date)
+        return _with_detail(data_extractor.extract_point_data("acidity", lat, lon, date, anomaly), detail)
     except Exception as e:
         logger.error(f"Error extracting acidity data: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/microplastics/point", response_model=PointDataResponse)
-async def get_microplastics_point(
+@app.get("/microplastics/point", response_model=Union[PointDataResponse, LeanPointDataResponse])
+def get_microplastics_point(
     lat: float = Query(..., ge=-90, le=90, description="Latitude in degrees"),
     lon: float = Query(..., ge=-180, le=180, description="Longitude in degrees"),
-    date: Optional[str] = Query(None, description="Date in YYYY-MM-DD format (nearest available if not specified)")
+    date: Optional[str] = Query(None, description="Date in YYYY-MM-DD format (nearest available if not specified)"),
+    detail: str = DETAIL_QUERY
 ):
     """Extract microplastics data at a specific point. Includes real data (1993-2019) and synthetic predictions (2019-2025)."""
     try:
-        return data_extractor.extract_point_data("microplastics", lat, lon, date)
+        return _with_detail(data_extractor.extract_point_data("microplastics", lat, lon, date), detail)
     except Exception as e:
         logger.error(f"Error extracting microplastics data: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -202,7 +346,7 @@ async def get_microplastics_points(
                 raise HTTPException(status_code=400, detail="Invalid bounds format. Use: minLon,minLat,maxLon,maxLat")
         
         # Get points from data extractor
-        points = await data_extractor.get_all_microplastics_points(
+        body = await data_extractor.get_microplastics_points_payload(
             min_concentration=min_concentration,
             data_source=data_source,
             year_min=year_min,
@@ -210,17 +354,82 @@ async def get_microplastics_points(
             spatial_bounds=spatial_bounds
         )
         
-        return points
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         logger.error(f"Error getting microplastics points: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/multi/point", response_model=MultiDatasetResponse)
+@app.get("/{dataset}/region", response_model=RegionStatsResponse)
+def get_region_stats(
+    dataset: str,
+    bbox: str = Query(..., description="Bounding box as 'minLon,minLat,maxLon,maxLat' (minLon > maxLon crosses the antimeridian)"),
+    date: Optional[str] = Query(None, description="Date in YYYY-MM-DD format (latest if not specified)"),
+    stats: str = Query("mean,min,max", description="Comma-separated statistics: mean, min, max, std, median, count, p1-p99"),
+    variables: Optional[str] = Query(None, description="Comma-separated variables (all if not specified)")
+):
+    """Area-weighted (cos lat), NaN-aware statistics of a dataset over a bounding box."""
+    try:
+        return region_stats_service.region_stats(dataset, bbox, date, stats, variables)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error computing region statistics for {dataset}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/summaries")
+def list_summaries():
+    """Datasets, variables and date coverage of the precomputed daily summary table."""
+    try:
+        return {
+            "regions": list(REGIONS),
+            "statistics": [name for name in SUMMARY_STATS if name != "count"] + ["valid_cells"],
+            "datasets": summary_table.contents()
+        }
+    except Exception as e:
+        logger.error(f"Error listing summaries: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/summaries/{dataset}")
+def get_summary_series(
+    dataset: str,
+    variable: str = Query(..., description="Variable name (e.g. sst)"),
+    region: str = Query("global", description="global, a basin (arctic, southern, atlantic, pacific, indian) or a latitude band (e.g. lat_0_30N)"),
+    start_date: Optional[str] = Query(None, description="Start date in YYYY-MM-DD format"),
+    end_date: Optional[str] = Query(None, description="End date in YYYY-MM-DD format")
+):
+    """Daily area-weighted statistics of one variable over one region, as columns for charting."""
+    if region not in REGIONS:
+        raise HTTPException(status_code=400, detail=f"Unknown region: {region}. Available: {', '.join(REGIONS)}")
+    try:
+        return {
+            "dataset": dataset,
+            "variable": variable,
+            "region": region,
+            "weighting": "cos(lat)",
+            "series": summary_table.query(dataset, variable, region, start_date, end_date)
+        }
+    except Exception as e:
+        logger.error(f"Error querying summaries for {dataset}/{variable}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/climatology")
+def get_climatology_status():
+    """Coverage of the day-of-year climatologies used for anomalies."""
+    try:
+        return data_extractor.climatology.status()
+    except Exception as e:
+        logger.error(f"Error reading climatology status: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/multi/point", response_model=Union[MultiDatasetResponse, LeanMultiDatasetResponse])
 async def get_multi_point(
     lat: float = Query(..., ge=-90, le=90, description="Latitude in degrees"),
     lon: float = Query(..., ge=-180, le=180, description="Longitude in degrees"),
     datasets: str = Query("sst,acidity,microplastics,currents", description="Comma-separated list of datasets"),
-    date: Optional[str] = Query(None, description="Date in YYYY-MM-DD format (latest if not specified)")
+    date: Optional[str] = Query(None, description="Date in YYYY-MM-DD format (latest if not specified)"),
+    detail: str = DETAIL_QUERY
 ):
     """Extract data from multiple datasets at a specific point."""
     # Rate limiting to prevent server overload
@@ -230,9 +439,10 @@ async def get_multi_point(
     
     active_requests += 1
     try:
-        return data_extractor.extract_multi_point_data(
+        response = data_extractor.extract_multi_point_data(
             datasets.split(','), lat, lon, date
         )
+        return data_extractor.lean_multi_response(response) if detail == "lean" else response
     except Exception as e:
         logger.error(f"Error extracting multi-point data: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -240,12 +450,38 @@ async def get_multi_point(
         active_requests -= 1
 
 
+@app.get("/api/stats/coalescing")
+async def get_coalescing_stats():
+    """Counters for concurrent identical requests served by a single in-flight extraction."""
+    return {
+        **data_extractor.get_coalescing_stats(),
+        "texture_lookup": texture_service.lookup_flights.get_stats()
+    }
+
+
+@app.websocket("/ws")
+async def realtime_channel(websocket: WebSocket):
+    """
+    Multiplexed point queries plus data_update/texture_update notifications.
+    
+    Client messages: {"type": "point", "id", "dataset", "lat", "lon", "date"?},
+    {"type": "multi_point", "id", "datasets"?, "lat", "lon", "date"?},
+    {"type": "cancel", "target": id} and {"type": "ping", "id"}.
+    """
+    await realtime_hub.serve(websocket)
+
+@app.get("/api/stats/realtime")
+async def get_realtime_stats():
+    """WebSocket connection, request and notification counters."""
+    return realtime_hub.get_stats()
+
+
 # Texture Endpoints
 
 @app.get("/textures/earth/nasa_world_topo_bathy.jpg")
 async def get_earth_texture():
     """Serve the NASA Earth texture file."""
-    earth_texture_path = Path(__file__).parent.parent.parent / "ocean-data" / "textures" / "earth" / "nasa_world_topo_bathy.jpg"
+    earth_texture_path = texture_service.texture_base_path / "earth" / "nasa_world_topo_bathy.jpg"
     
     if not earth_texture_path.exists():
         logger.error(f"Earth texture not found at: {earth_texture_path}")
@@ -257,8 +493,220 @@ async def get_earth_texture():
         filename="nasa_world_topo_bathy.jpg"
     )
 
+@app.get("/textures/anomaly/{dataset}")
+def get_anomaly_texture(
+    dataset: str,
+    variable: Optional[str] = Query(None, description="Climatology variable (dataset's primary variable if not specified)"),
+    date: Optional[str] = Query(None, description="Date in YYYY-MM-DD format (latest if not specified)")
+):
+    """Serve a texture of departures from the day-of-year climatology."""
+    try:
+        return anomaly_texture_service.serve_anomaly_texture(dataset, variable, date)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error serving anomaly texture for {dataset}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/tiles/{dataset}/{z}/{x}/{y}.png")
+def get_tile(
+    dataset: str,
+    z: int,
+    x: int,
+    y: int,
+    variable: Optional[str] = Query(None, description="Variable to render (dataset's primary variable if not specified)"),
+    date: Optional[str] = Query(None, description="Date in YYYY-MM-DD format (latest if not specified)")
+):
+    """Serve a 256x256 Web Mercator (XYZ) tile of a gridded dataset."""
+    try:
+        tile, data_date = tile_service.get_tile(dataset, z, x, y, variable, date)
+        return Response(
+            content=tile,
+            media_type="image/png",
+            headers={
+                "Cache-Control": "public, max-age=86400" if date else "public, max-age=300",
+                "X-Data-Date": data_date
+            }
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error rendering tile {dataset}/{z}/{x}/{y}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/stats/compression")
+async def get_compression_stats_endpoint():
+    """Response compression ratios and precompressed payload counters."""
+    return get_compression_stats()
+
+def _cache_samples(cache: str, hits: int, misses: int) -> List[Sample]:
+    lookups = hits + misses
+    labels = {"cache": cache}
+    return [
+        Sample("ocean_api_cache_hits_total", hits, "Cache hits", "counter", labels),
+        Sample("ocean_api_cache_misses_total", misses, "Cache misses", "counter", labels),
+        Sample("ocean_api_cache_hit_ratio", round(hits / lookups, 4) if lookups else 0.0,
+               "Cache hits per lookup since startup", "gauge", labels)
+    ]
+
+def _open_netcdf_files() -> int:
+    """NetCDF files this process holds open (cached datasets and in-flight reads)."""
+    try:
+        return sum(1 for handle in psutil.Process().open_files() if handle.path.endswith(".nc"))
+    except psutil.Error:
+        return 0
+
+@app.get("/metrics")
+async def get_metrics():
+    """Stage and request latency histograms, cache hit rates, queue depths and open NetCDF files (Prometheus text format)."""
+    point_cache = cache_manager.get_cache_stats()
+    payloads = data_extractor.microplastics_payloads.get_stats()
+    variants = precompressed.get_stats()
+    tiles = tile_service.get_stats()
+    point_flights = data_extractor.point_flights.get_stats()
+    extraction_executor = data_extractor.get_executor_stats()
+    threadpool = anyio.to_thread.current_default_thread_limiter().statistics()
+
+    samples = [
+        *_cache_samples("point", point_cache["cache_hits"], point_cache["cache_misses"]),
+        *_cache_samples("microplastics_payload", payloads["hits"], payloads["misses"]),
+        *_cache_samples("precompressed", variants["hits"], variants["compressions"]),
+        *_cache_samples("tiles", tiles["memory_hits"] + tiles["disk_hits"], tiles["renders"]),
+        Sample("ocean_api_coalesced_requests_total", point_flights["deduplicated"],
+               "Point requests served by another request's in-flight extraction", "counter"),
+        Sample("ocean_api_region_cache_bytes", region_stats_service.get_cache_stats()["cache_bytes"],
+               "Memory held by cached region grids"),
+        Sample("ocean_api_executor_queue_depth", extraction_executor["queued"],
+               "Tasks waiting for a worker", labels={"executor": "ocean_data"}),
+        Sample("ocean_api_executor_busy_workers", extraction_executor["running"],
+               "Workers running a task", labels={"executor": "ocean_data"}),
+        Sample("ocean_api_executor_queue_depth", threadpool.tasks_waiting,
+               "Tasks waiting for a worker", labels={"executor": "threadpool"}),
+        Sample("ocean_api_executor_busy_workers", threadpool.borrowed_tokens,
+               "Workers running a task", labels={"executor": "threadpool"}),
+        Sample("ocean_api_open_netcdf_files", _open_netcdf_files(), "NetCDF files held open by the process"),
+        Sample("ocean_api_cached_datasets", point_cache["open_files"], "Datasets kept open by the cache manager"),
+        *(Sample("ocean_api_deferred_load_seconds", round(seconds, 6),
+                 "Time spent importing a lazy module or building a deferred service", labels={"name": name})
+          for name, seconds in load_times().items())
+    ]
+    return Response(content=render_metrics(samples), media_type=PROMETHEUS_CONTENT_TYPE)
+
+# Admin endpoints (disabled unless OCEAN_ADMIN_TOKEN is set)
+
+@app.post("/admin/profiler/start", status_code=202, dependencies=[Depends(require_admin)], include_in_schema=False)
+async def start_profiler(
+    duration: float = Query(30.0, gt=0, le=MAX_DURATION_S, description="Sampling window in seconds"),
+    interval_ms: float = Query(10.0, ge=1, le=1000, description="Milliseconds between stack samples")
+):
+    """Sample every thread's stack for a bounded window (one session at a time)."""
+    try:
+        session = sampling_profiler.start(duration, interval_ms, endpoint_codes(app.routes))
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return session.summary()
+
+@app.post("/admin/profiler/stop", dependencies=[Depends(require_admin)], include_in_schema=False)
+def stop_profiler():
+    """End the running session early and return its aggregates."""
+    session = sampling_profiler.stop()
+    if session is None:
+        raise HTTPException(status_code=404, detail="No profiling session")
+    return session.summary()
+
+@app.get("/admin/profiler", dependencies=[Depends(require_admin)], include_in_schema=False)
+async def get_profiler_summary(top: int = Query(10, ge=1, le=100, description="Functions listed per endpoint")):
+    """Progress and per-endpoint aggregates of the running or last session."""
+    session = sampling_profiler.session
+    if session is None:
+        raise HTTPException(status_code=404, detail="No profiling session")
+    return session.summary(top)
+
+@app.get("/admin/profiler/folded", dependencies=[Depends(require_admin)], include_in_schema=False)
+async def get_profiler_folded():
+    """Folded stacks of the running or last session (flamegraph.pl, speedscope, inferno)."""
+    session = sampling_profiler.session
+    if session is None:
+        raise HTTPException(status_code=404, detail="No profiling session")
+    return Response(content=session.folded(), media_type="text/plain",
+                    headers={"Content-Disposition": f'attachment; filename="{profile_filename(session)}"'})
+
+@app.get("/api/stats/tiles")
+async def get_tile_stats():
+    """Tile cache and rendering counters."""
+    return tile_service.get_stats()
+
+@app.get("/textures/{category}/sequence")
+def get_texture_sequence(
+    category: str,
+    start: str = Query(..., description="First date in YYYY-MM-DD format"),
+    end: str = Query(..., description="Last date in YYYY-MM-DD format"),
+    step: int = Query(1, ge=1, description="Days between frames"),
+    resolution: str = Query("medium", description="Preferred texture resolution: preview, low, medium, high"),
+    format: str = Query("manifest", description="manifest (JSON), sprite (PNG sheet of one page) or multipart (all frames)"),
+    page: int = Query(0, ge=0, description="Sprite-sheet page (format=sprite)")
+):
+    """Consecutive texture frames for animation playback in a few requests."""
+    try:
+        if format == "manifest":
+            return texture_sequence_service.manifest(category, start, end, step, resolution)
+        if format == "sprite":
+            sheet, layout = texture_sequence_service.sprite_sheet(category, start, end, step, resolution, page)
+            return Response(
+                content=sheet,
+                media_type="image/png",
+                headers={"X-Sprite-Layout": json.dumps(layout, separators=(",", ":")),
+                         "Cache-Control": "public, max-age=3600"}
+            )
+        if format == "multipart":
+            body, media_type = texture_sequence_service.multipart(category, start, end, step, resolution)
+            return StreamingResponse(body, media_type=media_type)
+        raise ValueError(f"Unknown format: {format}. Available: manifest, sprite, multipart")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error serving texture sequence for {category}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/textures/{category}/videos")
+def list_texture_videos(category: str):
+    """List the encoded month/year videos of a texture category with their frame dates."""
+    try:
+        return {"category": category, "videos": texture_video_service.list_videos(category)}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error listing texture videos for {category}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/textures/{category}/videos/{period}")
+def get_texture_video(
+    category: str,
+    period: str,
+    codec: str = Query("vp9", description="Video codec: vp9 (with alpha) or av1")
+):
+    """Serve the WebM of a month (YYYY-MM) or year (YYYY) of textures; supports range requests."""
+    try:
+        video_path = texture_video_service.video_path(category, period, codec)
+        return FileResponse(
+            path=str(video_path),
+            media_type="video/webm",
+            headers={"Cache-Control": "public, max-age=86400"}
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error serving texture video {category}/{period}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/textures/{category}")
-async def get_texture(
+def get_texture(
     category: str,
     date: Optional[str] = Query(None, description="Date in YYYY-MM-DD format (latest if not specified)"),
     resolution: str = Query("medium", description="Texture resolution: preview, low, medium, high")
@@ -271,7 +719,7 @@ async def get_texture(
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/textures/list/{category}")
-async def list_category_textures(category: str):
+def list_category_textures(category: str):
     """List all available textures for a specific category."""
     try:
         available = texture_service.get_available_textures()
@@ -288,13 +736,11 @@ async def list_category_textures(category: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/textures/metadata")
-async def get_texture_metadata():
+def get_texture_metadata(request: Request):
     """Get metadata and summary of all available textures."""
     try:
-        return {
-            "available_textures": texture_service.get_available_textures(),
-            "summary": texture_service.get_texture_summary()
-        }
+        etag, body = texture_service.metadata_payload()
+        return _cached_json_response(request, etag, body)
     except Exception as e:
         logger.error(f"Error getting texture metadata: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -302,24 +748,24 @@ async def get_texture_metadata():
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc):
     """Custom HTTP exception handler."""
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=exc.status_code,
         content=ErrorResponse(
             error=exc.detail,
             status_code=exc.status_code
-        ).dict()
+        ).model_dump()
     )
 
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc):
     """General exception handler."""
     logger.error(f"Unhandled exception: {exc}")
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=500,
         content=ErrorResponse(
             error="Internal server error",
             status_code=500
-        ).dict()
+        ).model_dump()
     )
 
 if __name__ == "__main__":
@@ -0,0 +1,296 @@
+"""
+Response compression middleware.
+
+Negotiates brotli (when the optional brotli package is installed) or gzip
+from Accept-Encoding and compresses text and JSON responses above a size
+threshold, so small point responses are sent as-is. Images, video and
+other already-compressed media pass through untouched.
+
+Serialized payloads held in the API's caches (dataset lists, available
+dates, parameter metadata, microplastics collections) are registered with
+the shared PrecompressedVariants store: each is compressed once per
+encoding, at a higher level, and the compressed bytes are reused for every
+later response with the same body.
+"""
+
+import gzip
+import logging
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Bodies smaller than this are not worth the CPU (or the header bytes)
+MINIMUM_SIZE = 1024
+
+# Bodies at least this large are compressed in a worker thread
+OFFLOAD_SIZE = 256 * 1024
+
+COMPRESSIBLE_TYPES = (
+    "application/json", "application/geo+json", "application/javascript",
+    "application/xml", "image/svg+xml", "text/"
+)
+
+# Levels for per-request compression and for payloads compressed once and cached
+REQUEST_LEVELS = {"br": 4, "gzip": 6}
+PRECOMPRESSED_LEVELS = {"br": 9, "gzip": 9}
+
+
+def supported_encodings() -> Tuple[str, ...]:
+    """Encodings this server can produce, most preferred first."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Best supported encoding accepted by the client.
+
+    Args:
+        accept_encoding: Accept-Encoding header value (e.g. 'gzip, deflate, br;q=0.9')
+
+    Returns:
+        'br', 'gzip' or None for identity
+    """
+    accepted: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name.strip().lower()] = quality
+    for encoding in supported_encodings():
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if quality > 0:
+            return encoding
+    return None
+
+
+def compress(body: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    """Compress a whole body."""
+    level = REQUEST_LEVELS[encoding] if level is None else level
+    if encoding == "br":
+        return brotli.compress(body, quality=level)
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+class _StreamCompressor:
+    """Incremental compressor for streamed response bodies."""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=REQUEST_LEVELS["br"])
+        else:
+            self._compressor = zlib.compressobj(REQUEST_LEVELS["gzip"], zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def process(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.process(data) + self._compressor.flush()
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class PrecompressedVariants:
+    """
+    Compressed variants of cached response bodies.
+
+    Bodies are matched by identity: a cache serves the same bytes object on
+    every hit, so a lookup is a dict access instead of hashing the body.
+    """
+
+    def __init__(self, max_entries: int = 128, max_bytes: int = 256 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[int, Tuple[bytes, Dict[str, bytes]]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.compressions = 0
+
+    def register(self, body: bytes):
+        """Mark a cached body as worth keeping compressed variants of."""
+        if len(body) < MINIMUM_SIZE:
+            return
+        with self._lock:
+            if id(body) in self._entries and self._entries[id(body)][0] is body:
+                return
+            self._entries[id(body)] = (body, {})
+            self._size += len(body)
+            self._evict()
+
+    def get(self, body: bytes, encoding: str) -> Optional[bytes]:
+        """Compressed variant of a registered body (compressed on first use), or None if not registered."""
+        with self._lock:
+            entry = self._entries.get(id(body))
+            if entry is None or entry[0] is not body:
+                return None
+            self._entries.move_to_end(id(body))
+            variant = entry[1].get(encoding)
+            if variant is not None:
+                self.hits += 1
+                return variant
+
+        variant = compress(body, encoding, PRECOMPRESSED_LEVELS[encoding])
+        with self._lock:
+            entry = self._entries.get(id(body))
+            if entry is not None and entry[0] is body and encoding not in entry[1]:
+                entry[1][encoding] = variant
+                self._size += len(variant)
+                self.compressions += 1
+                self._evict()
+        return variant
+
+    def _evict(self):
+        while self._entries and (len(self._entries) > self.max_entries or self._size > self.max_bytes):
+            _, (body, variants) = self._entries.popitem(last=False)
+            self._size -= len(body) + sum(len(variant) for variant in variants.values())
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "payloads": len(self._entries),
+                "bytes": self._size,
+                "hits": self.hits,
+                "compressions": self.compressions
+            }
+
+
+# Shared by the payload caches and the middleware
+precompressed = PrecompressedVariants()
+
+# Response counters across all middleware instances
+_counters = {"compressed_responses": 0, "bytes_in": 0, "bytes_out": 0}
+
+
+def get_compression_stats() -> Dict[str, object]:
+    """Negotiation settings, compression ratios and precompressed-variant counters."""
+    return {
+        "encodings": list(supported_encodings()),
+        "minimum_size": MINIMUM_SIZE,
+        **_counters,
+        "precompressed": precompressed.get_stats()
+    }
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing eligible responses with the client's preferred encoding."""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = MINIMUM_SIZE,
+                 variants: PrecompressedVariants = precompressed):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.variants = variants
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressingResponder(self, send, encoding)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressingResponder:
+    """Send wrapper for one response: decides on the first body message, then compresses or passes through."""
+
+    def __init__(self, middleware: CompressionMiddleware, send: Send, encoding: str):
+        self.middleware = middleware
+        self.downstream = send
+        self.encoding = encoding
+        self.start_message: Optional[Message] = None
+        self.mode: Optional[str] = None  # 'passthrough', 'stream' or None until decided
+        self.compressor: Optional[_StreamCompressor] = None
+
+    async def send(self, message: Message):
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            return
+        if message["type"] != "http.response.body":
+            await self.downstream(message)
+            return
+
+        if self.mode == "passthrough":
+            await self.downstream(message)
+            return
+        if self.mode == "stream":
+            body = self.compressor.process(message.get("body", b""))
+            if not message.get("more_body", False):
+                body += self.compressor.finish()
+            _counters["bytes_out"] += len(body)
+            await self.downstream({"type": "http.response.body", "body": body,
+                                   "more_body": message.get("more_body", False)})
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        headers = MutableHeaders(raw=self.start_message["headers"])
+        if not self._eligible(headers) or (not more_body and len(body) < self.middleware.minimum_size):
+            self.mode = "passthrough"
+            await self.downstream(self.start_message)
+            await self.downstream(message)
+            return
+
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            # The compressed representation is not byte-identical to the original
+            headers["ETag"] = f"W/{etag}"
+        _counters["compressed_responses"] += 1
+        _counters["bytes_in"] += len(body)
+
+        if not more_body:
+            compressed = await self._compress(body)
+            headers["Content-Length"] = str(len(compressed))
+            _counters["bytes_out"] += len(compressed)
+            await self.downstream(self.start_message)
+            await self.downstream({"type": "http.response.body", "body": compressed})
+            return
+
+        # Streamed body: compress chunk by chunk
+        self.mode = "stream"
+        self.compressor = _StreamCompressor(self.encoding)
+        del headers["Content-Length"]
+        await self.downstream(self.start_message)
+        chunk = self.compressor.process(body)
+        _counters["bytes_out"] += len(chunk)
+        await self.downstream({"type": "http.response.body", "body": chunk, "more_body": True})
+
+    async def _compress(self, body: bytes) -> bytes:
+        """Precompressed variant if the body is a registered payload, otherwise compressed now."""
+        def work() -> bytes:
+            return self.middleware.variants.get(body, self.encoding) or compress(body, self.encoding)
+        # Large bodies are compressed off the event loop
+        if len(body) >= OFFLOAD_SIZE:
+            return await anyio.to_thread.run_sync(work)
+        return work()
+
+    def _eligible(self, headers: MutableHeaders) -> bool:
+        """Compressible media type, not already encoded, and a status that carries a body."""
+        if self.start_message["status"] in (204, 206, 304) or "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "")
+        return content_type.startswith(COMPRESSIBLE_TYPES)
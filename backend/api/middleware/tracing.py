@@ -0,0 +1,234 @@
+"""
+Request tracing and Prometheus-style metrics.
+
+Work inside a request is timed with span(stage, dataset): point extractions
+record file resolution, NetCDF lock wait, open, coordinate lookup, variable
+reads and classification, and the JSON response class records serialization.
+Each span is observed into a stage histogram and, while a request is being
+traced, appended to that request's trace, which TracingMiddleware returns as
+a Server-Timing header and adds to a per-route request histogram.
+
+render_metrics() writes every histogram plus point-in-time samples (cache
+hit rates, executor queue depth, open NetCDF files) in the Prometheus text
+exposition format served by /metrics.
+"""
+
+import bisect
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; spans range from sub-millisecond cache hits to multi-second cold opens
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Spans of the request being handled in this context (None outside a traced request);
+# threadpool endpoints inherit the list through the copied context
+_current_trace: contextvars.ContextVar[Optional[List[Tuple[str, str, float]]]] = \
+    contextvars.ContextVar("request_trace", default=None)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram per label combination (Prometheus semantics)."""
+
+    def __init__(self, name: str, description: str, label_names: Tuple[str, ...],
+                 buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.name = name
+        self.description = description
+        self.label_names = label_names
+        self.buckets = buckets
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float, *label_values: str):
+        """Add one observation; label values in label_names order."""
+        # Per series: one count per bucket, then +Inf count and sum
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [0.0] * (len(self.buckets) + 2)
+            if index < len(self.buckets):
+                series[index] += 1
+            series[-2] += 1
+            series[-1] += seconds
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            snapshot = sorted((labels, list(series)) for labels, series in self._series.items())
+        for label_values, series in snapshot:
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                bucket = _labels(self.label_names, label_values, f'le="{bound}"')
+                lines.append(f"{self.name}_bucket{bucket} {int(cumulative)}")
+            labels = _labels(self.label_names, label_values)
+            infinity = _labels(self.label_names, label_values, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{infinity} {int(series[-2])}")
+            lines.append(f"{self.name}_count{labels} {int(series[-2])}")
+            lines.append(f"{self.name}_sum{labels} {series[-1]:.6f}")
+        return lines
+
+
+# Pipeline stages of point extraction and serialization, per dataset
+stage_seconds = Histogram("ocean_api_stage_seconds", "Time spent per request stage",
+                          ("stage", "dataset"))
+
+# End-to-end point extraction per dataset (coalesced waits included)
+dataset_seconds = Histogram("ocean_api_point_extraction_seconds", "Point extraction latency per dataset",
+                            ("dataset",))
+
+# Whole requests per route template, method and status class
+request_seconds = Histogram("ocean_api_request_seconds", "HTTP request latency",
+                            ("method", "route", "status"))
+
+
+def _record(stage: str, dataset: str, elapsed: float):
+    stage_seconds.observe(elapsed, stage, dataset)
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.append((stage, dataset, elapsed))
+
+
+@contextmanager
+def span(stage: str, dataset: str = "") -> Iterator[None]:
+    """
+    Time a block as one stage of the current request.
+
+    Args:
+        stage: Stage name (e.g. 'open', 'read', 'serialize')
+        dataset: Dataset the stage works on ('' when not dataset-specific)
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record(stage, dataset, time.perf_counter() - start)
+
+
+class StageClock:
+    """
+    Times consecutive stages of one code path without nesting blocks.
+
+    Each lap(stage) records the time since the previous lap (or since the
+    clock started) as a span of that stage.
+    """
+
+    def __init__(self, dataset: str = ""):
+        self.dataset = dataset
+        self._last = time.perf_counter()
+
+    def lap(self, stage: str):
+        now = time.perf_counter()
+        _record(stage, self.dataset, now - self._last)
+        self._last = now
+
+
+@contextmanager
+def timed_lock(lock, dataset: str = "") -> Iterator[None]:
+    """Hold a lock, recording the wait for it as a 'lock_wait' span."""
+    with span("lock_wait", dataset):
+        lock.acquire()
+    try:
+        yield
+    finally:
+        lock.release()
+
+
+def server_timing(trace: Iterable[Tuple[str, str, float]], total: float) -> str:
+    """Server-Timing header value: durations summed per stage and dataset, then the total."""
+    durations: Dict[str, float] = {}
+    for stage, dataset, elapsed in trace:
+        name = f"{stage}-{dataset}" if dataset else stage
+        durations[name] = durations.get(name, 0.0) + elapsed
+    entries = [f"{name};dur={elapsed * 1000:.2f}" for name, elapsed in durations.items()]
+    entries.append(f"total;dur={total * 1000:.2f}")
+    return ", ".join(entries)
+
+
+class TracingMiddleware:
+    """ASGI middleware collecting a request's spans into Server-Timing and the request histogram."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        trace: List[Tuple[str, str, float]] = []
+        token = _current_trace.set(trace)
+        start = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message: Message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", server_timing(trace, time.perf_counter() - start))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_trace.reset(token)
+            # Route templates (not raw paths) keep the label set bounded
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            request_seconds.observe(time.perf_counter() - start, scope["method"], route, f"{status // 100}xx")
+
+
+@dataclass
+class Sample:
+    """A point-in-time gauge or counter value for /metrics."""
+    name: str
+    value: float
+    description: str
+    kind: str = "gauge"
+    labels: Dict[str, str] = field(default_factory=dict)
+
+
+def render_metrics(samples: Iterable[Sample] = ()) -> str:
+    """
+    Prometheus text exposition of the latency histograms plus point-in-time samples.
+
+    Args:
+        samples: Gauges and counters collected at scrape time (grouped by name)
+
+    Returns:
+        Metrics text ending in a newline
+    """
+    lines: List[str] = []
+    for histogram in (request_seconds, dataset_seconds, stage_seconds):
+        lines.extend(histogram.render())
+
+    described = set()
+    for sample in sorted(samples, key=lambda sample: sample.name):
+        if sample.name not in described:
+            described.add(sample.name)
+            lines.append(f"# HELP {sample.name} {sample.description}")
+            lines.append(f"# TYPE {sample.name} {sample.kind}")
+        labels = _labels(tuple(sample.labels), tuple(sample.labels.values()))
+        value = int(sample.value) if float(sample.value).is_integer() else sample.value
+        lines.append(f"{sample.name}{labels} {value}")
+    return "\n".join(lines) + "\n"
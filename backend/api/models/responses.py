@@ -5,7 +5,7 @@ Defines the structure of all API response objects to ensure consistent
 data formatting and automatic API documentation generation.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Dict, List, Optional, Any, Union
 from datetime import datetime
 
@@ -16,6 +16,8 @@ class Coordinates(BaseModel):
 
 class ParameterClassification(BaseModel):
     """Classification and interpretation of a parameter value."""
+    # Instances are interned by the parameter interpreter and shared across responses
+    model_config = ConfigDict(frozen=True)
     classification: str = Field(..., description="Value classification (e.g., 'Normal', 'High', 'Critical')")
     severity: str = Field(..., description="Severity level: low, medium, high, critical")
     color: str = Field(..., description="CSS color code for UI display")
@@ -25,6 +27,7 @@ class ParameterClassification(BaseModel):
 
 class EducationalContext(BaseModel):
     """Educational information about a parameter."""
+    model_config = ConfigDict(frozen=True)
     short_description: str = Field(..., description="Brief explanation of what this parameter measures")
     scientific_context: str = Field(..., description="Scientific significance and relevance")
     unit_explanation: str = Field(..., description="Explanation of the measurement units")
@@ -57,6 +60,29 @@ class MultiDatasetResponse(BaseModel):
     datasets: Dict[str, Union[PointDataResponse, Dict[str, Any]]] = Field(..., description="Data from each dataset")
     total_extraction_time_ms: float = Field(..., description="Total time for all extractions")
 
+class LeanDataValue(BaseModel):
+    """Data value without text; descriptions come from /parameters/metadata by classification ID."""
+    value: Optional[Union[float, str]] = Field(None, description="Data value (numeric or categorical)")
+    units: str = Field(..., description="Units of measurement")
+    valid: bool = Field(..., description="Whether the value is valid (not NaN)")
+    classification_id: Optional[str] = Field(None, description="Classification ID, e.g. 'sst.warm'")
+
+class LeanPointDataResponse(BaseModel):
+    """Point extraction response in lean detail mode."""
+    dataset: str = Field(..., description="Dataset name")
+    location: Coordinates = Field(..., description="Requested coordinates")
+    actual_location: Coordinates = Field(..., description="Actual grid coordinates used")
+    date: str = Field(..., description="Date of the data (YYYY-MM-DD)")
+    data: Dict[str, LeanDataValue] = Field(..., description="Extracted data variables")
+    extraction_time_ms: float = Field(..., description="Time taken for data extraction in milliseconds")
+
+class LeanMultiDatasetResponse(BaseModel):
+    """Multi-dataset point extraction response in lean detail mode."""
+    location: Coordinates = Field(..., description="Requested coordinates")
+    date: str = Field(..., description="Date of the data (YYYY-MM-DD)")
+    datasets: Dict[str, Union[LeanPointDataResponse, Dict[str, Any]]] = Field(..., description="Data from each dataset")
+    total_extraction_time_ms: float = Field(..., description="Total time for all extractions")
+
 class DatasetInfo(BaseModel):
     """Information about an available dataset."""
     name: str = Field(..., description="Human-readable dataset name")
@@ -79,4 +105,26 @@ class ErrorResponse(BaseModel):
     """Error response."""
     error: str = Field(..., description="Error message")
     status_code: int = Field(..., description="HTTP status code")
-    timestamp: str = Field(default_factory=lambda: datetime.now().isoformat(), description="Error timestamp")
\ No newline at end of file
+    timestamp: str = Field(default_factory=lambda: datetime.now().isoformat(), description="Error timestamp")
+
+class RegionVariableStats(BaseModel):
+    """Area-weighted statistics of one variable over a region."""
+    units: str = Field(..., description="Units of measurement")
+    long_name: str = Field(..., description="Descriptive name of the variable")
+    stats: Dict[str, Optional[Union[int, float]]] = Field(..., description="Requested statistics (None when no valid cells)")
+    valid_cells: int = Field(..., description="Cells with a finite value")
+    coverage_percent: float = Field(..., description="Ocean cells with a valid value, as a percentage of ocean cells in the region")
+    classifications: Optional[Dict[str, float]] = Field(None, description="Area-weighted share (%) of valid cells in each value classification")
+
+class RegionStatsResponse(BaseModel):
+    """Response for bounding-box aggregation."""
+    dataset: str = Field(..., description="Dataset name")
+    date: str = Field(..., description="Date of the data (YYYY-MM-DD)")
+    requested_bounds: Dict[str, float] = Field(..., description="Requested bounding box")
+    actual_bounds: Dict[str, float] = Field(..., description="Extent of the grid cells used")
+    grid_cells: int = Field(..., description="Grid cells inside the bounding box")
+    ocean_cells: int = Field(..., description="Grid cells inside the bounding box that are ocean")
+    weighting: str = Field("cos(lat)", description="Cell weighting used for the statistics")
+    variables: Dict[str, RegionVariableStats] = Field(..., description="Statistics per variable")
+    extraction_time_ms: float = Field(..., description="Time taken for aggregation in milliseconds")
+    file_source: str = Field(..., description="Source file name")
@@ -0,0 +1,221 @@
+"""
+On-demand sampling profiler for the API process.
+
+A profiling session starts a daemon thread that snapshots every thread's
+Python stack (sys._current_frames) every interval for a bounded window, then
+stops. Nothing is installed when no session runs: no trace or profile hooks,
+no thread, so the disabled cost is zero.
+
+Samples are aggregated as:
+- folded stacks ('outer;inner;leaf count'), the input format of flamegraph.pl,
+  speedscope and inferno
+- per-endpoint totals: a sample belongs to the route whose endpoint function
+  is on the sampled stack (threadpool workers and the event loop alike), with
+  the functions that were executing (self samples) for each endpoint
+
+Native time is attributed to the Python frame that called it, e.g. HDF5 reads
+show up under xarray's netCDF4 backend and validation under pydantic.
+"""
+
+import logging
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bounds of a session, so a forgotten request cannot leave the sampler running
+MAX_DURATION_S = 300.0
+MIN_INTERVAL_MS = 1.0
+MAX_INTERVAL_MS = 1000.0
+
+# Leaf frames of threads parked waiting for work (not request time unless inside an endpoint)
+IDLE_FRAMES = {
+    ("threading.py", "wait"), ("threading.py", "_wait_for_tstate_lock"),
+    ("queue.py", "get"), ("selectors.py", "select"), ("selectors.py", "poll"),
+    ("thread.py", "_worker")  # concurrent.futures worker blocked on its C SimpleQueue
+}
+
+UNATTRIBUTED = "(no endpoint)"
+
+
+def _frame_label(code: CodeType) -> str:
+    """'function (package/module.py)'; semicolons are the folded-stack separator."""
+    path = Path(code.co_filename)
+    return f"{code.co_name} ({path.parent.name}/{path.name})".replace(";", ":")
+
+
+@dataclass
+class ProfileSession:
+    """State and results of one sampling window."""
+    interval_ms: float
+    duration_s: float
+    started_at: str = field(default_factory=lambda: datetime.now().isoformat(timespec="seconds"))
+    running: bool = True
+    ticks: int = 0
+    stacks: Counter = field(default_factory=Counter)
+    endpoint_samples: Counter = field(default_factory=Counter)
+    endpoint_functions: Dict[str, Counter] = field(default_factory=dict)
+    elapsed_s: float = 0.0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def summary(self, top: int = 10) -> Dict[str, Any]:
+        """Session settings and per-endpoint aggregates (sample counts and estimated seconds)."""
+        interval_s = self.interval_ms / 1000
+        with self.lock:
+            return {
+                "running": self.running,
+                "started_at": self.started_at,
+                "duration_s": self.duration_s,
+                "interval_ms": self.interval_ms,
+                "elapsed_s": round(self.elapsed_s, 2),
+                "ticks": self.ticks,
+                "samples": sum(self.stacks.values()),
+                "endpoints": {
+                    endpoint: {
+                        "samples": samples,
+                        "estimated_seconds": round(samples * interval_s, 3),
+                        "top_functions": [
+                            {"function": function, "samples": count,
+                             "percent": round(100 * count / samples, 1)}
+                            for function, count in self.endpoint_functions[endpoint].most_common(top)
+                        ]
+                    }
+                    for endpoint, samples in self.endpoint_samples.most_common()
+                }
+            }
+
+    def folded(self) -> str:
+        """Folded stacks, one 'frame;frame;frame count' line per distinct stack."""
+        with self.lock:
+            return "".join(f"{stack} {count}\n" for stack, count in sorted(self.stacks.items()))
+
+
+class SamplingProfiler:
+    """Runs at most one bounded stack-sampling session at a time and keeps the last result."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._session: Optional[ProfileSession] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @property
+    def session(self) -> Optional[ProfileSession]:
+        """Running or most recent session (None before the first)."""
+        return self._session
+
+    def start(self, duration_s: float, interval_ms: float,
+              endpoints: Dict[CodeType, str]) -> ProfileSession:
+        """
+        Start sampling in the background.
+
+        Args:
+            duration_s: Window length in seconds (at most MAX_DURATION_S)
+            interval_ms: Time between stack snapshots in milliseconds
+            endpoints: Endpoint function code objects mapped to their route paths
+
+        Returns:
+            The new session
+
+        Raises:
+            ValueError: Duration or interval out of bounds
+            RuntimeError: A session is already running
+        """
+        if not 0 < duration_s <= MAX_DURATION_S:
+            raise ValueError(f"duration must be within (0, {MAX_DURATION_S:g}] seconds")
+        if not MIN_INTERVAL_MS <= interval_ms <= MAX_INTERVAL_MS:
+            raise ValueError(f"interval must be within [{MIN_INTERVAL_MS:g}, {MAX_INTERVAL_MS:g}] ms")
+
+        with self._lock:
+            if self._session is not None and self._session.running:
+                raise RuntimeError("A profiling session is already running")
+            session = ProfileSession(interval_ms=interval_ms, duration_s=duration_s)
+            self._session = session
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._sample, args=(session, endpoints),
+                                            name="sampling_profiler", daemon=True)
+            self._thread.start()
+        logger.info(f"🔬 Sampling profiler started: {duration_s:g}s every {interval_ms:g}ms")
+        return session
+
+    def stop(self) -> Optional[ProfileSession]:
+        """End the running session early; returns the (last) session."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        return self._session
+
+    def _sample(self, session: ProfileSession, endpoints: Dict[CodeType, str]):
+        own_id = threading.get_ident()
+        interval_s = session.interval_ms / 1000
+        start = time.perf_counter()
+        deadline = start + session.duration_s
+        try:
+            while not self._stop.is_set() and time.perf_counter() < deadline:
+                frames = sys._current_frames()
+                with session.lock:
+                    for thread_id, frame in frames.items():
+                        if thread_id != own_id:
+                            self._record(session, frame, endpoints)
+                    session.ticks += 1
+                del frames
+                self._stop.wait(interval_s)
+        except Exception as e:
+            logger.error(f"Sampling profiler failed: {e}")
+        finally:
+            session.elapsed_s = time.perf_counter() - start
+            session.running = False
+            logger.info(f"🔬 Sampling profiler finished: {session.ticks} ticks, "
+                        f"{sum(session.stacks.values())} samples")
+
+    @staticmethod
+    def _record(session: ProfileSession, frame: FrameType, endpoints: Dict[CodeType, str]):
+        """Add one thread's stack to the session (skipped when the thread idles outside an endpoint)."""
+        codes: List[CodeType] = []
+        while frame is not None:
+            codes.append(frame.f_code)
+            frame = frame.f_back
+        codes.reverse()
+
+        endpoint = next((endpoints[code] for code in codes if code in endpoints), None)
+        leaf = codes[-1]
+        if endpoint is None and (Path(leaf.co_filename).name, leaf.co_name) in IDLE_FRAMES:
+            return
+
+        endpoint = endpoint or UNATTRIBUTED
+        labels = [_frame_label(code) for code in codes]
+        session.stacks[";".join(labels)] += 1
+        session.endpoint_samples[endpoint] += 1
+        session.endpoint_functions.setdefault(endpoint, Counter())[labels[-1]] += 1
+
+
+def endpoint_codes(routes) -> Dict[CodeType, str]:
+    """Code objects of route endpoint functions mapped to '<METHODS> <path>' (e.g. 'GET /sst/point')."""
+    codes: Dict[CodeType, str] = {}
+    for route in routes:
+        endpoint = getattr(route, "endpoint", None)
+        code = getattr(endpoint, "__code__", None)
+        if code is None:
+            continue
+        methods = ",".join(sorted(getattr(route, "methods", None) or ())) or "WS"
+        codes[code] = f"{methods} {route.path}"
+    return codes
+
+
+# Shared by the admin endpoints
+sampling_profiler = SamplingProfiler()
+
+
+def profile_filename(session: ProfileSession, suffix: str = "folded") -> str:
+    """File name for a session's output, e.g. profile_20240701_120000.folded."""
+    stamp = session.started_at.replace("-", "").replace(":", "").replace("T", "_")
+    return f"profile_{stamp}.{suffix}"
+
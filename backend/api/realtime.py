@@ -0,0 +1,332 @@
+"""
+WebSocket channel for interactive point queries and data-update notifications.
+
+One connection carries many concurrent requests, each tagged with a client
+chosen ``id`` that is echoed on its response, so hovering the globe costs a
+small JSON frame instead of a full HTTP request. The same connection receives
+``data_update`` / ``texture_update`` pushes when new files land and doubles as
+the client's liveness signal in place of polling ``/health``.
+
+New files are detected through the file catalog's per-dataset generation
+counters, which the downloaders, processors and texture generators bump on
+every write, so the updater can run as a separate process. Broadcasts go to
+all clients concurrently; a client that cannot take a message within
+send_timeout is disconnected rather than holding up the others.
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set
+
+from fastapi import WebSocket, WebSocketDisconnect
+from starlette.concurrency import run_in_threadpool
+
+from api.endpoints.data_extractor import DataExtractor
+
+logger = logging.getLogger(__name__)
+
+POINT_DATASETS = ("sst", "currents", "acidity", "acidity_current", "acidity_historical", "microplastics")
+
+# Texture categories watched for new days, with the catalog glob of their daily images
+TEXTURE_PATTERNS = {"sst": "SST_*.png"}
+
+
+def _timestamp() -> str:
+    return datetime.now().isoformat()
+
+
+class _Connection:
+    """One client socket: serialized sends and its in-flight request tasks."""
+
+    def __init__(self, websocket: WebSocket, max_in_flight: int):
+        self.websocket = websocket
+        self.send_lock = asyncio.Lock()
+        self.tasks: Dict[str, asyncio.Task] = {}
+        self.slots = asyncio.Semaphore(max_in_flight)
+
+    async def send(self, message: Dict[str, Any]):
+        async with self.send_lock:
+            await self.websocket.send_json(message)
+
+
+class RealtimeHub:
+    """Multiplexes point queries over WebSockets and broadcasts data updates."""
+
+    def __init__(self, data_extractor: DataExtractor, poll_interval: float = 5.0,
+                 max_in_flight: int = 8, send_timeout: float = 5.0):
+        """
+        Initialize the hub.
+
+        Args:
+            data_extractor: Shared extractor answering point queries (may be a
+                deferred proxy; it is first used by the first catalog poll)
+            poll_interval: Seconds between checks of the catalog for new files
+            max_in_flight: Concurrent extractions allowed per connection
+            send_timeout: Seconds a client may take to accept a broadcast before it is dropped
+        """
+        self.data_extractor = data_extractor
+        self.poll_interval = poll_interval
+        self.max_in_flight = max_in_flight
+        self.send_timeout = send_timeout
+        self.connections: Set[_Connection] = set()
+        self._watch_task: Optional[asyncio.Task] = None
+        self._generations: Optional[Dict[str, Dict[str, int]]] = None
+        self._closing: Set[asyncio.Task] = set()
+        self.stats = {
+            "connections_total": 0,
+            "requests": 0,
+            "cancelled": 0,
+            "notifications": 0,
+            "dropped_slow_clients": 0
+        }
+
+    @property
+    def file_catalog(self):
+        return self.data_extractor.file_catalog
+
+    # Connection handling
+
+    async def serve(self, websocket: WebSocket):
+        """Run one client connection until it disconnects."""
+        await websocket.accept()
+        connection = _Connection(websocket, self.max_in_flight)
+        self.connections.add(connection)
+        self.stats["connections_total"] += 1
+        logger.info(f"🔌 WebSocket client connected ({len(self.connections)} active)")
+
+        try:
+            await connection.send({
+                "type": "connection",
+                "payload": {
+                    "status": "connected",
+                    "datasets": list(POINT_DATASETS),
+                    "latest_dates": await run_in_threadpool(self._latest_dates),
+                    "timestamp": _timestamp()
+                }
+            })
+            while True:
+                message = await websocket.receive_json()
+                await self._dispatch(connection, message)
+        except WebSocketDisconnect:
+            pass
+        except Exception as e:
+            logger.warning(f"WebSocket connection closed with error: {e}")
+        finally:
+            self.connections.discard(connection)
+            for task in connection.tasks.values():
+                task.cancel()
+            logger.info(f"🔌 WebSocket client disconnected ({len(self.connections)} active)")
+
+    async def _dispatch(self, connection: _Connection, message: Any):
+        """Route one client message; point queries run as independent tasks."""
+        if not isinstance(message, dict):
+            await self._send_error(connection, None, "Message must be a JSON object")
+            return
+
+        message_type = message.get("type")
+        request_id = message.get("id")
+
+        if message_type == "ping":
+            await connection.send({"type": "pong", "id": request_id, "payload": {"timestamp": _timestamp()}})
+        elif message_type == "cancel":
+            task = connection.tasks.get(str(message.get("target")))
+            if task is not None:
+                task.cancel()
+        elif message_type in ("point", "multi_point"):
+            if request_id is None:
+                await self._send_error(connection, None, f"'{message_type}' requests need an 'id'")
+                return
+            request_id = str(request_id)
+            previous = connection.tasks.get(request_id)
+            if previous is not None:
+                previous.cancel()
+            task = asyncio.create_task(self._answer(connection, request_id, message))
+            connection.tasks[request_id] = task
+            task.add_done_callback(lambda done, rid=request_id: self._forget_task(connection, rid, done))
+        else:
+            await self._send_error(connection, request_id, f"Unknown message type: {message_type}")
+
+    @staticmethod
+    def _forget_task(connection: _Connection, request_id: str, task: asyncio.Task):
+        if connection.tasks.get(request_id) is task:
+            del connection.tasks[request_id]
+
+    async def _answer(self, connection: _Connection, request_id: str, message: Dict[str, Any]):
+        """Run a point query in the threadpool and send its response."""
+        self.stats["requests"] += 1
+        try:
+            lat, lon = float(message["lat"]), float(message["lon"])
+            if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+                raise ValueError("lat must be within [-90, 90] and lon within [-180, 180]")
+            date_str = message.get("date")
+
+            async with connection.slots:
+                if message["type"] == "point":
+                    dataset = message.get("dataset")
+                    if dataset not in POINT_DATASETS:
+                        raise ValueError(f"Unknown dataset: {dataset}")
+                    result = await run_in_threadpool(
+                        self.data_extractor.extract_point_data, dataset, lat, lon, date_str
+                    )
+                    response_type = "point_data"
+                else:
+                    datasets = message.get("datasets") or ["sst", "acidity", "microplastics", "currents"]
+                    unknown = [name for name in datasets if name not in POINT_DATASETS]
+                    if unknown:
+                        raise ValueError(f"Unknown datasets: {', '.join(unknown)}")
+                    result = await run_in_threadpool(
+                        self.data_extractor.extract_multi_point_data, datasets, lat, lon, date_str
+                    )
+                    response_type = "multi_point_data"
+
+            await connection.send({
+                "type": response_type,
+                "id": request_id,
+                "payload": result.model_dump(mode="json")
+            })
+        except asyncio.CancelledError:
+            self.stats["cancelled"] += 1
+            raise
+        except (KeyError, TypeError, ValueError) as e:
+            await self._send_error(connection, request_id, f"Invalid request: {e}")
+        except Exception as e:
+            logger.error(f"WebSocket request {request_id} failed: {e}")
+            await self._send_error(connection, request_id, str(e))
+
+    async def _send_error(self, connection: _Connection, request_id: Optional[str], message: str):
+        try:
+            await connection.send({
+                "type": "error",
+                "id": request_id,
+                "payload": {"message": message, "timestamp": _timestamp()}
+            })
+        except Exception:
+            pass  # Client already gone
+
+    # Update notifications
+
+    def start(self):
+        """Start watching the catalog for new files (call from the running event loop)."""
+        if self._watch_task is None:
+            self._watch_task = asyncio.create_task(self._watch_updates())
+
+    async def stop(self):
+        """Stop the watcher and close open connections."""
+        if self._watch_task is not None:
+            self._watch_task.cancel()
+            try:
+                await self._watch_task
+            except asyncio.CancelledError:
+                pass
+            self._watch_task = None
+        for connection in list(self.connections):
+            try:
+                await connection.websocket.close(code=1001)
+            except Exception:
+                pass
+
+    async def _watch_updates(self):
+        """Poll the catalog generations and broadcast datasets/textures that changed."""
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                current = await run_in_threadpool(self._read_generations)
+                if self._generations is None:
+                    # First poll: the state to compare against, nothing to announce
+                    self._generations = current
+                    continue
+                notifications = await run_in_threadpool(self._changes_since, self._generations, current)
+                self._generations = current
+                for notification in notifications:
+                    await self.broadcast(notification)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Update watcher check failed: {e}")
+
+    def _read_generations(self) -> Dict[str, Dict[str, int]]:
+        return {
+            "unified": self.file_catalog.generations("unified"),
+            "textures": self.file_catalog.generations("textures")
+        }
+
+    def _changes_since(self, previous: Dict[str, Dict[str, int]],
+                       current: Dict[str, Dict[str, int]]) -> List[Dict[str, Any]]:
+        """Notifications for every dataset or texture category whose generation moved."""
+        notifications = []
+        for dataset_id, generation in current["unified"].items():
+            if dataset_id not in self.data_extractor.dataset_config:
+                continue
+            if previous.get("unified", {}).get(dataset_id) == generation:
+                continue
+            availability = self.data_extractor.availability_index.get(dataset_id)
+            notifications.append({
+                "type": "data_update",
+                "payload": {
+                    "dataset": dataset_id,
+                    "latest_date": availability.dates[-1] if availability.dates else None,
+                    "file_count": availability.file_count,
+                    "timestamp": _timestamp()
+                }
+            })
+        for category, generation in current["textures"].items():
+            if category not in TEXTURE_PATTERNS:
+                continue
+            if previous.get("textures", {}).get(category) == generation:
+                continue
+            latest = self.file_catalog.latest_date("textures", category, TEXTURE_PATTERNS[category])
+            notifications.append({
+                "type": "texture_update",
+                "payload": {
+                    "category": category,
+                    "latest_date": latest.isoformat() if latest else None,
+                    "timestamp": _timestamp()
+                }
+            })
+        return notifications
+
+    def _latest_dates(self) -> Dict[str, Optional[str]]:
+        summaries = self.data_extractor.availability_index.dataset_summaries()
+        return {dataset_id: summary["latest_date"] for dataset_id, summary in summaries.items()}
+
+    async def broadcast(self, message: Dict[str, Any]):
+        """Send a message to every connected client at once, dropping clients that fail or time out."""
+        self.stats["notifications"] += 1
+        connections = list(self.connections)
+        logger.info(f"📣 Broadcasting {message['type']} to {len(connections)} client(s): {message['payload']}")
+        results = await asyncio.gather(
+            *(asyncio.wait_for(connection.send(message), self.send_timeout) for connection in connections),
+            return_exceptions=True
+        )
+        for connection, result in zip(connections, results):
+            if isinstance(result, asyncio.TimeoutError):
+                self.stats["dropped_slow_clients"] += 1
+                logger.warning(f"⚠️ Dropping WebSocket client that took over {self.send_timeout:g}s to accept a broadcast")
+                self._drop(connection)
+            elif isinstance(result, Exception):
+                self._drop(connection)
+
+    def _drop(self, connection: _Connection):
+        """Stop serving a connection and close its socket in the background."""
+        self.connections.discard(connection)
+        for task in connection.tasks.values():
+            task.cancel()
+        task = asyncio.create_task(self._close(connection))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _close(self, connection: _Connection):
+        try:
+            # 1013: try again later; bounded, since a stalled client may not take the close frame either
+            await asyncio.wait_for(connection.websocket.close(code=1013), self.send_timeout)
+        except Exception:
+            pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Connection and request counters."""
+        return {
+            **self.stats,
+            "active_connections": len(self.connections),
+            "in_flight": sum(len(connection.tasks) for connection in self.connections)
+        }
@@ -0,0 +1,134 @@
+"""
+Single-flight request coalescing.
+
+Concurrent calls that share a key wait for one in-flight execution and all
+receive its result (or its exception), instead of each repeating the same
+file open and extraction. Nothing is cached once the flight lands; that is
+the cache manager's job.
+"""
+
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Flight:
+    """A single in-flight execution shared by the leader and its followers."""
+    done: threading.Event = field(default_factory=threading.Event)
+    result: Any = None
+    error: Optional[BaseException] = None
+    followers: int = 0
+
+
+class SingleFlight:
+    """Coalesces concurrent identical calls, from threads or coroutines."""
+
+    def __init__(self, name: str):
+        """
+        Initialize a single-flight group.
+
+        Args:
+            name: Group name used in stats and logs
+        """
+        self.name = name
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._async_flights: Dict[Hashable, asyncio.Future] = {}
+        self.stats = {
+            "calls": 0,
+            "executions": 0,
+            "deduplicated": 0,
+            "errors": 0
+        }
+
+    def run(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn once per key across concurrent threads.
+
+        Args:
+            key: Identity of the work
+            fn: Zero-argument callable doing the work
+
+        Returns:
+            fn's result, shared with every caller that joined the flight
+        """
+        with self._lock:
+            self.stats["calls"] += 1
+            flight = self._flights.get(key)
+            if flight is not None:
+                flight.followers += 1
+                self.stats["deduplicated"] += 1
+                leader = False
+            else:
+                flight = _Flight()
+                self._flights[key] = flight
+                self.stats["executions"] += 1
+                leader = True
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = fn()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            with self._lock:
+                self.stats["errors"] += 1
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+            if flight.followers:
+                logger.debug(f"🔗 {self.name}: {flight.followers} request(s) joined flight {key}")
+
+    async def run_async(self, key: Hashable, coro_fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await coro_fn once per key across concurrent coroutines on the event loop.
+
+        Args:
+            key: Identity of the work
+            coro_fn: Zero-argument callable returning an awaitable
+
+        Returns:
+            The awaitable's result, shared with every caller that joined the flight
+        """
+        self.stats["calls"] += 1
+        task = self._async_flights.get(key)
+        if task is None:
+            # The work runs as its own task, so no single caller owns it
+            task = asyncio.ensure_future(coro_fn())
+            self._async_flights[key] = task
+            self.stats["executions"] += 1
+            task.add_done_callback(lambda done: self._land_async(key, done))
+        else:
+            self.stats["deduplicated"] += 1
+
+        # shield: a cancelled caller, the first one included, must not cancel the shared work
+        return await asyncio.shield(task)
+
+    def _land_async(self, key: Hashable, task: asyncio.Future) -> None:
+        """Retire a finished async flight and count its failure."""
+        if self._async_flights.get(key) is task:
+            del self._async_flights[key]
+        # exception() also marks the error retrieved when every caller has gone
+        if not task.cancelled() and task.exception() is not None:
+            self.stats["errors"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters plus the current number of in-flight keys."""
+        with self._lock:
+            in_flight = len(self._flights) + len(self._async_flights)
+            stats = dict(self.stats)
+        stats["in_flight"] = in_flight
+        stats["dedup_ratio"] = round(stats["deduplicated"] / stats["calls"], 3) if stats["calls"] else 0.0
+        return stats
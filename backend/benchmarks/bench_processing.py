@@ -0,0 +1,92 @@
+"""
+Micro-benchmarks of the ingest pipeline's processing and texture stages.
+
+Stages run on synthetic grids in their downloaded layouts
+(benchmarks/fixtures.py) at each spacing of --grid-resolutions:
+
+- downsample:  SSTDownsampler.downsample_dataset to 1° (4x coarser for 1° input)
+- harmonize:   CoordinateHarmonizer.harmonize_dataset, 0-360° to -180-180°
+- currents:    CurrentsProcessor.process_dataset on three depth levels
+- texture:     TextureGenerator.data_to_texture of the harmonized SST field
+- ultra:       TextureGenerator.resample_to_ultra_resolution of that field
+- microplastics: MicroplasticsTextureGenerator.create_monthly_texture per texture size
+
+    cd benchmarks && python -m pytest --benchmark-autosave
+"""
+
+import numpy as np
+import pytest
+
+from benchmarks.fixtures import raw_currents_dataset, raw_microplastics_frame, raw_sst_dataset
+from processors.coordinate_harmonizer import CoordinateHarmonizer
+from processors.currents_processor import CurrentsProcessor
+from processors.microplastics_texture_generator import MicroplasticsTextureGenerator
+from processors.sst_downsampler import SSTDownsampler
+from processors.texture_generator import TextureGenerator
+
+
+@pytest.fixture(scope="session")
+def raw_sst(grid_resolution):
+    return raw_sst_dataset(grid_resolution)
+
+
+@pytest.fixture(scope="session")
+def raw_currents(grid_resolution):
+    return raw_currents_dataset(grid_resolution)
+
+
+@pytest.fixture(scope="session")
+def sst_field(raw_sst):
+    """Harmonized 2D SST field with its (lon, lat) coordinates."""
+    ds = CoordinateHarmonizer().harmonize_dataset(raw_sst)
+    return ds["sst"].isel(time=0, zlev=0).values, ds["lon"].values, ds["lat"].values
+
+
+@pytest.fixture(scope="session")
+def texture_generator(tmp_path_factory):
+    return TextureGenerator(tmp_path_factory.mktemp("textures"))
+
+
+@pytest.mark.benchmark(group="downsample")
+def bench_downsample(stage, raw_sst, grid_resolution):
+    target = 1.0 if grid_resolution < 1 else grid_resolution * 4
+    result = stage(SSTDownsampler().downsample_dataset, raw_sst, target, target)
+    assert result.sizes["lat"] == round(180 / target)
+
+
+@pytest.mark.benchmark(group="harmonize")
+def bench_harmonize(stage, raw_sst):
+    result = stage(CoordinateHarmonizer().harmonize_dataset, raw_sst, target_convention="-180-180")
+    assert float(result["lon"].min()) < 0
+
+
+@pytest.mark.benchmark(group="currents")
+def bench_process_currents(stage, raw_currents):
+    result = stage(CurrentsProcessor().process_dataset, raw_currents)
+    assert "uo" in result and "depth" not in result["uo"].dims
+
+
+@pytest.mark.benchmark(group="texture")
+def bench_data_to_texture(stage, texture_generator, sst_field):
+    data, lon, lat = sst_field
+    texture, _ = stage(texture_generator.data_to_texture, data, lon, lat,
+                       texture_generator.get_scientific_colormap("sst"))
+    assert texture.shape == data.shape + (4,)
+
+
+@pytest.mark.benchmark(group="ultra")
+def bench_resample_to_ultra_resolution(stage, texture_generator, sst_field):
+    data, lon, lat = sst_field
+    # Cubic interpolation (heavy upsampling) needs finite input: fill land with the ocean mean
+    filled = np.where(np.isnan(data), np.nanmean(data), data)
+    resampled, _, _ = stage(texture_generator.resample_to_ultra_resolution, filled, lon, lat, rounds=1)
+    assert resampled.shape[1] >= 2880
+
+
+@pytest.mark.benchmark(group="microplastics")
+@pytest.mark.parametrize("texture_resolution", ["low", "medium", "high"])
+def bench_microplastics_monthly_texture(stage, tmp_path, texture_resolution):
+    generator = MicroplasticsTextureGenerator(output_dir=str(tmp_path))
+    generator.data = raw_microplastics_frame(year=2024, month=7)
+    path = stage(generator.create_monthly_texture, 2024, 7, texture_resolution)
+    assert path.endswith(f"_{texture_resolution}.png")
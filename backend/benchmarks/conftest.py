@@ -0,0 +1,102 @@
+"""
+pytest-benchmark configuration of the processing micro-benchmarks.
+
+Each benchmark runs one pipeline stage on synthetic grids of every spacing in
+--grid-resolutions. The `stage` fixture times the stage with pytest-benchmark
+and records its peak traced memory in the benchmark's extra_info, so
+--benchmark-autosave / --benchmark-json keep time and memory together and
+--memory-baseline can compare peak memory against an earlier saved run.
+"""
+
+import gc
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+# Add backend to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+DEFAULT_GRID_RESOLUTIONS = "1,0.25,0.083"
+
+# Peaks below this are treated as equal to it when comparing (allocator noise)
+MEMORY_FLOOR_MB = 1.0
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("processing benchmarks")
+    group.addoption("--grid-resolutions", default=DEFAULT_GRID_RESOLUTIONS,
+                    help=f"Comma-separated grid spacings in degrees (default: {DEFAULT_GRID_RESOLUTIONS}; "
+                         "0.083 means 1/12°)")
+    group.addoption("--memory-baseline",
+                    help="Saved pytest-benchmark JSON whose peak memory per benchmark to compare against")
+    group.addoption("--memory-tolerance", type=float, default=0.2,
+                    help="Allowed relative peak-memory growth against --memory-baseline (default: 0.2)")
+
+
+def grid_spacing(text: str) -> float:
+    """Grid spacing in degrees; values close to 1/n (such as 0.083) snap to exactly 1/n."""
+    value = float(text)
+    if value < 1:
+        cells = round(1 / value)
+        if abs(1 / cells - value) < 1e-3:
+            return 1 / cells
+    return value
+
+
+def pytest_generate_tests(metafunc):
+    if "grid_resolution" in metafunc.fixturenames:
+        texts = [text.strip() for text in metafunc.config.getoption("grid_resolutions").split(",") if text.strip()]
+        metafunc.parametrize("grid_resolution", [grid_spacing(text) for text in texts],
+                             ids=[f"{text}deg" for text in texts], scope="session")
+
+
+@pytest.fixture(scope="session")
+def memory_baseline(pytestconfig) -> Dict[str, float]:
+    """Peak memory (MB) per benchmark name of the --memory-baseline run (empty without one)."""
+    path = pytestconfig.getoption("memory_baseline")
+    if not path:
+        return {}
+    saved = json.loads(Path(path).read_text())
+    return {bench["fullname"]: bench["extra_info"]["peak_memory_mb"]
+            for bench in saved.get("benchmarks", [])
+            if "peak_memory_mb" in bench.get("extra_info", {})}
+
+
+def _traced_peak(func, args: tuple, kwargs: dict) -> float:
+    """Run func once under tracemalloc and return its peak traced allocation in MB."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return round(peak / 1024 ** 2, 2)
+
+
+@pytest.fixture
+def stage(benchmark, request, memory_baseline, pytestconfig):
+    """
+    Benchmark a pipeline stage: peak memory from one traced run, then timed rounds.
+
+    The traced run doubles as the warm-up, so the timed rounds see warm
+    imports and colormap caches without the tracemalloc overhead.
+
+    Usage: stage(func, *args, rounds=3, **kwargs)
+    """
+    def run(func, *args, rounds: int = 3, **kwargs):
+        peak_mb = _traced_peak(func, args, kwargs)
+        benchmark.extra_info["peak_memory_mb"] = peak_mb
+        result = benchmark.pedantic(func, args=args, kwargs=kwargs, rounds=rounds, iterations=1)
+
+        before = memory_baseline.get(request.node.nodeid)
+        tolerance = pytestconfig.getoption("memory_tolerance")
+        if before is not None and peak_mb > max(before, MEMORY_FLOOR_MB) * (1 + tolerance):
+            pytest.fail(f"Peak memory regressed: {before} MB -> {peak_mb} MB (tolerance {tolerance:.0%})")
+        return result
+
+    return run
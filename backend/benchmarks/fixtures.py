@@ -0,0 +1,283 @@
+"""
+Synthetic harmonized NetCDF fixtures for benchmarks.
+
+Writes a small ocean-data root with the same directory layout, file names,
+dimensions and variables as the processed/unified_coords output of the
+pipeline, so the API can be exercised without downloading real data:
+
+- sst:                (time, zlev, lat, lon) sst, anom, err, ice
+- currents:           (time, depth, latitude, longitude) uo, vo, thetao, so
+- acidity_historical: (time, depth, latitude, longitude) no3, po4, si, o2, chl, nppv
+- acidity_current:    (time, depth, latitude, longitude) ph, dissic, talk
+- microplastics:      point observations along 'time'
+- textures/sst:       medium-resolution PNG frames for animation requests
+
+Fields are smooth functions of latitude, longitude and day with a fixed land
+mask, so values are plausible, deterministic for a seed and compress like
+real data.
+
+raw_sst_dataset(), raw_currents_dataset() and raw_microplastics_frame() build
+in-memory inputs in the downloaded (pre-processing) layouts for the
+processing micro-benchmarks: OISST on a 0-360° longitude grid, CMEMS
+currents with several depth levels and the unified microplastics CSV table.
+"""
+
+import logging
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import xarray as xr
+from PIL import Image
+
+from utils.file_catalog import get_file_catalog
+from utils.netcdf_encoding import encoding_policy
+from utils.ingest import ingest_output
+
+logger = logging.getLogger(__name__)
+
+# Default grid spacing (degrees) of each gridded dataset, as served in production
+DEFAULT_RESOLUTIONS = {
+    "sst": 1.0,
+    "currents": 0.25,
+    "acidity_historical": 0.25,
+    "acidity_current": 0.25
+}
+
+MICROPLASTICS_OBSERVATIONS = 20000
+TEXTURE_SIZE = (1024, 512)
+
+
+def fixture_dates(end_date: str, days: int) -> List[str]:
+    """The `days` consecutive dates (YYYY-MM-DD) ending at end_date."""
+    end = date.fromisoformat(end_date)
+    return [(end - timedelta(days=offset)).isoformat() for offset in range(days - 1, -1, -1)]
+
+
+def _axes(resolution: float):
+    """Cell-centred latitude and longitude axes of a global grid."""
+    lat = np.arange(-90 + resolution / 2, 90, resolution)
+    lon = np.arange(-180 + resolution / 2, 180, resolution)
+    return lat, lon
+
+
+def _land_mask(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+    """Fixed blob-shaped continents (True on land) covering roughly 30% of the globe."""
+    lat2d, lon2d = np.meshgrid(np.radians(lat), np.radians(lon), indexing="ij")
+    field = (np.sin(2 * lon2d) * np.cos(3 * lat2d) + 0.6 * np.sin(lon2d + 1.3) * np.cos(lat2d)
+             + 0.5 * np.cos(5 * lat2d + lon2d))
+    return (field > 0.55) | (lat2d < np.radians(-78))
+
+
+def _wave(lat: np.ndarray, lon: np.ndarray, day: int, phase: float) -> np.ndarray:
+    """Smooth day-dependent pattern in [-1, 1]."""
+    lat2d, lon2d = np.meshgrid(np.radians(lat), np.radians(lon), indexing="ij")
+    return np.sin(3 * lon2d + 0.05 * day + phase) * np.cos(2 * lat2d + phase)
+
+
+def _unified_path(data_root: Path, dataset: str, date_str: str) -> Path:
+    year, month = date_str[:4], date_str[5:7]
+    return (data_root / "processed" / "unified_coords" / dataset / year / month
+            / f"{dataset}_harmonized_{date_str.replace('-', '')}.nc")
+
+
+def _sst_dataset(date_str: str, resolution: float, rng: np.random.Generator) -> xr.Dataset:
+    lat, lon = _axes(resolution)
+    day = date.fromisoformat(date_str).timetuple().tm_yday
+    land = _land_mask(lat, lon)
+    lat2d = np.repeat(lat[:, None], lon.size, axis=1)
+
+    sst = 28 * np.cos(np.radians(lat2d)) ** 2 - 1.5 + 2 * _wave(lat, lon, day, 0.0)
+    sst += rng.normal(0, 0.2, sst.shape)
+    anom = 1.5 * _wave(lat, lon, day, 1.1)
+    err = 0.1 + 0.3 * np.abs(_wave(lat, lon, day, 2.3))
+    ice = np.clip((np.abs(lat2d) - 65) / 15, 0, 1)
+    fields = {"sst": (sst, "degC"), "anom": (anom, "degC"), "err": (err, "degC"), "ice": (ice, "%")}
+
+    data_vars = {}
+    for name, (values, units) in fields.items():
+        values = np.where(land, np.nan, values).astype("float32")
+        data_vars[name] = (("time", "zlev", "lat", "lon"), values[None, None], {"units": units})
+    return xr.Dataset(data_vars, coords={
+        "time": [np.datetime64(date_str, "ns")], "zlev": [0.0], "lat": lat, "lon": lon
+    })
+
+
+def _cmems_dataset(date_str: str, resolution: float, fields: Dict[str, tuple]) -> xr.Dataset:
+    """Surface layer on a CMEMS-style (time, depth, latitude, longitude) grid."""
+    lat, lon = _axes(resolution)
+    land = _land_mask(lat, lon)
+    data_vars = {}
+    for name, (values, units) in fields.items():
+        values = np.where(land, np.nan, values).astype("float32")
+        data_vars[name] = (("time", "depth", "latitude", "longitude"), values[None, None], {"units": units})
+    return xr.Dataset(data_vars, coords={
+        "time": [np.datetime64(date_str, "ns")], "depth": [0.494], "latitude": lat, "longitude": lon
+    })
+
+
+def _currents_dataset(date_str: str, resolution: float, rng: np.random.Generator) -> xr.Dataset:
+    lat, lon = _axes(resolution)
+    day = date.fromisoformat(date_str).timetuple().tm_yday
+    lat2d = np.repeat(lat[:, None], lon.size, axis=1)
+    # Zonal jets with eddies
+    uo = 0.4 * np.cos(np.radians(3 * lat2d)) + 0.2 * _wave(lat, lon, day, 0.4)
+    vo = 0.2 * _wave(lat, lon, day, 1.9)
+    thetao = 28 * np.cos(np.radians(lat2d)) ** 2 - 1.0 + _wave(lat, lon, day, 0.2)
+    so = 35 + 0.8 * _wave(lat, lon, day, 2.7) + rng.normal(0, 0.05, lat2d.shape)
+    return _cmems_dataset(date_str, resolution, {
+        "uo": (uo, "m s-1"), "vo": (vo, "m s-1"), "thetao": (thetao, "degC"), "so": (so, "1e-3")
+    })
+
+
+def _acidity_historical_dataset(date_str: str, resolution: float, rng: np.random.Generator) -> xr.Dataset:
+    lat, lon = _axes(resolution)
+    day = date.fromisoformat(date_str).timetuple().tm_yday
+    polar = np.repeat((np.abs(lat) / 90)[:, None], lon.size, axis=1)
+    return _cmems_dataset(date_str, resolution, {
+        "no3": (np.clip(25 * polar + 2 * _wave(lat, lon, day, 0.3), 0, None), "mmol m-3"),
+        "po4": (np.clip(1.8 * polar + 0.2 * _wave(lat, lon, day, 0.8), 0, None), "mmol m-3"),
+        "si": (np.clip(40 * polar ** 2 + 3 * _wave(lat, lon, day, 1.4), 0, None), "mmol m-3"),
+        "o2": (220 + 120 * polar + 10 * _wave(lat, lon, day, 2.1), "mmol m-3"),
+        "chl": (np.exp(rng.normal(-1.2, 0.6, polar.shape) + 1.5 * polar), "mg m-3"),
+        "nppv": (np.clip(30 - 20 * polar + 8 * _wave(lat, lon, day, 2.9), 0, None), "mg m-3 day-1")
+    })
+
+
+def _acidity_current_dataset(date_str: str, resolution: float, rng: np.random.Generator) -> xr.Dataset:
+    lat, lon = _axes(resolution)
+    day = date.fromisoformat(date_str).timetuple().tm_yday
+    polar = np.repeat((np.abs(lat) / 90)[:, None], lon.size, axis=1)
+    return _cmems_dataset(date_str, resolution, {
+        "ph": (8.05 - 0.08 * polar + 0.02 * _wave(lat, lon, day, 0.6), "1"),
+        "dissic": (2000 + 180 * polar + 15 * _wave(lat, lon, day, 1.6), "mmol m-3"),
+        "talk": (2300 + 40 * _wave(lat, lon, day, 2.4) + rng.normal(0, 3, polar.shape), "mmol m-3")
+    })
+
+
+GRIDDED_BUILDERS = {
+    "sst": _sst_dataset,
+    "currents": _currents_dataset,
+    "acidity_historical": _acidity_historical_dataset,
+    "acidity_current": _acidity_current_dataset
+}
+
+
+def raw_sst_dataset(resolution: float, date_str: str = "2024-07-01", seed: int = 0) -> xr.Dataset:
+    """NOAA OISST-style SST at the given spacing: (time, zlev, lat, lon) with 0-360° longitudes."""
+    ds = _sst_dataset(date_str, resolution, np.random.default_rng(seed))
+    ds = ds.roll(lon=ds.sizes["lon"] // 2, roll_coords=True)
+    return ds.assign_coords(lon=np.mod(ds["lon"].values, 360.0))
+
+
+def raw_currents_dataset(resolution: float, date_str: str = "2024-07-01", depths: int = 3,
+                         seed: int = 0) -> xr.Dataset:
+    """CMEMS-style currents at the given spacing: (time, depth, latitude, longitude) with `depths` levels."""
+    surface = _currents_dataset(date_str, resolution, np.random.default_rng(seed))
+    levels = [0.494, 1.541, 2.646, 3.819, 5.078, 6.441][:depths]
+    # Velocities weaken with depth
+    decay = xr.DataArray(np.exp(-np.arange(depths) / 4.0), dims="depth", coords={"depth": levels})
+    ds = surface.isel(depth=0, drop=True).expand_dims(depth=levels, axis=1)
+    for name in ("uo", "vo"):
+        ds[name] = (ds[name] * decay).astype("float32").transpose("time", "depth", "latitude", "longitude")
+        ds[name].attrs = surface[name].attrs
+    return ds
+
+
+def raw_microplastics_frame(observations: int = MICROPLASTICS_OBSERVATIONS, year: int = 2024, month: int = 7,
+                            seed: int = 0) -> pd.DataFrame:
+    """Unified microplastics CSV rows (as read by MicroplasticsTextureGenerator), all in one month."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "Latitude (degree)": rng.uniform(-60, 60, observations),
+        "Longitude(degree)": rng.uniform(-180, 180, observations),
+        "Microplastics measurement": rng.lognormal(-1, 2, observations),
+        "year": year,
+        "month": month
+    })
+
+
+def _microplastics_dataset(observations: int, rng: np.random.Generator) -> xr.Dataset:
+    """Unified microplastics observations, real (1993-2019) and synthetic (2019-2025)."""
+    days = np.sort(rng.integers(0, 33 * 365, observations))
+    times = pd.to_datetime("1993-01-01") + pd.to_timedelta(days, unit="D")
+    synthetic = times >= pd.Timestamp("2019-07-01")
+    return xr.Dataset({
+        "microplastics_concentration": ("time", rng.lognormal(-1, 2, observations)),
+        "latitude": ("time", rng.uniform(-60, 60, observations)),
+        "longitude": ("time", rng.uniform(-180, 180, observations)),
+        "data_source": ("time", np.where(synthetic, "synthetic", "real")),
+        "confidence": ("time", np.where(synthetic, 0.7, 1.0))
+    }, coords={"time": times.values})
+
+
+def _write_texture(path: Path, date_str: str):
+    """Gradient PNG standing in for a rendered SST texture."""
+    width, height = TEXTURE_SIZE
+    day = date.fromisoformat(date_str).timetuple().tm_yday
+    x = np.linspace(0, 2 * np.pi, width)
+    y = np.linspace(-np.pi / 2, np.pi / 2, height)
+    field = (np.cos(y)[:, None] ** 2 * (0.8 + 0.2 * np.sin(x[None, :] * 3 + day * 0.05)))
+    rgb = np.stack([field * 255, field * 160, (1 - field) * 255], axis=-1).astype(np.uint8)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.fromarray(rgb).save(path, optimize=False)
+
+
+def write_fixtures(data_root: Path, dates: List[str], resolutions: Optional[Dict[str, float]] = None,
+                   microplastics_observations: int = MICROPLASTICS_OBSERVATIONS, seed: int = 0,
+                   force: bool = False) -> Dict[str, int]:
+    """
+    Write a synthetic ocean-data root and index it in the file catalog.
+
+    Existing files are kept unless force is set, so repeated runs reuse them.
+
+    Args:
+        data_root: Directory to populate (must be named 'ocean-data' for the catalog)
+        dates: Dates (YYYY-MM-DD) to write gridded files and textures for
+        resolutions: Grid spacing per gridded dataset (defaults to DEFAULT_RESOLUTIONS)
+        microplastics_observations: Number of microplastics points
+        seed: Random seed of the noise components
+        force: Rewrite files that already exist
+
+    Returns:
+        Number of files written per dataset
+    """
+    data_root = Path(data_root)
+    resolutions = {**DEFAULT_RESOLUTIONS, **(resolutions or {})}
+    rng = np.random.default_rng(seed)
+    written = {}
+
+    for dataset, builder in GRIDDED_BUILDERS.items():
+        written[dataset] = 0
+        for date_str in dates:
+            path = _unified_path(data_root, dataset, date_str)
+            if path.exists() and not force:
+                continue
+            path.parent.mkdir(parents=True, exist_ok=True)
+            ds = builder(date_str, resolutions[dataset], rng)
+            encoding_policy.write(ds, path)
+            ingest_output(ds, path)
+            written[dataset] += 1
+
+    microplastics_path = (data_root / "processed" / "unified_coords" / "microplastics" / "unified"
+                          / "microplastics_complete_1993_2025.nc")
+    written["microplastics"] = 0
+    if force or not microplastics_path.exists():
+        microplastics_path.parent.mkdir(parents=True, exist_ok=True)
+        _microplastics_dataset(microplastics_observations, rng).to_netcdf(microplastics_path)
+        written["microplastics"] = 1
+
+    written["textures"] = 0
+    for date_str in dates:
+        compact = date_str.replace("-", "")
+        path = data_root / "textures" / "sst" / date_str[:4] / f"sst_texture_{compact}_medium.png"
+        if path.exists() and not force:
+            continue
+        _write_texture(path, date_str)
+        written["textures"] += 1
+
+    counts = get_file_catalog(data_root).rebuild()
+    logger.info(f"🧪 Fixtures in {data_root}: {written} (catalog: {counts})")
+    return written
@@ -0,0 +1,300 @@
+"""
+In-process load test of the API.
+
+Drives the FastAPI app through Starlette's TestClient (the full middleware
+stack, no network) with concurrent workers, records per-request latency and
+samples the process RSS and open file handles while a workload runs.
+
+Workloads mirror how the globe front end uses the API:
+- click:     a user clicking the globe (multi-dataset and per-dataset point lookups)
+- animation: scrubbing through days (sequence manifest, texture frames, current
+             vector fields and map tiles of consecutive dates)
+- batch:     analysis requests (region statistics, filtered microplastics
+             collections, dataset listings and metadata)
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import psutil
+
+# (path, query parameters) of one request
+RequestSpec = Tuple[str, Dict[str, Any]]
+
+LATENCY_METRICS = ("p50_ms", "p95_ms", "p99_ms")
+PROCESS_METRICS = ("rss_peak_mb", "rss_end_mb", "open_files_peak", "open_files_end")
+
+# Latencies below this are treated as equal to it when comparing (timer noise)
+LATENCY_FLOOR_MS = 1.0
+
+# Open-handle counts are small; growth within this many handles is not a leak
+OPEN_FILES_SLACK = 8
+
+
+def _ocean_point(rng: random.Random) -> Tuple[float, float]:
+    return round(rng.uniform(-60, 65), 3), round(rng.uniform(-180, 180), 3)
+
+
+def _bbox(rng: random.Random, max_span: float = 40.0) -> str:
+    min_lon = rng.uniform(-180, 180 - max_span)
+    min_lat = rng.uniform(-70, 70 - max_span / 2)
+    return (f"{min_lon:.2f},{min_lat:.2f},"
+            f"{min_lon + rng.uniform(5, max_span):.2f},{min_lat + rng.uniform(5, max_span / 2):.2f}")
+
+
+def click_requests(rng: random.Random, dates: List[str], count: int) -> List[RequestSpec]:
+    """Point lookups as issued by globe clicks (multi-point first, then single datasets)."""
+    requests = []
+    while len(requests) < count:
+        lat, lon = _ocean_point(rng)
+        date_str = rng.choice(dates)
+        detail = "lean" if rng.random() < 0.7 else "full"
+        requests.append(("/multi/point", {"lat": lat, "lon": lon, "date": date_str, "detail": detail,
+                                          "datasets": "sst,acidity,microplastics,currents"}))
+        dataset = rng.choice(("sst", "currents", "acidity"))
+        requests.append((f"/{dataset}/point", {"lat": lat, "lon": lon, "date": date_str, "detail": detail}))
+    return requests[:count]
+
+
+def animation_requests(rng: random.Random, dates: List[str], count: int) -> List[RequestSpec]:
+    """Frame-by-frame playback of a date window: manifest, textures, vectors and tiles."""
+    requests = []
+    while len(requests) < count:
+        requests.append(("/textures/sst/sequence", {"start": dates[0], "end": dates[-1], "format": "manifest"}))
+        x, y = rng.randrange(4), rng.randrange(4)
+        for date_str in dates:
+            requests.append(("/textures/sst", {"date": date_str, "resolution": "medium"}))
+            requests.append(("/currents/vectors", {"date": date_str, "resolution": rng.choice((1.0, 2.0)),
+                                                   "format": "float16"}))
+            requests.append((f"/tiles/sst/2/{x}/{y}.png", {"date": date_str}))
+    return requests[:count]
+
+
+def batch_requests(rng: random.Random, dates: List[str], count: int) -> List[RequestSpec]:
+    """Analysis and listing requests: region statistics, microplastics collections, metadata."""
+    requests = []
+    while len(requests) < count:
+        dataset = rng.choice(("sst", "currents", "acidity_current", "acidity_historical"))
+        requests.append((f"/{dataset}/region", {"bbox": _bbox(rng), "date": rng.choice(dates),
+                                                "stats": "mean,min,max,std,p90"}))
+        year_min = rng.randrange(1993, 2020)
+        requests.append(("/microplastics/points", rng.choice((
+            {},
+            {"data_source": "real"},
+            {"year_min": year_min, "year_max": year_min + 5},
+            {"min_concentration": 1.0, "bounds": _bbox(rng, 90.0)}
+        ))))
+        requests.append(rng.choice((
+            ("/available-dates", {}),
+            ("/datasets", {}),
+            ("/parameters/metadata", {})
+        )))
+    return requests[:count]
+
+
+@dataclass
+class Workload:
+    """Named request mix run with a fixed number of concurrent workers."""
+    name: str
+    description: str
+    build: Callable[[random.Random, List[str], int], List[RequestSpec]]
+    concurrency: int
+
+
+WORKLOADS = {
+    "click": Workload("click", "Globe clicks: multi-dataset and single-dataset point lookups", click_requests, 8),
+    "animation": Workload("animation", "Date scrubbing: sequence manifest, textures, vectors, tiles",
+                          animation_requests, 4),
+    "batch": Workload("batch", "Region statistics, microplastics collections, listings", batch_requests, 4)
+}
+
+
+class ProcessSampler:
+    """Background sampler of the peak RSS and open file handles of this process."""
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.process = psutil.Process()
+        self.rss_peak = 0
+        self.open_files_peak = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def open_files(self) -> int:
+        """Open file descriptors (handles on Windows)."""
+        if hasattr(self.process, "num_fds"):
+            return self.process.num_fds()
+        return self.process.num_handles()
+
+    def sample(self):
+        self.rss_peak = max(self.rss_peak, self.process.memory_info().rss)
+        self.open_files_peak = max(self.open_files_peak, self.open_files())
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def __enter__(self) -> "ProcessSampler":
+        self.sample()
+        self._thread = threading.Thread(target=self._run, name="benchmark_sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        self.sample()
+
+    def snapshot(self) -> Dict[str, float]:
+        return {
+            "rss_peak_mb": round(self.rss_peak / 1024 ** 2, 1),
+            "rss_end_mb": round(self.process.memory_info().rss / 1024 ** 2, 1),
+            "open_files_peak": self.open_files_peak,
+            "open_files_end": self.open_files()
+        }
+
+
+@dataclass
+class WorkloadResult:
+    """Latency distribution and process footprint of one workload run."""
+    name: str
+    concurrency: int
+    latencies_ms: List[float] = field(default_factory=list)
+    statuses: Dict[int, int] = field(default_factory=dict)
+    errors: int = 0
+    bytes_received: int = 0
+    elapsed_s: float = 0.0
+    process: Dict[str, float] = field(default_factory=dict)
+
+    def summary(self) -> Dict[str, Any]:
+        latencies = np.asarray(self.latencies_ms)
+        count = latencies.size
+        p50, p95, p99 = np.percentile(latencies, (50, 95, 99)) if count else (0.0, 0.0, 0.0)
+        return {
+            "requests": count,
+            "concurrency": self.concurrency,
+            "errors": self.errors,
+            "error_rate": round(self.errors / count, 4) if count else 0.0,
+            "statuses": {str(status): n for status, n in sorted(self.statuses.items())},
+            "p50_ms": round(float(p50), 2),
+            "p95_ms": round(float(p95), 2),
+            "p99_ms": round(float(p99), 2),
+            "mean_ms": round(float(latencies.mean()), 2) if count else 0.0,
+            "throughput_rps": round(count / self.elapsed_s, 1) if self.elapsed_s else 0.0,
+            "mb_received": round(self.bytes_received / 1024 ** 2, 2),
+            **self.process
+        }
+
+
+def is_error(response) -> bool:
+    """
+    Whether a response failed, including failures the API reports with status 200.
+
+    Point extraction answers a failed read with file_source "error" (or an
+    "error" field per dataset of a multi-dataset lookup) instead of an error
+    status, so JSON bodies are inspected as well as the status code.
+    """
+    if not 200 <= response.status_code < 300:
+        return True
+    if not response.headers.get("content-type", "").startswith("application/json"):
+        return False
+    try:
+        body = response.json()
+    except ValueError:
+        return True
+    if not isinstance(body, dict):
+        return False
+    entries = [body] + [entry for entry in (body.get("datasets") or {}).values() if isinstance(entry, dict)]
+    return any("error" in entry or entry.get("file_source") == "error" for entry in entries)
+
+
+def run_workload(client, workload: Workload, dates: List[str], requests: int, seed: int = 0,
+                 concurrency: Optional[int] = None, warmup: bool = False) -> WorkloadResult:
+    """
+    Run one workload against a TestClient.
+
+    Args:
+        client: Started TestClient of the app
+        workload: Request mix to run
+        dates: Dates the fixtures cover
+        requests: Number of requests to issue
+        seed: Seed of the request mix (same seed, same requests)
+        concurrency: Concurrent workers (workload default if None)
+        warmup: Issue the whole mix once, unmeasured, before the timed run
+
+    Returns:
+        WorkloadResult of the timed run
+    """
+    concurrency = concurrency or workload.concurrency
+    specs = workload.build(random.Random(seed), dates, requests)
+    result = WorkloadResult(workload.name, concurrency)
+    lock = threading.Lock()
+
+    def issue(spec: RequestSpec, record: bool):
+        path, params = spec
+        start = time.perf_counter()
+        response = client.get(path, params=params, headers={"Accept-Encoding": "gzip"})
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if record:
+            with lock:
+                result.latencies_ms.append(elapsed_ms)
+                result.statuses[response.status_code] = result.statuses.get(response.status_code, 0) + 1
+                result.errors += is_error(response)
+                result.bytes_received += response.num_bytes_downloaded
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=f"load_{workload.name}") as pool:
+        if warmup:
+            list(pool.map(lambda spec: issue(spec, False), specs))
+        with ProcessSampler() as sampler:
+            start = time.perf_counter()
+            list(pool.map(lambda spec: issue(spec, True), specs))
+            result.elapsed_s = time.perf_counter() - start
+        result.process = sampler.snapshot()
+    return result
+
+
+def compare_to_baseline(current: Dict[str, Any], baseline: Dict[str, Any],
+                        tolerance: float = 0.2) -> List[str]:
+    """
+    Regressions of a run against a baseline run.
+
+    Latency, RSS and open files regress when they grow by more than the
+    tolerance (open files by at least OPEN_FILES_SLACK handles), throughput
+    when it drops by more than the tolerance, and the error rate when it
+    grows at all.
+
+    Args:
+        current: Results of this run (as written by the runner)
+        baseline: Results of the baseline run
+        tolerance: Allowed relative change (0.2 = 20%)
+
+    Returns:
+        One message per regressed metric (empty if none)
+    """
+    regressions = []
+    for name, metrics in current["workloads"].items():
+        reference = baseline.get("workloads", {}).get(name)
+        if reference is None:
+            continue
+        for metric in LATENCY_METRICS:
+            before = max(reference[metric], LATENCY_FLOOR_MS)
+            if metrics[metric] > before * (1 + tolerance):
+                regressions.append(f"{name}.{metric}: {reference[metric]} -> {metrics[metric]}")
+        if metrics["throughput_rps"] < reference["throughput_rps"] * (1 - tolerance):
+            regressions.append(f"{name}.throughput_rps: {reference['throughput_rps']} -> {metrics['throughput_rps']}")
+        if metrics["error_rate"] > reference["error_rate"]:
+            regressions.append(f"{name}.error_rate: {reference['error_rate']} -> {metrics['error_rate']}")
+        for metric in PROCESS_METRICS:
+            if metric not in reference:
+                continue
+            allowed = reference[metric] * tolerance
+            if metric.startswith("open_files"):
+                allowed = max(allowed, OPEN_FILES_SLACK)
+            if metrics[metric] > reference[metric] + allowed:
+                regressions.append(f"{name}.{metric}: {reference[metric]} -> {metrics[metric]}")
+    return regressions
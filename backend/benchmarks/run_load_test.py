@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Load-test the API in-process on synthetic fixture data.
+
+Writes harmonized NetCDF fixtures (benchmarks/fixtures.py) into a scratch
+ocean-data root, starts the app against it through OCEAN_DATA_ROOT and runs
+the click, animation and batch workloads (benchmarks/load_test.py). Reports
+p50/p95/p99 latency, throughput, peak RSS and open file handles per workload.
+
+    python benchmarks/run_load_test.py --save-baseline benchmarks/baseline.json
+    python benchmarks/run_load_test.py --compare benchmarks/baseline.json
+
+With --compare the exit code is 1 when a metric regresses by more than
+--tolerance, so the script can gate CI.
+"""
+
+import os
+import sys
+import json
+import shutil
+import logging
+import argparse
+import platform
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+# Add backend to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.fixtures import DEFAULT_RESOLUTIONS, fixture_dates, write_fixtures
+from benchmarks.load_test import WORKLOADS, compare_to_baseline, run_workload
+from utils.file_catalog import DATA_ROOT_ENV, DATA_ROOT_NAME
+
+
+def _print_summary(name: str, summary: dict):
+    print(f"\n📊 {name} ({summary['requests']} requests, {summary['concurrency']} workers)")
+    print(f"   latency p50 {summary['p50_ms']:.1f}ms  p95 {summary['p95_ms']:.1f}ms  "
+          f"p99 {summary['p99_ms']:.1f}ms  mean {summary['mean_ms']:.1f}ms")
+    print(f"   throughput {summary['throughput_rps']:.1f} req/s, {summary['mb_received']:.1f} MB received, "
+          f"errors {summary['errors']} (statuses {summary['statuses']})")
+    print(f"   RSS peak {summary['rss_peak_mb']:.0f} MB (end {summary['rss_end_mb']:.0f} MB), "
+          f"open files peak {summary['open_files_peak']} (end {summary['open_files_end']})")
+
+
+def main():
+    """Write fixtures, run the selected workloads and report or compare the results."""
+    parser = argparse.ArgumentParser(description="In-process API load test on synthetic data")
+    parser.add_argument("--workloads", default=",".join(WORKLOADS),
+                        help=f"Comma-separated workloads (default: {','.join(WORKLOADS)})")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per workload (default: 200)")
+    parser.add_argument("--concurrency", type=int, help="Concurrent workers (default: per workload)")
+    parser.add_argument("--no-warmup", action="store_true", help="Measure cold caches as well")
+    parser.add_argument("--days", type=int, default=7, help="Days of fixture data (default: 7)")
+    parser.add_argument("--end-date", default="2024-07-07", help="Last fixture date (default: 2024-07-07)")
+    parser.add_argument("--resolution", type=float,
+                        help="Grid spacing of all gridded fixtures in degrees (default: production spacing)")
+    parser.add_argument("--data-root", help=f"Fixture directory, reused across runs (must be named {DATA_ROOT_NAME}; "
+                                            "default: temporary, removed afterwards)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of fixtures and request mixes")
+    parser.add_argument("--output", help="Write the results JSON here")
+    parser.add_argument("--save-baseline", help="Write the results JSON as the baseline for later comparisons")
+    parser.add_argument("--compare", help="Baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed relative regression per metric (default: 0.2)")
+    parser.add_argument("--verbose", action="store_true", help="Keep the API's INFO logging")
+    args = parser.parse_args()
+
+    workload_names = [name.strip() for name in args.workloads.split(",") if name.strip()]
+    unknown = [name for name in workload_names if name not in WORKLOADS]
+    if unknown:
+        parser.error(f"Unknown workload(s): {', '.join(unknown)}. Available: {', '.join(WORKLOADS)}")
+
+    scratch = None
+    if args.data_root:
+        data_root = Path(args.data_root).resolve()
+        if data_root.name != DATA_ROOT_NAME:
+            parser.error(f"--data-root must be a directory named {DATA_ROOT_NAME}")
+    else:
+        scratch = Path(tempfile.mkdtemp(prefix="ocean_benchmark_"))
+        data_root = scratch / DATA_ROOT_NAME
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format='%(asctime)s - %(levelname)s - %(message)s')
+
+    print("🏁 API Load Test")
+    print("=" * 50)
+    dates = fixture_dates(args.end_date, args.days)
+    resolutions = {name: args.resolution for name in DEFAULT_RESOLUTIONS} if args.resolution else None
+    print(f"🧪 Fixtures: {data_root} ({dates[0]} to {dates[-1]})")
+
+    try:
+        written = write_fixtures(data_root, dates, resolutions, seed=args.seed)
+        print(f"   written: {written}")
+
+        # The app resolves its data root at import
+        os.environ[DATA_ROOT_ENV] = str(data_root)
+        from fastapi.testclient import TestClient
+        from api.main import app
+        if not args.verbose:
+            logging.getLogger().setLevel(logging.WARNING)
+
+        results = {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "environment": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpus": os.cpu_count()
+            },
+            "config": {
+                "requests": args.requests,
+                "concurrency": args.concurrency,
+                "warmup": not args.no_warmup,
+                "days": args.days,
+                "resolutions": {**DEFAULT_RESOLUTIONS, **(resolutions or {})},
+                "seed": args.seed
+            },
+            "workloads": {}
+        }
+
+        with TestClient(app) as client:
+            for name in workload_names:
+                workload = WORKLOADS[name]
+                print(f"\n▶️  {name}: {workload.description}")
+                result = run_workload(client, workload, dates, args.requests, seed=args.seed,
+                                      concurrency=args.concurrency, warmup=not args.no_warmup)
+                summary = result.summary()
+                results["workloads"][name] = summary
+                _print_summary(name, summary)
+    finally:
+        if scratch is not None:
+            shutil.rmtree(scratch, ignore_errors=True)
+
+    for path in filter(None, (args.output, args.save_baseline)):
+        Path(path).write_text(json.dumps(results, indent=2) + "\n")
+        print(f"\n💾 Results written to {path}")
+
+    failed = any(summary["errors"] for summary in results["workloads"].values())
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        regressions = compare_to_baseline(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) against {args.compare} (tolerance {args.tolerance:.0%}):")
+            for regression in regressions:
+                print(f"   {regression}")
+            failed = True
+        else:
+            print(f"\n✅ No regressions against {args.compare} (tolerance {args.tolerance:.0%})")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
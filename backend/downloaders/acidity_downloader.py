@@ -19,6 +19,10 @@ import copernicusmarine
 import os
 
 from .base_downloader import BaseDataDownloader
+from processors.coordinate_harmonizer import CoordinateHarmonizer
+from utils.netcdf_encoding import encoding_policy
+from utils.ingest import ingest_output
+from utils.file_catalog import record_output
 
 class AcidityDownloader(BaseDataDownloader):
     """Downloads and processes CMEMS Global Ocean Biogeochemistry (acidity) data."""
@@ -174,6 +178,7 @@ class AcidityDownloader(BaseDataDownloader):
                 
                 # Move to final location
                 shutil.move(str(actual_file), str(raw_file_path))
+                record_output(raw_file_path)
                 
                 # Get file size for logging
                 file_size_mb = raw_file_path.stat().st_size / (1024 * 1024)
@@ -315,7 +320,8 @@ class AcidityDownloader(BaseDataDownloader):
                         harmonized_filename = f"acidity_harmonized_{target_date.strftime('%Y%m%d')}.nc"
                         harmonized_file_path = harmonized_dir / harmonized_filename
                         
-                        processed_ds.to_netcdf(harmonized_file_path, format='NETCDF4', engine='netcdf4')
+                        encoding_policy.write(processed_ds, harmonized_file_path)
+                        ingest_output(processed_ds, harmonized_file_path)
                         self.logger.info(f"Saved harmonized file: {harmonized_file_path}")
                         
                         # Set harmonized as final file
@@ -373,8 +379,7 @@ class AcidityDownloader(BaseDataDownloader):
         
         if lon_min >= 0 and lon_max > 180:
             # Need to convert from 0-360 to -180-180
-            ds = ds.assign_coords({lon_coord: (ds[lon_coord] + 180) % 360 - 180})
-            ds = ds.sortby(lon_coord)
+            ds = CoordinateHarmonizer.wrap_longitude(ds, lon_coord, '-180-180')
             
             # Add processing note
             ds.attrs.update({
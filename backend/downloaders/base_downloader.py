@@ -16,6 +16,8 @@ from typing import Dict, Any, List, Optional, Tuple
 from abc import ABC, abstractmethod
 import time
 
+from utils.file_catalog import delete_output
+
 class BaseDataDownloader(ABC):
     """Base class for all data downloaders with common functionality."""
     
@@ -458,7 +460,7 @@ class BaseDataDownloader(ABC):
             # Remove raw file (unless preservation is requested)
             if raw_file_path.exists() and not keep_raw_files:
                 raw_size = raw_file_path.stat().st_size
-                raw_file_path.unlink()
+                delete_output(raw_file_path)
                 optimization_log["files_removed"].append({
                     "path": str(raw_file_path),
                     "size_mb": round(raw_size / (1024 * 1024), 3),
@@ -473,7 +475,7 @@ class BaseDataDownloader(ABC):
             for intermediate_file in intermediate_files:
                 if intermediate_file.exists():
                     intermediate_size = intermediate_file.stat().st_size
-                    intermediate_file.unlink()
+                    delete_output(intermediate_file)
                     optimization_log["files_removed"].append({
                         "path": str(intermediate_file),
                         "size_mb": round(intermediate_size / (1024 * 1024), 3),
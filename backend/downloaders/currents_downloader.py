@@ -19,6 +19,11 @@ import copernicusmarine
 import os
 
 from .base_downloader import BaseDataDownloader
+from processors.coordinate_harmonizer import CoordinateHarmonizer
+from utils.netcdf_encoding import encoding_policy
+from utils.ingest import ingest_output
+from utils.currents_derived import add_derived_currents
+from utils.file_catalog import record_output, delete_output
 
 class CurrentsDownloader(BaseDataDownloader):
     """Downloads and processes CMEMS Global Ocean Currents data."""
@@ -211,6 +216,7 @@ class CurrentsDownloader(BaseDataDownloader):
                 
                 # Move to final location
                 shutil.move(str(actual_file), str(raw_file_path))
+                record_output(raw_file_path)
                 self.logger.info(f"Successfully downloaded: {raw_file_path}")
                 
                 # Process the file (harmonize coordinates if needed)
@@ -347,9 +353,10 @@ class CurrentsDownloader(BaseDataDownloader):
                     else:
                         self.logger.info("Converting coordinates from 0-360° to -180-180°")
                         # Convert coordinates if needed
-                        processed_ds = ds.assign_coords(
-                            longitude=((ds.longitude + 180) % 360) - 180
-                        ).sortby('longitude')
+                        processed_ds = CoordinateHarmonizer.wrap_longitude(ds, 'longitude', '-180-180')
+                
+                # Speed and direction are stored once here instead of derived per query
+                processed_ds = add_derived_currents(processed_ds)
                 
                 # Add processing metadata
                 processed_ds.attrs.update({
@@ -371,7 +378,8 @@ class CurrentsDownloader(BaseDataDownloader):
                 output_path = output_dir / output_filename
                 
                 # Save processed file
-                processed_ds.to_netcdf(output_path, engine='netcdf4')
+                encoding_policy.write(processed_ds, output_path)
+                ingest_output(processed_ds, output_path)
                 self.logger.info(f"Processed file saved: {output_path}")
                 
                 return output_path
@@ -497,7 +505,7 @@ class CurrentsDownloader(BaseDataDownloader):
                 # Remove raw file to save space (unless preservation is requested)
                 if raw_file_path.exists() and not keep_raw_files:
                     raw_size_mb = raw_file_path.stat().st_size / (1024 * 1024)
-                    raw_file_path.unlink()
+                    delete_output(raw_file_path)
                     self.logger.info(f"Auto-optimization: removed raw file, freed {raw_size_mb:.1f} MB")
                 elif keep_raw_files and raw_file_path.exists():
                     self.logger.info(f"Preserving raw file for further processing: {raw_file_path}")
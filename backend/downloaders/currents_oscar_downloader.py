@@ -18,6 +18,11 @@ from pathlib import Path
 from typing import Optional
 
 from .base_downloader import BaseDataDownloader
+from processors.coordinate_harmonizer import CoordinateHarmonizer
+from utils.netcdf_encoding import encoding_policy
+from utils.ingest import ingest_output
+from utils.currents_derived import add_derived_currents
+from utils.file_catalog import record_output
 
 
 class CurrentsOscarDownloader(BaseDataDownloader):
@@ -153,6 +158,7 @@ class CurrentsOscarDownloader(BaseDataDownloader):
                     for chunk in response.iter_content(chunk_size=8192):
                         if chunk:
                             f.write(chunk)
+                record_output(output_file)
                 
                 file_size_mb = output_file.stat().st_size / (1024 * 1024)
                 self.logger.info(f"Successfully downloaded OSCAR file: {output_file.name} ({file_size_mb:.1f} MB)")
@@ -210,12 +216,8 @@ class CurrentsOscarDownloader(BaseDataDownloader):
                     # Convert longitude if needed
                     lon_values = ds_renamed[lon_coord].values
                     if lon_values.max() > 180:
-                        # Convert 0-360 to -180-180
-                        lon_values = np.where(lon_values > 180, lon_values - 360, lon_values)
-                        ds_renamed = ds_renamed.assign_coords({lon_coord: lon_values})
-                        
-                        # Sort by longitude to maintain proper order
-                        ds_renamed = ds_renamed.sortby(lon_coord)
+                        # Convert 0-360 to -180-180 and restore ascending order
+                        ds_renamed = CoordinateHarmonizer.wrap_longitude(ds_renamed, lon_coord, '-180-180')
                         
                         self.logger.info("Coordinate conversion complete")
                     else:
@@ -227,6 +229,9 @@ class CurrentsOscarDownloader(BaseDataDownloader):
                 if 'lat' in ds_renamed.coords:
                     ds_renamed = ds_renamed.rename({'lat': 'latitude'})
                 
+                # Speed and direction are stored once here instead of derived per query
+                ds_renamed = add_derived_currents(ds_renamed)
+                
                 # Add processing metadata
                 ds_renamed.attrs.update({
                     'source': 'NASA OSCAR',
@@ -241,11 +246,9 @@ class CurrentsOscarDownloader(BaseDataDownloader):
                 processed_path.mkdir(parents=True, exist_ok=True)
                 processed_file = processed_path / processed_filename
                 
-                # Save with compression
-                ds_renamed.to_netcdf(
-                    processed_file,
-                    encoding={var: {'zlib': True, 'complevel': 4} for var in ds_renamed.data_vars}
-                )
+                # Save with the shared packing/compression policy
+                encoding_policy.write(ds_renamed, processed_file)
+                ingest_output(ds_renamed, processed_file)
                 
                 file_size_mb = processed_file.stat().st_size / (1024 * 1024)
                 self.logger.info(f"Processed file saved: {processed_file} ({file_size_mb:.1f} MB)")
@@ -28,6 +28,7 @@ from webdriver_manager.chrome import ChromeDriverManager
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
 from .base_downloader import BaseDataDownloader
+from utils.file_catalog import record_output
 
 class MicroplasticsDownloader(BaseDataDownloader):
     """Downloads and processes NOAA NCEI Marine Microplastics data."""
@@ -319,6 +320,7 @@ class MicroplasticsDownloader(BaseDataDownloader):
                 downloaded_file = downloaded_files[0]
                 if downloaded_file != output_file:
                     shutil.move(str(downloaded_file), str(output_file))
+                record_output(output_file)
                 
                 file_size_kb = output_file.stat().st_size / 1024
                 self.logger.info(f"Successfully downloaded NCEI microplastics data: {output_file.name} ({file_size_kb:.1f} KB)")
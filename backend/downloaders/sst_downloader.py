@@ -14,6 +14,10 @@ import tempfile
 import shutil
 
 from .base_downloader import BaseDataDownloader
+from processors.coordinate_harmonizer import CoordinateHarmonizer
+from utils.netcdf_encoding import encoding_policy
+from utils.ingest import ingest_output
+from utils.file_catalog import record_output
 
 class SSTDownloader(BaseDataDownloader):
     """Downloads and processes NOAA OISST v2.1 sea surface temperature data."""
@@ -130,6 +134,7 @@ class SSTDownloader(BaseDataDownloader):
             
             # Move to final location
             shutil.move(str(temp_path), str(raw_file_path))
+            record_output(raw_file_path)
             
             # Get file size for logging
             file_size_mb = raw_file_path.stat().st_size / (1024 * 1024)
@@ -225,7 +230,8 @@ class SSTDownloader(BaseDataDownloader):
                     downsampled_filename = f"sst_1deg_{target_date.strftime('%Y%m%d')}.nc"
                     downsampled_file_path = downsampled_dir / downsampled_filename
                     
-                    processed_ds.to_netcdf(downsampled_file_path, format='NETCDF4', engine='netcdf4')
+                    encoding_policy.write(processed_ds, downsampled_file_path)
+                    ingest_output(processed_ds, downsampled_file_path)
                     self.logger.info(f"Saved downsampled file: {downsampled_file_path}")
                     
                     # Set as potential final file and intermediate
@@ -246,7 +252,8 @@ class SSTDownloader(BaseDataDownloader):
                     harmonized_filename = f"sst_harmonized_{target_date.strftime('%Y%m%d')}.nc"
                     harmonized_file_path = harmonized_dir / harmonized_filename
                     
-                    processed_ds.to_netcdf(harmonized_file_path, format='NETCDF4', engine='netcdf4')
+                    encoding_policy.write(processed_ds, harmonized_file_path)
+                    ingest_output(processed_ds, harmonized_file_path)
                     self.logger.info(f"Saved harmonized file: {harmonized_file_path}")
                     
                     # Set harmonized as final file
@@ -326,8 +333,7 @@ class SSTDownloader(BaseDataDownloader):
         
         if lon_min >= 0 and lon_max > 180:
             # Need to convert from 0-360 to -180-180
-            ds = ds.assign_coords(lon=(ds.lon + 180) % 360 - 180)
-            ds = ds.sortby('lon')
+            ds = CoordinateHarmonizer.wrap_longitude(ds, 'lon', '-180-180')
             
             # Add processing note
             ds.attrs.update({
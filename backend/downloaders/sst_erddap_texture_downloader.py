@@ -14,6 +14,8 @@ import tempfile
 import shutil
 from PIL import Image
 
+from utils.file_catalog import record_output, delete_output
+
 class SSTERDDAPTextureDownloader:
     """Downloads high-quality SST textures from PacIOOS ERDDAP transparentPng service."""
     
@@ -193,6 +195,7 @@ class SSTERDDAPTextureDownloader:
                 
             # Move to final location
             shutil.move(str(temp_path), str(output_path))
+            record_output(output_path)
             
             file_size_mb = total_size / (1024 * 1024)
             self.logger.info(f"Successfully downloaded: {output_path} ({file_size_mb:.1f} MB)")
@@ -353,7 +356,7 @@ class SSTERDDAPTextureDownloader:
                 
                 if file_date < cutoff_date:
                     file_size = file_path.stat().st_size
-                    file_path.unlink()
+                    delete_output(file_path)
                     
                     results['files_removed'] += 1
                     results['space_freed_mb'] += file_size / (1024 * 1024)
@@ -11,6 +11,8 @@ from typing import Union, Optional, Dict, Any
 import logging
 from datetime import date
 from .coordinate_harmonizer import CoordinateHarmonizer
+from utils.netcdf_encoding import encoding_policy
+from utils.ingest import ingest_output
 
 class AcidityProcessor:
     """Handles processing of ocean acidity/biogeochemistry data."""
@@ -447,7 +449,8 @@ class AcidityProcessor:
                 ds_processed = self.process_dataset(ds, surface_only)
                 
                 # Save processed dataset
-                ds_processed.to_netcdf(output_path, format='NETCDF4', engine='netcdf4')
+                encoding_policy.write(ds_processed, output_path)
+                ingest_output(ds_processed, output_path)
                 
                 self.logger.info(f"Successfully processed acidity data: {input_path} -> {output_path}")
                 return True
@@ -7,9 +7,12 @@ Converts between different longitude conventions (0-360° vs -180-180°).
 import xarray as xr
 import numpy as np
 from pathlib import Path
-from typing import Union, Tuple
+from typing import Union, Tuple, Optional
 import logging
 
+from utils.netcdf_encoding import encoding_policy
+from utils.ingest import ingest_output
+
 class CoordinateHarmonizer:
     """Handles coordinate system conversions for ocean datasets."""
     
@@ -54,6 +57,68 @@ class CoordinateHarmonizer:
         else:
             return 'mixed'
     
+    @staticmethod
+    def _rotation_offset(lon_values: np.ndarray) -> Optional[int]:
+        """
+        Find the roll offset that puts wrapped longitudes back in ascending order.
+        
+        Wrapping a monotonic grid (e.g. a regular 0-360° grid) only moves the
+        seam, so the sorted order is a rotation of the original order. Irregular
+        or unsorted grids have no such offset.
+        
+        Args:
+            lon_values: Longitude values after wrapping to the target range
+            
+        Returns:
+            Number of positions to roll left, or None if a rotation cannot sort the grid
+        """
+        if lon_values.ndim != 1 or lon_values.size < 2:
+            return None
+        
+        offset = int(np.argmin(lon_values))
+        rotated = np.concatenate([lon_values[offset:], lon_values[:offset]])
+        if np.all(np.diff(rotated) > 0):
+            return offset
+        return None
+    
+    @classmethod
+    def wrap_longitude(cls, ds: xr.Dataset, lon_name: str, target_convention: str = '-180-180') -> xr.Dataset:
+        """
+        Wrap longitudes into the target convention and keep them ascending.
+        
+        Regular grids are reordered with a single roll, which is a contiguous
+        two-slice copy (and stays lazy for dask-backed data). Only grids that a
+        rotation cannot sort fall back to sortby, which gathers every variable
+        through an index array.
+        
+        Args:
+            ds: Input xarray Dataset
+            lon_name: Name of the longitude coordinate
+            target_convention: Target convention ('0-360' or '-180-180')
+            
+        Returns:
+            Dataset with wrapped, ascending longitude coordinates
+        """
+        lon_values = ds[lon_name].values
+        if target_convention == '-180-180':
+            # Only values east of 180° wrap, so a 180° column stays on the eastern edge
+            wrapped = np.where(lon_values > 180, (lon_values + 180) % 360 - 180, lon_values)
+        elif target_convention == '0-360':
+            wrapped = lon_values % 360
+        else:
+            raise ValueError(f"Unknown target convention: {target_convention}")
+        
+        ds_wrapped = ds.assign_coords({lon_name: (ds[lon_name].dims, wrapped, ds[lon_name].attrs)})
+        
+        offset = cls._rotation_offset(wrapped)
+        if offset is None:
+            logging.getLogger(__name__).debug(f"Irregular {lon_name} grid, falling back to sortby")
+            return ds_wrapped.sortby(lon_name)
+        if offset == 0:
+            return ds_wrapped
+        
+        return ds_wrapped.roll({lon_name: -offset}, roll_coords=True)
+    
     def convert_to_180_180(self, ds: xr.Dataset) -> xr.Dataset:
         """
         Convert longitude coordinates from 0-360° to -180-180°.
@@ -86,16 +151,8 @@ class CoordinateHarmonizer:
         elif current_convention == '0-360':
             self.logger.info("Converting longitude from 0-360° to -180-180°")
             
-            # Create a copy to avoid modifying original
-            ds_converted = ds.copy()
-            
-            # Convert longitude coordinates
-            ds_converted = ds_converted.assign_coords({
-                lon_name: (ds_converted[lon_name] + 180) % 360 - 180
-            })
-            
-            # Sort by longitude to maintain proper ordering
-            ds_converted = ds_converted.sortby(lon_name)
+            # Convert longitude coordinates and restore ascending order
+            ds_converted = self.wrap_longitude(ds, lon_name, '-180-180')
             
             # Add metadata about conversion
             ds_converted.attrs.update({
@@ -133,16 +190,8 @@ class CoordinateHarmonizer:
         elif current_convention == '-180-180':
             self.logger.info("Converting longitude from -180-180° to 0-360°")
             
-            # Create a copy to avoid modifying original
-            ds_converted = ds.copy()
-            
-            # Convert longitude coordinates
-            ds_converted = ds_converted.assign_coords({
-                lon_name: ds_converted[lon_name] % 360
-            })
-            
-            # Sort by longitude to maintain proper ordering
-            ds_converted = ds_converted.sortby(lon_name)
+            # Convert longitude coordinates and restore ascending order
+            ds_converted = self.wrap_longitude(ds, lon_name, '0-360')
             
             # Add metadata about conversion
             ds_converted.attrs.update({
@@ -325,7 +374,8 @@ class CoordinateHarmonizer:
                 ds_harmonized = self.harmonize_dataset(ds, target_convention)
                 
                 # Save to output file
-                ds_harmonized.to_netcdf(output_path, format='NETCDF4', engine='netcdf4')
+                encoding_policy.write(ds_harmonized, output_path)
+                ingest_output(ds_harmonized, output_path)
                 
                 self.logger.info(f"Successfully processed {input_path} -> {output_path}")
                 return True
@@ -11,6 +11,9 @@ from typing import Union, Optional, Dict, Any
 import logging
 from datetime import date
 from .coordinate_harmonizer import CoordinateHarmonizer
+from utils.netcdf_encoding import encoding_policy
+from utils.ingest import ingest_output
+from utils.currents_derived import add_derived_currents
 
 class CurrentsProcessor:
     """Handles processing of ocean currents data."""
@@ -313,51 +316,8 @@ class CurrentsProcessor:
         Returns:
             Dataset with additional derived variables
         """
-        ds_processed = ds.copy()
-        
-        # Determine velocity variable names
-        u_var = None
-        v_var = None
-        
-        if 'uo' in ds_processed.data_vars:
-            u_var = 'uo'
-        elif 'u' in ds_processed.data_vars:
-            u_var = 'u'
-            
-        if 'vo' in ds_processed.data_vars:
-            v_var = 'vo'
-        elif 'v' in ds_processed.data_vars:
-            v_var = 'v'
-        
-        # Calculate speed and direction if both components are available
-        if u_var and v_var:
-            u_data = ds_processed[u_var]
-            v_data = ds_processed[v_var]
-            
-            # Current speed (magnitude)
-            speed = np.sqrt(u_data**2 + v_data**2)
-            speed.attrs = {
-                'standard_name': 'sea_water_speed',
-                'long_name': 'Current speed',
-                'units': 'm s-1',
-                'description': f'Current speed calculated from {u_var} and {v_var} components',
-                'valid_range': [0.0, 10.0]
-            }
-            ds_processed['current_speed'] = speed
-            
-            # Current direction (0-360 degrees, oceanographic convention)
-            # Oceanographic convention: direction toward which current flows
-            direction = (np.arctan2(u_data, v_data) * 180.0 / np.pi) % 360
-            direction.attrs = {
-                'standard_name': 'direction_of_sea_water_velocity',
-                'long_name': 'Current direction',
-                'units': 'degrees',
-                'description': 'Direction toward which current flows (oceanographic convention, 0=North, 90=East)',
-                'valid_range': [0.0, 360.0],
-                'convention': 'Oceanographic (direction TO which flow is directed)'
-            }
-            ds_processed['current_direction'] = direction
-            
+        ds_processed = add_derived_currents(ds)
+        if ds_processed is not ds:
             self.logger.info("Calculated current speed and direction from velocity components")
         
         return ds_processed
@@ -558,7 +518,8 @@ class CurrentsProcessor:
                 ds_processed = self.process_dataset(ds, surface_only)
                 
                 # Save processed dataset
-                ds_processed.to_netcdf(output_path, format='NETCDF4', engine='netcdf4')
+                encoding_policy.write(ds_processed, output_path)
+                ingest_output(ds_processed, output_path)
                 
                 self.logger.info(f"Successfully processed currents data: {input_path} -> {output_path}")
                 return True
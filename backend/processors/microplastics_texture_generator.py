@@ -18,6 +18,8 @@ from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
 import warnings
+
+from utils.file_catalog import record_output
 warnings.filterwarnings('ignore')
 
 # Import existing texture generator components
@@ -172,6 +174,7 @@ class MicroplasticsTextureGenerator:
         output_path = os.path.join(self.output_dir, str(year), filename)
         
         texture_image.save(output_path, 'PNG')
+        record_output(Path(output_path))
         
         self.logger.info(f"Saved texture: {output_path}")
         
@@ -324,6 +327,7 @@ class MicroplasticsTextureGenerator:
         output_path = os.path.join(self.output_dir, str(year), filename)
         
         image.save(output_path, 'PNG')
+        record_output(Path(output_path))
         
         return output_path
     
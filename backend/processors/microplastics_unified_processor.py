@@ -20,6 +20,9 @@ import logging
 import xarray as xr
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Union
+
+from utils.netcdf_encoding import encoding_policy
+from utils.ingest import ingest_output
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -836,7 +839,8 @@ class MicroplasticsUnifiedProcessor:
         }
         
         # Save to NetCDF
-        ds.to_netcdf(output_path)
+        encoding_policy.write(ds, output_path)
+        ingest_output(ds, output_path)
         
         self.logger.info(f"NetCDF file saved successfully: {output_path}")
         
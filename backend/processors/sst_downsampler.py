@@ -11,6 +11,9 @@ from typing import Union, Optional, Tuple
 import logging
 from datetime import date
 
+from utils.netcdf_encoding import encoding_policy
+from utils.ingest import ingest_output
+
 class SSTDownsampler:
     """Handles spatial downsampling of SST data."""
     
@@ -286,7 +289,8 @@ class SSTDownsampler:
                         self.logger.warning(warning)
                 
                 # Save downsampled dataset
-                ds_downsampled.to_netcdf(output_path, format='NETCDF4', engine='netcdf4')
+                encoding_policy.write(ds_downsampled, output_path)
+                ingest_output(ds_downsampled, output_path)
                 
                 self.logger.info(f"Successfully downsampled {input_path} -> {output_path}")
                 self.logger.info(f"Shape reduction: {validation['statistics']['reduction_factor']}")
@@ -16,6 +16,8 @@ import logging
 from datetime import datetime
 import json
 
+from utils.file_catalog import record_output
+
 class TextureGenerator:
     """Base class for generating PNG textures from ocean data."""
     
@@ -161,7 +163,8 @@ class TextureGenerator:
         
     def data_to_texture(self, data: np.ndarray, lon: np.ndarray, lat: np.ndarray,
                        colormap: str, normalize_method: str = 'percentile',
-                       use_natural_land_mask: bool = True) -> Tuple[np.ndarray, Dict[str, Any]]:
+                       use_natural_land_mask: bool = True,
+                       vmin: Optional[float] = None, vmax: Optional[float] = None) -> Tuple[np.ndarray, Dict[str, Any]]:
         """
         Convert data array to texture with color mapping using natural NaN patterns for land.
         Handles different coordinate ranges (e.g., limited coverage -80°/80° vs SST -90°/90°).
@@ -173,6 +176,8 @@ class TextureGenerator:
             colormap: Colormap name
             normalize_method: Data normalization method
             use_natural_land_mask: Whether to use natural NaN patterns for land transparency
+            vmin: Color scale minimum (with normalize_method='custom')
+            vmax: Color scale maximum (with normalize_method='custom')
             
         Returns:
             RGBA texture array and metadata
@@ -191,24 +196,25 @@ class TextureGenerator:
         if is_limited_coverage:
             # For limited coverage data (like -80°/80° range), expand to global texture
             texture, metadata = self._create_expanded_global_texture(
-                data, lon, lat, colormap, normalize_method, use_natural_land_mask
+                data, lon, lat, colormap, normalize_method, use_natural_land_mask, vmin, vmax
             )
         else:
             # Standard processing for full global coverage
             texture, metadata = self._create_standard_texture(
-                data, lon, lat, colormap, normalize_method, use_natural_land_mask
+                data, lon, lat, colormap, normalize_method, use_natural_land_mask, vmin, vmax
             )
         
         return texture, metadata
     
     def _create_standard_texture(self, data: np.ndarray, lon: np.ndarray, lat: np.ndarray,
-                                colormap: str, normalize_method: str, use_natural_land_mask: bool) -> Tuple[np.ndarray, Dict[str, Any]]:
+                                colormap: str, normalize_method: str, use_natural_land_mask: bool,
+                                vmin: Optional[float] = None, vmax: Optional[float] = None) -> Tuple[np.ndarray, Dict[str, Any]]:
         """Create texture for full global coverage data (like SST)."""
         # Normalize data (only valid ocean data, preserve NaN for land)
-        norm_data, norm_params = self.normalize_data(data, method=normalize_method)
+        norm_data, norm_params = self.normalize_data(data, method=normalize_method, vmin=vmin, vmax=vmax)
         
         # Get colormap
-        cmap = self._get_colormap(colormap)
+        cmap = self.get_colormap(colormap)
             
         # Set NaN values (land areas) to be transparent white
         if use_natural_land_mask:
@@ -257,7 +263,8 @@ class TextureGenerator:
         return texture, metadata
     
     def _create_expanded_global_texture(self, data: np.ndarray, lon: np.ndarray, lat: np.ndarray,
-                                       colormap: str, normalize_method: str, use_natural_land_mask: bool) -> Tuple[np.ndarray, Dict[str, Any]]:
+                                       colormap: str, normalize_method: str, use_natural_land_mask: bool,
+                                vmin: Optional[float] = None, vmax: Optional[float] = None) -> Tuple[np.ndarray, Dict[str, Any]]:
         """Create texture for limited coverage data expanded to global range."""
         from scipy.interpolate import RegularGridInterpolator
         
@@ -325,10 +332,10 @@ class TextureGenerator:
         # For areas outside source coverage (polar regions), keep as NaN (will appear as white/transparent)
         
         # Normalize the expanded data
-        norm_data, norm_params = self.normalize_data(global_data, method=normalize_method)
+        norm_data, norm_params = self.normalize_data(global_data, method=normalize_method, vmin=vmin, vmax=vmax)
         
         # Get colormap
-        cmap = self._get_colormap(colormap)
+        cmap = self.get_colormap(colormap)
             
         # Set NaN values to be transparent white
         if use_natural_land_mask:
@@ -383,8 +390,16 @@ class TextureGenerator:
         
         return texture, metadata
     
-    def _get_colormap(self, colormap: str):
-        """Get matplotlib colormap object."""
+    def get_colormap(self, colormap: str):
+        """
+        Get matplotlib colormap object.
+        
+        Args:
+            colormap: Colormap name (e.g. from get_scientific_colormap; 'cmocean.' prefix for cmocean maps)
+            
+        Returns:
+            Colormap (viridis if the name is unknown)
+        """
         try:
             if colormap.startswith('cmocean.'):
                 cmap_name = colormap.split('.')[1]
@@ -416,6 +431,7 @@ class TextureGenerator:
             # Save PNG only
             img = Image.fromarray(texture, mode='RGBA')
             img.save(output_path, 'PNG')
+            record_output(output_path)
                 
             self.logger.info(f"Saved texture: {output_path}")
             return True
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Offline encoder packing texture frames into compressed videos.
+
+A month or year of daily textures is a few hundred near-identical PNGs;
+as a VP9 (or AV1) WebM it is one file a fraction of their summed size that
+a browser decodes in hardware and can scrub with range requests. Each video
+gets a JSON sidecar listing the date of every frame, so frame i of the video
+(at i / fps seconds) maps back to a texture date.
+
+Encoding runs a local ffmpeg; videos are written to
+ocean-data/textures/{category}/videos/{category}_{period}_{codec}.webm with
+period YYYY or YYYYMM.
+"""
+
+import calendar
+import json
+import logging
+import shutil
+import subprocess
+import tempfile
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.file_catalog import record_output
+
+logger = logging.getLogger(__name__)
+
+VIDEO_DIRNAME = "videos"
+DEFAULT_FPS = 12
+
+# ffmpeg encoder arguments per codec. VP9 keeps the alpha channel (land stays
+# transparent); libaom AV1 in WebM has no alpha, so land is encoded black.
+VIDEO_CODECS = {
+    "vp9": [
+        "-c:v", "libvpx-vp9", "-pix_fmt", "yuva420p", "-crf", "32", "-b:v", "0",
+        "-row-mt", "1", "-auto-alt-ref", "0", "-deadline", "good", "-cpu-used", "2"
+    ],
+    "av1": [
+        "-c:v", "libaom-av1", "-pix_fmt", "yuv420p", "-crf", "34", "-b:v", "0",
+        "-row-mt", "1", "-cpu-used", "6"
+    ],
+}
+
+
+def period_bounds(period: str) -> Tuple[date, date]:
+    """
+    First and last date of a period.
+
+    Args:
+        period: 'YYYY' or 'YYYY-MM'
+
+    Raises:
+        ValueError: Malformed period
+    """
+    parts = period.split("-")
+    if len(parts) == 1 and len(parts[0]) == 4 and parts[0].isdigit():
+        year = int(parts[0])
+        return date(year, 1, 1), date(year, 12, 31)
+    if len(parts) == 2 and len(parts[0]) == 4 and parts[0].isdigit() and parts[1].isdigit():
+        year, month = int(parts[0]), int(parts[1])
+        if not 1 <= month <= 12:
+            raise ValueError(f"Invalid month in period: {period}")
+        return date(year, month, 1), date(year, month, calendar.monthrange(year, month)[1])
+    raise ValueError(f"Period must be YYYY or YYYY-MM: {period}")
+
+
+def video_name(category: str, period: str, codec: str) -> str:
+    return f"{category}_{period.replace('-', '')}_{codec}.webm"
+
+
+class TextureVideoEncoder:
+    """Packs a period's texture frames into one WebM via ffmpeg."""
+
+    def __init__(self, texture_service, ffmpeg: str = "ffmpeg", timeout: int = 3600):
+        """
+        Initialize the encoder.
+
+        Args:
+            texture_service: TextureService whose index supplies the frames
+            ffmpeg: ffmpeg executable name or path
+            timeout: Seconds allowed for one encode
+        """
+        self.texture_service = texture_service
+        self.ffmpeg = ffmpeg
+        self.timeout = timeout
+
+    def video_dir(self, category: str) -> Path:
+        return self.texture_service.texture_base_path / category / VIDEO_DIRNAME
+
+    def collect_frames(self, category: str, period: str, resolution: str = "medium") -> List[Dict[str, Any]]:
+        """
+        One texture per available date of the period, in date order, all of one resolution.
+
+        The concat demuxer needs frames of one size. Of the resolutions in
+        preference order (SST ERDDAP ultra, the requested one, then the other
+        supported ones) the one covering the most dates is used; dates without
+        it are left out.
+        """
+        if category not in self.texture_service.supported_categories:
+            raise ValueError(f"Unsupported category: {category}")
+        first, last = period_bounds(period)
+        dated = [
+            (date_str, resolutions)
+            for date_str, resolutions in self.texture_service.texture_index.get(category).items()
+            if first.isoformat() <= date_str <= last.isoformat()
+        ]
+        preference = list(dict.fromkeys(
+            (["ultra"] if category == "sst" else []) + [resolution] + self.texture_service.supported_resolutions
+        ))
+        # max() keeps the first candidate on ties, so preference order breaks them
+        chosen = max(preference, key=lambda candidate: sum(candidate in resolutions for _, resolutions in dated))
+        return [
+            {"date": date_str, "path": resolutions[chosen], "resolution": chosen}
+            for date_str, resolutions in dated
+            if chosen in resolutions
+        ]
+
+    def periods(self, category: str, period_kind: str = "month") -> List[str]:
+        """Periods ('YYYY' or 'YYYY-MM') that have at least one texture."""
+        width = 4 if period_kind == "year" else 7
+        return sorted({date_str[:width] for date_str in self.texture_service.texture_index.get(category)})
+
+    def encode(self, category: str, period: str, codec: str = "vp9", fps: int = DEFAULT_FPS,
+               resolution: str = "medium", force: bool = False) -> Optional[Path]:
+        """
+        Encode one period to WebM and write its frame manifest.
+
+        An existing video is kept if its manifest lists the same frames and it is
+        newer than all of them, unless force is set.
+
+        Returns:
+            Path of the video, or None if the period has no frames
+
+        Raises:
+            ValueError: Unknown codec or category, malformed period
+            RuntimeError: ffmpeg is missing or failed
+        """
+        if codec not in VIDEO_CODECS:
+            raise ValueError(f"Unknown codec: {codec}. Available: {', '.join(VIDEO_CODECS)}")
+        frames = self.collect_frames(category, period, resolution)
+        if not frames:
+            logger.warning(f"No {category} textures for {period}")
+            return None
+
+        output_path = self.video_dir(category) / video_name(category, period, codec)
+        manifest_path = output_path.with_suffix(".json")
+        frame_dates = [frame["date"] for frame in frames]
+        if not force and self._is_current(output_path, manifest_path, frames, fps):
+            logger.info(f"⏭️ {output_path.name} is up to date ({len(frames)} frames)")
+            return output_path
+
+        if shutil.which(self.ffmpeg) is None:
+            raise RuntimeError(f"{self.ffmpeg} not found; install ffmpeg with libvpx-vp9/libaom to encode videos")
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = output_path.with_suffix(".partial")
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as concat_file:
+            # Concat demuxer list: every frame shown for one frame period
+            for frame in frames:
+                concat_file.write(f"file '{frame['path'].resolve()}'\nduration {1 / fps:.6f}\n")
+            # The last entry's duration is only honoured when the file is repeated
+            concat_file.write(f"file '{frames[-1]['path'].resolve()}'\n")
+        try:
+            cmd = [
+                self.ffmpeg, "-y", "-loglevel", "error",
+                "-f", "concat", "-safe", "0", "-i", concat_file.name,
+                # 4:2:0 chroma needs even dimensions; keyframe every second for scrubbing
+                "-vf", "scale=trunc(iw/2)*2:trunc(ih/2)*2",
+                "-r", str(fps), "-g", str(fps), "-frames:v", str(len(frames)),
+                *VIDEO_CODECS[codec],
+                "-f", "webm", str(tmp_path)
+            ]
+            logger.info(f"🎬 Encoding {len(frames)} {category} frames for {period} as {codec}")
+            subprocess.run(cmd, capture_output=True, text=True, timeout=self.timeout, check=True)
+        except subprocess.TimeoutExpired:
+            tmp_path.unlink(missing_ok=True)
+            raise RuntimeError(f"ffmpeg timed out encoding {output_path.name}")
+        except subprocess.CalledProcessError as e:
+            tmp_path.unlink(missing_ok=True)
+            raise RuntimeError(f"ffmpeg failed encoding {output_path.name}: {e.stderr.strip()}")
+        finally:
+            Path(concat_file.name).unlink(missing_ok=True)
+        tmp_path.replace(output_path)
+
+        source_bytes = sum(frame["path"].stat().st_size for frame in frames)
+        manifest = {
+            "category": category,
+            "period": period,
+            "codec": codec,
+            "container": "webm",
+            "fps": fps,
+            "resolution": frames[0]["resolution"],
+            "alpha": codec == "vp9",
+            "frame_count": len(frames),
+            "frames": frame_dates,
+            "sources": [frame["path"].name for frame in frames],
+            "size": output_path.stat().st_size,
+            "source_size": source_bytes,
+        }
+        manifest_path.write_text(json.dumps(manifest, indent=2))
+        record_output(output_path)
+        record_output(manifest_path)
+        logger.info(f"✅ {output_path.name}: {len(frames)} frames, "
+                    f"{manifest['size'] / 1024:.0f} KB from {source_bytes / 1024:.0f} KB of PNGs")
+        return output_path
+
+    @staticmethod
+    def _is_current(output_path: Path, manifest_path: Path, frames: List[Dict[str, Any]], fps: int) -> bool:
+        """Whether an existing video already holds exactly these frames."""
+        try:
+            manifest = json.loads(manifest_path.read_text())
+            video_mtime = output_path.stat().st_mtime_ns
+        except (OSError, ValueError):
+            return False
+        return (
+            manifest.get("fps") == fps
+            and manifest.get("sources") == [frame["path"].name for frame in frames]
+            and all(frame["path"].stat().st_mtime_ns <= video_mtime for frame in frames)
+        )
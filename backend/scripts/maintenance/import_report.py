@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Report what importing the API costs in a fresh interpreter.
+
+Runs `python -X importtime -c "import api.main"` in a subprocess (a cold
+import, nothing cached in sys.modules), then prints the total, the slowest
+packages and modules, and any heavy dependency that was imported eagerly
+instead of on first use (see utils.lazy_imports).
+
+    python scripts/maintenance/import_report.py
+    python scripts/maintenance/import_report.py --budget 1.0   # exit 1 when slower
+"""
+
+import sys
+import argparse
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Imports run from backend/ (script is in scripts/maintenance/, two levels down)
+BACKEND_DIR = Path(__file__).resolve().parent.parent.parent
+
+# Dependencies the API loads on first use; any of them in an import report is a regression
+HEAVY_MODULES = ("xarray", "pandas", "scipy", "matplotlib", "cmocean", "netCDF4", "dask", "PIL.Image", "yaml")
+
+
+def measure(module: str, runs: int) -> List[Tuple[str, int, int]]:
+    """
+    Import a module in fresh interpreters and keep the fastest run.
+
+    Returns:
+        (module name, self microseconds, cumulative microseconds) per imported module
+    """
+    best: List[Tuple[str, int, int]] = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=BACKEND_DIR, capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "import failed")
+        entries = []
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            self_us, cumulative_us, name = (part.strip() for part in line[len("import time:"):].split("|"))
+            if self_us.isdigit():
+                entries.append((name, int(self_us), int(cumulative_us)))
+        total = next((cumulative for name, _, cumulative in entries if name == module), 0)
+        best_total = next((cumulative for name, _, cumulative in best if name == module), None)
+        if best_total is None or total < best_total:
+            best = entries
+    return best
+
+
+def package_times(entries: List[Tuple[str, int, int]]) -> Dict[str, int]:
+    """Self time summed per top-level package, in microseconds."""
+    packages: Dict[str, int] = {}
+    for name, self_us, _ in entries:
+        package = name.split(".")[0]
+        packages[package] = packages.get(package, 0) + self_us
+    return packages
+
+
+def main():
+    """Print the import-time report and check it against an optional budget."""
+    parser = argparse.ArgumentParser(description="Measure the cold import time of the API")
+    parser.add_argument("--module", default="api.main", help="Module to import (default: api.main)")
+    parser.add_argument("--runs", type=int, default=3, help="Fresh interpreters to try; the fastest is reported (default: 3)")
+    parser.add_argument("--top", type=int, default=15, help="Packages and modules listed (default: 15)")
+    parser.add_argument("--budget", type=float, help="Fail (exit 1) when the import takes longer, in seconds")
+    args = parser.parse_args()
+
+    print("⏱️  API Import-Time Report")
+    print("=" * 50)
+    try:
+        entries = measure(args.module, max(1, args.runs))
+    except RuntimeError as e:
+        print(f"❌ Importing {args.module} failed: {e}")
+        return 1
+
+    total_s = next((cumulative for name, _, cumulative in entries if name == args.module), 0) / 1e6
+    print(f"\n📦 {args.module}: {total_s:.3f}s cold import, {len(entries)} modules (fastest of {args.runs})")
+
+    print("\n📊 Slowest packages (self time):")
+    for package, self_us in sorted(package_times(entries).items(), key=lambda item: -item[1])[:args.top]:
+        print(f"   {self_us / 1000:8.1f}ms  {package}")
+
+    print("\n📊 Slowest modules (self time):")
+    for name, self_us, cumulative_us in sorted(entries, key=lambda entry: -entry[1])[:args.top]:
+        print(f"   {self_us / 1000:8.1f}ms  {name} ({cumulative_us / 1000:.1f}ms with imports)")
+
+    imported = {name for name, _, _ in entries}
+    eager = [module for module in HEAVY_MODULES if module in imported]
+    if eager:
+        print(f"\n⚠️  Heavy modules imported eagerly: {', '.join(eager)}")
+    else:
+        print(f"\n✅ No heavy modules imported eagerly ({', '.join(HEAVY_MODULES)} load on first use)")
+
+    if args.budget is not None and total_s > args.budget:
+        print(f"\n❌ Import took {total_s:.3f}s, over the {args.budget:g}s budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+One-off migration of existing unified_coords files to the shared NetCDF encoding policy.
+Rewrites each harmonized file with int16 packing, zlib/shuffle compression and
+point-read chunking, and reports space and point-read latency gains.
+"""
+
+import sys
+import json
+import time
+import random
+import argparse
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+import numpy as np
+import xarray as xr
+
+# Add backend to path for imports (script is in scripts/maintenance/, need to go up two levels to reach backend/)
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from utils.netcdf_encoding import encoding_policy, LAT_DIMS, LON_DIMS
+from utils.file_catalog import delete_output, move_output
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def measure_point_read_ms(file_path: Path, points: List[tuple]) -> Optional[float]:
+    """Average time to open a file and read every variable at one point, as the API does per click."""
+    timings = []
+    for lat, lon in points:
+        start = time.perf_counter()
+        with xr.open_dataset(file_path) as ds:
+            lat_name = next((name for name in LAT_DIMS if name in ds.dims), None)
+            lon_name = next((name for name in LON_DIMS if name in ds.dims), None)
+            if lat_name is None or lon_name is None:
+                return None
+            point = ds.sel({lat_name: lat, lon_name: lon}, method='nearest')
+            for var_name in point.data_vars:
+                _ = point[var_name].values
+        timings.append((time.perf_counter() - start) * 1000)
+    return float(np.median(timings)) if timings else None
+
+
+def migrate_file(file_path: Path, points: List[tuple], dry_run: bool = False) -> Dict[str, Any]:
+    """Rewrite a single file with the encoding policy and measure the result."""
+    result = {
+        "path": str(file_path),
+        "size_before_kb": round(file_path.stat().st_size / 1024, 1),
+        "size_after_kb": None,
+        "read_before_ms": measure_point_read_ms(file_path, points),
+        "read_after_ms": None,
+        "status": "pending"
+    }
+
+    temp_path = file_path.with_suffix('.nc.migrating')
+    try:
+        with xr.open_dataset(file_path) as ds:
+            ds.load()
+            encoding_policy.write(ds, temp_path)
+
+        # Make sure the new file reads back before touching the original
+        with xr.open_dataset(temp_path) as check:
+            _ = list(check.data_vars)
+
+        result["size_after_kb"] = round(temp_path.stat().st_size / 1024, 1)
+        result["read_after_ms"] = measure_point_read_ms(temp_path, points)
+
+        if dry_run:
+            delete_output(temp_path)
+            result["status"] = "dry_run"
+        else:
+            move_output(temp_path, file_path)
+            result["status"] = "migrated"
+
+    except Exception as e:
+        logger.error(f"Failed to migrate {file_path}: {e}")
+        if temp_path.exists():
+            delete_output(temp_path)
+        result["status"] = "failed"
+        result["error"] = str(e)
+
+    return result
+
+
+def summarize(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Aggregate space and latency gains over all migrated files."""
+    done = [r for r in results if r["status"] in ("migrated", "dry_run")]
+    before_kb = sum(r["size_before_kb"] for r in done)
+    after_kb = sum(r["size_after_kb"] for r in done)
+    reads_before = [r["read_before_ms"] for r in done if r["read_before_ms"] is not None]
+    reads_after = [r["read_after_ms"] for r in done if r["read_after_ms"] is not None]
+
+    return {
+        "files_processed": len(results),
+        "files_migrated": len(done),
+        "files_failed": len([r for r in results if r["status"] == "failed"]),
+        "size_before_mb": round(before_kb / 1024, 3),
+        "size_after_mb": round(after_kb / 1024, 3),
+        "space_saved_percent": round((1 - after_kb / before_kb) * 100, 1) if before_kb else 0,
+        "median_read_before_ms": round(float(np.median(reads_before)), 2) if reads_before else None,
+        "median_read_after_ms": round(float(np.median(reads_after)), 2) if reads_after else None
+    }
+
+
+def main():
+    """Main migration execution."""
+    backend_path = Path(__file__).parent.parent.parent
+    data_root = backend_path.parent / "ocean-data"
+
+    parser = argparse.ArgumentParser(description="Rewrite unified_coords NetCDF files with the shared encoding policy")
+    parser.add_argument("--dataset", help="Only migrate one dataset directory (e.g. sst, currents, acidity_current)")
+    parser.add_argument("--dry-run", action="store_true", help="Measure gains without replacing the original files")
+    parser.add_argument("--max-files", type=int, help="Maximum number of files to migrate")
+    parser.add_argument("--sample-points", type=int, default=5, help="Random points used for read-latency measurement")
+    args = parser.parse_args()
+
+    unified_path = data_root / "processed" / "unified_coords"
+    search_path = unified_path / args.dataset if args.dataset else unified_path
+    logs_path = data_root / "logs" / "optimization"
+    logs_path.mkdir(parents=True, exist_ok=True)
+
+    files = sorted(search_path.rglob("*.nc"))
+    if args.max_files:
+        files = files[:args.max_files]
+
+    print("🗜️  NetCDF Encoding Migration")
+    print("=" * 50)
+    print(f"📁 Data directory: {search_path}")
+    print(f"   Files to process: {len(files)}{' (dry run)' if args.dry_run else ''}")
+
+    rng = random.Random(42)
+    points = [(rng.uniform(-60, 60), rng.uniform(-180, 180)) for _ in range(args.sample_points)]
+
+    results = []
+    for i, file_path in enumerate(files, 1):
+        result = migrate_file(file_path, points, dry_run=args.dry_run)
+        results.append(result)
+        if result["status"] != "failed":
+            print(f"   [{i}/{len(files)}] {file_path.name}: "
+                  f"{result['size_before_kb']:.0f} KB -> {result['size_after_kb']:.0f} KB")
+
+    summary = summarize(results)
+    print(f"\n📊 Space: {summary['size_before_mb']:.1f} MB -> {summary['size_after_mb']:.1f} MB "
+          f"({summary['space_saved_percent']:.1f}% saved)")
+    print(f"⚡ Median point read: {summary['median_read_before_ms']} ms -> {summary['median_read_after_ms']} ms")
+
+    report_file = logs_path / f"encoding_migration_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(report_file, 'w') as f:
+        json.dump({"summary": summary, "files": results}, f, indent=2, default=str)
+    print(f"\n💾 Report saved to: {report_file}")
+
+    return 1 if summary["files_failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
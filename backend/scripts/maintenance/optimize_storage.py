@@ -12,6 +12,11 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
+# Add backend to path for imports (script is in scripts/maintenance/, need to go up two levels to reach backend/)
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from utils.file_catalog import delete_output
+
 def analyze_storage_usage(data_root: Path) -> Dict[str, any]:
     """Analyze current storage usage across all processing stages."""
     
@@ -234,7 +239,7 @@ def execute_optimization(data_root: Path, plan: Dict, dry_run: bool = True) -> D
                     file_size_mb = file_path.stat().st_size / (1024 * 1024)
                     
                     if not dry_run:
-                        file_path.unlink()  # Delete the file
+                        delete_output(file_path)  # Delete the file (and its catalog entry)
                         execution_log["files_removed"].append(str(file_path))
                     
                     action_log["files_processed"] += 1
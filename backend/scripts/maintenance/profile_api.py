@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Profile a running API process with its on-demand sampling profiler.
+
+Starts a bounded sampling window through the admin endpoints, waits for it to
+finish, writes the folded stacks (input of flamegraph.pl, speedscope and
+inferno) and prints the busiest functions per endpoint.
+
+The API must run with OCEAN_ADMIN_TOKEN set; pass the same token with --token
+or the OCEAN_ADMIN_TOKEN environment variable.
+
+    python scripts/maintenance/profile_api.py --duration 30 --interval-ms 5
+    flamegraph.pl profile_20240701_120000.folded > profile.svg
+"""
+
+import os
+import sys
+import time
+import argparse
+from pathlib import Path
+
+import requests
+
+# Add backend to path for imports (script is in scripts/maintenance/, need to go up two levels to reach backend/)
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from api.admin import ADMIN_TOKEN_ENV, ADMIN_TOKEN_HEADER
+
+
+def _print_summary(summary: dict, top: int):
+    print(f"\n📊 {summary['samples']} samples in {summary['ticks']} ticks "
+          f"({summary['elapsed_s']:.1f}s every {summary['interval_ms']:g}ms)")
+    for endpoint, stats in summary["endpoints"].items():
+        print(f"\n   {endpoint}: {stats['samples']} samples (~{stats['estimated_seconds']:.2f}s)")
+        for function in stats["top_functions"][:top]:
+            print(f"      {function['percent']:5.1f}%  {function['function']}")
+
+
+def main():
+    """Run one profiling session against the API and save its output."""
+    parser = argparse.ArgumentParser(description="Sample the API's stacks and write a flamegraph-ready profile")
+    parser.add_argument("--url", default="http://localhost:8000", help="API base URL (default: http://localhost:8000)")
+    parser.add_argument("--token", default=os.environ.get(ADMIN_TOKEN_ENV),
+                        help=f"Admin token (default: ${ADMIN_TOKEN_ENV})")
+    parser.add_argument("--duration", type=float, default=30.0, help="Sampling window in seconds (default: 30)")
+    parser.add_argument("--interval-ms", type=float, default=10.0, help="Milliseconds between samples (default: 10)")
+    parser.add_argument("--top", type=int, default=10, help="Functions listed per endpoint (default: 10)")
+    parser.add_argument("--output", type=Path, help="Folded-stack output file (default: server-provided name)")
+    args = parser.parse_args()
+
+    if not args.token:
+        parser.error(f"An admin token is required (--token or ${ADMIN_TOKEN_ENV})")
+
+    session = requests.Session()
+    session.headers[ADMIN_TOKEN_HEADER] = args.token
+    base_url = args.url.rstrip("/")
+
+    print("🔬 API Sampling Profiler")
+    print("=" * 50)
+    response = session.post(f"{base_url}/admin/profiler/start",
+                            params={"duration": args.duration, "interval_ms": args.interval_ms})
+    if response.status_code != 202:
+        print(f"❌ Could not start profiling ({response.status_code}): {response.text}")
+        return 1
+    print(f"▶️  Sampling {args.url} for {args.duration:g}s every {args.interval_ms:g}ms...")
+
+    try:
+        time.sleep(args.duration)
+        while True:
+            summary = session.get(f"{base_url}/admin/profiler", params={"top": args.top}).json()
+            if not summary["running"]:
+                break
+            time.sleep(0.5)
+    except KeyboardInterrupt:
+        print("\n⏹️  Stopping early")
+        summary = session.post(f"{base_url}/admin/profiler/stop").json()
+
+    response = session.get(f"{base_url}/admin/profiler/folded")
+    response.raise_for_status()
+    output = args.output
+    if output is None:
+        disposition = response.headers.get("content-disposition", "")
+        output = Path(disposition.partition('filename="')[2].rstrip('"') or "profile.folded")
+    output.write_text(response.text)
+
+    _print_summary(summary, args.top)
+    print(f"\n💾 Folded stacks written to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
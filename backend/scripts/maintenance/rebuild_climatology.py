@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Backfill the day-of-year climatologies from existing harmonized files.
+New files are folded in at write time; this covers files written before the
+climatologies existed (or rebuilds them from scratch with --force).
+"""
+
+import sys
+import time
+import shutil
+import argparse
+import logging
+from pathlib import Path
+
+import xarray as xr
+
+# Add backend to path for imports (script is in scripts/maintenance/, need to go up two levels to reach backend/)
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from utils.file_catalog import get_file_catalog
+from utils.climatology import CLIMATOLOGY_VARIABLES, get_climatology_engine, update_from_file
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+
+def main():
+    """Fold every cataloged harmonized file into its dataset's climatologies."""
+    backend_path = Path(__file__).parent.parent.parent
+    default_root = backend_path.parent / "ocean-data"
+
+    parser = argparse.ArgumentParser(description="Backfill day-of-year climatologies for anomalies")
+    parser.add_argument("--base-path", type=Path, default=default_root, help="ocean-data directory")
+    parser.add_argument("--dataset", choices=sorted(CLIMATOLOGY_VARIABLES), help="Only this dataset")
+    parser.add_argument("--force", action="store_true", help="Delete existing climatologies and rebuild them")
+    args = parser.parse_args()
+
+    catalog = get_file_catalog(args.base_path)
+    engine = get_climatology_engine(catalog.data_root)
+    datasets = [args.dataset] if args.dataset else sorted(CLIMATOLOGY_VARIABLES)
+
+    print("🌡️ Climatology Backfill")
+    print("=" * 50)
+    print(f"📁 Data directory: {catalog.data_root}")
+    print(f"   Climatologies: {engine.base_path}")
+
+    if args.force:
+        for dataset in datasets:
+            shutil.rmtree(engine.base_path / dataset, ignore_errors=True)
+        # Drop cached stores so they are recreated empty
+        engine._stores.clear()
+
+    start = time.time()
+    updated = skipped = failed = 0
+    for dataset in datasets:
+        entries = [entry for entry in catalog.entries("unified", dataset, "*.nc") if entry.date]
+        print(f"\n📊 {dataset}: {len(entries)} harmonized files")
+        stores = [engine.store(dataset, variable) for variable in CLIMATOLOGY_VARIABLES[dataset]]
+        for i, entry in enumerate(entries, 1):
+            if all(store.has_date(entry.date) for store in stores):
+                skipped += 1
+                continue
+            try:
+                with xr.open_dataset(entry.path) as ds:
+                    update_from_file(ds, entry.path)
+                updated += 1
+            except Exception as e:
+                logging.warning(f"Failed to process {entry.path.name}: {e}")
+                failed += 1
+            if i % 100 == 0:
+                print(f"   {i}/{len(entries)} files processed...")
+
+    print(f"\n✅ Folded in: {updated}, already present: {skipped}, failed: {failed} "
+          f"({time.time() - start:.1f}s)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Rebuild the ocean data file catalog from the filesystem.
+Needed only for files added outside the downloaders/processors (manual copies,
+restores from backup); normal writes keep the catalog current on their own.
+"""
+
+import sys
+import argparse
+import logging
+from pathlib import Path
+
+# Add backend to path for imports (script is in scripts/maintenance/, need to go up two levels to reach backend/)
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from utils.file_catalog import get_file_catalog
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+
+def main():
+    """Reconcile the catalog with the ocean-data tree."""
+    backend_path = Path(__file__).parent.parent.parent
+    default_root = backend_path.parent / "ocean-data"
+
+    parser = argparse.ArgumentParser(description="Rebuild the ocean data file catalog")
+    parser.add_argument("--base-path", type=Path, default=default_root, help="ocean-data directory")
+    args = parser.parse_args()
+
+    catalog = get_file_catalog(args.base_path)
+
+    print("📇 File Catalog Rebuild")
+    print("=" * 50)
+    print(f"📁 Data directory: {catalog.data_root}")
+    print(f"   Database: {catalog.db_path}")
+
+    stats = catalog.rebuild()
+
+    print(f"\n✅ Added: {stats['added']}, updated: {stats['updated']}, "
+          f"removed: {stats['removed']}, unchanged: {stats['unchanged']}")
+    for stage in ("raw", "unified", "processed", "textures"):
+        count = catalog.count(stage)
+        if count:
+            size_gb = catalog.total_size_bytes(stage) / (1024 ** 3)
+            print(f"   {stage}: {count} files, {size_gb:.2f} GB")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Backfill the daily summary statistics table from existing harmonized files.
+New files are summarized at write time; this covers files written before the
+table existed (or after a change to the region definitions with --force).
+"""
+
+import sys
+import time
+import argparse
+import logging
+from pathlib import Path
+
+import xarray as xr
+
+# Add backend to path for imports (script is in scripts/maintenance/, need to go up two levels to reach backend/)
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from utils.file_catalog import get_file_catalog
+from utils.summary_stats import CIRCULAR_VARIABLES, get_summary_table, summarize_file
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+
+def main():
+    """Summarize every cataloged harmonized file that has no summaries yet."""
+    backend_path = Path(__file__).parent.parent.parent
+    default_root = backend_path.parent / "ocean-data"
+
+    parser = argparse.ArgumentParser(description="Backfill daily area-weighted summary statistics")
+    parser.add_argument("--base-path", type=Path, default=default_root, help="ocean-data directory")
+    parser.add_argument("--dataset", help="Only this dataset (e.g. sst)")
+    parser.add_argument("--start-date", help="First date to summarize (YYYY-MM-DD)")
+    parser.add_argument("--end-date", help="Last date to summarize (YYYY-MM-DD)")
+    parser.add_argument("--force", action="store_true", help="Recompute days that already have summaries")
+    args = parser.parse_args()
+
+    catalog = get_file_catalog(args.base_path)
+    table = get_summary_table(catalog.data_root)
+    entries = [
+        entry for entry in catalog.entries("unified", args.dataset, "*.nc", args.start_date, args.end_date)
+        if entry.date
+    ]
+
+    print("📈 Summary Statistics Backfill")
+    print("=" * 50)
+    print(f"📁 Data directory: {catalog.data_root}")
+    print(f"   Table: {table.db_path}")
+    print(f"   Harmonized files: {len(entries)}")
+
+    # Tables written before directions were excluded hold meaningless linear means of them
+    dropped = table.drop_variables(list(CIRCULAR_VARIABLES))
+    if dropped:
+        print(f"   Dropped {dropped} direction rows ({', '.join(CIRCULAR_VARIABLES)})")
+
+    start = time.time()
+    summarized = skipped = failed = 0
+    for i, entry in enumerate(entries, 1):
+        if not args.force and table.has_date(entry.dataset, entry.date):
+            skipped += 1
+            continue
+        try:
+            with xr.open_dataset(entry.path) as ds:
+                summarize_file(ds, entry.path)
+            summarized += 1
+        except Exception as e:
+            logging.warning(f"Failed to summarize {entry.path.name}: {e}")
+            failed += 1
+        if i % 100 == 0:
+            print(f"   {i}/{len(entries)} files processed...")
+
+    print(f"\n✅ Summarized: {summarized}, already present: {skipped}, failed: {failed} "
+          f"({time.time() - start:.1f}s)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,6 +17,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from downloaders.acidity_historical_downloader import AcidityHistoricalDownloader
 from downloaders.acidity_current_downloader import AcidityCurrentDownloader
+from utils.file_catalog import delete_output, move_output
 
 # Configure logging
 logging.basicConfig(
@@ -136,7 +137,7 @@ class CorruptedFileRepairer:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_path = backup_dir / f"{file_path.stem}_{timestamp}.corrupted"
         
-        file_path.rename(backup_path)
+        move_output(file_path, backup_path)
         logger.info(f"Backed up corrupted file: {backup_path}")
         
         return backup_path
@@ -246,7 +247,7 @@ class CorruptedFileRepairer:
                     
                     # Remove backup if repair successful
                     if backup_path.exists():
-                        backup_path.unlink()
+                        delete_output(backup_path)
                         logger.info(f"Removed backup: {backup_path}")
                 else:
                     results["failed"] += 1
@@ -255,7 +256,7 @@ class CorruptedFileRepairer:
                     
                     # Restore from backup if repair failed
                     if backup_path.exists() and not corrupted_file.exists():
-                        backup_path.rename(corrupted_file)
+                        move_output(backup_path, corrupted_file)
                         logger.info(f"Restored from backup: {corrupted_file.name}")
                         
             except Exception as e:
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Pack texture frames into month or year WebM videos for animation playback.
+Videos already holding the current frames are skipped, so the script can run
+after every texture batch; --force re-encodes them. Requires a local ffmpeg
+built with libvpx-vp9 (or libaom for --codec av1).
+"""
+
+import sys
+import time
+import argparse
+import logging
+from pathlib import Path
+
+# Add backend to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from api.endpoints.texture_service import TextureService
+from processors.texture_video_encoder import DEFAULT_FPS, VIDEO_CODECS, TextureVideoEncoder
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+
+def main():
+    """Encode every (or one) period of a texture category."""
+    parser = argparse.ArgumentParser(description="Encode texture sequences as month/year WebM videos")
+    parser.add_argument("--category", default="sst", help="Texture category (default: sst)")
+    parser.add_argument("--period", choices=["month", "year"], default="month", help="Frames per video")
+    parser.add_argument("--only", help="Encode a single period (YYYY or YYYY-MM)")
+    parser.add_argument("--codec", choices=sorted(VIDEO_CODECS), default="vp9", help="Video codec")
+    parser.add_argument("--fps", type=int, default=DEFAULT_FPS, help=f"Frames per second (default: {DEFAULT_FPS})")
+    parser.add_argument("--resolution", default="medium", help="Preferred texture resolution")
+    parser.add_argument("--ffmpeg", default="ffmpeg", help="ffmpeg executable")
+    parser.add_argument("--force", action="store_true", help="Re-encode videos that are up to date")
+    args = parser.parse_args()
+
+    texture_service = TextureService()
+    encoder = TextureVideoEncoder(texture_service, ffmpeg=args.ffmpeg)
+    periods = [args.only] if args.only else encoder.periods(args.category, args.period)
+
+    print("🎬 Texture Video Encoding")
+    print("=" * 50)
+    print(f"📁 Output: {encoder.video_dir(args.category)}")
+    print(f"   {len(periods)} {args.period} period(s), codec {args.codec} at {args.fps} fps")
+
+    start = time.time()
+    encoded = failed = 0
+    for period in periods:
+        try:
+            if encoder.encode(args.category, period, args.codec, args.fps, args.resolution, args.force):
+                encoded += 1
+        except (ValueError, RuntimeError) as e:
+            logging.error(f"Failed to encode {args.category} {period}: {e}")
+            failed += 1
+
+    print(f"\n✅ Videos up to date: {encoded}, failed: {failed} ({time.time() - start:.1f}s)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
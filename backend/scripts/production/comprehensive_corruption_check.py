@@ -6,13 +6,19 @@ Scans all raw and processed NetCDF files to identify any corruption.
 
 import sys
 import logging
+import argparse
 from pathlib import Path
 import xarray as xr
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional
 import json
 from datetime import datetime
 import numpy as np
 
+# Add backend to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from utils.file_integrity import ParallelIntegrityScanner, IntegrityManifest
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -23,12 +29,27 @@ logger = logging.getLogger(__name__)
 class ComprehensiveCorruptionChecker:
     """Performs comprehensive corruption check on ocean data files."""
     
-    def __init__(self):
-        """Initialize the corruption checker."""
-        self.base_path = Path("/media/anecoica/ANECOICA_DEV/pantha-rei-data-viz/ocean-data")
+    def __init__(self, base_path: Optional[Path] = None, mode: str = "fast",
+                 max_workers: Optional[int] = None, use_manifest: bool = True):
+        """
+        Initialize the corruption checker.
+        
+        Args:
+            base_path: Ocean data root
+            mode: 'fast' (header/size/sampled-chunk tier, full decode on suspects) or 'full'
+            max_workers: Worker processes for scanning (defaults to CPU count)
+            use_manifest: Skip files unchanged since the last scan
+        """
+        self.base_path = base_path or Path("/media/anecoica/ANECOICA_DEV/pantha-rei-data-viz/ocean-data")
         self.raw_path = self.base_path / "raw"
         self.processed_path = self.base_path / "processed"
         
+        manifest = None
+        if use_manifest:
+            manifest = IntegrityManifest(self.base_path / "logs" / "integrity" / "corruption_manifest.json",
+                                         self.base_path)
+        self.scanner = ParallelIntegrityScanner(manifest=manifest, mode=mode, max_workers=max_workers)
+        
         # Track results
         self.results = {
             "scan_timestamp": datetime.now().isoformat(),
@@ -41,9 +62,10 @@ class ComprehensiveCorruptionChecker:
             }
         }
         
-    def check_file_corruption(self, file_path: Path) -> Tuple[bool, str, Dict]:
+    @staticmethod
+    def check_file_corruption(file_path: Path) -> Tuple[bool, str, Dict]:
         """
-        Check if a NetCDF file is corrupted.
+        Check if a NetCDF file is corrupted (full decode).
         
         Returns:
             Tuple of (is_healthy, error_message, file_info)
@@ -148,25 +170,29 @@ class ComprehensiveCorruptionChecker:
             "corrupted_files": 0,
             "corrupted_list": [],
             "error_types": {},
-            "total_size_gb": 0
+            "total_size_gb": 0,
+            "scan_tiers": {"quick": 0, "full": 0},
+            "cached_results": 0
         }
         
-        # Check each file
-        for i, nc_file in enumerate(nc_files, 1):
-            # Progress indicator for large datasets
-            if i % 500 == 0:
-                logger.info(f"Progress: {i}/{len(nc_files)} files checked...")
-            
-            is_healthy, error_msg, file_info = self.check_file_corruption(nc_file)
+        # Tiered parallel scan; full decode only runs on suspects in fast mode
+        scan_results = self.scanner.scan(nc_files, full_check=self.check_file_corruption)
+        
+        for nc_file, record in scan_results.items():
+            size_mb = record["size_bytes"] / (1024 * 1024)
             
             # Update totals
             self.results["summary"]["total_files_scanned"] += 1
-            dataset_results["total_size_gb"] += file_info["size_mb"] / 1024
+            dataset_results["total_size_gb"] += size_mb / 1024
+            dataset_results["scan_tiers"][record["tier"]] += 1
+            if record.get("cached"):
+                dataset_results["cached_results"] += 1
             
-            if is_healthy:
+            if record["status"] == "healthy":
                 dataset_results["healthy_files"] += 1
                 self.results["summary"]["total_healthy"] += 1
             else:
+                error_msg = record["error"] or "Unknown error"
                 dataset_results["corrupted_files"] += 1
                 self.results["summary"]["total_corrupted"] += 1
                 
@@ -179,8 +205,8 @@ class ComprehensiveCorruptionChecker:
                 dataset_results["corrupted_list"].append({
                     "file": str(nc_file.relative_to(self.base_path)),
                     "error": error_msg,
-                    "size_mb": file_info["size_mb"],
-                    "modified": file_info["modified"]
+                    "size_mb": size_mb,
+                    "modified": record["modified"]
                 })
                 
                 # Log corrupted files immediately
@@ -194,6 +220,9 @@ class ComprehensiveCorruptionChecker:
         logger.info(f"  Healthy: {dataset_results['healthy_files']}")
         logger.info(f"  Corrupted: {dataset_results['corrupted_files']} ({corruption_rate:.2f}%)")
         logger.info(f"  Total size: {dataset_results['total_size_gb']:.2f} GB")
+        logger.info(f"  Scan tiers: {dataset_results['scan_tiers']['quick']} quick, "
+                    f"{dataset_results['scan_tiers']['full']} full decode, "
+                    f"{dataset_results['cached_results']} from manifest")
         
         if dataset_results["error_types"]:
             logger.info(f"  Error types:")
@@ -313,7 +342,20 @@ class ComprehensiveCorruptionChecker:
 
 def main():
     """Main function."""
-    checker = ComprehensiveCorruptionChecker()
+    parser = argparse.ArgumentParser(description="Comprehensive corruption check for ocean data files")
+    parser.add_argument("--mode", choices=["fast", "full"], default="fast",
+                        help="fast: header/size/sampled-chunk checks with full decode on suspects; full: decode every file")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument("--no-cache", action="store_true", help="Rescan files even if unchanged since the last scan")
+    parser.add_argument("--base-path", type=Path, help="Base path for ocean data")
+    args = parser.parse_args()
+    
+    checker = ComprehensiveCorruptionChecker(
+        base_path=args.base_path,
+        mode=args.mode,
+        max_workers=args.workers,
+        use_manifest=not args.no_cache
+    )
     results = checker.run_comprehensive_scan()
     
     # Return exit code based on corruption found
@@ -18,6 +18,7 @@ import json
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from downloaders.sst_erddap_texture_downloader import SSTERDDAPTextureDownloader
+from utils.file_catalog import delete_output
 
 class DailySSTPipelineError(Exception):
     """Custom exception for daily SST pipeline errors."""
@@ -174,7 +175,7 @@ class DailyTextureUpdater:
                         continue
                     else:
                         self.logger.warning(f"Existing texture is invalid, re-downloading: {target_date}")
-                        texture_path.unlink()  # Remove invalid file
+                        delete_output(texture_path)  # Remove invalid file
                 
                 # Download texture
                 success = self.downloader.download_texture_for_date(target_date)
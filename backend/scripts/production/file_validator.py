@@ -14,19 +14,34 @@ from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Set
 from datetime import datetime
 import json
+from functools import partial
 from PIL import Image
 import os
 
 # Add backend to path (now two levels up since we're in scripts/production/)
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from utils.file_integrity import ParallelIntegrityScanner, IntegrityManifest
+from utils.file_catalog import get_file_catalog
+
 class FileValidator:
     """Comprehensive file validation for ocean data files."""
     
-    def __init__(self, base_path: Optional[Path] = None):
-        """Initialize file validator."""
+    def __init__(self, base_path: Optional[Path] = None, max_workers: Optional[int] = None,
+                 use_manifest: bool = True):
+        """
+        Initialize file validator.
+        
+        Args:
+            base_path: Ocean data root
+            max_workers: Worker processes for dataset validation (defaults to CPU count)
+            use_manifest: Reuse results for files unchanged since they were last validated
+        """
         self.base_path = base_path or Path(__file__).parent.parent.parent / "ocean-data"
         self.logger = logging.getLogger(__name__)
+        self.max_workers = max_workers
+        self.use_manifest = use_manifest
+        self.file_catalog = get_file_catalog(self.base_path)
         
         # Validation thresholds and expectations
         self.validation_config = {
@@ -314,18 +329,23 @@ class FileValidator:
         except Exception as e:
             result["warnings"].append(f"Cannot validate time dimension: {e}")
     
-    def validate_dataset(self, dataset: str, file_paths: List[Path] = None) -> Dict:
+    def validate_dataset(self, dataset: str, file_paths: List[Path] = None, mode: str = "fast") -> Dict:
         """
         Validate multiple files for a dataset.
         
+        Files are checked in parallel. In "fast" mode each file gets a header,
+        size and sampled-chunk check, and only suspects get the full validation;
+        "full" mode runs the full validation on every file.
+        
         Args:
             dataset: Dataset name
             file_paths: List of specific files to validate (None for all files)
+            mode: Scan mode ("fast" or "full")
         
         Returns:
             Dictionary with validation results for all files
         """
-        self.logger.info(f"Starting validation for dataset: {dataset}")
+        self.logger.info(f"Starting validation for dataset: {dataset} ({mode} mode)")
         
         if file_paths is None:
             file_paths = self._discover_dataset_files(dataset)
@@ -333,19 +353,34 @@ class FileValidator:
         results = {
             "dataset": dataset,
             "validation_timestamp": datetime.now().isoformat(),
+            "scan_mode": mode,
             "total_files": len(file_paths),
             "valid_files": 0,
             "invalid_files": 0,
             "files_with_warnings": 0,
+            "full_validations": 0,
+            "cached_results": 0,
             "files": {}
         }
         
-        for file_path in file_paths:
-            self.logger.debug(f"Validating: {file_path}")
+        manifest = None
+        if self.use_manifest:
+            manifest = IntegrityManifest(self.base_path / "logs" / "integrity" / f"validator_{dataset}_manifest.json",
+                                         self.base_path)
+        scanner = ParallelIntegrityScanner(manifest=manifest, mode=mode, max_workers=self.max_workers)
+        scan_results = scanner.scan(file_paths, full_check=partial(self._full_check, dataset=dataset))
+        
+        for file_path, record in scan_results.items():
+            if record["details"] is not None:
+                file_result = record["details"]
+                results["full_validations"] += 1
+            else:
+                file_result = self._quick_result(file_path, dataset, record)
             
-            file_result = self.validate_file(file_path, dataset)
-            file_key = str(file_path.relative_to(self.base_path))
-            results["files"][file_key] = file_result
+            if record.get("cached"):
+                results["cached_results"] += 1
+            
+            results["files"][self._file_key(file_path)] = file_result
             
             if file_result["is_valid"]:
                 results["valid_files"] += 1
@@ -355,52 +390,75 @@ class FileValidator:
             if file_result["warnings"]:
                 results["files_with_warnings"] += 1
         
-        self.logger.info(f"Validation complete: {results['valid_files']}/{results['total_files']} files valid")
+        self.file_catalog.set_validation_states({
+            file_path: "valid" if results["files"][self._file_key(file_path)]["is_valid"] else "invalid"
+            for file_path in scan_results
+        })
+        
+        self.logger.info(f"Validation complete: {results['valid_files']}/{results['total_files']} files valid "
+                         f"({results['full_validations']} fully validated, {results['cached_results']} unchanged)")
         
         return results
     
+    def _file_key(self, file_path: Path) -> str:
+        """Report key for a file (relative to the data root when possible)."""
+        for root in (self.base_path, self.base_path.resolve()):
+            try:
+                return str(file_path.relative_to(root))
+            except ValueError:
+                continue
+        return str(file_path)
+    
+    def _full_check(self, file_path: Path, dataset: str) -> Tuple[bool, str, Dict]:
+        """Full validation in the shape expected by the integrity scanner."""
+        result = self.validate_file(file_path, dataset)
+        message = "; ".join(result["errors"]) if result["errors"] else "OK"
+        return result["is_valid"], message, result
+    
+    def _quick_result(self, file_path: Path, dataset: str, record: Dict) -> Dict:
+        """Validation result for a file that only went through the quick tier."""
+        healthy = record["status"] == "healthy"
+        return {
+            "file_path": str(file_path),
+            "dataset": dataset,
+            "is_valid": healthy,
+            "errors": [] if healthy else [record["error"]],
+            "warnings": [],
+            "file_info": {
+                "size_bytes": record["size_bytes"],
+                "size_kb": record["size_bytes"] / 1024,
+                "modified_time": record["modified"]
+            },
+            "validation_tier": "quick",
+            "validation_timestamp": datetime.now().isoformat()
+        }
+    
     def _discover_dataset_files(self, dataset: str) -> List[Path]:
-        """Discover all files for a dataset."""
-        files = []
-        
+        """Discover all files for a dataset from the file catalog."""
         if dataset == "sst_textures":
-            texture_path = self.base_path / "textures" / "sst"
-            if texture_path.exists():
-                files = list(texture_path.rglob("*.png"))
-        else:
-            # Check processed/unified_coords directory first (priority)
-            processed_path = self.base_path / "processed/unified_coords" / dataset
-            if processed_path.exists():
-                files.extend(list(processed_path.rglob("*.nc")))
-            
-            # Also check for acidity variants in processed
-            if dataset == "acidity":
-                for variant in ["acidity_current", "acidity_historical"]:
-                    variant_path = self.base_path / "processed/unified_coords" / variant
-                    if variant_path.exists():
-                        files.extend(list(variant_path.rglob("*.nc")))
-            
-            # If no processed files found, check raw directory as fallback
-            if not files:
-                raw_path = self.base_path / "raw" / dataset  
-                if raw_path.exists():
-                    files.extend(list(raw_path.rglob("*.nc")))
-                    
-                # Also check for acidity variants in raw
-                if dataset == "acidity":
-                    for variant in ["acidity_current", "acidity_historical"]:
-                        variant_path = self.base_path / "raw" / variant
-                        if variant_path.exists():
-                            files.extend(list(variant_path.rglob("*.nc")))
-        
-        return sorted(files)
+            return self.file_catalog.paths("textures", "sst", "*.png")
+        
+        # Also check for acidity variants
+        datasets = [dataset]
+        if dataset == "acidity":
+            datasets.extend(["acidity_current", "acidity_historical"])
+        
+        # Check processed/unified_coords first (priority)
+        files = self.file_catalog.paths("unified", datasets, "*.nc")
+        
+        # If no processed files found, check raw directory as fallback
+        if not files:
+            files = self.file_catalog.paths("raw", datasets, "*.nc")
+        
+        return files
     
-    def find_corrupted_files(self, dataset: str = None) -> Dict:
+    def find_corrupted_files(self, dataset: str = None, mode: str = "fast") -> Dict:
         """
         Find all corrupted files across datasets.
         
         Args:
             dataset: Specific dataset to check (None for all)
+            mode: Scan mode ("fast" or "full")
         
         Returns:
             Dictionary mapping datasets to lists of corrupted files
@@ -412,7 +470,7 @@ class FileValidator:
         for ds in datasets_to_check:
             self.logger.info(f"Checking for corrupted files in {ds}...")
             
-            validation_result = self.validate_dataset(ds)
+            validation_result = self.validate_dataset(ds, mode=mode)
             
             corrupted_list = []
             for file_key, file_result in validation_result["files"].items():
@@ -446,7 +504,7 @@ class FileValidator:
         
         for dataset in datasets:
             self.logger.info(f"Generating report for {dataset}...")
-            report["datasets"][dataset] = self.validate_dataset(dataset)
+            report["datasets"][dataset] = self.validate_dataset(dataset, mode="full")
         
         # Write report
         with open(output_path, 'w') as f:
@@ -470,6 +528,12 @@ def main():
                        help="Generate comprehensive validation report")
     parser.add_argument("--base-path", type=Path, 
                        help="Base path for ocean data")
+    parser.add_argument("--mode", choices=["fast", "full"], default="fast",
+                       help="fast: header/size/sampled-chunk checks with full validation on suspects; full: validate every file")
+    parser.add_argument("--workers", type=int,
+                       help="Worker processes (default: CPU count)")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Revalidate files even if unchanged since the last run")
     parser.add_argument("--verbose", "-v", action="store_true",
                        help="Verbose output")
     
@@ -480,7 +544,7 @@ def main():
     logging.basicConfig(level=level, format='%(asctime)s - %(levelname)s - %(message)s')
     
     # Initialize validator
-    validator = FileValidator(args.base_path)
+    validator = FileValidator(args.base_path, max_workers=args.workers, use_manifest=not args.no_cache)
     
     try:
         if args.file:
@@ -497,7 +561,7 @@ def main():
                 
         elif args.find_corrupted:
             # Find corrupted files
-            corrupted = validator.find_corrupted_files(args.dataset)
+            corrupted = validator.find_corrupted_files(args.dataset, mode=args.mode)
             
             if corrupted:
                 print("Corrupted files found:")
@@ -516,7 +580,7 @@ def main():
             
         elif args.dataset:
             # Validate specific dataset
-            result = validator.validate_dataset(args.dataset)
+            result = validator.validate_dataset(args.dataset, mode=args.mode)
             print(json.dumps(result, indent=2))
             
             if result["invalid_files"] > 0:
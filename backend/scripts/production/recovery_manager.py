@@ -32,6 +32,7 @@ from downloaders.currents_downloader import CurrentsDownloader
 from downloaders.acidity_hybrid_downloader import AcidityHybridDownloader
 from downloaders.microplastics_downloader import MicroplasticsDownloader
 from processors.coordinate_harmonizer import CoordinateHarmonizer
+from utils.file_catalog import delete_output, get_file_catalog
 
 @dataclass
 class RecoveryTask:
@@ -63,6 +64,7 @@ class RecoveryManager:
         
         # Initialize components
         self.file_validator = FileValidator(self.base_path)
+        self.file_catalog = get_file_catalog(self.base_path)
         self.status_manager = StatusManager()
         self.coordinate_harmonizer = CoordinateHarmonizer()
         
@@ -173,21 +175,24 @@ class RecoveryManager:
                 
             self.logger.info(f"Checking processed files for {dataset}...")
             
-            raw_path = self.base_path / "raw" / dataset
-            processed_path = self.base_path / "processed" / "unified_coords" / dataset
+            data_root = self.file_catalog.data_root
+            raw_path = data_root / "raw" / dataset
+            processed_path = data_root / "processed" / "unified_coords" / dataset
             
-            if not raw_path.exists():
+            raw_files = self.file_catalog.paths("raw", dataset, "*.nc")
+            if not raw_files:
                 continue
+            processed_files = set(self.file_catalog.paths("unified", dataset))
             
             missing_pairs = []
             
             # Find raw files without corresponding processed files
-            for raw_file in raw_path.rglob("*.nc"):
+            for raw_file in raw_files:
                 # Construct expected processed file path
                 rel_path = raw_file.relative_to(raw_path)
                 processed_file = processed_path / rel_path.parent / f"{rel_path.stem}_harmonized.nc"
                 
-                if not processed_file.exists():
+                if processed_file not in processed_files:
                     missing_pairs.append((raw_file, processed_file))
             
             if missing_pairs:
@@ -349,7 +354,7 @@ class RecoveryManager:
         # Remove corrupted file
         if task.file_path.exists():
             self.logger.info(f"Removing corrupted file: {task.file_path}")
-            task.file_path.unlink()
+            delete_output(task.file_path)
         
         # Redownload
         downloader = self.downloaders.get(task.dataset)
@@ -419,7 +424,7 @@ class RecoveryManager:
         
         # Remove existing processed file if any
         if task.file_path.exists():
-            task.file_path.unlink()
+            delete_output(task.file_path)
         
         try:
             self.logger.info(f"Reprocessing {raw_file} -> {task.file_path}")
@@ -451,7 +456,7 @@ class RecoveryManager:
         try:
             if task.file_path.exists():
                 self.logger.info(f"Removing partial download: {task.file_path}")
-                task.file_path.unlink()
+                delete_output(task.file_path)
                 self.stats["cleanup_operations"] += 1
             
             # If we have a target date, try to redownload
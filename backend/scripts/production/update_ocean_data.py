@@ -20,7 +20,6 @@ import json
 from datetime import datetime, date, timedelta
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Set
-import re
 
 # Add backend to path (now two levels up since we're in scripts/production/)
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -32,19 +31,29 @@ from downloaders.currents_downloader import CurrentsDownloader
 from downloaders.acidity_hybrid_downloader import AcidityHybridDownloader
 from downloaders.microplastics_downloader import MicroplasticsDownloader
 from processors.coordinate_harmonizer import CoordinateHarmonizer
+from utils.file_catalog import get_file_catalog
 
 class GapDetector:
-    """Detects gaps in ocean data by scanning actual files."""
+    """Detects gaps in ocean data by querying the file catalog."""
+    
+    # Catalog filename patterns for the latest-file lookup per dataset
+    FILE_PATTERNS = {
+        "sst": "sst_harmonized_*.nc",
+        "currents": "currents*.nc",
+        "acidity_current": "acidity*.nc",
+        "acidity_historical": "acidity*.nc",
+    }
     
     def __init__(self, base_path: Path):
         self.base_path = base_path
         self.raw_path = base_path / "raw"
         self.processed_path = base_path / "processed" / "unified_coords"
         self.textures_path = base_path / "textures"
+        self.file_catalog = get_file_catalog(base_path)
         
     def detect_gaps(self, dataset: str) -> Tuple[Optional[date], List[date]]:
         """
-        Detect gaps for a dataset by scanning actual files.
+        Detect gaps for a dataset from the files recorded in the catalog.
         
         Returns:
             Tuple of (latest_date_found, list_of_missing_dates_to_current)
@@ -56,28 +65,10 @@ class GapDetector:
     
     def _detect_texture_gaps(self) -> Tuple[Optional[date], List[date]]:
         """Detect gaps in SST texture files."""
-        texture_path = self.textures_path / "sst"
-        if not texture_path.exists():
-            # No textures exist, start from texture start date
-            return None, self._generate_date_range(date(2003, 1, 1), date.today() - timedelta(days=1))
-        
-        # Find latest texture file
-        latest_date = None
-        texture_pattern = re.compile(r"SST_(\d{8})\.png")
-        
-        for year_dir in sorted(texture_path.glob("*"), reverse=True):
-            if not year_dir.is_dir():
-                continue
-            for texture_file in sorted(year_dir.glob("SST_*.png"), reverse=True):
-                match = texture_pattern.match(texture_file.name)
-                if match:
-                    date_str = match.group(1)
-                    latest_date = datetime.strptime(date_str, "%Y%m%d").date()
-                    break
-            if latest_date:
-                break
+        latest_date = self.file_catalog.latest_date("textures", "sst", "SST_*.png")
         
         if not latest_date:
+            # No textures exist, start from texture start date
             return None, self._generate_date_range(date(2003, 1, 1), date.today() - timedelta(days=1))
         
         # Generate missing dates from latest to yesterday
@@ -94,54 +85,12 @@ class GapDetector:
         if dataset == "acidity":
             return self._detect_acidity_hybrid_gaps()
         
-        # Check processed/unified_coords first (priority)
-        dataset_path = self.processed_path / dataset
-        if not dataset_path.exists():
-            # No data exists, start from dataset start date
-            start_dates = {
-                "sst": date(2003, 1, 1),  # Align with user requirement: 2003-present coverage
-                "currents": date(2003, 1, 1),
-                "acidity": date(2021, 1, 1)  # Only current acidity data
-            }
-            start_date = start_dates.get(dataset, date(2024, 1, 1))
-            return None, self._generate_date_range(start_date, date.today() - timedelta(days=1))
-        
-        # Find latest file by scanning directory structure
-        latest_date = None
-        
-        # Different patterns for different datasets
-        if dataset == "sst":
-            pattern = re.compile(r"sst_harmonized_(\d{8})\.nc")
-        elif dataset == "currents":
-            pattern = re.compile(r"currents.*?(\d{8}).*\.nc")
-        elif dataset.startswith("acidity"):
-            pattern = re.compile(r"acidity.*?(\d{8}).*\.nc")
-        elif dataset == "microplastics":
+        if dataset == "microplastics":
             # Microplastics dataset excluded - not processed
             return date.today() - timedelta(days=1), []  # Always up to date
-        else:
-            pattern = re.compile(r".*(\d{8}).*\.nc")
         
-        # Scan for latest file
-        for year_dir in sorted(dataset_path.glob("*"), reverse=True):
-            if not year_dir.is_dir():
-                continue
-            for month_dir in sorted(year_dir.glob("*"), reverse=True):
-                if not month_dir.is_dir():
-                    continue
-                for data_file in sorted(month_dir.glob("*.nc"), reverse=True):
-                    match = pattern.search(data_file.name)
-                    if match:
-                        date_str = match.group(1)
-                        try:
-                            latest_date = datetime.strptime(date_str, "%Y%m%d").date()
-                            break
-                        except ValueError:
-                            continue
-                if latest_date:
-                    break
-            if latest_date:
-                break
+        # Latest processed/unified_coords file recorded for the dataset
+        latest_date = self._find_latest_date(dataset)
         
         if not latest_date:
             # No valid files found, start from beginning
@@ -165,19 +114,9 @@ class GapDetector:
         """Detect gaps in acidity hybrid system (current directories only)."""
         # Only use acidity_current directory (excluding acidity_historical)
         # - acidity_current: 2021-present
+        latest_date = self._find_latest_date("acidity_current")
         
-        current_path = self.processed_path / "acidity_current"
-        
-        latest_current = None
-        
-        # Check current data (2021-present) only
-        if current_path.exists():
-            latest_current = self._find_latest_date_in_path(current_path, r"acidity.*?(\d{8}).*\.nc")
-        
-        # Determine overall latest date
-        if latest_current:
-            latest_date = latest_current
-        else:
+        if not latest_date:
             # No data found, start from 2021 (when current data begins)
             return None, self._generate_date_range(date(2021, 1, 1), date.today() - timedelta(days=1))
         
@@ -189,31 +128,10 @@ class GapDetector:
         missing_dates = self._generate_date_range(latest_date + timedelta(days=1), yesterday)
         return latest_date, missing_dates
     
-    def _find_latest_date_in_path(self, path: Path, pattern_str: str) -> Optional[date]:
-        """Helper method to find latest date in a directory using given pattern."""
-        if not path.exists():
-            return None
-        
-        pattern = re.compile(pattern_str)
-        latest_date = None
-        
-        for year_dir in sorted(path.glob("*"), reverse=True):
-            if not year_dir.is_dir():
-                continue
-            for month_dir in sorted(year_dir.glob("*"), reverse=True):
-                if not month_dir.is_dir():
-                    continue
-                for data_file in sorted(month_dir.glob("*.nc"), reverse=True):
-                    match = pattern.search(data_file.name)
-                    if match:
-                        date_str = match.group(1)
-                        try:
-                            latest_date = datetime.strptime(date_str, "%Y%m%d").date()
-                            return latest_date  # Return first (latest) match found
-                        except ValueError:
-                            continue
-        
-        return latest_date
+    def _find_latest_date(self, dataset: str) -> Optional[date]:
+        """Latest date among the dataset's unified_coords files in the catalog."""
+        pattern = self.FILE_PATTERNS.get(dataset, "*.nc")
+        return self.file_catalog.latest_date("unified", dataset, pattern)
     
     def _generate_date_range(self, start_date: date, end_date: date) -> List[date]:
         """Generate list of dates between start and end (inclusive)."""
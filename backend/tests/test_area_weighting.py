@@ -0,0 +1,93 @@
+"""Tests for area-weighted grid statistics and surface layer selection."""
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from utils.area_weighting import (
+    latitude_weights, parse_stats, surface_field, surface_layer, weighted_stats
+)
+
+
+def test_latitude_weights_follow_cos_lat():
+    weights = latitude_weights(np.array([0.0, 60.0, -60.0, 90.0]))
+
+    np.testing.assert_allclose(weights, [1.0, 0.5, 0.5, 0.0], atol=1e-12)
+    assert (weights >= 0).all()
+
+
+def test_parse_stats():
+    assert parse_stats("Mean, max,p90,mean,") == ["mean", "max", "p90"]
+
+
+@pytest.mark.parametrize("spec", ["", "mean,p0", "p100", "average"])
+def test_parse_stats_rejects_unknown(spec):
+    with pytest.raises(ValueError):
+        parse_stats(spec)
+
+
+def test_weighted_mean_favours_larger_cells():
+    # One equatorial cell at 0 and one at 60N at 3: area weights 1 and 0.5
+    values = np.array([[0.0], [3.0]])
+    weights = latitude_weights(np.array([0.0, 60.0]))[:, None]
+
+    stats = weighted_stats(values, weights, ["mean", "std", "min", "max", "count"])
+
+    assert stats["mean"] == pytest.approx(1.0)
+    assert stats["std"] == pytest.approx(np.sqrt((1.0 * 1 + 4.0 * 0.5) / 1.5))
+    assert (stats["min"], stats["max"], stats["count"]) == (0.0, 3.0, 2)
+
+
+def test_equal_weights_reproduce_midpoint_percentiles():
+    values = np.arange(1.0, 12.0)
+    stats = weighted_stats(values, np.ones_like(values), ["median", "p10", "p90"])
+
+    assert stats["median"] == pytest.approx(np.median(values))
+    assert stats["p10"] == pytest.approx(np.percentile(values, 10, method="hazen"))
+    assert stats["p90"] == pytest.approx(np.percentile(values, 90, method="hazen"))
+
+
+def test_nan_and_zero_weight_cells_are_skipped():
+    values = np.array([[np.nan, 2.0], [4.0, 100.0]])
+    weights = np.array([[1.0], [0.0]])
+
+    stats = weighted_stats(values, weights, ["mean", "count"])
+    assert stats == {"mean": 2.0, "count": 1}
+
+    empty = weighted_stats(np.full((2, 2), np.nan), np.ones((2, 1)), ["mean", "count"])
+    assert empty == {"mean": None, "count": 0}
+
+
+def currents_dataset() -> xr.Dataset:
+    shape = (1, 2, 2, 3)  # time, depth, lat, lon
+    u = np.zeros(shape, dtype=np.float32)
+    v = np.zeros(shape, dtype=np.float32)
+    u[0, 0], v[0, 0] = 3.0, 4.0
+    u[0, 1] = 30.0
+    coords = {"time": [0], "depth": [0.5, 10.0], "latitude": [0.0, 1.0], "longitude": [0.0, 1.0, 2.0]}
+    dims = ("time", "depth", "latitude", "longitude")
+    return xr.Dataset({"uo": (dims, u), "vo": (dims, v),
+                       "label": (("latitude",), np.array(["a", "b"]))}, coords=coords)
+
+
+def test_surface_layer_takes_first_level_in_lat_lon_order():
+    layer = surface_layer(currents_dataset()["uo"].transpose("longitude", "depth", "time", "latitude"))
+
+    assert layer.dims == ("latitude", "longitude")
+    assert (layer.values == 3.0).all()
+
+
+def test_surface_layer_rejects_non_grid_variables():
+    ds = currents_dataset()
+
+    assert surface_layer(ds["label"]) is None
+    assert surface_layer(ds["uo"].isel(longitude=0)) is None
+
+
+def test_surface_field_derives_current_speed():
+    speed = surface_field(currents_dataset(), "current_speed")
+
+    assert speed.shape == (2, 3)
+    np.testing.assert_allclose(speed.values, 5.0)
+    assert speed.attrs["units"] == "m s-1"
+    assert surface_field(currents_dataset(), "sst") is None
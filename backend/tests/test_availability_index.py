@@ -0,0 +1,76 @@
+"""Tests for date-range compression and the catalog-backed availability index."""
+
+import pytest
+
+from api.availability_index import AvailabilityIndex, compress_date_ranges
+from utils.file_catalog import FileCatalog
+
+DATASETS = {
+    "sst": {"file_pattern": "sst_harmonized_*.nc"},
+    "currents": {"file_pattern": "currents_harmonized_*.nc"},
+}
+
+
+@pytest.mark.parametrize("dates, ranges", [
+    ([], []),
+    (["2024-01-01"], [["2024-01-01", "2024-01-01"]]),
+    (["2024-01-01", "2024-01-02", "2024-01-05"],
+     [["2024-01-01", "2024-01-02"], ["2024-01-05", "2024-01-05"]]),
+    # Runs continue across month, year and leap-day boundaries
+    (["2023-12-31", "2024-01-01", "2024-02-28", "2024-02-29", "2024-03-01"],
+     [["2023-12-31", "2024-01-01"], ["2024-02-28", "2024-03-01"]]),
+])
+def test_compress_date_ranges(dates, ranges):
+    assert compress_date_ranges(dates) == ranges
+
+
+def write_day(root, dataset: str, day: str):
+    path = root / "processed" / "unified_coords" / dataset / f"{dataset}_harmonized_{day}.nc"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"data")
+    return path
+
+
+def test_index_recomputes_only_datasets_whose_generation_moved(tmp_path):
+    root = tmp_path / "ocean-data"
+    for day in ("20240101", "20240102", "20240104"):
+        write_day(root, "sst", day)
+    catalog = FileCatalog(root)
+    index = AvailabilityIndex(catalog, DATASETS)
+
+    assert index.available_dates("ranges")["sst"] == {
+        "start": "2024-01-01", "end": "2024-01-04", "count": 3,
+        "ranges": [["2024-01-01", "2024-01-02"], ["2024-01-04", "2024-01-04"]],
+    }
+    assert index.get("currents").dates == []
+    assert not index.refresh()
+
+    currents = index.get("currents")
+    catalog.record_file(write_day(root, "sst", "20240103"))
+
+    assert index.refresh()
+    assert index.get("sst").ranges == [["2024-01-01", "2024-01-04"]]
+    assert index.get("currents") is currents
+
+
+def test_payload_is_rebuilt_after_a_catalog_change(tmp_path):
+    root = tmp_path / "ocean-data"
+    write_day(root, "sst", "20240101")
+    catalog = FileCatalog(root)
+    index = AvailabilityIndex(catalog, DATASETS)
+    builds = []
+
+    def build():
+        builds.append(1)
+        return index.available_dates()
+
+    etag, body = index.payload("list", build)
+    assert index.payload("list", build) == (etag, body)
+    assert len(builds) == 1
+
+    catalog.record_file(write_day(root, "sst", "20240102"))
+    new_etag, new_body = index.payload("list", build)
+
+    assert len(builds) == 2
+    assert new_etag != etag
+    assert b"2024-01-02" in new_body
@@ -0,0 +1,114 @@
+"""Tests for the incremental day-of-year climatology stores."""
+
+from datetime import date
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from utils.climatology import MIN_YEARS, ClimatologyStore, day_bin
+
+LATS = [0.5, 1.5]
+LONS = [10.5, 11.5]
+
+# Days of the first 5-day bin in different years, with the value of cell (0, 0)
+SAMPLES = {
+    date(2001, 1, 1): 1.0,
+    date(2002, 1, 2): 2.0,
+    date(2003, 1, 3): 4.0,
+    date(2004, 1, 1): 7.0,
+}
+
+
+def field(value: float, lats=LATS) -> xr.DataArray:
+    values = np.full((len(lats), len(LONS)), value, dtype=np.float32)
+    values[1, 1] = np.nan  # land
+    return xr.DataArray(values, dims=("lat", "lon"), coords={"lat": lats, "lon": LONS},
+                        name="sst", attrs={"units": "degC", "long_name": "SST"})
+
+
+def filled_store(path, samples=SAMPLES) -> ClimatologyStore:
+    store = ClimatologyStore(path)
+    for day, value in samples.items():
+        assert store.update(field(value), day)
+    return store
+
+
+def test_welford_update_matches_batch_statistics(tmp_path):
+    store = filled_store(tmp_path / "sst")
+    values = np.array(list(SAMPLES.values()))
+
+    normal = store.normal(date(2010, 1, 4), 0.5, 10.5)
+
+    assert day_bin(date(2010, 1, 4)) == 0
+    assert normal["mean"] == pytest.approx(values.mean(), rel=1e-6)
+    assert normal["std"] == pytest.approx(values.std(ddof=1), rel=1e-6)
+    assert normal["years"] == 4
+    assert normal["samples"] == 4
+
+
+def test_other_bins_and_land_cells_stay_empty(tmp_path):
+    store = filled_store(tmp_path / "sst")
+
+    mean, std, _, _ = store.normal_field(date(2010, 7, 1))
+    assert np.isnan(mean).all()
+    mean, std, _, _ = store.normal_field(date(2010, 1, 1))
+    assert np.isnan(mean[1, 1]) and np.isfinite(mean[0, 0])
+
+
+def test_cells_need_min_years(tmp_path):
+    samples = dict(list(SAMPLES.items())[:MIN_YEARS - 1])
+    # Several samples of one year count as one year
+    samples[date(2002, 1, 4)] = 3.0
+    store = filled_store(tmp_path / "sst", samples)
+
+    assert store.normal(date(2010, 1, 1), 0.5, 10.5) is None
+
+
+def test_duplicate_days_and_foreign_grids_are_skipped(tmp_path):
+    store = filled_store(tmp_path / "sst")
+
+    assert not store.update(field(100.0), date(2001, 1, 1))
+    assert not store.update(field(100.0, lats=[0.5, 1.5, 2.5]), date(2005, 1, 1))
+    assert store.normal(date(2010, 1, 1), 0.5, 10.5)["samples"] == 4
+
+
+def test_leave_one_out_excludes_the_queried_day(tmp_path):
+    store = filled_store(tmp_path / "sst")
+    day = date(2004, 1, 1)
+    others = np.array([value for other, value in SAMPLES.items() if other != day])
+
+    normal = store.normal(day, 0.5, 10.5, exclude=SAMPLES[day])
+
+    assert normal["mean"] == pytest.approx(others.mean(), rel=1e-5)
+    assert normal["std"] == pytest.approx(others.std(ddof=1), rel=1e-5)
+    assert normal["samples"] == 3
+    assert normal["years"] == 3
+
+
+def test_leave_one_out_keeps_years_with_other_samples(tmp_path):
+    samples = {**SAMPLES, date(2004, 1, 3): 5.0}
+    store = filled_store(tmp_path / "sst", samples)
+
+    normal = store.normal(date(2004, 1, 1), 0.5, 10.5, exclude=samples[date(2004, 1, 1)])
+
+    assert normal["years"] == 4
+    assert normal["samples"] == 4
+
+
+def test_leave_one_out_ignored_for_days_not_folded_in(tmp_path):
+    store = filled_store(tmp_path / "sst")
+
+    assert store.normal(date(2005, 1, 1), 0.5, 10.5, exclude=50.0)["samples"] == 4
+
+
+def test_leave_one_out_field_matches_point(tmp_path):
+    store = filled_store(tmp_path / "sst")
+    day = date(2003, 1, 3)
+
+    mean, std, _, _ = store.normal_field(day, exclude=field(SAMPLES[day]).values)
+    point = store.normal(day, 0.5, 10.5, exclude=SAMPLES[day])
+
+    assert mean[0, 0] == pytest.approx(point["mean"], rel=1e-6)
+    assert std[0, 0] == pytest.approx(point["std"], rel=1e-6)
+    assert np.isnan(mean[1, 1])
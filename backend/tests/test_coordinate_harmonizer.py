@@ -0,0 +1,34 @@
+"""Tests for longitude wrapping in the coordinate harmonizer."""
+
+import numpy as np
+import xarray as xr
+
+from processors.coordinate_harmonizer import CoordinateHarmonizer
+
+
+def grid(lons) -> xr.Dataset:
+    lons = np.asarray(lons, dtype=np.float64)
+    return xr.Dataset({"u": (("lat", "lon"), np.tile(lons, (2, 1)))},
+                      coords={"lat": [0.0, 1.0], "lon": lons})
+
+
+def test_wrap_to_180_keeps_the_180_meridian():
+    ds = CoordinateHarmonizer.wrap_longitude(grid(np.arange(0.0, 360.0, 45.0)), "lon", "-180-180")
+
+    assert ds.lon.values.tolist() == [-135.0, -90.0, -45.0, 0.0, 45.0, 90.0, 135.0, 180.0]
+    # Data move with their coordinates
+    assert ds.u.values[0].tolist() == [225.0, 270.0, 315.0, 0.0, 45.0, 90.0, 135.0, 180.0]
+
+
+def test_wrap_to_360_rolls_regular_grid():
+    ds = CoordinateHarmonizer.wrap_longitude(grid(np.arange(-179.5, 180.0, 1.0)), "lon", "0-360")
+
+    assert np.all(np.diff(ds.lon.values) > 0)
+    assert ds.lon.values[0] == 0.5 and ds.lon.values[-1] == 359.5
+    np.testing.assert_array_equal(ds.u.values[0] % 360, ds.lon.values)
+
+
+def test_irregular_grid_falls_back_to_sorting():
+    ds = CoordinateHarmonizer.wrap_longitude(grid([10.0, 200.0, 90.0, 350.0]), "lon", "-180-180")
+
+    assert ds.lon.values.tolist() == [-160.0, -10.0, 10.0, 90.0]
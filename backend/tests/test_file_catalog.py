@@ -0,0 +1,122 @@
+"""Tests for the SQLite file catalog and its per-dataset generations."""
+
+from datetime import date
+
+import pytest
+
+from utils.file_catalog import (
+    FileCatalog, delete_output, extract_file_date, get_file_catalog, move_output, record_output
+)
+
+
+@pytest.fixture
+def data_root(tmp_path):
+    root = tmp_path / "ocean-data"
+    (root / "processed" / "unified_coords" / "sst" / "2024" / "01").mkdir(parents=True)
+    (root / "processed" / "unified_coords" / "currents").mkdir(parents=True)
+    return root
+
+
+def write(path, content=b"data"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return path
+
+
+def sst_file(root, day: str):
+    return root / "processed" / "unified_coords" / "sst" / day[:4] / day[4:6] / f"sst_harmonized_{day}.nc"
+
+
+def test_extract_file_date():
+    assert extract_file_date("sst_harmonized_20240131.nc") == "2024-01-31"
+    assert extract_file_date("sst_20241399_20240102.nc") == "2024-01-02"
+    assert extract_file_date("metadata.json") is None
+
+
+def test_layout_maps_to_stages(data_root):
+    catalog = FileCatalog(data_root)
+
+    assert catalog.stage_of(sst_file(data_root, "20240101")) == ("unified", "sst")
+    assert catalog.stage_of(data_root / "raw" / "sst" / "2024" / "a.nc") == ("raw", "sst")
+    assert catalog.stage_of(data_root / "textures" / "sst" / "a.png") == ("textures", "sst")
+    assert catalog.stage_of(data_root / "processed" / "unified_coords" / "a.nc") is None
+    assert catalog.stage_of(data_root / "raw" / "sst" / "a.nc.tmp") is None
+    assert catalog.stage_of(data_root.parent / "elsewhere" / "a.nc") is None
+
+
+def test_initial_build_catalogs_existing_files(data_root):
+    for day in ("20240101", "20240102"):
+        write(sst_file(data_root, day))
+    catalog = FileCatalog(data_root)
+
+    assert catalog.dates("unified", ["sst"]) == ["2024-01-01", "2024-01-02"]
+    assert catalog.latest_date("unified", ["sst"]) == date(2024, 1, 2)
+    assert catalog.generations("unified") == {"sst": 1}
+
+
+def test_record_and_remove_bump_only_their_dataset(data_root):
+    catalog = FileCatalog(data_root)
+    catalog.ensure_built()
+    assert catalog.generations("unified") == {}
+
+    assert catalog.record_file(write(sst_file(data_root, "20240103")))
+    currents = write(data_root / "processed" / "unified_coords" / "currents" / "currents_20240103.nc")
+    assert catalog.record_file(currents)
+    assert catalog.generations("unified") == {"sst": 1, "currents": 1}
+
+    # Rewriting a file invalidates its dataset again
+    assert catalog.record_file(write(sst_file(data_root, "20240103"), b"rewritten"))
+    assert catalog.generations("unified") == {"sst": 2, "currents": 1}
+
+    sst_file(data_root, "20240103").unlink()
+    assert catalog.remove_file(sst_file(data_root, "20240103"))
+    assert catalog.generations("unified") == {"sst": 3, "currents": 1}
+    assert catalog.dates("unified", ["sst"]) == []
+
+    # Removing a file that is not cataloged leaves the generation alone
+    assert catalog.remove_file(sst_file(data_root, "20240103"))
+    assert catalog.generations("unified")["sst"] == 3
+
+
+def test_files_outside_the_catalog_are_ignored(data_root):
+    catalog = FileCatalog(data_root)
+    catalog.ensure_built()
+
+    assert not catalog.record_file(write(data_root / "processed" / "unified_coords" / "stray.nc"))
+    assert not catalog.record_file(sst_file(data_root, "20240109"))  # not on disk
+    assert catalog.generations("unified") == {}
+
+
+def test_rebuild_reconciles_files_changed_behind_its_back(data_root):
+    kept = write(sst_file(data_root, "20240101"))
+    gone = write(sst_file(data_root, "20240102"))
+    catalog = FileCatalog(data_root)
+    catalog.ensure_built()
+
+    gone.unlink()
+    write(sst_file(data_root, "20240105"))
+    stats = catalog.rebuild()
+
+    assert stats == {"added": 1, "updated": 0, "removed": 1, "unchanged": 1}
+    assert catalog.dates("unified", ["sst"]) == ["2024-01-01", "2024-01-05"]
+    assert catalog.generations("unified") == {"sst": 2}
+    assert kept.exists()
+
+
+def test_output_helpers_keep_the_catalog_in_step(data_root):
+    catalog = get_file_catalog(data_root)
+    catalog.ensure_built()
+
+    scratch = write(sst_file(data_root, "20240104").with_suffix(".nc.tmp"))
+    record_output(scratch)
+    assert catalog.count("unified", ["sst"]) == 0
+
+    moved = move_output(scratch, sst_file(data_root, "20240104"))
+    assert catalog.dates("unified", ["sst"]) == ["2024-01-04"]
+    generation = catalog.generations("unified")["sst"]
+
+    assert delete_output(moved)
+    assert not moved.exists()
+    assert catalog.count("unified", ["sst"]) == 0
+    assert catalog.generations("unified")["sst"] == generation + 1
+    assert not delete_output(moved)
@@ -0,0 +1,74 @@
+"""Tests for the NetCDF encoding policy's int16 packing."""
+
+import netCDF4
+import numpy as np
+import xarray as xr
+
+from utils.currents_derived import add_derived_currents
+from utils.netcdf_encoding import PACKED_MAX, PACKED_MIN, NetCDFEncodingPolicy, PackedEncoding
+
+
+def currents_dataset() -> xr.Dataset:
+    lat = np.arange(-2.0, 2.5, 0.5)
+    lon = np.arange(10.0, 14.5, 0.5)
+    rng = np.random.default_rng(0)
+    shape = (1, lat.size, lon.size)
+    coords = {"time": [np.datetime64("2024-01-01", "ns")], "lat": lat, "lon": lon}
+    ds = xr.Dataset(
+        {
+            "u": (("time", "lat", "lon"), rng.uniform(-1.5, 1.5, shape).astype(np.float32), {"units": "m s-1"}),
+            "v": (("time", "lat", "lon"), rng.uniform(-1.5, 1.5, shape).astype(np.float32), {"units": "m s-1"}),
+        },
+        coords=coords,
+    )
+    ds["u"][0, 0, 0] = np.nan
+    return add_derived_currents(ds)
+
+
+def test_derived_currents_round_trip(tmp_path):
+    ds = currents_dataset()
+    path = NetCDFEncodingPolicy().write(ds, tmp_path / "currents_2024-01-01.nc")
+
+    with xr.open_dataset(path) as written:
+        for name, atol in (("current_speed", 0.0005), ("current_direction", 0.005)):
+            assert written[name].encoding["dtype"] == np.int16
+            np.testing.assert_allclose(written[name].values, ds[name].values, atol=atol)
+
+    # netCDF4 masks against valid_range before unpacking, so it must be in packed units
+    with netCDF4.Dataset(path) as nc:
+        for name in ("current_speed", "current_direction"):
+            variable = nc.variables[name]
+            assert variable.valid_range.dtype == np.int16
+            values = variable[:]
+            assert values.mask.sum() == 1  # only the NaN input cell
+            assert np.allclose(values.compressed(), ds[name].values[np.isfinite(ds[name].values)], atol=0.005)
+
+
+def test_valid_range_converted_to_packed_units():
+    policy = NetCDFEncodingPolicy()
+    direction = policy.packed_variables["current_direction"]
+
+    attrs = policy.packed_attrs({"valid_range": [0.0, 360.0], "units": "degrees"}, direction)
+
+    assert attrs["valid_range"].tolist() == [-18000, 18000]
+    assert attrs["units"] == "degrees"
+
+
+def test_pack_clips_to_int16_range():
+    packing = PackedEncoding(scale_factor=0.001)
+
+    packed = packing.pack([-100.0, 0.0012, 100.0])
+
+    assert packed.dtype == np.int16
+    assert packed.tolist() == [PACKED_MIN, 1, PACKED_MAX]
+
+
+def test_values_outside_packing_range_stay_float32():
+    policy = NetCDFEncodingPolicy()
+    sst = xr.DataArray(np.array([[10.0, 400.0]], dtype=np.float64), dims=("lat", "lon"))
+
+    encoding = policy.variable_encoding("sst", sst)
+
+    assert encoding["dtype"] == "float32"
+    # In range data are packed
+    assert policy.variable_encoding("sst", sst.clip(max=30.0))["dtype"] == "int16"
@@ -0,0 +1,48 @@
+"""Tests for region bounding-box parsing and longitude selection."""
+
+import numpy as np
+import pytest
+
+from api.endpoints.region_stats import RegionStatsService, lon_mask, parse_bbox
+
+# Cell centres of 1 degree grids in both longitude conventions
+LONS_180 = np.arange(-179.5, 180.0, 1.0)
+LONS_360 = np.arange(0.5, 360.0, 1.0)
+
+
+def test_parse_bbox():
+    assert parse_bbox("170,-10,-170,10") == (170.0, -10.0, -170.0, 10.0)
+
+
+@pytest.mark.parametrize("bbox", ["1,2,3", "0,20,10,10", "-190,0,10,10", "0,-95,10,10"])
+def test_parse_bbox_rejects_malformed_boxes(bbox):
+    with pytest.raises(ValueError):
+        parse_bbox(bbox)
+
+
+@pytest.mark.parametrize("lons", [LONS_180, LONS_360])
+def test_box_across_antimeridian(lons):
+    selected = lon_mask(lons, 170.0, -170.0)
+
+    centres = np.where(lons > 180, lons - 360, lons)[selected]
+    assert selected.sum() == 20
+    assert set(centres) == set(np.arange(170.5, 180.0, 1.0)) | set(np.arange(-179.5, -170.0, 1.0))
+
+
+@pytest.mark.parametrize("lons", [LONS_180, LONS_360])
+def test_box_west_of_greenwich(lons):
+    selected = lon_mask(lons, -20.0, -10.0)
+
+    centres = np.where(lons > 180, lons - 360, lons)[selected]
+    assert sorted(centres) == list(np.arange(-19.5, -10.0, 1.0))
+
+
+@pytest.mark.parametrize("lons", [LONS_180, LONS_360])
+def test_full_span_selects_every_longitude(lons):
+    assert lon_mask(lons, -180.0, 180.0).all()
+
+
+def test_lon_extent_across_antimeridian():
+    region_lons = np.array([170.5, 179.5, 180.5, 189.5])
+
+    assert RegionStatsService._lon_extent(region_lons, 170.0, -170.0) == (170.5, -170.5)
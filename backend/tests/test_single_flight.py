@@ -0,0 +1,140 @@
+"""Tests for single-flight request coalescing."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from api.single_flight import SingleFlight
+
+
+def test_concurrent_threads_share_one_execution():
+    flights = SingleFlight("test")
+    release = threading.Event()
+    calls = []
+
+    def work():
+        calls.append(1)
+        release.wait(timeout=5)
+        return "value"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(flights.run("key", work))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    # Every follower has joined before the leader is released
+    while flights.get_stats()["calls"] < 5:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert results == ["value"] * 5
+    assert len(calls) == 1
+    stats = flights.get_stats()
+    assert stats["executions"] == 1
+    assert stats["deduplicated"] == 4
+    assert stats["in_flight"] == 0
+
+
+def test_thread_error_reaches_every_caller():
+    flights = SingleFlight("test")
+    release = threading.Event()
+
+    def work():
+        release.wait(timeout=5)
+        raise ValueError("broken file")
+
+    errors = []
+
+    def call():
+        try:
+            flights.run("key", work)
+        except ValueError as e:
+            errors.append(str(e))
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    while flights.get_stats()["calls"] < 3:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert errors == ["broken file"] * 3
+    assert flights.get_stats()["errors"] == 1
+
+
+def test_sequential_calls_are_not_cached():
+    flights = SingleFlight("test")
+    calls = []
+
+    flights.run("key", lambda: calls.append(1))
+    flights.run("key", lambda: calls.append(1))
+
+    assert len(calls) == 2
+
+
+def test_async_callers_share_one_execution():
+    flights = SingleFlight("test")
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "value"
+
+    async def main():
+        return await asyncio.gather(*(flights.run_async("key", work) for _ in range(4)))
+
+    assert asyncio.run(main()) == ["value"] * 4
+    assert len(calls) == 1
+    assert flights.get_stats()["deduplicated"] == 3
+
+
+def test_async_error_reaches_every_caller():
+    flights = SingleFlight("test")
+
+    async def work():
+        await asyncio.sleep(0.01)
+        raise ValueError("broken file")
+
+    async def main():
+        return await asyncio.gather(*(flights.run_async("key", work) for _ in range(3)),
+                                    return_exceptions=True)
+
+    results = asyncio.run(main())
+    assert [str(r) for r in results] == ["broken file"] * 3
+    assert all(isinstance(r, ValueError) for r in results)
+    assert flights.get_stats()["errors"] == 1
+
+
+def test_cancelled_first_caller_does_not_cancel_followers():
+    flights = SingleFlight("test")
+
+    async def main():
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            return "value"
+
+        first = asyncio.create_task(flights.run_async("key", work))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flights.run_async("key", work))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await follower
+
+    assert asyncio.run(main()) == "value"
+    stats = flights.get_stats()
+    assert stats["executions"] == 1
+    assert stats["in_flight"] == 0
@@ -0,0 +1,158 @@
+"""
+Area-weighted, NaN-aware statistics on regular lat/lon grids.
+
+Grid cells shrink towards the poles, so unweighted means over a lat/lon grid
+overstate high latitudes. Every reduction here weights each cell by cos(lat),
+which is proportional to its area on a regular grid, and ignores NaN cells
+(land, ice, missing retrievals).
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from utils.lazy_imports import lazy_import
+
+# Imported on first use: xarray (with pandas) dominates API startup time
+xr = lazy_import("xarray")
+
+# Statistics accepted by the region/summary APIs; pNN is any percentile 1-99
+BASE_STATS = ("mean", "min", "max", "std", "median", "count")
+_PERCENTILE_PATTERN = re.compile(r"^p([1-9]\d?)$")
+
+LAT_NAMES = ('lat', 'latitude')
+LON_NAMES = ('lon', 'longitude')
+
+# Velocity component pairs current speed can be derived from, in order of preference
+VELOCITY_PAIRS = (("uo", "vo"), ("u", "v"), ("ugos", "vgos"), ("ug", "vg"))
+
+
+def surface_layer(var: xr.DataArray) -> Optional[xr.DataArray]:
+    """
+    A variable's surface layer as a (lat, lon) array.
+
+    Every non-spatial dimension (time, depth/zlev) is reduced to its first
+    index, the same selection point extraction uses.
+
+    Returns:
+        The 2-D layer, or None if the variable is not numeric on a lat/lon grid
+    """
+    lat_dim = next((dim for dim in var.dims if dim in LAT_NAMES), None)
+    lon_dim = next((dim for dim in var.dims if dim in LON_NAMES), None)
+    if lat_dim is None or lon_dim is None or not np.issubdtype(var.dtype, np.number):
+        return None
+    for dim in var.dims:
+        if dim not in (lat_dim, lon_dim):
+            var = var.isel({dim: 0})
+    return var.transpose(lat_dim, lon_dim)
+
+
+def velocity_components(ds: xr.Dataset) -> Optional[Tuple[xr.DataArray, xr.DataArray]]:
+    """Surface eastward and northward velocity layers, from the first available component pair."""
+    for u_name, v_name in VELOCITY_PAIRS:
+        if u_name in ds.data_vars and v_name in ds.data_vars:
+            u, v = surface_layer(ds[u_name]), surface_layer(ds[v_name])
+            if u is not None and v is not None:
+                return u, v
+    return None
+
+
+def surface_field(ds: xr.Dataset, variable: str) -> Optional[xr.DataArray]:
+    """
+    Surface layer of a dataset variable, deriving current_speed from velocity components if absent.
+
+    Returns:
+        The 2-D layer, or None if the variable is not available on a lat/lon grid
+    """
+    if variable in ds.data_vars:
+        return surface_layer(ds[variable])
+    if variable == "current_speed":
+        components = velocity_components(ds)
+        if components is not None:
+            speed = np.hypot(*components)
+            speed.attrs = {"units": "m s-1", "long_name": "Current speed"}
+            return speed
+    return None
+
+
+def parse_stats(spec: str) -> List[str]:
+    """
+    Parse a comma-separated statistics list such as "mean,min,max,p90".
+
+    Raises:
+        ValueError: If a statistic name is not recognised
+    """
+    stats = []
+    for name in (part.strip().lower() for part in spec.split(",")):
+        if not name:
+            continue
+        if name not in BASE_STATS and not _PERCENTILE_PATTERN.match(name):
+            raise ValueError(f"Unknown statistic '{name}' (use {', '.join(BASE_STATS)} or p1-p99)")
+        if name not in stats:
+            stats.append(name)
+    if not stats:
+        raise ValueError("No statistics requested")
+    return stats
+
+
+def latitude_weights(lats: np.ndarray) -> np.ndarray:
+    """cos(lat) weight per latitude row (proportional to cell area on a regular grid)."""
+    return np.clip(np.cos(np.deg2rad(np.asarray(lats, dtype=np.float64))), 0.0, None)
+
+
+def weighted_quantile(values: np.ndarray, weights: np.ndarray, q: float) -> float:
+    """Quantile (0-1) of finite values under the given weights."""
+    order = np.argsort(values)
+    sorted_values = values[order]
+    cumulative = np.cumsum(weights[order])
+    # Midpoint rule: with equal weights this is the Hazen percentile (same median as numpy)
+    positions = (cumulative - 0.5 * weights[order]) / cumulative[-1]
+    return float(np.interp(q, positions, sorted_values))
+
+
+def weighted_stats(values: np.ndarray, weights: np.ndarray,
+                   stats: Sequence[str]) -> Dict[str, Optional[float]]:
+    """
+    Area-weighted statistics of a grid, skipping NaN cells.
+
+    Args:
+        values: Data values (any shape)
+        weights: Cell weights broadcastable to values
+        stats: Statistic names from parse_stats()
+
+    Returns:
+        Dictionary of statistic -> value (None when no cell is valid)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    weights = np.broadcast_to(weights, values.shape)
+    valid = np.isfinite(values) & (weights > 0)
+    data = values[valid]
+    w = weights[valid]
+
+    result: Dict[str, Optional[float]] = {}
+    if data.size == 0:
+        for name in stats:
+            result[name] = 0 if name == "count" else None
+        return result
+
+    total_weight = w.sum()
+    mean = float(np.dot(data, w) / total_weight)
+    for name in stats:
+        if name == "mean":
+            result[name] = mean
+        elif name == "min":
+            result[name] = float(data.min())
+        elif name == "max":
+            result[name] = float(data.max())
+        elif name == "std":
+            result[name] = float(np.sqrt(np.dot((data - mean) ** 2, w) / total_weight))
+        elif name == "count":
+            result[name] = int(data.size)
+        elif name == "median":
+            result[name] = weighted_quantile(data, w, 0.5)
+        else:
+            result[name] = weighted_quantile(data, w, int(name[1:]) / 100.0)
+    return result
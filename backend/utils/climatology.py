@@ -0,0 +1,458 @@
+"""
+Incremental day-of-year climatologies for harmonized ocean data.
+
+For each climatology variable a store keeps, per grid cell and day-of-year
+bin, the running sample count, mean and sum of squared deviations (Welford's
+algorithm), and the set of years that contributed. Each new harmonized day
+updates one bin in place as it is written, so "normal" values and anomalies
+are a single array lookup instead of a scan over decades of files.
+
+Storage layout (under ocean-data/climatology/<dataset>/<variable>/):
+- count.npy, mean.npy, m2.npy: memory-mapped (bins, lat, lon) arrays
+- years.npy: (bins, lat, lon) bitmask of contributing years since YEAR_BASE
+- meta.json: grid, bin width, store version and the dates already folded in
+
+A bin holds up to five samples per year, so its sample count says nothing
+about how many years it spans: cells are served once MIN_YEARS distinct
+years contributed. A normal for a day that is itself folded in leaves that
+day out, so an anomaly is never measured against a mean containing it.
+
+Days are grouped into 5-day bins (73 per year) and fields are block-averaged
+to a 1° grid when finer: one sample per bin per year would make daily bins
+noisy, and full-resolution daily stores for the 0.083° currents would need
+tens of gigabytes.
+
+Stores are updated by one ingest process at a time (downloads run
+sequentially per dataset). Updates write the bin in place through r+ memory
+maps, so they are not atomic: a reader in another process that looks at a bin
+while it is being updated can see it half-written, e.g. the new count with the
+old mean. This affects only that bin's anomalies, for the few milliseconds the
+update takes, and is accepted instead of rewriting every array (tens of MB per
+variable) on each daily update. meta.json is replaced atomically, and only
+after the arrays are flushed.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from utils.area_weighting import surface_field
+from utils.file_catalog import extract_file_date, find_data_root, get_file_catalog
+from utils.lazy_imports import lazy_import
+from utils.netcdf_access import open_netcdf
+
+# Imported on first use: xarray (with pandas) dominates API startup time
+xr = lazy_import("xarray")
+
+logger = logging.getLogger(__name__)
+
+CLIMATOLOGY_DIRNAME = "climatology"
+
+BIN_DAYS = 5
+N_BINS = 73  # day 366 folds into the last bin
+TARGET_RESOLUTION = 1.0  # degrees
+
+# Minimum distinct years in a bin before a cell's climatology is served
+MIN_YEARS = 3
+
+# Years are bits of a uint64 counted from the start of the OISST record
+YEAR_BASE = 1981
+MAX_YEARS = 64
+
+# Stores written by an older layout (no years.npy) are rebuilt from scratch
+STORE_VERSION = 2
+
+# Variables with a climatology, per harmonized dataset
+CLIMATOLOGY_VARIABLES: Dict[str, List[str]] = {
+    "sst": ["sst"],
+    "currents": ["current_speed"],
+    "acidity_current": ["ph", "dissic", "talk"],
+    "acidity_historical": ["no3", "po4", "si", "o2", "chl", "nppv"],
+}
+
+
+def day_bin(day: date) -> int:
+    """Day-of-year bin index for a date."""
+    return min((day.timetuple().tm_yday - 1) // BIN_DAYS, N_BINS - 1)
+
+
+def coarsen_factor(field: xr.DataArray) -> int:
+    """Cells per block side when coarsening a field to TARGET_RESOLUTION."""
+    lat_dim = field.dims[0]
+    resolution = float(abs(field[lat_dim].values[1] - field[lat_dim].values[0])) if field[lat_dim].size > 1 else TARGET_RESOLUTION
+    return max(int(round(TARGET_RESOLUTION / resolution)), 1) if resolution > 0 else 1
+
+
+def coarsen_to_target(field: xr.DataArray) -> xr.DataArray:
+    """Block-average a field to roughly TARGET_RESOLUTION degrees (NaN-aware)."""
+    lat_dim, lon_dim = field.dims
+    factor = coarsen_factor(field)
+    if factor <= 1:
+        return field
+    coarse = field.coarsen({lat_dim: factor, lon_dim: factor}, boundary="trim").mean()
+    coarse.attrs = field.attrs
+    return coarse
+
+
+def year_count(years: np.ndarray) -> np.ndarray:
+    """Number of years set in each element of a uint64 year bitmask array."""
+    years = np.ascontiguousarray(years, dtype="<u8")
+    bits = np.unpackbits(years.view(np.uint8).reshape(*years.shape, 8), axis=-1)
+    return bits.sum(axis=-1, dtype=np.int64)
+
+
+def _year_bit(day: date) -> Optional[int]:
+    offset = day.year - YEAR_BASE
+    return offset if 0 <= offset < MAX_YEARS else None
+
+
+class ClimatologyStore:
+    """Running day-of-year statistics for one variable of one dataset."""
+
+    def __init__(self, path: Path):
+        """
+        Initialize a store.
+
+        Args:
+            path: Store directory (created on first update)
+        """
+        self.path = Path(path)
+        self.meta_path = self.path / "meta.json"
+        self._meta: Optional[Dict] = None
+        self._arrays: Dict[str, np.memmap] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def exists(self) -> bool:
+        return self.meta_path.exists()
+
+    def _load_meta(self) -> Optional[Dict]:
+        if self._meta is None and self.exists:
+            with open(self.meta_path) as f:
+                meta = json.load(f)
+            if meta.get("version") != STORE_VERSION:
+                # Treated as empty: the next update recreates it (rebuild_climatology.py backfills)
+                logger.warning(f"⚠️ Climatology {self.path} predates year tracking; rebuild it with "
+                               f"scripts/maintenance/rebuild_climatology.py --force")
+                return None
+            meta["dates"] = set(meta["dates"])
+            self._meta = meta
+        return self._meta
+
+    def _array(self, name: str, mode: str = "r") -> np.memmap:
+        if mode == "r" and name in self._arrays:
+            return self._arrays[name]
+        array = np.load(self.path / f"{name}.npy", mmap_mode=mode)
+        if mode == "r":
+            self._arrays[name] = array
+        return array
+
+    def _create(self, lats: np.ndarray, lons: np.ndarray, units: str, long_name: str):
+        """Allocate empty arrays for a grid."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        shape = (N_BINS, lats.size, lons.size)
+        for name, dtype in (("count", np.uint16), ("mean", np.float32), ("m2", np.float32), ("years", np.uint64)):
+            array = np.lib.format.open_memmap(self.path / f"{name}.npy", mode="w+", dtype=dtype, shape=shape)
+            array.flush()
+            del array
+        self._meta = {
+            "version": STORE_VERSION,
+            "lats": [float(value) for value in lats],
+            "lons": [float(value) for value in lons],
+            "bin_days": BIN_DAYS,
+            "units": units,
+            "long_name": long_name,
+            "dates": set()
+        }
+
+    def _save_meta(self):
+        meta = dict(self._meta)
+        meta["dates"] = sorted(meta["dates"])
+        meta["updated_at"] = datetime.now().isoformat()
+        tmp_path = self.meta_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(meta, f)
+        tmp_path.replace(self.meta_path)
+
+    def has_date(self, day: str) -> bool:
+        meta = self._load_meta()
+        return meta is not None and day in meta["dates"]
+
+    def update(self, field: xr.DataArray, day: date) -> bool:
+        """
+        Fold one day's field into its bin (Welford update).
+
+        Returns:
+            False if the day was already included or the grid does not match
+        """
+        with self._lock:
+            meta = self._load_meta()
+            lat_dim, lon_dim = field.dims
+            lats, lons = field[lat_dim].values, field[lon_dim].values
+            if meta is None:
+                self._create(lats, lons, field.attrs.get("units", ""), field.attrs.get("long_name", ""))
+                meta = self._meta
+            elif len(meta["lats"]) != lats.size or len(meta["lons"]) != lons.size:
+                logger.warning(f"Grid of {field.name} on {day} does not match climatology {self.path}, skipping")
+                return False
+            if day.isoformat() in meta["dates"]:
+                return False
+
+            b = day_bin(day)
+            count, mean, m2, years = (self._array(name, "r+") for name in ("count", "mean", "m2", "years"))
+            x = field.values.astype(np.float64)
+            valid = np.isfinite(x)
+
+            n = count[b].astype(np.float64) + valid
+            old_mean = mean[b].astype(np.float64)
+            delta = np.where(valid, x - old_mean, 0.0)
+            new_mean = old_mean + np.divide(delta, n, out=np.zeros_like(delta), where=n > 0)
+            m2[b] = m2[b] + np.where(valid, delta * (x - new_mean), 0.0)
+            mean[b] = new_mean
+            count[b] = np.minimum(n, np.iinfo(np.uint16).max)
+            bit = _year_bit(day)
+            if bit is None:
+                logger.warning(f"{day.year} is outside the year range of {self.path}; not counted as a year")
+            else:
+                years[b] = np.where(valid, years[b] | np.uint64(1 << bit), years[b])
+            for array in (count, mean, m2, years):
+                array.flush()
+            del count, mean, m2, years
+
+            meta["dates"].add(day.isoformat())
+            self._save_meta()
+            # Readers must remap to see the new bin
+            self._arrays.clear()
+            return True
+
+    def _cell(self, lat: float, lon: float) -> Tuple[int, int]:
+        meta = self._load_meta()
+        lats, lons = np.asarray(meta["lats"]), np.asarray(meta["lons"])
+        if lons.max() > 180:
+            lon = lon % 360
+        return int(np.abs(lats - lat).argmin()), int(np.abs(lons - lon).argmin())
+
+    def cell_value(self, field: xr.DataArray, lat: float, lon: float) -> float:
+        """
+        Value a day's surface field contributed to the cell at a location.
+
+        Reads only the coarsening block of that cell (NaN-aware mean, as in
+        coarsen_to_target); NaN if the block has no valid values.
+        """
+        i, j = self._cell(lat, lon)
+        factor = coarsen_factor(field)
+        lat_dim, lon_dim = field.dims
+        block = field.isel({lat_dim: slice(i * factor, (i + 1) * factor),
+                            lon_dim: slice(j * factor, (j + 1) * factor)}).values.astype(np.float64)
+        finite = block[np.isfinite(block)]
+        return float(finite.mean()) if finite.size else float("nan")
+
+    def _leave_out(self, b: int, day: date, n, mean, m2, years, exclude):
+        """
+        Bin statistics without one folded-in day (reverse Welford update).
+
+        Its year is removed when no other folded-in date of the bin falls in
+        that year (decided per bin, not per cell).
+        """
+        x = np.asarray(exclude, dtype=np.float64)
+        valid = np.isfinite(x) & (n > 0)
+        n_out = n - valid
+        mean_out = np.where(valid, np.divide(n * mean - np.where(valid, x, 0.0), n_out,
+                                             out=np.zeros_like(mean), where=n_out > 0), mean)
+        m2_out = np.where(valid, m2 - np.where(valid, (x - mean) * (x - mean_out), 0.0), m2)
+        bit = _year_bit(day)
+        same_year = any(
+            other != day.isoformat() and other[:4] == str(day.year) and day_bin(date.fromisoformat(other)) == b
+            for other in self._meta["dates"]
+        )
+        if bit is not None and not same_year:
+            years = np.where(valid, years & ~np.uint64(1 << bit), years)
+        return n_out, mean_out, m2_out, years
+
+    def normal(self, day: date, lat: float, lon: float,
+               exclude: Optional[float] = None) -> Optional[Dict[str, float]]:
+        """
+        Climatological mean and standard deviation for a day at a location.
+
+        Args:
+            day: Day whose bin is used
+            lat, lon: Location (nearest cell)
+            exclude: The day's own value at the cell (see cell_value); left out
+                of the statistics when the day is folded into the store
+
+        Returns:
+            Dictionary with mean, std, years and samples, or None if fewer than MIN_YEARS years
+        """
+        if self._load_meta() is None:
+            return None
+        i, j = self._cell(lat, lon)
+        b = day_bin(day)
+        n = np.float64(self._array("count")[b, i, j])
+        mean = np.float64(self._array("mean")[b, i, j])
+        m2 = np.float64(self._array("m2")[b, i, j])
+        years = np.uint64(self._array("years")[b, i, j])
+        if exclude is not None and self.has_date(day.isoformat()):
+            n, mean, m2, years = self._leave_out(b, day, n, mean, m2, years, exclude)
+        year_n = int(year_count(np.atleast_1d(years))[0])
+        if year_n < MIN_YEARS or n < 2:
+            return None
+        std = float(np.sqrt(max(float(m2), 0.0) / (float(n) - 1)))
+        return {"mean": float(mean), "std": std, "years": year_n, "samples": int(n)}
+
+    def normal_field(self, day: date, exclude: Optional[np.ndarray] = None
+                     ) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Climatological mean and std fields for a day's bin.
+
+        Args:
+            day: Day whose bin is used
+            exclude: The day's own field on the store grid (coarsen_to_target);
+                left out of the statistics when the day is folded into the store
+
+        Returns:
+            (mean, std, lats, lons) with NaN where there are fewer than MIN_YEARS years, or None
+        """
+        meta = self._load_meta()
+        if meta is None:
+            return None
+        b = day_bin(day)
+        n = self._array("count")[b].astype(np.float64)
+        mean = self._array("mean")[b].astype(np.float64)
+        m2 = self._array("m2")[b].astype(np.float64)
+        years = np.asarray(self._array("years")[b])
+        if exclude is not None and self.has_date(day.isoformat()):
+            n, mean, m2, years = self._leave_out(b, day, n, mean, m2, years, exclude)
+        enough = (year_count(years) >= MIN_YEARS) & (n >= 2)
+        std = np.sqrt(np.maximum(m2, 0.0) / np.maximum(n - 1, 1))
+        return (np.where(enough, mean, np.nan), np.where(enough, std, np.nan),
+                np.asarray(meta["lats"]), np.asarray(meta["lons"]))
+
+    def summary(self) -> Dict:
+        meta = self._load_meta()
+        if meta is None:
+            return {"days": 0}
+        dates = sorted(meta["dates"])
+        return {
+            "days": len(dates),
+            "start": dates[0] if dates else None,
+            "end": dates[-1] if dates else None,
+            "grid": [len(meta["lats"]), len(meta["lons"])],
+            "bin_days": meta["bin_days"],
+            "units": meta["units"]
+        }
+
+
+class ClimatologyEngine:
+    """All climatology stores of one ocean-data root."""
+
+    def __init__(self, data_root: Path):
+        """
+        Initialize the engine.
+
+        Args:
+            data_root: ocean-data directory
+        """
+        self.base_path = Path(data_root) / CLIMATOLOGY_DIRNAME
+        self._stores: Dict[Tuple[str, str], ClimatologyStore] = {}
+        self._lock = threading.Lock()
+
+    def store(self, dataset: str, variable: str) -> ClimatologyStore:
+        key = (dataset, variable)
+        with self._lock:
+            if key not in self._stores:
+                self._stores[key] = ClimatologyStore(self.base_path / dataset / variable)
+            return self._stores[key]
+
+    def update(self, ds: xr.Dataset, dataset: str, day: date) -> List[str]:
+        """
+        Fold one harmonized day into every climatology of its dataset.
+
+        Returns:
+            Variables that were updated
+        """
+        updated = []
+        for variable in CLIMATOLOGY_VARIABLES.get(dataset, []):
+            field = surface_field(ds, variable)
+            if field is None:
+                continue
+            field.name = variable
+            if self.store(dataset, variable).update(coarsen_to_target(field), day):
+                updated.append(variable)
+        return updated
+
+    def normal(self, dataset: str, variable: str, day: date, lat: float, lon: float,
+               file_path: Optional[Path] = None) -> Optional[Dict[str, float]]:
+        """
+        Climatological mean/std for one variable at a location and day (None if unavailable).
+
+        With file_path (the day's harmonized file) the day itself is left out
+        of the normal when it has been folded into the climatology.
+        """
+        if variable not in CLIMATOLOGY_VARIABLES.get(dataset, []):
+            return None
+        store = self.store(dataset, variable)
+        exclude = None
+        if file_path is not None and store.has_date(day.isoformat()):
+            with open_netcdf(file_path) as ds:
+                field = surface_field(ds, variable)
+                if field is not None:
+                    exclude = store.cell_value(field, lat, lon)
+        return store.normal(day, lat, lon, exclude)
+
+    def status(self) -> Dict[str, Dict[str, Dict]]:
+        """Coverage of every climatology store."""
+        return {
+            dataset: {variable: self.store(dataset, variable).summary() for variable in variables}
+            for dataset, variables in CLIMATOLOGY_VARIABLES.items()
+        }
+
+
+_engines: Dict[Path, ClimatologyEngine] = {}
+_engines_lock = threading.Lock()
+
+
+def get_climatology_engine(data_root: Path) -> ClimatologyEngine:
+    """Shared climatology engine for an ocean-data root."""
+    data_root = Path(data_root).resolve()
+    with _engines_lock:
+        if data_root not in _engines:
+            _engines[data_root] = ClimatologyEngine(data_root)
+        return _engines[data_root]
+
+
+def update_from_file(ds: xr.Dataset, file_path: Path) -> Optional[List[str]]:
+    """
+    Fold a harmonized dataset into the climatologies of its dataset.
+
+    Returns:
+        Updated variables, or None if the file is not a dated harmonized output
+    """
+    data_root = find_data_root(file_path)
+    if data_root is None:
+        return None
+    located = get_file_catalog(data_root).stage_of(file_path)
+    day = extract_file_date(Path(file_path).name)
+    if located is None or located[0] != "unified" or day is None:
+        return None
+    return get_climatology_engine(data_root).update(ds, located[1], date.fromisoformat(day))
+
+
+def record_climatology(ds: xr.Dataset, file_path: Path):
+    """
+    Ingest hook: fold a harmonized file that was just written into its climatologies.
+
+    Never raises: a climatology problem must not fail a download or processing run.
+    """
+    try:
+        updated = update_from_file(ds, Path(file_path))
+        if updated:
+            logger.info(f"🌡️ Updated climatology of {', '.join(updated)} with {Path(file_path).name}")
+    except Exception as e:
+        logger.warning(f"⚠️ Could not update climatology with {file_path}: {e}")
@@ -0,0 +1,549 @@
+"""
+Persistent catalog of ocean data files.
+
+A single SQLite database in the ocean-data root records every data file under
+raw/, processed/ and textures/ with its dataset, date, size, mtime and
+validation state. Downloaders and processors record files as they write them,
+so listing dates, finding the latest file or summing storage is an indexed
+query instead of an rglob over tens of thousands of daily files.
+
+Layout mapping (relative to the ocean-data root):
+- raw/<dataset>/...                       -> stage 'raw'
+- processed/unified_coords/<dataset>/...  -> stage 'unified'
+- processed/<dataset>/...                 -> stage 'processed'
+- textures/<category>/...                 -> stage 'textures'
+"""
+
+import os
+import re
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, date
+from pathlib import Path
+from typing import Dict, List, Optional, Iterable, Tuple, Any
+
+logger = logging.getLogger(__name__)
+
+CATALOG_FILENAME = "file_catalog.sqlite"
+DATA_ROOT_NAME = "ocean-data"
+
+# Overrides the repository's ocean-data directory for the API (e.g. benchmarks on fixture data)
+DATA_ROOT_ENV = "OCEAN_DATA_ROOT"
+
+# Top-level directories that hold data files
+CATALOGED_ROOTS = ("raw", "processed", "textures")
+
+# In-progress or scratch files never enter the catalog
+TEMP_SUFFIXES = {".tmp", ".temp", ".partial", ".downloading", ".migrating"}
+
+VALIDATION_STATES = ("unvalidated", "valid", "invalid")
+
+_DATE_PATTERN = re.compile(r"(?<!\d)(\d{4})(\d{2})(\d{2})(?!\d)")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    stage TEXT NOT NULL,
+    dataset TEXT NOT NULL,
+    name TEXT NOT NULL,
+    date TEXT,
+    size_bytes INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    validation_state TEXT NOT NULL DEFAULT 'unvalidated',
+    validated_at TEXT,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_files_stage_dataset_date ON files (stage, dataset, date);
+CREATE TABLE IF NOT EXISTS catalog_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS dataset_generations (
+    stage TEXT NOT NULL,
+    dataset TEXT NOT NULL,
+    generation INTEGER NOT NULL,
+    PRIMARY KEY (stage, dataset)
+);
+"""
+
+_BUMP_GENERATION = """
+INSERT INTO dataset_generations (stage, dataset, generation) VALUES (?, ?, 1)
+ON CONFLICT(stage, dataset) DO UPDATE SET generation = generation + 1
+"""
+
+
+@dataclass
+class CatalogEntry:
+    """A single cataloged file."""
+    path: Path
+    stage: str
+    dataset: str
+    date: Optional[str]
+    size_bytes: int
+    mtime_ns: int
+    validation_state: str
+
+
+def extract_file_date(filename: str) -> Optional[str]:
+    """Extract the first valid YYYYMMDD date in a filename as YYYY-MM-DD."""
+    for match in _DATE_PATTERN.finditer(filename):
+        try:
+            return date(int(match.group(1)), int(match.group(2)), int(match.group(3))).isoformat()
+        except ValueError:
+            continue
+    return None
+
+
+class FileCatalog:
+    """SQLite-backed index of the files in one ocean-data root."""
+
+    def __init__(self, data_root: Path):
+        """
+        Initialize the catalog.
+
+        Args:
+            data_root: ocean-data directory; the database lives directly inside it
+        """
+        self.data_root = Path(data_root).resolve()
+        self.db_path = self.data_root / CATALOG_FILENAME
+        self._schema_ready = False
+        self._built = False
+        self._build_lock = threading.Lock()
+
+    def __getstate__(self):
+        # Locks cannot cross process boundaries (owners get pickled into worker pools)
+        state = self.__dict__.copy()
+        del state['_build_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._build_lock = threading.Lock()
+
+    @contextmanager
+    def _connect(self):
+        """Short-lived connection; WAL lets the API read while a downloader writes."""
+        if not self._schema_ready:
+            self.data_root.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            if not self._schema_ready:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(_SCHEMA)
+                self._schema_ready = True
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _classify(self, file_path: Path) -> Optional[Tuple[str, str, str]]:
+        """Map an absolute path to (relative key, stage, dataset), or None if not cataloged."""
+        try:
+            rel = file_path.resolve().relative_to(self.data_root)
+        except ValueError:
+            return None
+
+        parts = rel.parts
+        if len(parts) < 3 or parts[0] not in CATALOGED_ROOTS:
+            return None
+        if file_path.name.startswith('.') or file_path.suffix in TEMP_SUFFIXES:
+            return None
+
+        if parts[0] == "processed" and parts[1] == "unified_coords":
+            if len(parts) < 4:
+                return None
+            return str(rel), "unified", parts[2]
+        return str(rel), parts[0], parts[1]
+
+    def stage_of(self, file_path: Path) -> Optional[Tuple[str, str]]:
+        """(stage, dataset) a path belongs to, or None if it is outside the catalog."""
+        classified = self._classify(Path(file_path))
+        return classified[1:] if classified else None
+
+    def _row_for(self, file_path: Path, stat: os.stat_result) -> Optional[Tuple]:
+        classified = self._classify(file_path)
+        if classified is None:
+            return None
+        key, stage, dataset = classified
+        return (key, stage, dataset, file_path.name, extract_file_date(file_path.name),
+                stat.st_size, stat.st_mtime_ns, datetime.now().isoformat())
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def record_file(self, file_path: Path, validation_state: Optional[str] = None) -> bool:
+        """
+        Record a file that was just written (or rewritten).
+
+        Args:
+            file_path: File on disk
+            validation_state: Known validation state; a changed file otherwise reverts to 'unvalidated'
+
+        Returns:
+            True if the file belongs to this catalog and was recorded
+        """
+        file_path = Path(file_path)
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return False
+        row = self._row_for(file_path, stat)
+        if row is None:
+            return False
+
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO files (path, stage, dataset, name, date, size_bytes, mtime_ns, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(path) DO UPDATE SET
+                    size_bytes = excluded.size_bytes,
+                    mtime_ns = excluded.mtime_ns,
+                    updated_at = excluded.updated_at,
+                    validation_state = CASE
+                        WHEN files.size_bytes != excluded.size_bytes OR files.mtime_ns != excluded.mtime_ns
+                        THEN 'unvalidated' ELSE files.validation_state END
+                """,
+                row
+            )
+            conn.execute(_BUMP_GENERATION, (row[1], row[2]))
+            if validation_state:
+                conn.execute(
+                    "UPDATE files SET validation_state = ?, validated_at = ? WHERE path = ?",
+                    (validation_state, datetime.now().isoformat(), row[0])
+                )
+        return True
+
+    def remove_file(self, file_path: Path) -> bool:
+        """Drop a deleted file from the catalog."""
+        classified = self._classify(Path(file_path))
+        if classified is None:
+            return False
+        key, stage, dataset = classified
+        with self._connect() as conn:
+            if conn.execute("DELETE FROM files WHERE path = ?", (key,)).rowcount:
+                conn.execute(_BUMP_GENERATION, (stage, dataset))
+        return True
+
+    def set_validation_states(self, states: Dict[Path, str]):
+        """
+        Store validation results for many files at once.
+
+        Args:
+            states: Mapping of file path to 'valid' or 'invalid'
+        """
+        now = datetime.now().isoformat()
+        rows = []
+        for file_path, state in states.items():
+            classified = self._classify(Path(file_path))
+            if classified:
+                rows.append((state, now, classified[0]))
+        if rows:
+            with self._connect() as conn:
+                conn.executemany("UPDATE files SET validation_state = ?, validated_at = ? WHERE path = ?", rows)
+
+    def rebuild(self, directory: Optional[Path] = None) -> Dict[str, int]:
+        """
+        Reconcile the catalog with the filesystem in one walk.
+
+        Used to bootstrap an empty catalog and to pick up files copied in
+        outside the downloaders/processors.
+
+        Args:
+            directory: Only reconcile files under this directory (e.g. one texture
+                category); the whole data root if None
+
+        Returns:
+            Counts of added, updated, removed and unchanged files
+        """
+        if directory is None:
+            roots = [self.data_root / root_name for root_name in CATALOGED_ROOTS]
+            prefix = None
+        else:
+            roots = [Path(directory)]
+            prefix = str(Path(directory).resolve().relative_to(self.data_root)) + os.sep
+
+        with self._connect() as conn:
+            known = {
+                path: (size, mtime, stage, dataset)
+                for path, size, mtime, stage, dataset in conn.execute(
+                    "SELECT path, size_bytes, mtime_ns, stage, dataset FROM files"
+                )
+                if prefix is None or path.startswith(prefix)
+            }
+
+        seen = set()
+        upserts = []
+        stats = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+
+        for root in roots:
+            if not root.exists():
+                continue
+            for dirpath, _, filenames in os.walk(root):
+                for filename in filenames:
+                    file_path = Path(dirpath) / filename
+                    try:
+                        stat = file_path.stat()
+                    except OSError:
+                        continue
+                    row = self._row_for(file_path, stat)
+                    if row is None:
+                        continue
+                    seen.add(row[0])
+                    previous = known.get(row[0])
+                    if previous and previous[:2] == (stat.st_size, stat.st_mtime_ns):
+                        stats["unchanged"] += 1
+                        continue
+                    stats["updated" if previous else "added"] += 1
+                    upserts.append(row)
+
+        removed = [(path,) for path in known if path not in seen]
+        stats["removed"] = len(removed)
+        changed_datasets = {(row[1], row[2]) for row in upserts}
+        changed_datasets.update(known[path][2:] for (path,) in removed)
+
+        with self._connect() as conn:
+            conn.executemany(
+                """
+                INSERT INTO files (path, stage, dataset, name, date, size_bytes, mtime_ns, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(path) DO UPDATE SET
+                    size_bytes = excluded.size_bytes,
+                    mtime_ns = excluded.mtime_ns,
+                    updated_at = excluded.updated_at,
+                    validation_state = 'unvalidated'
+                """,
+                upserts
+            )
+            conn.executemany("DELETE FROM files WHERE path = ?", removed)
+            conn.executemany(_BUMP_GENERATION, sorted(changed_datasets))
+            if directory is None:
+                conn.execute(
+                    "INSERT OR REPLACE INTO catalog_meta (key, value) VALUES ('last_full_scan', ?)",
+                    (datetime.now().isoformat(),)
+                )
+
+        scope = self.data_root if directory is None else directory
+        logger.info(f"📇 File catalog rebuilt for {scope}: {stats['added']} added, {stats['updated']} updated, "
+                    f"{stats['removed']} removed, {stats['unchanged']} unchanged")
+        return stats
+
+    def ensure_built(self):
+        """Run the initial filesystem walk once if the catalog has never been built."""
+        if self._built:
+            return
+        with self._build_lock:
+            if self.last_full_scan() is None:
+                logger.info(f"📇 Building file catalog for {self.data_root}")
+                self.rebuild()
+            self._built = True
+
+    def last_full_scan(self) -> Optional[str]:
+        """Timestamp of the last full reconciliation, None if never built."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT value FROM catalog_meta WHERE key = 'last_full_scan'").fetchone()
+        return row[0] if row else None
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def generations(self, stage: str) -> Dict[str, int]:
+        """
+        Per-dataset change counters for a stage.
+
+        A dataset's generation increases whenever one of its files is recorded
+        or removed, so callers can cache derived data and rebuild only the
+        datasets whose generation moved.
+        """
+        self.ensure_built()
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT dataset, generation FROM dataset_generations WHERE stage = ?", (stage,)
+            ).fetchall()
+        return dict(rows)
+
+    @staticmethod
+    def _where(stage: Optional[str], datasets: Optional[Iterable[str]], name_glob: Optional[str],
+               start_date: Optional[str], end_date: Optional[str]) -> Tuple[str, List[Any]]:
+        clauses, params = [], []
+        if stage:
+            clauses.append("stage = ?")
+            params.append(stage)
+        if datasets is not None:
+            datasets = [datasets] if isinstance(datasets, str) else list(datasets)
+            clauses.append(f"dataset IN ({', '.join('?' for _ in datasets)})")
+            params.extend(datasets)
+        if name_glob:
+            clauses.append("name GLOB ?")
+            params.append(name_glob)
+        if start_date:
+            clauses.append("date >= ?")
+            params.append(start_date)
+        if end_date:
+            clauses.append("date <= ?")
+            params.append(end_date)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def entries(self, stage: Optional[str] = None, datasets: Optional[Iterable[str]] = None,
+                name_glob: Optional[str] = None, start_date: Optional[str] = None,
+                end_date: Optional[str] = None) -> List[CatalogEntry]:
+        """
+        List cataloged files.
+
+        Args:
+            stage: 'raw', 'unified', 'processed' or 'textures'
+            datasets: Dataset name or names
+            name_glob: Filename pattern (shell glob, as for Path.glob)
+            start_date: Inclusive lower date bound (YYYY-MM-DD)
+            end_date: Inclusive upper date bound (YYYY-MM-DD)
+
+        Returns:
+            Entries ordered by date then path
+        """
+        self.ensure_built()
+        where, params = self._where(stage, datasets, name_glob, start_date, end_date)
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT path, stage, dataset, date, size_bytes, mtime_ns, validation_state "
+                f"FROM files{where} ORDER BY date, path",
+                params
+            ).fetchall()
+        return [
+            CatalogEntry(self.data_root / row[0], row[1], row[2], row[3], row[4], row[5], row[6])
+            for row in rows
+        ]
+
+    def paths(self, stage: Optional[str] = None, datasets: Optional[Iterable[str]] = None,
+              name_glob: Optional[str] = None) -> List[Path]:
+        """Absolute paths of matching files, sorted by path."""
+        return sorted(entry.path for entry in self.entries(stage, datasets, name_glob))
+
+    def dates(self, stage: str, datasets: Optional[Iterable[str]] = None,
+              name_glob: Optional[str] = None) -> List[str]:
+        """Sorted distinct dates (YYYY-MM-DD) of matching files."""
+        self.ensure_built()
+        where, params = self._where(stage, datasets, name_glob, None, None)
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT DISTINCT date FROM files{where} AND date IS NOT NULL ORDER BY date",
+                params
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def latest_date(self, stage: str, datasets: Optional[Iterable[str]] = None,
+                    name_glob: Optional[str] = None) -> Optional[date]:
+        """Most recent file date for matching files."""
+        self.ensure_built()
+        where, params = self._where(stage, datasets, name_glob, None, None)
+        with self._connect() as conn:
+            row = conn.execute(f"SELECT MAX(date) FROM files{where}", params).fetchone()
+        return date.fromisoformat(row[0]) if row and row[0] else None
+
+    def count(self, stage: Optional[str] = None, datasets: Optional[Iterable[str]] = None,
+              name_glob: Optional[str] = None) -> int:
+        """Number of matching files."""
+        self.ensure_built()
+        where, params = self._where(stage, datasets, name_glob, None, None)
+        with self._connect() as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM files{where}", params).fetchone()[0]
+
+    def total_size_bytes(self, stage: Optional[str] = None) -> int:
+        """Total size of cataloged files, optionally for one stage."""
+        self.ensure_built()
+        where, params = self._where(stage, None, None, None, None)
+        with self._connect() as conn:
+            return conn.execute(f"SELECT COALESCE(SUM(size_bytes), 0) FROM files{where}", params).fetchone()[0]
+
+
+_catalogs: Dict[Path, FileCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_file_catalog(data_root: Path) -> FileCatalog:
+    """Shared catalog instance for an ocean-data root."""
+    data_root = Path(data_root).resolve()
+    with _catalogs_lock:
+        if data_root not in _catalogs:
+            _catalogs[data_root] = FileCatalog(data_root)
+        return _catalogs[data_root]
+
+
+def default_data_root() -> Path:
+    """ocean-data root served by the API: $OCEAN_DATA_ROOT, else the one next to backend/."""
+    override = os.environ.get(DATA_ROOT_ENV)
+    if override:
+        return Path(override).resolve()
+    return Path(__file__).resolve().parent.parent.parent / DATA_ROOT_NAME
+
+
+def find_data_root(file_path: Path) -> Optional[Path]:
+    """Nearest ancestor directory named ocean-data, if any."""
+    for parent in Path(file_path).resolve().parents:
+        if parent.name == DATA_ROOT_NAME:
+            return parent
+    return None
+
+
+def record_output(file_path: Path, validation_state: Optional[str] = None):
+    """
+    Record a freshly written file in its catalog.
+
+    Never raises: a catalog problem must not fail a download or processing run.
+    """
+    try:
+        data_root = find_data_root(file_path)
+        if data_root is not None:
+            get_file_catalog(data_root).record_file(file_path, validation_state)
+    except Exception as e:
+        logger.warning(f"⚠️ Could not record {file_path} in file catalog: {e}")
+
+
+def forget_output(file_path: Path):
+    """Remove a deleted file from its catalog. Never raises."""
+    try:
+        data_root = find_data_root(file_path)
+        if data_root is not None:
+            get_file_catalog(data_root).remove_file(file_path)
+    except Exception as e:
+        logger.warning(f"⚠️ Could not remove {file_path} from file catalog: {e}")
+
+
+def delete_output(file_path: Path, missing_ok: bool = True) -> bool:
+    """
+    Delete a data file and drop it from its catalog.
+
+    Use instead of Path.unlink for files under ocean-data: the catalog is not
+    rescanned, so a file deleted behind its back stays listed (gap detection,
+    status and the availability and texture indexes keep reporting it).
+
+    Returns:
+        True if a file was deleted
+    """
+    file_path = Path(file_path)
+    try:
+        file_path.unlink()
+        deleted = True
+    except FileNotFoundError:
+        if not missing_ok:
+            raise
+        deleted = False
+    forget_output(file_path)
+    return deleted
+
+
+def move_output(source: Path, destination: Path) -> Path:
+    """
+    Rename a data file (replacing any destination) and move its catalog entry.
+
+    Returns:
+        The destination path
+    """
+    destination = Path(source).replace(destination)
+    forget_output(Path(source))
+    record_output(destination)
+    return destination
@@ -0,0 +1,387 @@
+"""
+Tiered, parallel integrity scanning for ocean data files.
+
+Scanning tiers:
+- Quick tier: magic bytes, file size versus the dataset's size distribution,
+  header parse and one sampled chunk read per variable
+- Full tier: caller-supplied deep check (full decode), run only on files the
+  quick tier marks as suspect, or on every file in "full" mode
+
+Results are cached in a JSON manifest keyed by path, mtime and size so files
+that have not changed since the last scan are never reopened.
+"""
+
+import os
+import re
+import json
+import logging
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+from typing import Dict, List, Optional, Callable, Tuple, Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# File signatures
+HDF5_SIGNATURE = b'\x89HDF\r\n\x1a\n'
+NETCDF_CLASSIC_SIGNATURES = (b'CDF\x01', b'CDF\x02', b'CDF\x05')
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# HDF5 allows a user block in front of the superblock, placed at 0, 512, 1024, 2048...
+HDF5_SIGNATURE_OFFSETS = (0, 512, 1024, 2048, 4096)
+
+# Number of same-series files needed before size outliers are flagged
+MIN_SIZE_SAMPLES = 10
+
+SCAN_MODES = ('fast', 'full')
+
+# Full-tier check signature: path -> (is_healthy, message, details)
+FullCheck = Callable[[Path], Tuple[bool, str, Dict[str, Any]]]
+
+
+@dataclass(frozen=True)
+class SizeProfile:
+    """Expected file size band for one series of files."""
+    median_bytes: float
+    low_ratio: float = 0.5
+    high_ratio: float = 3.0
+
+    @classmethod
+    def from_sizes(cls, sizes: List[int]) -> Optional['SizeProfile']:
+        """Build a profile from known-good sizes, None if there are too few."""
+        if len(sizes) < MIN_SIZE_SAMPLES:
+            return None
+        return cls(median_bytes=float(np.median(sizes)))
+
+    def check(self, size_bytes: int) -> Optional[str]:
+        """Return a description of the deviation, or None if the size is plausible."""
+        if size_bytes < self.median_bytes * self.low_ratio:
+            return f"Size {size_bytes / 1024:.1f} KB well below series median {self.median_bytes / 1024:.1f} KB"
+        if size_bytes > self.median_bytes * self.high_ratio:
+            return f"Size {size_bytes / 1024:.1f} KB well above series median {self.median_bytes / 1024:.1f} KB"
+        return None
+
+
+def series_key(file_path: Path) -> str:
+    """Group files that should have similar sizes (same directory family and name prefix)."""
+    prefix = re.sub(r'\d{8}.*$', '', file_path.name)
+    return f"{file_path.suffix}:{prefix}"
+
+
+def _has_netcdf_signature(file_path: Path) -> bool:
+    """Check NetCDF classic or HDF5 (NetCDF4) magic bytes."""
+    with open(file_path, 'rb') as f:
+        head = f.read(8)
+        if head[:4] in NETCDF_CLASSIC_SIGNATURES or head == HDF5_SIGNATURE:
+            return True
+        for offset in HDF5_SIGNATURE_OFFSETS[1:]:
+            f.seek(offset)
+            if f.read(8) == HDF5_SIGNATURE:
+                return True
+    return False
+
+
+def _sample_variable(var, rng: np.random.Generator) -> None:
+    """Read one randomly placed chunk (or window for contiguous storage) of a variable."""
+    shape = var.shape
+    if not shape or 0 in shape:
+        return
+
+    chunking = var.chunking()
+    if chunking == 'contiguous' or not chunking:
+        # Small window in the trailing two dims, first index elsewhere
+        window = [1] * len(shape)
+        for axis in range(max(0, len(shape) - 2), len(shape)):
+            window[axis] = min(shape[axis], 16)
+    else:
+        window = [min(size, chunk) for size, chunk in zip(shape, chunking)]
+
+    index = []
+    for size, length in zip(shape, window):
+        n_blocks = max(1, size // length)
+        start = int(rng.integers(0, n_blocks)) * length
+        index.append(slice(start, min(size, start + length)))
+
+    _ = var[tuple(index)]
+
+
+def _quick_check_netcdf(file_path: Path) -> Optional[str]:
+    """Header parse plus a sampled chunk read; returns an error string or None."""
+    import netCDF4
+
+    rng = np.random.default_rng(zlib.crc32(file_path.name.encode()))
+    with netCDF4.Dataset(file_path, 'r') as nc:
+        nc.set_auto_mask(False)
+        if not nc.dimensions:
+            return "No dimensions in header"
+        data_vars = [name for name, var in nc.variables.items() if name not in nc.dimensions]
+        if not data_vars:
+            return "No data variables in header"
+        for name in data_vars:
+            _sample_variable(nc.variables[name], rng)
+    return None
+
+
+def _quick_check_png(file_path: Path) -> Optional[str]:
+    """PNG structure check without decoding pixels."""
+    from PIL import Image
+
+    with Image.open(file_path) as img:
+        img.verify()
+    return None
+
+
+def quick_check(file_path: Path, size_profile: Optional[SizeProfile] = None) -> Dict[str, Any]:
+    """
+    Run the cheap tier on a single file.
+
+    Args:
+        file_path: File to check
+        size_profile: Expected size band for the file's series, if known
+
+    Returns:
+        Dictionary with 'status' (healthy, suspect or corrupted) and 'error'
+    """
+    try:
+        size_bytes = file_path.stat().st_size
+        if size_bytes == 0:
+            return {"status": "corrupted", "error": "Empty file"}
+
+        if file_path.suffix.lower() == '.png':
+            with open(file_path, 'rb') as f:
+                if f.read(8) != PNG_SIGNATURE:
+                    return {"status": "corrupted", "error": "File header corruption"}
+        elif not _has_netcdf_signature(file_path):
+            return {"status": "corrupted", "error": "File header corruption"}
+
+        if size_profile:
+            size_issue = size_profile.check(size_bytes)
+            if size_issue:
+                return {"status": "suspect", "error": size_issue}
+
+        if file_path.suffix.lower() == '.png':
+            error = _quick_check_png(file_path)
+        else:
+            error = _quick_check_netcdf(file_path)
+
+        if error:
+            return {"status": "suspect", "error": error}
+        return {"status": "healthy", "error": None}
+
+    except Exception as e:
+        return {"status": "suspect", "error": f"Quick check failed: {str(e)[:100]}"}
+
+
+def _scan_file(file_path: Path, mode: str, size_profile: Optional[SizeProfile],
+               full_check: Optional[FullCheck]) -> Dict[str, Any]:
+    """Worker entry point: quick tier, escalating to the full tier when needed."""
+    record: Dict[str, Any] = {"tier": "quick", "details": None}
+
+    if mode == 'fast':
+        quick = quick_check(file_path, size_profile)
+        record["status"] = quick["status"]
+        record["error"] = quick["error"]
+        if quick["status"] != "suspect" or full_check is None:
+            return record
+
+    if full_check is None:
+        record.update({"status": "suspect", "error": "No full check available"})
+        return record
+
+    is_healthy, message, details = full_check(file_path)
+    record.update({
+        "tier": "full",
+        "status": "healthy" if is_healthy else "corrupted",
+        "error": None if is_healthy else message,
+        "details": details,
+    })
+    return record
+
+
+class IntegrityManifest:
+    """JSON manifest of scan results keyed by relative path, mtime and size."""
+
+    def __init__(self, manifest_path: Path, base_path: Path):
+        """
+        Initialize the manifest.
+
+        Args:
+            manifest_path: JSON file holding cached results
+            base_path: Root that manifest keys are relative to
+        """
+        self.manifest_path = manifest_path
+        self.base_path = base_path
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    def _load(self):
+        if not self.manifest_path.exists():
+            return
+        try:
+            with open(self.manifest_path, 'r') as f:
+                self.entries = json.load(f).get("files", {})
+        except Exception as e:
+            logger.warning(f"⚠️ Ignoring unreadable integrity manifest {self.manifest_path}: {e}")
+            self.entries = {}
+
+    def key(self, file_path: Path) -> str:
+        try:
+            return str(file_path.relative_to(self.base_path))
+        except ValueError:
+            return str(file_path)
+
+    def lookup(self, file_path: Path, stat: os.stat_result, mode: str) -> Optional[Dict[str, Any]]:
+        """Return the cached record if the file is unchanged and was scanned at least as deeply."""
+        entry = self.entries.get(self.key(file_path))
+        if not entry:
+            return None
+        if entry.get("mtime_ns") != stat.st_mtime_ns or entry.get("size_bytes") != stat.st_size:
+            return None
+        if mode == 'full' and entry.get("mode") != 'full':
+            return None
+        return entry
+
+    def store(self, file_path: Path, stat: os.stat_result, mode: str, record: Dict[str, Any]):
+        self.entries[self.key(file_path)] = {
+            **record,
+            "mtime_ns": stat.st_mtime_ns,
+            "size_bytes": stat.st_size,
+            "mode": mode,
+            "scanned_at": datetime.now().isoformat(),
+        }
+
+    def healthy_sizes(self) -> Dict[str, List[int]]:
+        """Sizes of previously verified healthy files grouped by series."""
+        sizes: Dict[str, List[int]] = {}
+        for key, entry in self.entries.items():
+            if entry.get("status") == "healthy":
+                sizes.setdefault(series_key(Path(key)), []).append(entry["size_bytes"])
+        return sizes
+
+    def save(self):
+        """Atomically write the manifest."""
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.manifest_path.with_suffix('.tmp')
+        with open(temp_path, 'w') as f:
+            json.dump({"updated": datetime.now().isoformat(), "files": self.entries}, f, default=str)
+        temp_path.replace(self.manifest_path)
+
+
+class ParallelIntegrityScanner:
+    """Scans files across a process pool with tiered checks and a result manifest."""
+
+    def __init__(self, manifest: Optional[IntegrityManifest] = None, mode: str = 'fast',
+                 max_workers: Optional[int] = None):
+        """
+        Initialize the scanner.
+
+        Args:
+            manifest: Result cache; None disables caching
+            mode: 'fast' (quick tier, full decode on suspects) or 'full' (full decode on every file)
+            max_workers: Worker processes (defaults to CPU count; 1 scans in-process)
+        """
+        if mode not in SCAN_MODES:
+            raise ValueError(f"Unknown scan mode '{mode}', expected one of {SCAN_MODES}")
+        self.manifest = manifest
+        self.mode = mode
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def _size_profiles(self, files: List[Path], stats: Dict[Path, os.stat_result]) -> Dict[str, SizeProfile]:
+        """Size bands per series, from verified files when there are enough of them."""
+        history = self.manifest.healthy_sizes() if self.manifest else {}
+        current: Dict[str, List[int]] = {}
+        for file_path in files:
+            current.setdefault(series_key(file_path), []).append(stats[file_path].st_size)
+
+        profiles = {}
+        for key, sizes in current.items():
+            reference = history.get(key) if len(history.get(key, [])) >= MIN_SIZE_SAMPLES else sizes
+            profile = SizeProfile.from_sizes(reference)
+            if profile:
+                profiles[key] = profile
+        return profiles
+
+    def scan(self, files: List[Path], full_check: Optional[FullCheck] = None) -> Dict[Path, Dict[str, Any]]:
+        """
+        Scan files, reusing manifest results for unchanged files.
+
+        Args:
+            files: Files to scan
+            full_check: Picklable deep check run on suspects (and on every file in full mode)
+
+        Returns:
+            Mapping of file path to record with status, tier, error, details, size_bytes,
+            modified and 'cached'
+        """
+        stats: Dict[Path, os.stat_result] = {}
+        results: Dict[Path, Dict[str, Any]] = {}
+        missing = []
+
+        for file_path in files:
+            try:
+                stats[file_path] = file_path.stat()
+            except OSError as e:
+                results[file_path] = {"status": "corrupted", "tier": "quick", "error": f"Cannot stat file: {e}",
+                                      "details": None, "cached": False}
+                missing.append(file_path)
+
+        to_scan = []
+        for file_path in files:
+            if file_path in results:
+                continue
+            cached = self.manifest.lookup(file_path, stats[file_path], self.mode) if self.manifest else None
+            if cached:
+                results[file_path] = {**cached, **_file_facts(stats[file_path]), "cached": True}
+            else:
+                to_scan.append(file_path)
+
+        logger.info(f"🔍 Integrity scan ({self.mode}): {len(to_scan)} to scan, "
+                    f"{len(files) - len(to_scan) - len(missing)} unchanged since last scan")
+
+        if to_scan:
+            profiles = self._size_profiles(to_scan, stats)
+            tasks = [partial(_scan_file, mode=self.mode, size_profile=profiles.get(series_key(p)),
+                             full_check=full_check) for p in to_scan]
+
+            if self.max_workers > 1 and len(to_scan) > 1:
+                chunksize = max(1, len(to_scan) // (self.max_workers * 8))
+                with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                    records = executor.map(_run_task, tasks, to_scan, chunksize=chunksize)
+                    scanned = zip(to_scan, records)
+                    results.update(self._collect(scanned, stats, len(to_scan)))
+            else:
+                scanned = ((p, task(p)) for task, p in zip(tasks, to_scan))
+                results.update(self._collect(scanned, stats, len(to_scan)))
+
+            if self.manifest:
+                self.manifest.save()
+
+        return {file_path: results[file_path] for file_path in files}
+
+    def _collect(self, scanned, stats: Dict[Path, os.stat_result], total: int) -> Dict[Path, Dict[str, Any]]:
+        collected = {}
+        for i, (file_path, record) in enumerate(scanned, 1):
+            if i % 500 == 0:
+                logger.info(f"Progress: {i}/{total} files scanned...")
+            if self.manifest:
+                self.manifest.store(file_path, stats[file_path], self.mode, record)
+            collected[file_path] = {**record, **_file_facts(stats[file_path]), "cached": False}
+        return collected
+
+
+def _file_facts(stat: os.stat_result) -> Dict[str, Any]:
+    """Size and modification time reported with every record."""
+    return {
+        "size_bytes": stat.st_size,
+        "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+    }
+
+
+def _run_task(task: Callable[[Path], Dict[str, Any]], file_path: Path) -> Dict[str, Any]:
+    """Module-level trampoline so partials can be dispatched through executor.map."""
+    return task(file_path)
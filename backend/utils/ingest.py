@@ -0,0 +1,42 @@
+"""
+Post-write ingest of NetCDF outputs.
+
+Processors and downloaders write each output with encoding_policy.write and
+then call ingest_output with the dataset still in memory. The file is recorded
+in the file catalog, and harmonized daily files also feed the summary table,
+the day-of-year climatologies and the current field pyramids without being
+read back from disk. Each step decides from the catalog stage whether the file
+concerns it.
+"""
+
+from pathlib import Path
+from typing import Union
+
+import xarray as xr
+
+from utils.climatology import record_climatology
+from utils.file_catalog import record_output
+from utils.summary_stats import record_summary
+from utils.vector_fields import record_vector_field
+
+
+def ingest_output(ds: xr.Dataset, output_path: Union[str, Path]) -> Path:
+    """
+    Register a freshly written file and update the stores derived from it.
+
+    Never raises: every step logs its own failure, so ingest problems cannot
+    fail a download or processing run.
+
+    Args:
+        ds: Dataset that was written, in physical (unpacked) units
+        output_path: Path the dataset was written to
+
+    Returns:
+        The output path
+    """
+    output_path = Path(output_path)
+    record_output(output_path)
+    record_summary(ds, output_path)
+    record_climatology(ds, output_path)
+    record_vector_field(ds, output_path)
+    return output_path
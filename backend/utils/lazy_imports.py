@@ -0,0 +1,188 @@
+"""
+Deferred imports and singletons for fast API startup.
+
+Serving a health check needs FastAPI and the API's own modules, not
+xarray/pandas (~0.5s to import), matplotlib/cmocean (~0.5s) or the data
+services built on them. Postponing those until first use keeps cold starts
+(new workers, scale-from-zero instances) well under a second:
+
+- lazy_import("xarray") returns a module proxy that imports the module on
+  first attribute access. Modules that use it in annotations add
+  `from __future__ import annotations` so signatures never touch it.
+- deferred(factory, name) returns a singleton proxy that calls factory on
+  first attribute access. A missing data directory or config file then
+  fails the request that needs it instead of the import of api.main, and a
+  failed build is retried on the next access.
+- warm_up() resolves every registered module and singleton, e.g. from a
+  startup background thread, so the first requests rarely pay for imports.
+
+load_times() reports what was loaded and how long each load took.
+"""
+
+import importlib
+import logging
+import threading
+import time
+from types import ModuleType
+from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Every proxy created, in creation order (warm_up resolves them in this order)
+_registry: List[Any] = []
+_registry_lock = threading.Lock()
+
+# Proxy name -> seconds spent loading it
+_load_times: Dict[str, float] = {}
+
+
+def _register(proxy):
+    with _registry_lock:
+        _registry.append(proxy)
+
+
+def _record_load(name: str, kind: str, elapsed: float):
+    # Several modules proxy the same import; the first load is the one that paid for it
+    _load_times.setdefault(name, elapsed)
+    logger.debug("⏱️ Loaded %s %s in %.1fms", kind, name, elapsed * 1000)
+
+
+class LazyModule:
+    """Stand-in for a module, imported on first attribute access (thread-safe)."""
+
+    __slots__ = ("_name", "_module", "_lock")
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module: Optional[ModuleType] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._module is not None
+
+    def load(self) -> ModuleType:
+        """Import (once) and return the real module."""
+        module = self._module
+        if module is None:
+            with self._lock:
+                if self._module is None:
+                    start = time.perf_counter()
+                    self._module = importlib.import_module(self._name)
+                    _record_load(self._name, "module", time.perf_counter() - start)
+                module = self._module
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<lazy module '{self._name}' ({state})>"
+
+
+class Deferred(Generic[T]):
+    """Singleton proxy, built by its factory on first attribute access (thread-safe)."""
+
+    __slots__ = ("_factory", "_name", "_instance", "_lock")
+
+    def __init__(self, factory: Callable[[], T], name: str):
+        self._factory = factory
+        self._name = name
+        self._instance: Optional[T] = None
+        self._lock = threading.Lock()
+
+    @property
+    def initialized(self) -> bool:
+        return self._instance is not None
+
+    def resolve(self) -> T:
+        """Build (once) and return the real instance; exceptions propagate and the next call retries."""
+        instance = self._instance
+        if instance is None:
+            with self._lock:
+                if self._instance is None:
+                    start = time.perf_counter()
+                    self._instance = self._factory()
+                    _record_load(self._name, "singleton", time.perf_counter() - start)
+                instance = self._instance
+        return instance
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.resolve(), attr)
+
+    def __repr__(self) -> str:
+        state = "initialized" if self.initialized else "not initialized"
+        return f"<deferred {self._name} ({state})>"
+
+
+def lazy_import(name: str) -> Any:
+    """
+    Module proxy that imports `name` on first attribute access.
+
+    Args:
+        name: Absolute module name (e.g. 'xarray', 'PIL.Image')
+
+    Returns:
+        LazyModule standing in for the module (typed Any so attribute use type-checks)
+    """
+    proxy = LazyModule(name)
+    _register(proxy)
+    return proxy
+
+
+def deferred(factory: Callable[[], T], name: str) -> T:
+    """
+    Singleton proxy that calls factory on first attribute access.
+
+    Args:
+        factory: Builds the instance (may use other deferred singletons)
+        name: Label for logs and load_times()
+
+    Returns:
+        Deferred standing in for the instance (typed as the instance)
+    """
+    proxy = Deferred(factory, name)
+    _register(proxy)
+    return proxy  # type: ignore[return-value]
+
+
+def resolve(value: Any) -> Any:
+    """The real object behind a proxy (or the value itself)."""
+    if isinstance(value, Deferred):
+        return value.resolve()
+    if isinstance(value, LazyModule):
+        return value.load()
+    return value
+
+
+def warm_up() -> Dict[str, float]:
+    """
+    Load every registered module, then build every registered singleton.
+
+    Failures are logged and skipped (the proxy retries on its next use).
+
+    Returns:
+        Seconds spent per proxy loaded by this call
+    """
+    with _registry_lock:
+        proxies = sorted(_registry, key=lambda proxy: isinstance(proxy, Deferred))
+    start = time.perf_counter()
+    loaded = {}
+    for proxy in proxies:
+        if proxy.initialized if isinstance(proxy, Deferred) else proxy.loaded:
+            continue
+        try:
+            resolve(proxy)
+            loaded.setdefault(proxy._name, _load_times.get(proxy._name, 0.0))
+        except Exception as e:
+            logger.warning(f"⚠️ Warm-up could not load {proxy._name}: {e}")
+    logger.info(f"🔥 Warm-up loaded {len(loaded)} modules and services in {time.perf_counter() - start:.2f}s")
+    return loaded
+
+
+def load_times() -> Dict[str, float]:
+    """Seconds spent loading each proxy resolved so far, in load order."""
+    return dict(_load_times)
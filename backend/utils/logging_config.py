@@ -0,0 +1,148 @@
+"""
+Process-wide logging configuration.
+
+configure_logging() replaces logging.basicConfig for long-running processes:
+- records are handed to a QueueHandler and written by a QueueListener thread,
+  so a slow terminal or disk never blocks the event loop or request threads
+- StructuredFormatter appends fields passed with extra={...} as key=value
+  pairs, or writes one JSON object per line (OCEAN_LOG_FORMAT=json)
+- levels are set globally (OCEAN_LOG_LEVEL) and per logger
+  (OCEAN_LOG_LEVELS="api.endpoints.data_extractor=DEBUG,api.cache_manager=WARNING")
+- OCEAN_LOG_FILE adds a file handler next to stderr
+
+Hot paths log with %-style arguments (formatted only when a record is
+emitted) and per-request lines at DEBUG, where DebugSampler keeps one in
+every N records of each message so DEBUG stays affordable under load.
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+from typing import Dict, Optional
+
+LOG_LEVEL_ENV = "OCEAN_LOG_LEVEL"
+LOG_LEVELS_ENV = "OCEAN_LOG_LEVELS"
+LOG_FORMAT_ENV = "OCEAN_LOG_FORMAT"
+LOG_FILE_ENV = "OCEAN_LOG_FILE"
+LOG_SAMPLE_ENV = "OCEAN_LOG_SAMPLE_EVERY"
+
+DEFAULT_SAMPLE_EVERY = 100
+
+# Attributes every LogRecord has; anything else came in through extra={...}
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "taskName"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_configure_lock = threading.Lock()
+
+
+class StructuredFormatter(logging.Formatter):
+    """Text lines with extra fields as key=value, or one JSON object per record."""
+
+    def __init__(self, json_lines: bool = False):
+        super().__init__('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        self.json_lines = json_lines
+
+    @staticmethod
+    def fields(record: logging.LogRecord) -> Dict[str, object]:
+        """Structured fields attached to a record through extra={...}."""
+        return {key: value for key, value in vars(record).items() if key not in _RECORD_ATTRIBUTES}
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields = self.fields(record)
+        if self.json_lines:
+            entry = {
+                "time": self.formatTime(record),
+                "level": record.levelname,
+                "logger": record.name,
+                "message": record.getMessage(),
+                **fields
+            }
+            if record.exc_info:
+                entry["exception"] = self.formatException(record.exc_info)
+            return json.dumps(entry, default=str, ensure_ascii=False)
+        text = super().format(record)
+        if fields:
+            text += " " + " ".join(f"{key}={value}" for key, value in fields.items())
+        return text
+
+
+class DebugSampler(logging.Filter):
+    """
+    Passes one in every `every` DEBUG records per message template.
+
+    Records at INFO and above always pass. Attach to the logger of a hot
+    path whose per-request lines are logged at DEBUG.
+    """
+
+    def __init__(self, every: Optional[int] = None):
+        super().__init__()
+        self.every = max(1, every or int(os.environ.get(LOG_SAMPLE_ENV, DEFAULT_SAMPLE_EVERY)))
+        self._counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or self.every == 1:
+            return True
+        with self._lock:
+            count = self._counts.get(record.msg, 0)
+            self._counts[record.msg] = count + 1
+        return count % self.every == 0
+
+
+def parse_module_levels(spec: str) -> Dict[str, int]:
+    """'name=LEVEL,name=LEVEL' into {logger name: level}."""
+    levels = {}
+    for item in spec.split(","):
+        name, _, level = item.partition("=")
+        if name.strip() and level.strip():
+            levels[name.strip()] = logging.getLevelName(level.strip().upper())
+    return {name: level for name, level in levels.items() if isinstance(level, int)}
+
+
+def configure_logging(level: Optional[str] = None, module_levels: Optional[Dict[str, str]] = None,
+                      log_file: Optional[str] = None, json_lines: Optional[bool] = None):
+    """
+    Route all logging through a background queue listener.
+
+    Safe to call more than once: later calls only update levels. Arguments
+    default to the OCEAN_LOG_* environment variables.
+
+    Args:
+        level: Root level name (default: $OCEAN_LOG_LEVEL or INFO)
+        module_levels: Logger name to level name, applied after $OCEAN_LOG_LEVELS
+        log_file: Also write to this file (default: $OCEAN_LOG_FILE)
+        json_lines: JSON records instead of text (default: $OCEAN_LOG_FORMAT == 'json')
+    """
+    global _listener
+    root = logging.getLogger()
+    root.setLevel((level or os.environ.get(LOG_LEVEL_ENV, "INFO")).upper())
+    levels = parse_module_levels(os.environ.get(LOG_LEVELS_ENV, ""))
+    levels.update(parse_module_levels(",".join(f"{name}={value}" for name, value in (module_levels or {}).items())))
+    for name, module_level in levels.items():
+        logging.getLogger(name).setLevel(module_level)
+
+    with _configure_lock:
+        if _listener is not None:
+            return
+        if json_lines is None:
+            json_lines = os.environ.get(LOG_FORMAT_ENV, "text").lower() == "json"
+        formatter = StructuredFormatter(json_lines)
+        handlers = [logging.StreamHandler()]
+        log_file = log_file or os.environ.get(LOG_FILE_ENV)
+        if log_file:
+            handlers.append(logging.FileHandler(log_file, encoding="utf-8"))
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+        records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        root.addHandler(logging.handlers.QueueHandler(records))
+        _listener = logging.handlers.QueueListener(records, *handlers, respect_handler_level=True)
+        _listener.start()
+        # Flush queued records on interpreter exit
+        atexit.register(_listener.stop)
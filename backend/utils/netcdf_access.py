@@ -0,0 +1,101 @@
+"""
+Thread-safe NetCDF access for the API.
+
+The HDF5 library bundled with the netCDF4 wheels is built without thread
+safety, and xarray only serializes reads of variable data: opening a file
+(which reads all metadata) and closing it run under a per-file lock. Request
+threads, the extractor's executor and background tile rendering touching
+files at the same time corrupt the HDF5 state and crash the process.
+
+Two kinds of lock keep that safe without serializing the whole API:
+
+- HDF5_LOCK guards the library itself. It is held only while HDF5 runs:
+  opening a file, each read of variable data, and closing it. Selection,
+  masking and statistics on arrays already read run without it.
+- file_lock(path) is one reentrant lock per file, held by open_netcdf for
+  the whole open-read-close sequence. Work on one file is ordered while
+  requests for different files and datasets proceed concurrently.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Union
+
+from utils.lazy_imports import lazy_import
+
+# Imported on first use: xarray (with pandas) dominates API startup time
+xr = lazy_import("xarray")
+
+HDF5_LOCK = threading.RLock()
+
+# One lock per data file; the set of files is bounded by the data directory
+_file_locks: Dict[str, threading.RLock] = {}
+_file_locks_guard = threading.Lock()
+
+
+def file_lock(file_path: Union[str, Path]) -> threading.RLock:
+    """
+    Reentrant lock serializing access to one NetCDF file.
+
+    Args:
+        file_path: NetCDF file (relative and absolute paths share a lock)
+
+    Returns:
+        The file's lock, created on first use
+    """
+    key = os.path.abspath(file_path)
+    with _file_locks_guard:
+        lock = _file_locks.get(key)
+        if lock is None:
+            lock = _file_locks[key] = threading.RLock()
+        return lock
+
+
+def open_dataset(file_path: Union[str, Path], **kwargs) -> xr.Dataset:
+    """
+    Open a dataset whose HDF5 calls hold HDF5_LOCK.
+
+    The open runs under the lock, lazy reads of variable data take it through
+    xarray's lock argument, and closing the dataset (directly or by leaving a
+    with-block) takes it again. Use for handles kept beyond one request;
+    open_netcdf adds the per-file lock for the usual open-read-close sequence.
+
+    Args:
+        file_path: NetCDF file to open
+        **kwargs: Extra keyword arguments forwarded to xr.open_dataset
+
+    Returns:
+        The open dataset
+    """
+    with HDF5_LOCK:
+        ds = xr.open_dataset(file_path, lock=HDF5_LOCK, **kwargs)
+
+    backend_close = ds._close
+
+    def close() -> None:
+        with HDF5_LOCK:
+            backend_close()
+
+    ds.set_close(close)
+    return ds
+
+
+@contextmanager
+def open_netcdf(file_path: Union[str, Path], **kwargs) -> Iterator[xr.Dataset]:
+    """
+    Open a dataset for the duration of a with-block, holding its file lock.
+
+    Args:
+        file_path: NetCDF file to open
+        **kwargs: Extra keyword arguments forwarded to xr.open_dataset
+
+    Yields:
+        The open dataset (closed when the block exits)
+    """
+    with file_lock(file_path):
+        with open_dataset(file_path, **kwargs) as ds:
+            yield ds
@@ -0,0 +1,233 @@
+"""
+NetCDF encoding policy for harmonized ocean data outputs.
+
+Every processed/harmonized file written by the processors and downloaders goes
+through this policy so that all outputs share the same on-disk layout:
+- Known physical variables are packed to int16 with scale_factor/add_offset
+- Other floating point variables are stored as float32
+- zlib + shuffle compression on every numeric variable
+- Small spatial chunks so a single point read only decompresses one chunk
+"""
+
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Any, Optional, Union
+
+import numpy as np
+import xarray as xr
+
+logger = logging.getLogger(__name__)
+
+# Names used for the spatial dimensions across all datasets
+LAT_DIMS = ('lat', 'latitude')
+LON_DIMS = ('lon', 'longitude')
+
+# int16 fill value for packed variables (-32768 is kept free so the range stays symmetric)
+PACKED_FILL_VALUE = np.int16(-32767)
+PACKED_MIN = -32766
+PACKED_MAX = 32767
+
+
+@dataclass(frozen=True)
+class PackedEncoding:
+    """int16 packing parameters for a variable."""
+    scale_factor: float
+    add_offset: float = 0.0
+
+    @property
+    def valid_range(self) -> tuple:
+        """Physical value range representable by this packing."""
+        return (
+            PACKED_MIN * self.scale_factor + self.add_offset,
+            PACKED_MAX * self.scale_factor + self.add_offset
+        )
+
+    def pack(self, values: Any) -> np.ndarray:
+        """Physical values in packed int16 units, clipped to the packed range."""
+        packed = np.round((np.asarray(values, dtype=np.float64) - self.add_offset) / self.scale_factor)
+        return np.clip(packed, PACKED_MIN, PACKED_MAX).astype(np.int16)
+
+
+class NetCDFEncodingPolicy:
+    """Builds per-variable encodings and writes NetCDF files with them."""
+
+    def __init__(self, complevel: int = 4, spatial_chunk: int = 128):
+        """
+        Initialize the encoding policy.
+
+        Args:
+            complevel: zlib compression level (1-9)
+            spatial_chunk: Chunk edge length along lat/lon dimensions
+        """
+        self.complevel = complevel
+        self.spatial_chunk = spatial_chunk
+
+        # Packing tuned to the precision of the source products
+        self.packed_variables: Dict[str, PackedEncoding] = {
+            # SST (NOAA OISST ships these as int16 with 0.01 scale)
+            'sst': PackedEncoding(scale_factor=0.01),
+            'anom': PackedEncoding(scale_factor=0.01),
+            'err': PackedEncoding(scale_factor=0.01),
+            'ice': PackedEncoding(scale_factor=0.01),
+            # Currents velocities and derived quantities
+            'uo': PackedEncoding(scale_factor=0.001),
+            'vo': PackedEncoding(scale_factor=0.001),
+            'u': PackedEncoding(scale_factor=0.001),
+            'v': PackedEncoding(scale_factor=0.001),
+            'ug': PackedEncoding(scale_factor=0.001),
+            'vg': PackedEncoding(scale_factor=0.001),
+            'current_speed': PackedEncoding(scale_factor=0.001),
+            'current_direction': PackedEncoding(scale_factor=0.01, add_offset=180.0),
+            'thetao': PackedEncoding(scale_factor=0.001, add_offset=20.0),
+            'so': PackedEncoding(scale_factor=0.001, add_offset=20.0),
+            # Acidity
+            'ph': PackedEncoding(scale_factor=0.0001, add_offset=7.5),
+        }
+
+    def _chunk_shape(self, var: xr.Variable) -> Optional[tuple]:
+        """Chunk shape for point reads: one spatial tile, one step along other dims."""
+        if not any(dim in LAT_DIMS + LON_DIMS for dim in var.dims):
+            return None
+
+        chunks = []
+        for dim, size in zip(var.dims, var.shape):
+            if dim in LAT_DIMS or dim in LON_DIMS:
+                chunks.append(max(1, min(size, self.spatial_chunk)))
+            else:
+                chunks.append(1)
+        return tuple(chunks)
+
+    def _fits_packing(self, data: xr.DataArray, packing: PackedEncoding) -> bool:
+        """Check that finite values fit the packed int16 range."""
+        if data.size == 0:
+            return True
+        low, high = packing.valid_range
+        data_min = data.min(skipna=True)
+        data_max = data.max(skipna=True)
+        if np.isnan(float(data_min)):
+            return True  # All NaN, nothing to overflow
+        return low <= float(data_min) and float(data_max) <= high
+
+    def variable_encoding(self, name: str, data: xr.DataArray) -> Dict[str, Any]:
+        """
+        Build the encoding for a single data variable.
+
+        Args:
+            name: Variable name
+            data: Variable data
+
+        Returns:
+            Encoding dictionary for xarray's to_netcdf
+        """
+        if not np.issubdtype(data.dtype, np.number):
+            # Strings/objects cannot be compressed as vlen data
+            return {}
+
+        encoding: Dict[str, Any] = {
+            'zlib': True,
+            'complevel': self.complevel,
+            'shuffle': True,
+        }
+
+        chunksizes = self._chunk_shape(data.variable)
+        if chunksizes:
+            encoding['chunksizes'] = chunksizes
+
+        if np.issubdtype(data.dtype, np.floating):
+            packing = self.packed_variables.get(name)
+            if packing and self._fits_packing(data, packing):
+                encoding.update({
+                    'dtype': 'int16',
+                    'scale_factor': packing.scale_factor,
+                    'add_offset': packing.add_offset,
+                    '_FillValue': PACKED_FILL_VALUE,
+                })
+            else:
+                if packing:
+                    logger.warning(f"Values of '{name}' exceed int16 packing range, storing as float32")
+                encoding.update({
+                    'dtype': 'float32',
+                    '_FillValue': np.float32(np.nan),
+                })
+
+        return encoding
+
+    def packed_attrs(self, attrs: Dict[str, Any], packing: PackedEncoding) -> Dict[str, Any]:
+        """
+        Attributes of a packed variable, with valid_range/valid_min/valid_max in packed units.
+
+        CF readers (netCDF4's auto-masking among them) compare these against
+        the stored int16 values before unpacking, so ranges left in physical
+        units would mask every value.
+
+        Args:
+            attrs: Variable attributes in physical units
+            packing: The variable's int16 packing
+
+        Returns:
+            A new attribute dictionary
+        """
+        packed = dict(attrs)
+        for key in ('valid_range', 'valid_min', 'valid_max'):
+            if key in packed:
+                packed[key] = packing.pack(packed[key])
+        return packed
+
+    def build_encoding(self, ds: xr.Dataset) -> Dict[str, Dict[str, Any]]:
+        """
+        Build the encoding for every data variable in a dataset.
+
+        Args:
+            ds: Dataset about to be written
+
+        Returns:
+            Nested encoding dictionary keyed by variable name
+        """
+        return {
+            name: self.variable_encoding(name, ds[name])
+            for name in ds.data_vars
+        }
+
+    def write(self, ds: xr.Dataset, output_path: Union[str, Path], **kwargs) -> Path:
+        """
+        Write a dataset to NetCDF4 using the encoding policy.
+
+        Only writes the file: callers register it afterwards with
+        utils.ingest.ingest_output.
+
+        Args:
+            ds: Dataset to write
+            output_path: Destination path
+            **kwargs: Extra keyword arguments forwarded to to_netcdf
+
+        Returns:
+            Path of the written file
+        """
+        output_path = Path(output_path)
+        encoding = self.build_encoding(ds)
+
+        # Encodings inherited from the source file (chunk sizes, packing of
+        # the raw product) no longer match the processed grid
+        ds_out = ds.copy()
+        for name in ds_out.variables:
+            ds_out[name].encoding = {
+                key: value for key, value in ds_out[name].encoding.items()
+                if key in ('units', 'calendar')
+            }
+        for name, var_encoding in encoding.items():
+            if var_encoding.get('dtype') == 'int16':
+                ds_out[name].attrs = self.packed_attrs(ds_out[name].attrs, self.packed_variables[name])
+
+        ds_out.to_netcdf(
+            output_path,
+            format='NETCDF4',
+            engine='netcdf4',
+            encoding=encoding,
+            **kwargs
+        )
+        return output_path
+
+
+# Global policy instance shared by all write sites
+encoding_policy = NetCDFEncodingPolicy()
@@ -5,18 +5,27 @@ Provides dynamic, value-based descriptions and educational context for ocean mea
 Leverages the existing classifyMeasurement logic from the frontend with enhanced backend intelligence.
 """
 
-import yaml
+import re
 import logging
+from bisect import bisect_right
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any, Union
 from datetime import datetime
 from dataclasses import dataclass
 
+import numpy as np
+
+from api.json_response import dumps, payload_etag
+from api.middleware.compression import precompressed
 from api.models.responses import ParameterClassification, EducationalContext
+from utils.lazy_imports import deferred, lazy_import
+
+yaml = lazy_import("yaml")
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(frozen=True)
 class ValueRange:
     """Represents a value range with its associated interpretation."""
     min_val: float
@@ -27,12 +36,44 @@ class ValueRange:
     environmental_impact: str
     context: str
 
+# Codes returned by classify_array for values that fall in no range
+BELOW_RANGE = -1
+ABOVE_RANGE = -2
+UNCLASSIFIED = -3  # NaN, or a gap between ranges
+
+@dataclass(frozen=True)
+class CompiledParameter:
+    """A parameter's value ranges as sorted breakpoints, with its shared response objects."""
+    ranges: Tuple[ValueRange, ...]
+    mins: np.ndarray
+    maxs: np.ndarray
+    min_list: Tuple[float, ...]
+    upper: float
+    range_ids: Tuple[str, ...]
+    low: Optional[ParameterClassification]
+    high: Optional[ParameterClassification]
+    educational_context: EducationalContext
+
+def classification_id(parameter: str, classification: str) -> str:
+    """Stable identifier of a classification, e.g. 'sst.warm' or 'ph.extremely_acidic'."""
+    return f"{parameter}.{re.sub(r'[^a-z0-9]+', '_', classification.lower()).strip('_')}"
+
+@lru_cache(maxsize=4096)
+def _parse_year_month(date: str) -> Optional[Tuple[int, int]]:
+    """(year, month) of a YYYY-MM-DD date, or None if malformed."""
+    try:
+        dt = datetime.strptime(date, '%Y-%m-%d')
+    except (ValueError, TypeError):
+        return None
+    return dt.year, dt.month
+
 class ParameterInterpreter:
     """Contextual intelligence system for interpreting ocean parameter measurements."""
     
     def __init__(self):
         """Initialize the parameter interpreter with configuration data."""
-        self.config_path = Path("config/parameter_descriptions.yaml")
+        # Relative to backend/, not the working directory the API was started from
+        self.config_path = Path(__file__).resolve().parent.parent / "config" / "parameter_descriptions.yaml"
         self.config = self._load_config()
         
         # Enhanced classification mapping with more parameters
@@ -43,6 +84,14 @@ class ParameterInterpreter:
             'critical': '#991b1b'  # Dark Red
         }
         
+        # YAML ranges compiled to breakpoint arrays. Classification objects are
+        # interned: every response with the same range and context shares one
+        # (immutable) instance, so a lookup is a bisect plus a dict hit.
+        self.compiled = self._compile()
+        self._classifications: Dict[Tuple, ParameterClassification] = {}
+        self._categorical: Dict[Tuple[str, str], Optional[ParameterClassification]] = {}
+        self._metadata_payloads: Dict[Tuple[str, ...], Tuple[str, bytes]] = {}
+        
         logger.info("🧠 Parameter interpreter initialized with dynamic descriptions")
     
     def _load_config(self) -> Dict[str, Any]:
@@ -54,6 +103,46 @@ class ParameterInterpreter:
             logger.error(f"Failed to load parameter descriptions config: {e}")
             return {}
     
+    def _compile(self) -> Dict[str, CompiledParameter]:
+        """Compile each parameter's value ranges into sorted breakpoints and shared objects."""
+        compiled = {}
+        for parameter, param_config in (self.config.get('parameters') or {}).items():
+            value_ranges = param_config.get('value_ranges', [])
+            ranges = tuple(sorted(
+                (
+                    ValueRange(
+                        min_val=float(r['min']), max_val=float(r['max']),
+                        classification=r['classification'], severity=r['severity'],
+                        description=r['description'], environmental_impact=r['environmental_impact'],
+                        context=r['context']
+                    )
+                    for r in value_ranges
+                ),
+                key=lambda r: r.min_val
+            ))
+            for previous, current in zip(ranges, ranges[1:]):
+                if current.min_val < previous.max_val:
+                    logger.warning(f"Overlapping value ranges for {parameter}: "
+                                   f"{previous.classification} and {current.classification}")
+            compiled[parameter] = CompiledParameter(
+                ranges=ranges,
+                mins=np.array([r.min_val for r in ranges]),
+                maxs=np.array([r.max_val for r in ranges]),
+                min_list=tuple(r.min_val for r in ranges),
+                upper=max((r.max_val for r in ranges), default=np.inf),
+                range_ids=tuple(classification_id(parameter, r.classification) for r in ranges),
+                low=self._handle_outlier_value(parameter, -np.inf, value_ranges),
+                high=self._handle_outlier_value(parameter, np.inf, value_ranges),
+                educational_context=EducationalContext(
+                    short_description=param_config.get('short_description', ''),
+                    scientific_context=param_config.get('scientific_context', ''),
+                    unit_explanation=param_config.get('unit_explanation', ''),
+                    health_implications=param_config.get('health_implications', {}),
+                    measurement_context=param_config.get('measurement_context', {})
+                )
+            )
+        return compiled
+    
     def get_parameter_classification(
         self, 
         parameter: str, 
@@ -73,12 +162,16 @@ class ParameterInterpreter:
         Returns:
             ParameterClassification with dynamic description or None if not found
         """
-        if value is None or not self.config.get('parameters', {}).get(parameter):
+        compiled = self.compiled.get(parameter)
+        if value is None or compiled is None:
             return None
         
         # Handle string values (like microplastics data_source)
         if isinstance(value, str):
-            return self._classify_categorical_parameter(parameter, value)
+            key = (parameter, value)
+            if key not in self._categorical:
+                self._categorical[key] = self._classify_categorical_parameter(parameter, value)
+            return self._categorical[key]
         
         # Handle numeric values
         try:
@@ -86,28 +179,169 @@ class ParameterInterpreter:
         except (ValueError, TypeError):
             return None
         
-        param_config = self.config['parameters'][parameter]
-        value_ranges = param_config.get('value_ranges', [])
-        
         # Find the appropriate range for this value
-        for range_config in value_ranges:
-            if range_config['min'] <= numeric_value < range_config['max']:
-                # Add contextual enhancement based on location/date
-                enhanced_context = self._enhance_context(
-                    range_config['context'], parameter, numeric_value, location, date
-                )
-                
-                return ParameterClassification(
-                    classification=range_config['classification'],
-                    severity=range_config['severity'],
-                    color=self.classification_colors.get(range_config['severity'], '#6b7280'),
-                    description=range_config['description'],
-                    environmental_impact=range_config['environmental_impact'],
-                    context=enhanced_context
-                )
+        index = bisect_right(compiled.min_list, numeric_value) - 1
+        if index >= 0 and numeric_value < compiled.ranges[index].max_val:
+            # Contextual enhancement based on location/date
+            regional = self._get_regional_context(location[0], location[1], parameter, numeric_value) if location else ""
+            temporal = self._get_temporal_context(date, parameter, numeric_value) if date else ""
+            key = (parameter, index, regional, temporal)
+            classification = self._classifications.get(key)
+            if classification is None:
+                classification = self._build_classification(compiled.ranges[index], regional, temporal)
+                self._classifications[key] = classification
+            return classification
         
         # Handle values outside defined ranges
-        return self._handle_outlier_value(parameter, numeric_value, value_ranges)
+        if compiled.ranges and numeric_value < compiled.ranges[0].min_val:
+            return compiled.low
+        if compiled.ranges and numeric_value >= compiled.upper:
+            return compiled.high
+        return None
+    
+    def _build_classification(self, value_range: ValueRange, regional: str, temporal: str) -> ParameterClassification:
+        """Classification of one range with its regional and temporal context appended."""
+        context = value_range.context
+        if regional:
+            context += f" {regional}"
+        if temporal:
+            context += f" {temporal}"
+        return ParameterClassification(
+            classification=value_range.classification,
+            severity=value_range.severity,
+            color=self.classification_colors.get(value_range.severity, '#6b7280'),
+            description=value_range.description,
+            environmental_impact=value_range.environmental_impact,
+            context=context
+        )
+    
+    def classify_array(self, parameter: str, values: np.ndarray) -> np.ndarray:
+        """
+        Range index of every value, for classifying whole grids or point sets at once.
+        
+        Args:
+            parameter: Parameter name
+            values: Values of any shape
+            
+        Returns:
+            int16 array of the same shape: index into the parameter's sorted ranges,
+            or BELOW_RANGE, ABOVE_RANGE or UNCLASSIFIED
+        """
+        values = np.asarray(values, dtype=np.float64)
+        compiled = self.compiled.get(parameter)
+        codes = np.full(values.shape, UNCLASSIFIED, dtype=np.int16)
+        if compiled is None or not compiled.ranges:
+            return codes
+        
+        index = np.searchsorted(compiled.mins, values, side='right') - 1
+        in_range = (index >= 0) & (values < compiled.maxs[np.clip(index, 0, None)])
+        codes[in_range] = index[in_range]
+        codes[values < compiled.mins[0]] = BELOW_RANGE
+        codes[values >= compiled.upper] = ABOVE_RANGE
+        return codes
+    
+    def classification_labels(self, parameter: str) -> Dict[int, str]:
+        """Classification name of every code classify_array can return for a parameter, lowest values first."""
+        compiled = self.compiled.get(parameter)
+        if compiled is None:
+            return {}
+        labels = {BELOW_RANGE: compiled.low.classification} if compiled.low is not None else {}
+        labels.update((i, r.classification) for i, r in enumerate(compiled.ranges))
+        if compiled.high is not None:
+            labels[ABOVE_RANGE] = compiled.high.classification
+        return labels
+    
+    def classification_breakdown(self, parameter: str, values: np.ndarray,
+                                 weights: Optional[np.ndarray] = None) -> Optional[Dict[str, float]]:
+        """
+        Share (percent, optionally weighted) of finite values in each classification.
+        
+        Returns:
+            Classification name -> percentage, or None if the parameter has no ranges or no finite values
+        """
+        labels = self.classification_labels(parameter)
+        if not labels:
+            return None
+        values = np.asarray(values, dtype=np.float64)
+        codes = self.classify_array(parameter, values)
+        weights = np.ones(values.shape) if weights is None else np.broadcast_to(weights, values.shape)
+        
+        classified = codes != UNCLASSIFIED
+        total = float(weights[np.isfinite(values)].sum())
+        if total <= 0:
+            return None
+        # Shift codes to non-negative bins: ABOVE_RANGE -> 0, BELOW_RANGE -> 1, ranges -> 2..
+        totals = np.bincount(codes[classified].astype(np.int64) - ABOVE_RANGE,
+                             weights=weights[classified], minlength=len(labels) + 2)
+        breakdown = {}
+        for code, label in labels.items():
+            share = float(totals[code - ABOVE_RANGE])
+            if share > 0:
+                breakdown[label] = round(100.0 * share / total, 2)
+        return breakdown
+    
+    def get_classification_id(self, parameter: str, value: Union[float, str, None]) -> Optional[str]:
+        """Identifier of the range a value falls in (see get_parameter_metadata), or None."""
+        compiled = self.compiled.get(parameter)
+        if compiled is None or value is None or isinstance(value, str):
+            return None
+        try:
+            numeric_value = float(value)
+        except (ValueError, TypeError):
+            return None
+        index = bisect_right(compiled.min_list, numeric_value) - 1
+        if index >= 0 and numeric_value < compiled.ranges[index].max_val:
+            return compiled.range_ids[index]
+        if compiled.low is not None and numeric_value < compiled.ranges[0].min_val:
+            return classification_id(parameter, compiled.low.classification)
+        if compiled.high is not None and numeric_value >= compiled.upper:
+            return classification_id(parameter, compiled.high.classification)
+        return None
+    
+    def get_parameter_metadata(self, parameters: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Static text of each parameter: educational context and every classification by ID.
+        
+        Args:
+            parameters: Parameter names (all configured parameters if not specified)
+        """
+        names = parameters if parameters is not None else list(self.compiled)
+        metadata = {}
+        for parameter in names:
+            compiled = self.compiled.get(parameter)
+            if compiled is None:
+                continue
+            classifications = {}
+            if compiled.low is not None:
+                classifications[classification_id(parameter, compiled.low.classification)] = {
+                    **compiled.low.model_dump(), "min": None, "max": compiled.ranges[0].min_val
+                }
+            for range_id, value_range in zip(compiled.range_ids, compiled.ranges):
+                classifications[range_id] = {
+                    **self._build_classification(value_range, "", "").model_dump(),
+                    "min": value_range.min_val, "max": value_range.max_val
+                }
+            if compiled.high is not None:
+                classifications[classification_id(parameter, compiled.high.classification)] = {
+                    **compiled.high.model_dump(), "min": compiled.upper, "max": None
+                }
+            metadata[parameter] = {
+                "educational_context": compiled.educational_context.model_dump(),
+                "classifications": classifications
+            }
+        return metadata
+    
+    def metadata_payload(self, parameters: Optional[List[str]] = None) -> Tuple[str, bytes]:
+        """Serialized get_parameter_metadata() and its ETag, built once per parameter selection."""
+        # Unknown names are dropped so the cache stays bounded by the configured parameters
+        key = tuple(sorted(set(parameters) & set(self.compiled))) if parameters is not None else tuple(self.compiled)
+        cached = self._metadata_payloads.get(key)
+        if cached is None:
+            body = dumps(self.get_parameter_metadata(list(key)))
+            cached = (payload_etag(body), body)
+            precompressed.register(body)
+            self._metadata_payloads[key] = cached
+        return cached
     
     def _classify_categorical_parameter(self, parameter: str, value: str) -> Optional[ParameterClassification]:
         """Handle categorical parameters like data source types."""
@@ -150,32 +384,6 @@ class ParameterInterpreter:
         
         return None
     
-    def _enhance_context(
-        self, 
-        base_context: str, 
-        parameter: str, 
-        value: float,
-        location: Optional[Tuple[float, float]], 
-        date: Optional[str]
-    ) -> str:
-        """Enhance contextual description with geographic and temporal information."""
-        enhanced_context = base_context
-        
-        # Add geographic context
-        if location:
-            lat, lon = location
-            region_context = self._get_regional_context(lat, lon, parameter, value)
-            if region_context:
-                enhanced_context += f" {region_context}"
-        
-        # Add temporal context  
-        if date:
-            temporal_context = self._get_temporal_context(date, parameter, value)
-            if temporal_context:
-                enhanced_context += f" {temporal_context}"
-        
-        return enhanced_context
-    
     def _get_regional_context(self, lat: float, lon: float, parameter: str, value: float) -> str:
         """Provide geographic context based on location."""
         # Arctic regions
@@ -209,42 +417,39 @@ class ParameterInterpreter:
     
     def _get_temporal_context(self, date: str, parameter: str, value: float) -> str:
         """Provide temporal context based on date and seasonality."""
-        try:
-            dt = datetime.strptime(date, '%Y-%m-%d')
-            month = dt.month
-            year = dt.year
-            
-            # Seasonal context
-            if parameter == 'sst':
-                # Northern hemisphere summer
-                if month in [6, 7, 8] and value > 25:
-                    return "Summer maximum temperatures, monitor for heat stress."
-                # Winter cooling
-                elif month in [12, 1, 2] and value < 15:
-                    return "Winter cooling phase, normal seasonal variation."
-            
-            elif parameter == 'chl':
-                # Spring bloom season
-                if month in [3, 4, 5] and value > 3:
-                    return "Likely spring phytoplankton bloom period."
-                # Fall productivity
-                elif month in [9, 10] and value > 2:
-                    return "Fall productivity increase, secondary bloom season."
-            
-            # Climate change context
-            if year >= 2020:
-                if parameter == 'sst' and value > 28:
-                    return "Recent warming consistent with climate change trends."
-                elif parameter == 'ph' and value < 7.9:
-                    return "Continued ocean acidification from rising atmospheric CO₂."
-            elif year >= 2024:
-                if parameter == 'sst' and value > 27:
-                    return "2024-2025 measurements show continued ocean warming."
-                elif parameter == 'microplastics_concentration' and value > 2.0:
-                    return "Current high pollution levels reflect growing plastic crisis."
+        parsed = _parse_year_month(date)
+        if parsed is None:
+            return ""
+        year, month = parsed
         
-        except (ValueError, TypeError):
-            pass
+        # Seasonal context
+        if parameter == 'sst':
+            # Northern hemisphere summer
+            if month in [6, 7, 8] and value > 25:
+                return "Summer maximum temperatures, monitor for heat stress."
+            # Winter cooling
+            elif month in [12, 1, 2] and value < 15:
+                return "Winter cooling phase, normal seasonal variation."
+        
+        elif parameter == 'chl':
+            # Spring bloom season
+            if month in [3, 4, 5] and value > 3:
+                return "Likely spring phytoplankton bloom period."
+            # Fall productivity
+            elif month in [9, 10] and value > 2:
+                return "Fall productivity increase, secondary bloom season."
+        
+        # Climate change context
+        if year >= 2020:
+            if parameter == 'sst' and value > 28:
+                return "Recent warming consistent with climate change trends."
+            elif parameter == 'ph' and value < 7.9:
+                return "Continued ocean acidification from rising atmospheric CO₂."
+        elif year >= 2024:
+            if parameter == 'sst' and value > 27:
+                return "2024-2025 measurements show continued ocean warming."
+            elif parameter == 'microplastics_concentration' and value > 2.0:
+                return "Current high pollution levels reflect growing plastic crisis."
         
         return ""
     
@@ -300,19 +505,9 @@ class ParameterInterpreter:
         return None
     
     def get_educational_context(self, parameter: str) -> Optional[EducationalContext]:
-        """Get educational information about a parameter."""
-        if parameter not in self.config.get('parameters', {}):
-            return None
-        
-        param_config = self.config['parameters'][parameter]
-        
-        return EducationalContext(
-            short_description=param_config.get('short_description', ''),
-            scientific_context=param_config.get('scientific_context', ''),
-            unit_explanation=param_config.get('unit_explanation', ''),
-            health_implications=param_config.get('health_implications', {}),
-            measurement_context=param_config.get('measurement_context', {})
-        )
+        """Get educational information about a parameter (a shared, compiled-once instance)."""
+        compiled = self.compiled.get(parameter)
+        return compiled.educational_context if compiled else None
     
     def get_global_context_indicators(self) -> Dict[str, List[str]]:
         """Get global environmental context indicators."""
@@ -381,5 +576,5 @@ class ParameterInterpreter:
         
         return insights
 
-# Global instance for use across the application
-parameter_interpreter = ParameterInterpreter()
\ No newline at end of file
+# Global instance for use across the application, built on first use
+parameter_interpreter = deferred(ParameterInterpreter, "parameter_interpreter")
\ No newline at end of file
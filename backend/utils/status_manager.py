@@ -10,6 +10,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
+from utils.file_catalog import get_file_catalog
+
 class StatusManager:
     """Manages status tracking for all datasets and system health."""
     
@@ -68,12 +70,10 @@ class StatusManager:
             # Get disk usage for the data directory
             usage = psutil.disk_usage(str(base_path))
             
-            # Calculate used space by our data
+            # Calculate used space by our data (raw, processed and texture files in the catalog)
             total_our_data = 0
             if base_path.exists():
-                for file_path in base_path.rglob("*"):
-                    if file_path.is_file():
-                        total_our_data += file_path.stat().st_size
+                total_our_data = get_file_catalog(base_path).total_size_bytes()
             
             return {
                 "total_disk_gb": usage.total / (1024**3),
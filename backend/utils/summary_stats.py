@@ -0,0 +1,326 @@
+"""
+Daily area-weighted summary statistics for harmonized ocean data.
+
+Every harmonized file written through the NetCDF encoding policy is reduced,
+while its dataset is still in memory, to cos(lat)-weighted mean/std/min/max
+per surface variable for the globe, each ocean basin and each 30° latitude
+band. The rows go to a SQLite table in the ocean-data root, clustered on
+(dataset, variable, region, date), so a decade-long trend for one series is a
+single contiguous range read instead of reopening thousands of files.
+
+Basins are coarse longitude sectors with the same polar cut-offs as the
+analysis scripts (Arctic north of 65°N, Southern south of 60°S).
+
+Directions (degrees on a circle) are not summarized: the arithmetic mean of
+359° and 1° is 180°. Current speed carries the magnitude; u/v the vector.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import logging
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from utils.area_weighting import latitude_weights, surface_layer, weighted_stats
+from utils.file_catalog import extract_file_date, find_data_root, get_file_catalog
+from utils.lazy_imports import lazy_import
+
+# Imported on first use: xarray (with pandas) dominates API startup time
+xr = lazy_import("xarray")
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_FILENAME = "summary_stats.sqlite"
+
+SUMMARY_STATS = ("mean", "std", "min", "max", "count")
+
+# Angular variables, whose linear statistics are meaningless
+CIRCULAR_VARIABLES = ("current_direction", "direction")
+
+BASINS = ("arctic", "southern", "atlantic", "pacific", "indian")
+LATITUDE_BANDS = (
+    ("lat_90S_60S", -90, -60), ("lat_60S_30S", -60, -30), ("lat_30S_0", -30, 0),
+    ("lat_0_30N", 0, 30), ("lat_30N_60N", 30, 60), ("lat_60N_90N", 60, 90)
+)
+REGIONS = ("global",) + BASINS + tuple(name for name, _, _ in LATITUDE_BANDS)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS daily_summaries (
+    dataset TEXT NOT NULL,
+    variable TEXT NOT NULL,
+    region TEXT NOT NULL,
+    date TEXT NOT NULL,
+    mean REAL,
+    std REAL,
+    min REAL,
+    max REAL,
+    valid_cells INTEGER NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (dataset, variable, region, date)
+) WITHOUT ROWID;
+"""
+
+
+def basin_labels(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """
+    Basin index (into BASINS) for every cell of a regular lat/lon grid.
+
+    Longitude sectors: Indian 20°E-147°E, Pacific 147°E-70°W (east of 100°W
+    only south of 9°N, i.e. Panama), Atlantic the rest.
+    """
+    lat2d = np.asarray(lats, dtype=np.float64)[:, np.newaxis]
+    lon2d = ((np.asarray(lons, dtype=np.float64) + 180.0) % 360.0 - 180.0)[np.newaxis, :]
+
+    labels = np.full((lat2d.size, lon2d.size), BASINS.index("atlantic"), dtype=np.int8)
+    pacific = (lon2d >= 147) | (lon2d < -100) | ((lon2d < -70) & (lat2d < 9))
+    indian = (lon2d >= 20) & (lon2d < 147)
+    labels[np.broadcast_to(pacific, labels.shape)] = BASINS.index("pacific")
+    labels[np.broadcast_to(indian, labels.shape)] = BASINS.index("indian")
+    labels[np.broadcast_to(lat2d > 65, labels.shape)] = BASINS.index("arctic")
+    labels[np.broadcast_to(lat2d < -60, labels.shape)] = BASINS.index("southern")
+    return labels
+
+
+class RegionMasks:
+    """Region selections for one grid, built once and reused for every file on it."""
+
+    def __init__(self, lats: np.ndarray, lons: np.ndarray):
+        self.shape = (lats.size, lons.size)
+        self.weights = np.broadcast_to(latitude_weights(lats)[:, np.newaxis], self.shape)
+        self.basins = basin_labels(lats, lons)
+        self.band_rows = {
+            name: (lats >= south) & (lats < north if north < 90 else lats <= north)
+            for name, south, north in LATITUDE_BANDS
+        }
+
+    def reduce(self, values: np.ndarray) -> Dict[str, Dict[str, Optional[float]]]:
+        """Summary statistics of a (lat, lon) field for every region."""
+        results = {"global": weighted_stats(values, self.weights, SUMMARY_STATS)}
+        for index, basin in enumerate(BASINS):
+            cells = self.basins == index
+            results[basin] = weighted_stats(values[cells], self.weights[cells], SUMMARY_STATS)
+        for name, rows in self.band_rows.items():
+            results[name] = weighted_stats(values[rows], self.weights[rows], SUMMARY_STATS)
+        return results
+
+
+_masks: "OrderedDict[Tuple, RegionMasks]" = OrderedDict()
+_masks_lock = threading.Lock()
+_MAX_MASK_GRIDS = 4
+
+
+def region_masks(lats: np.ndarray, lons: np.ndarray) -> RegionMasks:
+    """Cached region masks for a grid."""
+    key = (lats.size, lons.size, float(lats[0]), float(lats[-1]), float(lons[0]), float(lons[-1]))
+    with _masks_lock:
+        masks = _masks.get(key)
+        if masks is not None:
+            _masks.move_to_end(key)
+            return masks
+    masks = RegionMasks(lats, lons)
+    with _masks_lock:
+        _masks[key] = masks
+        while len(_masks) > _MAX_MASK_GRIDS:
+            _masks.popitem(last=False)
+    return masks
+
+
+def is_circular(var_name: str, var: xr.DataArray) -> bool:
+    """Whether a variable is a direction (by name or CF standard_name)."""
+    return var_name in CIRCULAR_VARIABLES or "direction" in var.attrs.get("standard_name", "")
+
+
+def summarize_dataset(ds: xr.Dataset) -> List[Tuple[str, str, Dict[str, Optional[float]]]]:
+    """
+    Area-weighted statistics of every surface variable of a gridded dataset.
+
+    The surface layer is the first time/depth index, as in point extraction.
+    Directions are skipped (see is_circular).
+
+    Returns:
+        List of (variable, region, stats) tuples; empty for non-gridded datasets
+    """
+    rows = []
+    for var_name, var in ds.data_vars.items():
+        if is_circular(var_name, var):
+            continue
+        layer = surface_layer(var)
+        if layer is None:
+            continue
+        lat_dim, lon_dim = layer.dims
+        values = layer.values.astype(np.float64)
+        masks = region_masks(ds[lat_dim].values, ds[lon_dim].values)
+        for region, stats in masks.reduce(values).items():
+            rows.append((var_name, region, stats))
+    return rows
+
+
+class SummaryStatsTable:
+    """SQLite table of daily per-region summary statistics."""
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize the table.
+
+        Args:
+            db_path: SQLite database file (created on first use)
+        """
+        self.db_path = Path(db_path)
+        self._schema_ready = False
+
+    @contextmanager
+    def _connect(self):
+        """Short-lived connection; WAL lets the API read while ingest writes."""
+        if not self._schema_ready:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            if not self._schema_ready:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(_SCHEMA)
+                self._schema_ready = True
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def upsert(self, dataset: str, date: str, rows: List[Tuple[str, str, Dict[str, Optional[float]]]]) -> int:
+        """
+        Store (replace) the summaries of one dataset day.
+
+        Returns:
+            Number of rows written
+        """
+        now = datetime.now().isoformat()
+        records = [
+            (dataset, variable, region, date, stats["mean"], stats["std"], stats["min"], stats["max"],
+             stats["count"], now)
+            for variable, region, stats in rows
+        ]
+        with self._connect() as conn:
+            # Variables no longer summarized must not outlive a recompute of the day
+            conn.execute("DELETE FROM daily_summaries WHERE dataset = ? AND date = ?", (dataset, date))
+            conn.executemany(
+                "INSERT OR REPLACE INTO daily_summaries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                records
+            )
+        return len(records)
+
+    def drop_variables(self, variables: List[str]) -> int:
+        """
+        Delete every stored row of the given variables.
+
+        Returns:
+            Number of rows deleted
+        """
+        placeholders = ", ".join("?" for _ in variables)
+        with self._connect() as conn:
+            cursor = conn.execute(f"DELETE FROM daily_summaries WHERE variable IN ({placeholders})", list(variables))
+        return cursor.rowcount
+
+    def has_date(self, dataset: str, date: str) -> bool:
+        """Whether summaries exist for a dataset day."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM daily_summaries WHERE dataset = ? AND date = ? LIMIT 1", (dataset, date)
+            ).fetchone()
+        return row is not None
+
+    def query(self, dataset: str, variable: str, region: str = "global",
+              start_date: Optional[str] = None, end_date: Optional[str] = None) -> Dict[str, List[Any]]:
+        """
+        Time series of one variable over one region, as columns.
+
+        Returns:
+            Dictionary with 'date', 'mean', 'std', 'min', 'max' and 'valid_cells' lists
+        """
+        sql = ("SELECT date, mean, std, min, max, valid_cells FROM daily_summaries "
+               "WHERE dataset = ? AND variable = ? AND region = ?")
+        params: List[Any] = [dataset, variable, region]
+        if start_date:
+            sql += " AND date >= ?"
+            params.append(start_date)
+        if end_date:
+            sql += " AND date <= ?"
+            params.append(end_date)
+        sql += " ORDER BY date"
+
+        with self._connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        columns = ("date", "mean", "std", "min", "max", "valid_cells")
+        return {name: [row[i] for row in rows] for i, name in enumerate(columns)}
+
+    def contents(self) -> Dict[str, Dict[str, Any]]:
+        """Variables and date coverage per summarized dataset."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT dataset, variable, MIN(date), MAX(date), COUNT(DISTINCT date) FROM daily_summaries "
+                "WHERE region = 'global' GROUP BY dataset, variable ORDER BY dataset, variable"
+            ).fetchall()
+        contents: Dict[str, Dict[str, Any]] = {}
+        for dataset, variable, start, end, days in rows:
+            entry = contents.setdefault(dataset, {"variables": {}})
+            entry["variables"][variable] = {"start": start, "end": end, "days": days}
+        return contents
+
+
+_tables: Dict[Path, SummaryStatsTable] = {}
+_tables_lock = threading.Lock()
+
+
+def get_summary_table(data_root: Path) -> SummaryStatsTable:
+    """Shared summary table for an ocean-data root."""
+    db_path = (Path(data_root) / SUMMARY_FILENAME).resolve()
+    with _tables_lock:
+        if db_path not in _tables:
+            _tables[db_path] = SummaryStatsTable(db_path)
+        return _tables[db_path]
+
+
+def summarize_file(ds: xr.Dataset, file_path: Path,
+                   skip_existing: bool = False) -> Optional[int]:
+    """
+    Summarize a harmonized dataset and store it for its dataset day.
+
+    Args:
+        ds: Dataset contents of file_path (already in memory at write time)
+        file_path: Where the dataset lives; must be under processed/unified_coords
+        skip_existing: Leave days that already have summaries untouched
+
+    Returns:
+        Number of rows written, or None if the file is not a dated harmonized output
+    """
+    data_root = find_data_root(file_path)
+    if data_root is None:
+        return None
+    located = get_file_catalog(data_root).stage_of(file_path)
+    date = extract_file_date(Path(file_path).name)
+    if located is None or located[0] != "unified" or date is None:
+        return None
+
+    dataset = located[1]
+    table = get_summary_table(data_root)
+    if skip_existing and table.has_date(dataset, date):
+        return 0
+    return table.upsert(dataset, date, summarize_dataset(ds))
+
+
+def record_summary(ds: xr.Dataset, file_path: Path):
+    """
+    Ingest hook: summarize a harmonized file that was just written.
+
+    Never raises: a statistics problem must not fail a download or processing run.
+    """
+    try:
+        written = summarize_file(ds, Path(file_path))
+        if written:
+            logger.info(f"📈 Stored {written} summary rows for {Path(file_path).name}")
+    except Exception as e:
+        logger.warning(f"⚠️ Could not summarize {file_path}: {e}")
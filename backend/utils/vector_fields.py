@@ -0,0 +1,177 @@
+"""
+Precomputed multi-resolution surface current fields.
+
+When a harmonized currents file is written, its surface u/v components are
+block-averaged to a fixed set of decimation levels and stored as float16 in
+one .npz per day (ocean-data/vector_fields/currents/YYYY/). Serving a
+particle-animation field is then a slice of a small array instead of a read
+and reduction of the full 0.083° grid.
+
+Levels finer than the source grid are skipped (OSCAR is already 1°).
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from utils.area_weighting import velocity_components
+from utils.file_catalog import extract_file_date, find_data_root, get_file_catalog
+from utils.lazy_imports import lazy_import
+
+# Imported on first use: xarray (with pandas) dominates API startup time
+xr = lazy_import("xarray")
+
+logger = logging.getLogger(__name__)
+
+VECTOR_FIELDS_DIRNAME = "vector_fields"
+
+# Decimation levels in degrees, finest first
+VECTOR_LEVELS = (0.25, 0.5, 1.0, 2.0)
+
+
+def level_key(resolution: float) -> str:
+    return f"{resolution:g}"
+
+
+def build_pyramid(ds: xr.Dataset) -> Optional[Dict[str, np.ndarray]]:
+    """
+    Block-averaged surface u/v at every decimation level not finer than the source grid.
+
+    Returns:
+        Arrays keyed 'u_<level>', 'v_<level>', 'lat_<level>', 'lon_<level>', or None without velocities
+    """
+    components = velocity_components(ds)
+    if components is None:
+        return None
+    u, v = components
+    lat_dim, lon_dim = u.dims
+    lats = u[lat_dim].values
+    native = float(abs(lats[1] - lats[0])) if lats.size > 1 else 1.0
+
+    arrays: Dict[str, np.ndarray] = {}
+    levels = []
+    for resolution in VECTOR_LEVELS:
+        if resolution < native * 0.95:
+            continue
+        factor = max(1, int(round(resolution / native)))
+        if factor > 1:
+            level_u = u.coarsen({lat_dim: factor, lon_dim: factor}, boundary="trim").mean()
+            level_v = v.coarsen({lat_dim: factor, lon_dim: factor}, boundary="trim").mean()
+        else:
+            level_u, level_v = u, v
+        key = level_key(resolution)
+        arrays[f"u_{key}"] = level_u.values.astype(np.float16)
+        arrays[f"v_{key}"] = level_v.values.astype(np.float16)
+        arrays[f"lat_{key}"] = level_u[lat_dim].values.astype(np.float32)
+        arrays[f"lon_{key}"] = level_u[lon_dim].values.astype(np.float32)
+        levels.append(resolution)
+
+    if not levels:
+        return None
+    arrays["levels"] = np.asarray(levels, dtype=np.float32)
+    return arrays
+
+
+class VectorFieldStore:
+    """Per-day current pyramids of one ocean-data root."""
+
+    def __init__(self, data_root: Path, max_cached_days: int = 8):
+        """
+        Initialize the store.
+
+        Args:
+            data_root: ocean-data directory
+            max_cached_days: Pyramids kept in memory (a few MB each)
+        """
+        self.base_path = Path(data_root) / VECTOR_FIELDS_DIRNAME / "currents"
+        self.max_cached_days = max_cached_days
+        self._cache: "OrderedDict[Tuple[str, int], Dict[str, np.ndarray]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def pyramid_path(self, date: str) -> Path:
+        return self.base_path / date[:4] / f"currents_vectors_{date.replace('-', '')}.npz"
+
+    def write(self, ds: xr.Dataset, date: str) -> Optional[Path]:
+        """
+        Build and store the pyramid of one day.
+
+        Returns:
+            Path of the pyramid, or None if the dataset has no velocity components
+        """
+        arrays = build_pyramid(ds)
+        if arrays is None:
+            return None
+        path = self.pyramid_path(date)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        buffer = io.BytesIO()
+        np.savez(buffer, **arrays)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(buffer.getvalue())
+        tmp_path.replace(path)
+        return path
+
+    def load(self, date: str) -> Optional[Dict[str, np.ndarray]]:
+        """Pyramid of one day (from memory when cached), or None if not built."""
+        path = self.pyramid_path(date)
+        try:
+            key = (str(path), path.stat().st_mtime_ns)
+        except OSError:
+            return None
+        with self._lock:
+            arrays = self._cache.get(key)
+            if arrays is not None:
+                self._cache.move_to_end(key)
+                return arrays
+        with np.load(path) as npz:
+            arrays = {name: npz[name] for name in npz.files}
+        with self._lock:
+            self._cache[key] = arrays
+            while len(self._cache) > self.max_cached_days:
+                self._cache.popitem(last=False)
+        return arrays
+
+    @staticmethod
+    def levels(arrays: Dict[str, np.ndarray]) -> List[float]:
+        return [float(level) for level in arrays["levels"]]
+
+
+_stores: Dict[Path, VectorFieldStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_vector_field_store(data_root: Path) -> VectorFieldStore:
+    """Shared vector field store for an ocean-data root."""
+    data_root = Path(data_root).resolve()
+    with _stores_lock:
+        if data_root not in _stores:
+            _stores[data_root] = VectorFieldStore(data_root)
+        return _stores[data_root]
+
+
+def record_vector_field(ds: xr.Dataset, file_path: Path):
+    """
+    Ingest hook: precompute the current pyramid of a harmonized currents file that was just written.
+
+    Never raises: a vector field problem must not fail a download or processing run.
+    """
+    try:
+        file_path = Path(file_path)
+        data_root = find_data_root(file_path)
+        if data_root is None:
+            return
+        located = get_file_catalog(data_root).stage_of(file_path)
+        date = extract_file_date(file_path.name)
+        if located != ("unified", "currents") or date is None:
+            return
+        path = get_vector_field_store(data_root).write(ds, date)
+        if path is not None:
+            logger.info(f"🌀 Stored current field pyramid for {date}")
+    except Exception as e:
+        logger.warning(f"⚠️ Could not build current field pyramid for {file_path}: {e}")
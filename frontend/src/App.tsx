@@ -9,6 +9,7 @@ import LanguageSelector from './components/LanguageSelector';
 import { useWebSocket } from './hooks/useWebSocket';
 import { useTextureLoader } from './hooks/useTextureLoader';
 import { fetchMultiPointData, transformToLegacyFormat, getLatestAvailableDate } from './services/oceanDataService';
+import { requestCache } from './utils/requestCache';
 import type { Coordinates, ClimateDataResponse, OceanMeasurement, DateRange, MultiDatasetOceanResponse } from './utils/types';
 import { 
   generateRandomDate, 
@@ -544,6 +545,16 @@ function App() {
           }
           break;
           
+        case 'data_update':
+          // New day processed on the server - cached point responses may be stale
+          console.log(`🆕 New ${message.payload?.dataset} data available: ${message.payload?.latest_date}`);
+          requestCache.clearAll();
+          break;
+          
+        case 'texture_update':
+          console.log(`🖼️ New ${message.payload?.category} texture available: ${message.payload?.latest_date}`);
+          break;
+          
         case 'progress':
           console.log('⏳ Progress:', message.payload?.message);
           setProgressMessage(message.payload?.message || 'Processing...');
@@ -1,60 +1,66 @@
 import { useEffect, useRef, useState } from 'react';
 import type { WebSocketMessage } from '../utils/types';
+import { realtimeChannel } from '../services/realtimeChannel';
 
 interface UseWebSocketOptions {
   onMessage?: (message: WebSocketMessage) => void;
   onConnect?: () => void;
   onDisconnect?: () => void;
-  reconnectDelay?: number;
 }
 
 export function useWebSocket(options: UseWebSocketOptions = {}) {
-  const { onMessage, onConnect, onDisconnect, reconnectDelay = 3000 } = options;
-  const [isConnected, setIsConnected] = useState(false);
-  const wsRef = useRef<WebSocket | null>(null);
-  const reconnectTimeoutRef = useRef<NodeJS.Timeout | null>(null);
-
-  const connect = () => {
-    // REST API only - no WebSocket server exists
-    // Simulate immediate connection for compatibility
-    setIsConnected(true);
-    onConnect?.();
-    
-    if (reconnectTimeoutRef.current) {
-      clearTimeout(reconnectTimeoutRef.current);
-      reconnectTimeoutRef.current = null;
-    }
-  };
+  const [isConnected, setIsConnected] = useState(realtimeChannel.isOpen());
 
-  const sendMessage = (message: WebSocketMessage) => {
-    // REST API only - WebSocket messages not supported
-    // This function is kept for compatibility but does nothing
-    console.warn('WebSocket sendMessage called but only REST API is available');
-  };
+  // Keep the latest callbacks without resubscribing on every render
+  const optionsRef = useRef(options);
+  optionsRef.current = options;
 
-  const disconnect = () => {
-    if (reconnectTimeoutRef.current) {
-      clearTimeout(reconnectTimeoutRef.current);
-      reconnectTimeoutRef.current = null;
-    }
-    
-    // REST API only - no WebSocket connection to close
-    setIsConnected(false);
-    onDisconnect?.();
-  };
+  // This hook's hold on the shared connection (other users keep it open)
+  const releaseRef = useRef<(() => void) | null>(null);
 
   useEffect(() => {
-    // Simulate connection when using REST API instead
-    setIsConnected(true);
-    
+    releaseRef.current = realtimeChannel.start();
+
+    let wasOpen = realtimeChannel.isOpen();
+    const unsubscribeStatus = realtimeChannel.onStatus((status) => {
+      const open = status === 'open';
+      setIsConnected(open);
+      if (open && !wasOpen) {
+        optionsRef.current.onConnect?.();
+      } else if (!open && wasOpen) {
+        optionsRef.current.onDisconnect?.();
+      }
+      wasOpen = open;
+    });
+
+    const unsubscribeMessages = realtimeChannel.subscribe((message) => {
+      optionsRef.current.onMessage?.(message);
+    });
+
     return () => {
-      disconnect();
+      unsubscribeStatus();
+      unsubscribeMessages();
+      releaseRef.current?.();
+      releaseRef.current = null;
     };
   }, []);
 
+  const sendMessage = (message: Record<string, any>) => {
+    if (!realtimeChannel.send(message)) {
+      console.warn('WebSocket sendMessage called while disconnected');
+    }
+  };
+
+  const disconnect = () => {
+    releaseRef.current?.();
+    releaseRef.current = null;
+  };
+
   return {
     isConnected,
     sendMessage,
+    request: realtimeChannel.request.bind(realtimeChannel),
+    cancel: realtimeChannel.cancel.bind(realtimeChannel),
     disconnect
   };
-}
\ No newline at end of file
+}
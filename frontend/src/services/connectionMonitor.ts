@@ -3,10 +3,13 @@
  * 
  * Monitors backend API health and automatically detects when the server
  * restarts or becomes unavailable, providing real-time status updates.
+ * While the realtime WebSocket channel is open its connection state is used
+ * directly; /health is only polled while the socket is down.
  */
 
 import React from 'react';
 import { requestCache } from '../utils/requestCache';
+import { realtimeChannel } from './realtimeChannel';
 
 export type ConnectionStatus = 'connected' | 'disconnected' | 'reconnecting' | 'error';
 
@@ -31,6 +34,34 @@ class ConnectionMonitor {
   constructor() {
     // Start monitoring immediately
     this.startMonitoring();
+
+    // An open socket is proof of life - no need to poll /health
+    realtimeChannel.onStatus((channelStatus) => {
+      if (channelStatus === 'open') {
+        this.handleChannelOpen();
+      } else if (channelStatus === 'closed' && !this.monitorInterval) {
+        this.scheduleNextCheck(this.fastInterval);
+      }
+    });
+    // Held for the lifetime of the app, so the socket outlives any one component
+    realtimeChannel.start();
+  }
+
+  /**
+   * Switch from /health polling to the WebSocket connection state
+   */
+  private handleChannelOpen() {
+    if (this.monitorInterval) {
+      clearTimeout(this.monitorInterval);
+      this.monitorInterval = null;
+    }
+
+    if (this.status !== 'connected') {
+      // Clear cache on reconnection to ensure fresh data
+      requestCache.clearAll();
+    }
+    this.reconnectAttempts = 0;
+    this.updateStatus('connected');
   }
 
   /**
@@ -50,9 +81,15 @@ class ConnectionMonitor {
   private scheduleNextCheck(interval: number) {
     if (this.monitorInterval) {
       clearTimeout(this.monitorInterval);
+      this.monitorInterval = null;
+    }
+
+    if (realtimeChannel.isOpen()) {
+      return;
     }
     
     this.monitorInterval = setTimeout(() => {
+      this.monitorInterval = null;
       this.checkConnection();
     }, interval);
   }
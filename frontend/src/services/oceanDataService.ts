@@ -7,9 +7,11 @@
  * - Request deduplication to prevent duplicate API calls
  * - Intelligent caching with browser storage persistence
  * - Automatic cache management and cleanup
+ * - Point queries over the realtime WebSocket channel when it is open (REST fallback)
  */
 
 import { requestCache } from '../utils/requestCache';
+import { realtimeChannel } from './realtimeChannel';
 
 const API_BASE_URL = 'http://localhost:8000';
 
@@ -69,6 +71,20 @@ export async function fetchMultiPointData(
   return requestCache.get(
     cacheKey,
     async () => {
+      // One frame over the open socket instead of a full HTTP request
+      if (realtimeChannel.isOpen()) {
+        try {
+          const { promise } = realtimeChannel.request<MultiDatasetResponse>(
+            'multi_point',
+            { lat, lon, datasets, date },
+            datasets.includes('currents') ? 60000 : 30000
+          );
+          return await promise;
+        } catch (error) {
+          console.warn('WebSocket multi-point request failed, falling back to REST:', error);
+        }
+      }
+
       // Original fetch logic with optimizations
       const params = new URLSearchParams({
         lat: lat.toString(),
@@ -178,6 +194,15 @@ export async function fetchSingleDataset(
   lon: number,
   date?: string
 ): Promise<PointDataResponse> {
+  if (realtimeChannel.isOpen()) {
+    try {
+      const { promise } = realtimeChannel.request<PointDataResponse>('point', { dataset, lat, lon, date });
+      return await promise;
+    } catch (error) {
+      console.warn(`WebSocket ${dataset} request failed, falling back to REST:`, error);
+    }
+  }
+
   const params = new URLSearchParams({
     lat: lat.toString(),
     lon: lon.toString()
@@ -222,35 +247,54 @@ export async function fetchAvailableDates(): Promise<Record<string, string[]>> {
   return response.json();
 }
 
+/**
+ * Compact availability for one dataset: consecutive-day runs instead of every date
+ */
+export interface DatasetDateRanges {
+  start: string | null;
+  end: string | null;
+  count: number | null;
+  ranges: [string, string][];
+}
+
+/**
+ * Get available dates for all datasets as compact date ranges
+ */
+export async function fetchAvailableDateRanges(): Promise<Record<string, DatasetDateRanges>> {
+  const response = await fetch(`${API_BASE_URL}/available-dates?format=ranges`);
+  
+  if (!response.ok) {
+    throw new Error(`API request failed: ${response.status} ${response.statusText}`);
+  }
+  
+  return response.json();
+}
+
 /**
  * Get the latest available date from all datasets
  */
 export async function getLatestAvailableDate(): Promise<string> {
   try {
-    const availableDates = await fetchAvailableDates();
+    const availableDates = await fetchAvailableDateRanges();
     
-    // Flatten all dates from all datasets (excluding microplastics which has a range)
-    const allDates: string[] = [];
+    // Latest end date across datasets (excluding microplastics which has a fixed range)
+    let latestDate: string | null = null;
     
-    for (const [dataset, dates] of Object.entries(availableDates)) {
+    for (const [dataset, availability] of Object.entries(availableDates)) {
       if (dataset === 'microplastics') continue; // Skip microplastics as it has a date range
       
-      dates.forEach(date => {
-        if (date && !date.includes(' to ')) { // Ensure it's a single date
-          allDates.push(date);
-        }
-      });
+      if (availability.end && (!latestDate || availability.end > latestDate)) {
+        latestDate = availability.end;
+      }
     }
     
-    if (allDates.length === 0) {
+    if (!latestDate) {
       // Fallback to latest available texture date
       console.warn('No available dates found, using fallback date');
       return '2025-07-31'; // Latest available texture date
     }
     
-    // Sort dates and return the most recent
-    allDates.sort();
-    return allDates[allDates.length - 1];
+    return latestDate;
   } catch (error) {
     console.error('Error fetching available dates:', error);
     // Return latest available texture date as fallback
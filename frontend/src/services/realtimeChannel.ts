@@ -0,0 +1,254 @@
+/**
+ * Realtime Channel Service
+ *
+ * Single WebSocket connection to the backend `/ws` endpoint shared by the app.
+ * Features:
+ * - Point queries multiplexed over one socket with request IDs (no per-hover HTTP overhead)
+ * - Cancellation of superseded requests
+ * - Server pushes when a new day of data or a new texture lands
+ * - Connection state used by the connection monitor instead of polling /health
+ */
+
+import type { WebSocketMessage } from '../utils/types';
+
+export type ChannelStatus = 'connecting' | 'open' | 'closed';
+
+type StatusListener = (status: ChannelStatus) => void;
+type MessageListener = (message: WebSocketMessage) => void;
+
+interface PendingRequest {
+  resolve: (payload: any) => void;
+  reject: (error: Error) => void;
+  timeoutId: ReturnType<typeof setTimeout>;
+}
+
+const API_BASE_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
+const WS_URL = `${API_BASE_URL.replace(/^http/, 'ws')}/ws`;
+
+class RealtimeChannel {
+  private socket: WebSocket | null = null;
+  private status: ChannelStatus = 'closed';
+  private statusListeners: Set<StatusListener> = new Set();
+  private messageListeners: Set<MessageListener> = new Set();
+  private pending: Map<string, PendingRequest> = new Map();
+  private nextId = 0;
+  private reconnectTimeout: ReturnType<typeof setTimeout> | null = null;
+  private reconnectAttempts = 0;
+  private maxReconnectDelay = 30000;
+  private started = false;
+  private users = 0;
+
+  /**
+   * Register a user of the connection and open it if needed. It reconnects
+   * automatically while any user holds it.
+   *
+   * @returns Release function (idempotent); the connection closes when its last user releases it
+   */
+  start(): () => void {
+    this.users++;
+    if (!this.started) {
+      this.started = true;
+      this.connect();
+    }
+
+    let released = false;
+    return () => {
+      if (released) return;
+      released = true;
+      this.users--;
+      if (this.users === 0) {
+        this.stop();
+      }
+    };
+  }
+
+  /**
+   * Close the connection and stop reconnecting
+   */
+  private stop() {
+    this.started = false;
+    if (this.reconnectTimeout) {
+      clearTimeout(this.reconnectTimeout);
+      this.reconnectTimeout = null;
+    }
+    this.socket?.close();
+    this.socket = null;
+  }
+
+  private connect() {
+    if (typeof WebSocket === 'undefined') return;
+
+    this.updateStatus('connecting');
+    const socket = new WebSocket(WS_URL);
+    this.socket = socket;
+
+    socket.onopen = () => {
+      this.reconnectAttempts = 0;
+      this.updateStatus('open');
+    };
+
+    socket.onmessage = (event) => {
+      let message: WebSocketMessage;
+      try {
+        message = JSON.parse(event.data);
+      } catch (error) {
+        console.warn('Ignoring malformed WebSocket message');
+        return;
+      }
+      this.handleMessage(message);
+    };
+
+    socket.onclose = () => {
+      if (this.socket === socket) {
+        this.socket = null;
+      }
+      this.rejectPending('WebSocket connection closed');
+      this.updateStatus('closed');
+      this.scheduleReconnect();
+    };
+
+    socket.onerror = () => {
+      // onclose follows and handles reconnection
+    };
+  }
+
+  private scheduleReconnect() {
+    if (!this.started || this.reconnectTimeout) return;
+
+    const delay = Math.min(1000 * 2 ** this.reconnectAttempts, this.maxReconnectDelay);
+    this.reconnectAttempts++;
+    this.reconnectTimeout = setTimeout(() => {
+      this.reconnectTimeout = null;
+      this.connect();
+    }, delay);
+  }
+
+  private handleMessage(message: WebSocketMessage) {
+    // Responses to our own requests carry the request ID
+    const pending = message.id ? this.pending.get(message.id) : undefined;
+    if (pending && message.id) {
+      this.pending.delete(message.id);
+      clearTimeout(pending.timeoutId);
+      if (message.type === 'error') {
+        pending.reject(new Error(message.payload?.message || 'WebSocket request failed'));
+      } else {
+        pending.resolve(message.payload);
+      }
+      return;
+    }
+
+    // Everything else (connection info, data/texture notifications) goes to listeners
+    this.messageListeners.forEach(listener => {
+      try {
+        listener(message);
+      } catch (error) {
+        console.error('WebSocket listener failed:', error);
+      }
+    });
+  }
+
+  private rejectPending(reason: string) {
+    this.pending.forEach(({ reject, timeoutId }) => {
+      clearTimeout(timeoutId);
+      reject(new Error(reason));
+    });
+    this.pending.clear();
+  }
+
+  private updateStatus(status: ChannelStatus) {
+    if (this.status === status) return;
+    this.status = status;
+    this.statusListeners.forEach(listener => {
+      try {
+        listener(status);
+      } catch (error) {
+        console.error('WebSocket status listener failed:', error);
+      }
+    });
+  }
+
+  /**
+   * Whether requests can currently be sent over the socket
+   */
+  isOpen(): boolean {
+    return this.status === 'open' && this.socket?.readyState === WebSocket.OPEN;
+  }
+
+  getStatus(): ChannelStatus {
+    return this.status;
+  }
+
+  /**
+   * Send a request and resolve with the payload of its response
+   */
+  request<T = any>(type: 'point' | 'multi_point', params: Record<string, any>, timeoutMs: number = 30000): { id: string; promise: Promise<T> } {
+    const id = `r${++this.nextId}`;
+    const promise = new Promise<T>((resolve, reject) => {
+      if (!this.isOpen()) {
+        reject(new Error('WebSocket not connected'));
+        return;
+      }
+      const timeoutId = setTimeout(() => {
+        this.pending.delete(id);
+        this.cancel(id);
+        reject(new Error(`WebSocket request timed out after ${timeoutMs / 1000}s`));
+      }, timeoutMs);
+      this.pending.set(id, { resolve, reject, timeoutId });
+      this.socket!.send(JSON.stringify({ type, id, ...params }));
+    });
+    return { id, promise };
+  }
+
+  /**
+   * Cancel an in-flight request (e.g. a hover the pointer already left)
+   */
+  cancel(id: string) {
+    const pending = this.pending.get(id);
+    if (pending) {
+      clearTimeout(pending.timeoutId);
+      this.pending.delete(id);
+      pending.reject(new Error('Request cancelled'));
+    }
+    if (this.isOpen()) {
+      this.socket!.send(JSON.stringify({ type: 'cancel', target: id }));
+    }
+  }
+
+  /**
+   * Send a raw message (no response tracking)
+   */
+  send(message: Record<string, any>): boolean {
+    if (!this.isOpen()) return false;
+    this.socket!.send(JSON.stringify(message));
+    return true;
+  }
+
+  /**
+   * Subscribe to server-pushed messages
+   */
+  subscribe(listener: MessageListener): () => void {
+    this.messageListeners.add(listener);
+    return () => {
+      this.messageListeners.delete(listener);
+    };
+  }
+
+  /**
+   * Subscribe to connection status changes (called immediately with the current status)
+   */
+  onStatus(listener: StatusListener): () => void {
+    this.statusListeners.add(listener);
+    listener(this.status);
+    return () => {
+      this.statusListeners.delete(listener);
+    };
+  }
+}
+
+// Export singleton instance
+export const realtimeChannel = new RealtimeChannel();
+
+// Make it available globally for debugging
+if (typeof window !== 'undefined') {
+  (window as any).realtimeChannel = realtimeChannel;
+}
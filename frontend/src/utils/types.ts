@@ -35,7 +35,9 @@ export interface DateRange {
 }
 
 export interface WebSocketMessage {
-  type: 'texture_update' | 'coordinate_data' | 'climate_data' | 'progress' | 'error' | 'connection' | 'getOceanData' | 'oceanData' | 'pong' | 'temperature_request' | 'salinity_request' | 'wave_request' | 'currents_request' | 'chlorophyll_request' | 'ph_request' | 'biodiversity_request' | 'microplastics_request' | 'temperature_data' | 'salinity_data' | 'wave_data' | 'currents_data' | 'chlorophyll_data' | 'ph_data' | 'biodiversity_data' | 'microplastics_data';
+  type: 'texture_update' | 'coordinate_data' | 'climate_data' | 'progress' | 'error' | 'connection' | 'getOceanData' | 'oceanData' | 'pong' | 'temperature_request' | 'salinity_request' | 'wave_request' | 'currents_request' | 'chlorophyll_request' | 'ph_request' | 'biodiversity_request' | 'microplastics_request' | 'temperature_data' | 'salinity_data' | 'wave_data' | 'currents_data' | 'chlorophyll_data' | 'ph_data' | 'biodiversity_data' | 'microplastics_data' | 'data_update' | 'point_data' | 'multi_point_data';
+  // Request ID echoed on responses from the /ws channel
+  id?: string | null;
   payload: {
     coordinates?: Coordinates;
     texturePath?: string;
@@ -68,6 +70,11 @@ export interface WebSocketMessage {
     data_policy?: string;
     system?: string;
     system_info?: string;
+    // data_update / texture_update notifications
+    dataset?: string;
+    category?: string;
+    latest_date?: string | null;
+    latest_dates?: Record<string, string | null>;
   };
   // Backend response fields
   data?: any;